@@ -26,3 +26,9 @@ class InvalidInputResponseErrorStatus(StrValueLabel):
     INVALID_RECRUIT_JOB_INPUT_ERROR_400 = (
         '400-invalid_recruit_job_input-00001', ErrorMessage.INVALID_INPUT_ERROR_MESSAGE.label
     )
+    INVALID_ARROW_QUESTION_RESPONSE_INPUT_DATA_400 = (
+        '400-invalid_arrow_question_response_input_data-00001', ErrorMessage.INVALID_INPUT_ERROR_MESSAGE.label
+    )
+    INVALID_QUESTION_RESPONSE_REPLY_INPUT_DATA_400 = (
+        '400-invalid_question_response_reply_input_data-00001', ErrorMessage.INVALID_INPUT_ERROR_MESSAGE.label
+    )
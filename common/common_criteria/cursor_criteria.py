@@ -1,16 +1,90 @@
-from datetime import (
-    date,
-    datetime,
+from typing import (
+    Any,
+    List,
+    Optional,
+    Tuple,
+    Type,
 )
-from typing import Any
 
 from common.common_interfaces.cursor_criteria_interfaces import CursorCriteriaInterface
-from common.common_utils import format_iso8601
-from common.common_utils.encode_utils import data_to_urlsafe_base64
+from common.common_utils.decode_utils import (
+    compact_cursor_to_values,
+    is_compact_cursor,
+    urlsafe_base64_to_data,
+)
+from common.common_utils.encode_utils import values_to_compact_cursor
+from django.conf import settings
+from django.db.models import (
+    BooleanField,
+    Expression,
+    F,
+    Model,
+    Q,
+    Value,
+)
+
+
+ROW_VALUE_OPERATORS = {
+    'lt': '<',
+    'lte': '<=',
+    'gt': '>',
+    'gte': '>=',
+}
+
+
+class RowValueComparison(Expression):
+    """
+    (a, b) < (x, y) 처럼 Row 값을 한 번에 비교합니다.
+    정렬 방향이 같은 복합 인덱스 하나의 range scan 으로 처리할 수 있습니다.
+    """
+    conditional = True
+
+    def __init__(self, attributes: List[str], operator: str, values: List[Any]) -> None:
+        super().__init__(output_field=BooleanField())
+        if len(attributes) != len(values):
+            raise ValueError('attributes and values must have the same length.')
+        self.operator = operator
+        self.lhs = [F(attribute) for attribute in attributes]
+        self.rhs = [Value(value) for value in values]
+
+    def get_source_expressions(self):
+        return [*self.lhs, *self.rhs]
+
+    def set_source_expressions(self, exprs):
+        self.lhs = exprs[:len(self.lhs)]
+        self.rhs = exprs[len(self.lhs):]
+
+    def as_sql(self, compiler, connection):
+        lhs_sql, lhs_params = self._compile_row(self.lhs, compiler)
+        rhs_sql, rhs_params = self._compile_row(self.rhs, compiler)
+        return f'({lhs_sql}) {ROW_VALUE_OPERATORS[self.operator]} ({rhs_sql})', [*lhs_params, *rhs_params]
+
+    @staticmethod
+    def _compile_row(expressions, compiler):
+        sqls = []
+        params = []
+        for expression in expressions:
+            sql, expression_params = compiler.compile(expression)
+            sqls.append(sql)
+            params.extend(expression_params)
+        return ', '.join(sqls), params
 
 
 class CursorCriteria(CursorCriteriaInterface):
+    """
+    cursor_keys: '{attribute}__{operator}' 는 범위 비교, 연산자가 없는 key 는 같음(=) 비교
+    model: 인덱스 점검(check_cursor_indexes)에 사용할 Model
+    filter_fields: cursor 외에 항상 같음(=) 으로 거는 조건 (인덱스 점검에만 사용)
+    """
     cursor_keys = []
+    model: Optional[Type[Model]] = None
+    filter_fields = []
+
+    registry: List[Type['CursorCriteria']] = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        CursorCriteria.registry.append(cls)
 
     @classmethod
     def is_valid_decoded_cursor(cls, decoded_cursor: dict) -> bool:
@@ -20,21 +94,41 @@ class CursorCriteria(CursorCriteriaInterface):
         return True
 
     @classmethod
-    def get_encoded_base64_cursor_data(cls, data: Any) -> str:
-        encoding_data = {}
+    def get_cursor_salt(cls) -> str:
+        """
+        다른 CursorCriteria 나 cursor_keys 가 바뀐 cursor 는 HMAC 이 맞지 않습니다.
+        """
+        return f'cursor:{cls.__name__}:{",".join(cls.cursor_keys)}'
 
+    @classmethod
+    def get_encoded_base64_cursor_data(cls, data: Any) -> str:
+        values = []
         for cursor_key in cls.cursor_keys:
             attribute = cursor_key.split('__')[0]
             try:
-                value = getattr(data, attribute)
+                values.append(getattr(data, attribute))
             except AttributeError:
                 raise ValueError(f"Attribute '{attribute}' not found in '{data.__class__.__name__}'")
-            if isinstance(value, (datetime, date)):
-                encoding_data[cursor_key] = format_iso8601(value)
-            else:
-                encoding_data[cursor_key] = value
 
-        return data_to_urlsafe_base64(encoding_data)
+        return values_to_compact_cursor(values, cls.get_cursor_salt())
+
+    @classmethod
+    def decode_cursor(cls, base64_cursor: str) -> dict:
+        """
+        압축 cursor 는 HMAC 확인 후 cursor_keys 순서대로 값을 매핑합니다.
+        LEGACY_CURSOR_ENABLED 이면 이전 JSON cursor 도 받습니다.
+        """
+        if is_compact_cursor(base64_cursor):
+            values = compact_cursor_to_values(base64_cursor, cls.get_cursor_salt())
+            if len(values) != len(cls.cursor_keys):
+                raise ValueError
+            return dict(zip(cls.cursor_keys, values))
+        if not settings.LEGACY_CURSOR_ENABLED:
+            raise ValueError
+        decoded_cursor = urlsafe_base64_to_data(base64_cursor)
+        if not isinstance(decoded_cursor, dict):
+            raise ValueError
+        return decoded_cursor
 
     @classmethod
     def get_ordering_data(cls):
@@ -47,3 +141,67 @@ class CursorCriteria(CursorCriteriaInterface):
                 elif operator in {'gt', 'gte'}:
                     ordering_data.append(attribute)
         return ordering_data
+
+    @classmethod
+    def get_key_attributes(cls) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """
+        (같음 비교 attribute 목록, (범위 비교 attribute, operator) 목록)
+        """
+        equal_attributes = []
+        range_attributes = []
+        for cursor_key in cls.cursor_keys:
+            if '__' in cursor_key:
+                attribute, operator = cursor_key.split('__')
+                range_attributes.append((attribute, operator))
+            else:
+                equal_attributes.append(cursor_key)
+        return equal_attributes, range_attributes
+
+    @classmethod
+    def is_row_value_comparable(cls) -> bool:
+        """
+        범위 비교 key 가 2개 이상이고 모두 같은 방향이면 Row 값 비교로 처리할 수 있습니다.
+        """
+        _, range_attributes = cls.get_key_attributes()
+        directions = {operator[:2] for _, operator in range_attributes}
+        return len(range_attributes) > 1 and len(directions) == 1
+
+    @classmethod
+    def get_filtering_q(cls, decoded_cursor: dict) -> Q:
+        """
+        cursor_keys 순서대로 사전식(keyset) 비교 조건을 만듭니다.
+        ['rank__lt', 'id__lt'] -> (rank, id) < (x, y)
+        방향이 섞여 있으면 rank < x OR (rank = x AND id > y) 처럼 풀어서 비교합니다.
+        연산자가 없는 key 는 모든 조건에 같음(=) 으로 적용합니다.
+        """
+        if not decoded_cursor:
+            return Q()
+
+        equal_filters = {
+            cursor_key: decoded_cursor[cursor_key]
+            for cursor_key in cls.cursor_keys
+            if '__' not in cursor_key
+        }
+        range_keys = [cursor_key for cursor_key in cls.cursor_keys if '__' in cursor_key]
+
+        if cls.is_row_value_comparable():
+            # 앞 key 가 같은 경우는 다음 key 에서 비교하므로 마지막 key 의 연산자만 의미가 있습니다.
+            return Q(**equal_filters) & Q(
+                RowValueComparison(
+                    attributes=[cursor_key.split('__')[0] for cursor_key in range_keys],
+                    operator=range_keys[-1].split('__')[1],
+                    values=[decoded_cursor[cursor_key] for cursor_key in range_keys],
+                )
+            )
+
+        filtering_q = Q()
+        prefix_filters = {}
+        for index, cursor_key in enumerate(range_keys):
+            attribute, operator = cursor_key.split('__')
+            value = decoded_cursor[cursor_key]
+            if index < len(range_keys) - 1:
+                # 같은 값은 다음 key 에서 비교합니다.
+                operator = operator[:2]
+            filtering_q |= Q(**prefix_filters, **{f'{attribute}__{operator}': value})
+            prefix_filters[attribute] = value
+        return Q(**equal_filters) & filtering_q
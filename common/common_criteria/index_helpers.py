@@ -0,0 +1,120 @@
+from typing import (
+    List,
+    Optional,
+    Type,
+)
+
+from common.common_criteria.cursor_criteria import CursorCriteria
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connection
+from django.utils.module_loading import autodiscover_modules
+
+
+class CursorIndexReport:
+    """
+    CursorCriteria 하나의 인덱스 점검 결과
+
+    equal_columns: 같음(=) 비교 컬럼 (인덱스 앞부분, 순서 무관)
+    range_columns: (컬럼, 'ASC' / 'DESC') 범위 비교 컬럼
+    index_name: 지원하는 인덱스 (없으면 None)
+    message: 지원하지 않는 이유
+    """
+
+    def __init__(
+            self,
+            cursor_criteria: Type[CursorCriteria],
+            equal_columns: List[str] = None,
+            range_columns: List[tuple] = None,
+            index_name: Optional[str] = None,
+            message: str = '',
+    ) -> None:
+        self.cursor_criteria = cursor_criteria
+        self.equal_columns = equal_columns or []
+        self.range_columns = range_columns or []
+        self.index_name = index_name
+        self.message = message
+
+    @property
+    def is_supported(self) -> bool:
+        return self.index_name is not None
+
+    def __str__(self):
+        model = self.cursor_criteria.model
+        columns = ', '.join(
+            [*self.equal_columns, *(f'{column} {order}' for column, order in self.range_columns)]
+        )
+        return (
+            f'{self.cursor_criteria.__module__}.{self.cursor_criteria.__name__} '
+            f'[{model._meta.label if model else "-"}] ({columns}) '
+            f'{"OK " + self.index_name if self.is_supported else "MISSING " + self.message}'
+        )
+
+
+def _is_supporting_index(constraint: dict, equal_columns: List[str], range_columns: List[tuple]) -> bool:
+    """
+    같음 비교 컬럼이 앞에 오고 범위 비교 컬럼이 순서대로 이어지며,
+    정렬 방향이 모두 같거나 모두 반대(역방향 scan)인 btree 인덱스
+    """
+    if constraint['index']:
+        if constraint.get('type') not in ('idx', 'btree') or constraint.get('definition'):
+            return False
+    elif not constraint['unique']:
+        return False
+
+    columns = constraint['columns']
+    orders = constraint.get('orders') or ['ASC'] * len(columns)
+    prefix = len(equal_columns)
+    range_slice = slice(prefix, prefix + len(range_columns))
+    if set(columns[:prefix]) != set(equal_columns):
+        return False
+    if columns[range_slice] != [column for column, _ in range_columns]:
+        return False
+    index_orders = orders[range_slice]
+    expected_orders = [order for _, order in range_columns]
+    reversed_orders = ['ASC' if order == 'DESC' else 'DESC' for order in expected_orders]
+    return index_orders in (expected_orders, reversed_orders)
+
+
+def get_cursor_index_report(cursor_criteria: Type[CursorCriteria]) -> CursorIndexReport:
+    model = cursor_criteria.model
+    if model is None:
+        return CursorIndexReport(cursor_criteria, message='model 이 지정되지 않았습니다.')
+
+    equal_attributes, range_attributes = cursor_criteria.get_key_attributes()
+    try:
+        equal_columns = [
+            model._meta.get_field(attribute).column
+            for attribute in [*cursor_criteria.filter_fields, *equal_attributes]
+        ]
+        range_columns = [
+            (model._meta.get_field(attribute).column, 'DESC' if operator.startswith('lt') else 'ASC')
+            for attribute, operator in range_attributes
+        ]
+    except FieldDoesNotExist as e:
+        return CursorIndexReport(cursor_criteria, message=f'컬럼이 아닌 값은 인덱스를 사용할 수 없습니다. ({e})')
+
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+    index_name = next(
+        (
+            name
+            for name, constraint in sorted(constraints.items())
+            if _is_supporting_index(constraint, equal_columns, range_columns)
+        ),
+        None,
+    )
+    return CursorIndexReport(
+        cursor_criteria,
+        equal_columns=equal_columns,
+        range_columns=range_columns,
+        index_name=index_name,
+        message='' if index_name else '일치하는 btree 인덱스가 없습니다.',
+    )
+
+
+def get_cursor_index_reports() -> List[CursorIndexReport]:
+    """
+    각 app 의 cursor_criteria 모듈을 불러와 등록된 모든 CursorCriteria 를 점검합니다.
+    """
+    autodiscover_modules('cursor_criteria')
+    return [get_cursor_index_report(cursor_criteria) for cursor_criteria in CursorCriteria.registry]
@@ -1,12 +1,22 @@
+import base64
 from datetime import (
     date,
     datetime,
+    timezone,
 )
-from unittest.mock import patch
 
-from common.common_criteria.cursor_criteria import CursorCriteria
+from common.common_criteria.cursor_criteria import (
+    CursorCriteria,
+    RowValueComparison,
+)
 from common.common_testcase_helpers.testcase_helpers import SampleModel
-from django.test import TestCase
+from common.common_utils.encode_utils import data_to_urlsafe_base64
+from django.db.models import Q
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from product.models import PointProduct
 
 
 class SampleCursorCriteria(CursorCriteria):
@@ -37,14 +47,11 @@ class CursorCriteriaTests(TestCase):
             False,
         )
 
-    @patch('common.common_criteria.cursor_criteria.data_to_urlsafe_base64')
-    def test_get_encoded_base64_cursor_data(self, mock_data_to_urlsafe_base64):
-        # Given: Mock data_to_urlsafe_base64
-        mock_data_to_urlsafe_base64.return_value = 'encoded_string'
-        # And: Sample data
+    def test_get_encoded_base64_cursor_data(self):
+        # Given: Sample data
         data = SampleModel(
             id=1,
-            timestamp=datetime(2021, 8, 1, 12, 0),
+            timestamp=datetime(2021, 8, 1, 12, 0, tzinfo=timezone.utc),
             name="Project",
             datestamp=date(2021, 8, 1),
         )
@@ -52,17 +59,59 @@ class CursorCriteriaTests(TestCase):
         # When: get_encoded_base64_cursor_data
         result = SampleCursorCriteria.get_encoded_base64_cursor_data(data)
 
-        # Then: expected result
-        self.assertEqual(result, 'encoded_string')
-        # And: data_to_urlsafe_base64 called with expected dict
-        expected_dict = {
-            'id__lte': 1,
-            'timestamp__lt': '2021-08-01T12:00:00+09:00',  # Assumes date formatting in valid_keys handling
-            'name': 'Project',
-            'datestamp__gt': '2021-08-01T00:00:00+09:00',
-        }
-        # And: data_to_urlsafe_base64 called with expected dict
-        mock_data_to_urlsafe_base64.assert_called_once_with(expected_dict)
+        # Then: key 이름 없이 값만 담은 압축 cursor
+        self.assertLess(len(result), 64)
+        # And: decode 하면 cursor_keys 순서대로 값이 복원됩니다.
+        self.assertEqual(
+            SampleCursorCriteria.decode_cursor(result),
+            {
+                'id__lte': 1,
+                'timestamp__lt': datetime(2021, 8, 1, 12, 0, tzinfo=timezone.utc),
+                'name': 'Project',
+                'datestamp__gt': date(2021, 8, 1),
+            },
+        )
+
+    def test_decode_cursor_should_reject_cursor_of_other_criteria(self):
+        # Given: 같은 cursor_keys 의 다른 CursorCriteria 로 만든 cursor
+        class OtherCursorCriteria(CursorCriteria):
+            cursor_keys = ['id__lt']
+
+        class SampleIdCursorCriteria(CursorCriteria):
+            cursor_keys = ['id__lt']
+
+        cursor = OtherCursorCriteria.get_encoded_base64_cursor_data(SampleModel(id=1))
+
+        # Expect: HMAC 이 맞지 않아 실패
+        with self.assertRaises(ValueError):
+            SampleIdCursorCriteria.decode_cursor(cursor)
+
+    def test_decode_cursor_should_reject_tampered_cursor(self):
+        # Given: 값을 바꾼 cursor
+        class SampleIdCursorCriteria(CursorCriteria):
+            cursor_keys = ['id__lt']
+
+        payload = bytearray(
+            base64.urlsafe_b64decode(SampleIdCursorCriteria.get_encoded_base64_cursor_data(SampleModel(id=1)) + '==')
+        )
+        payload[-9] ^= 1
+        cursor = base64.urlsafe_b64encode(bytes(payload)).decode('utf-8').rstrip('=')
+
+        # Expect:
+        with self.assertRaises(ValueError):
+            SampleIdCursorCriteria.decode_cursor(cursor)
+
+    def test_decode_cursor_should_accept_legacy_json_cursor(self):
+        # Given: 이전 JSON cursor
+        cursor = data_to_urlsafe_base64({'id__lt': 1})
+
+        # Expect:
+        self.assertEqual(SampleCursorCriteria.decode_cursor(cursor), {'id__lt': 1})
+
+        # And: LEGACY_CURSOR_ENABLED 가 꺼지면 실패
+        with override_settings(LEGACY_CURSOR_ENABLED=False):
+            with self.assertRaises(ValueError):
+                SampleCursorCriteria.decode_cursor(cursor)
 
     def test_get_encoded_base64_cursor_data_invalid_key(self):
         # Given: Sample data with missing attribute for cursor_keys 'datestamp'
@@ -114,3 +163,62 @@ class CursorCriteriaTests(TestCase):
 
         # Then:
         self.assertEqual(ordering_data, ['-id', '-created', 'name'])
+
+    def test_get_filtering_q_should_return_empty_q_when_cursor_is_empty(self):
+        # Given:
+        # When:
+        filtering_q = SampleCursorCriteria.get_filtering_q({})
+
+        # Then:
+        self.assertEqual(filtering_q, Q())
+
+    def test_get_filtering_q_should_compare_keys_lexicographically(self):
+        # Given:
+        class SampleRankCursorCriteria(CursorCriteria):
+            cursor_keys = ['rank__lte', 'id__lt']
+
+        # When:
+        filtering_q = SampleRankCursorCriteria.get_filtering_q({'rank__lte': 0.5, 'id__lt': 10})
+
+        # Then: (rank, id) < (0.5, 10)
+        self.assertEqual(
+            filtering_q,
+            Q() & Q(RowValueComparison(attributes=['rank', 'id'], operator='lt', values=[0.5, 10])),
+        )
+
+    def test_get_filtering_q_should_expand_keys_when_directions_are_mixed(self):
+        # Given:
+        class SampleMixedCursorCriteria(CursorCriteria):
+            cursor_keys = ['rank__lt', 'id__gt']
+
+        # When:
+        filtering_q = SampleMixedCursorCriteria.get_filtering_q({'rank__lt': 0.5, 'id__gt': 10})
+
+        # Then: rank < 0.5 OR (rank = 0.5 AND id > 10)
+        self.assertEqual(filtering_q, Q() & (Q(rank__lt=0.5) | Q(rank=0.5, id__gt=10)))
+
+    def test_get_filtering_q_should_compare_row_values_in_sql(self):
+        # Given:
+        class SampleOrderingCursorCriteria(CursorCriteria):
+            cursor_keys = ['ordering__gt', 'id__gt']
+
+        # When:
+        sql = str(
+            PointProduct.objects.filter(
+                SampleOrderingCursorCriteria.get_filtering_q({'ordering__gt': 1, 'id__gt': 10}),
+            ).query
+        )
+
+        # Then: 복합 인덱스 range scan 이 가능한 Row 값 비교
+        self.assertIn('("product_pointproduct"."ordering", "product_pointproduct"."id") > (1, 10)', sql)
+
+    def test_get_filtering_q_should_apply_equal_keys_to_all_conditions(self):
+        # Given:
+        class SampleEqualCursorCriteria(CursorCriteria):
+            cursor_keys = ['map_id', 'id__gt']
+
+        # When:
+        filtering_q = SampleEqualCursorCriteria.get_filtering_q({'map_id': 1, 'id__gt': 10})
+
+        # Then:
+        self.assertEqual(filtering_q, Q(map_id=1) & Q(id__gt=10))
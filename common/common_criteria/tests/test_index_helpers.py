@@ -0,0 +1,72 @@
+from common.common_criteria.cursor_criteria import CursorCriteria
+from common.common_criteria.index_helpers import (
+    get_cursor_index_report,
+    get_cursor_index_reports,
+)
+from django.test import TestCase
+from map.models import Map
+from product.cursor_criteria import PointProductCursorCriteria
+from product.models import PointProduct
+
+
+class CursorIndexReportTestCase(TestCase):
+    def test_get_cursor_index_report_should_find_composite_index(self):
+        # When:
+        report = get_cursor_index_report(PointProductCursorCriteria)
+
+        # Then: (ordering, id) 인덱스로 지원
+        self.assertTrue(report.is_supported)
+        self.assertEqual(report.index_name, 'point_product_ordering_id_idx')
+        self.assertEqual(report.range_columns, [('ordering', 'ASC'), ('id', 'ASC')])
+
+    def test_get_cursor_index_report_should_allow_backward_scan(self):
+        # Given: 인덱스와 반대 방향
+        class SampleDescendingCursorCriteria(CursorCriteria):
+            cursor_keys = ['ordering__lt', 'id__lt']
+            model = PointProduct
+
+        # When:
+        report = get_cursor_index_report(SampleDescendingCursorCriteria)
+
+        # Then:
+        self.assertTrue(report.is_supported)
+
+    def test_get_cursor_index_report_should_report_missing_index(self):
+        # Given: 방향이 섞인 cursor, 인덱스가 없는 cursor
+        class SampleMixedCursorCriteria(CursorCriteria):
+            cursor_keys = ['ordering__lt', 'id__gt']
+            model = PointProduct
+
+        class SamplePriceCursorCriteria(CursorCriteria):
+            cursor_keys = ['price__lt', 'id__lt']
+            model = PointProduct
+
+        # Expect:
+        self.assertFalse(get_cursor_index_report(SampleMixedCursorCriteria).is_supported)
+        self.assertFalse(get_cursor_index_report(SamplePriceCursorCriteria).is_supported)
+
+    def test_get_cursor_index_report_should_report_annotation_and_missing_model(self):
+        # Given:
+        class SampleRankCursorCriteria(CursorCriteria):
+            cursor_keys = ['rank__lt', 'id__lt']
+            model = Map
+
+        class SampleNoModelCursorCriteria(CursorCriteria):
+            cursor_keys = ['id__lt']
+
+        # When:
+        rank_report = get_cursor_index_report(SampleRankCursorCriteria)
+        no_model_report = get_cursor_index_report(SampleNoModelCursorCriteria)
+
+        # Then:
+        self.assertFalse(rank_report.is_supported)
+        self.assertIn('rank', rank_report.message)
+        self.assertFalse(no_model_report.is_supported)
+        self.assertEqual(no_model_report.message, 'model 이 지정되지 않았습니다.')
+
+    def test_get_cursor_index_reports_should_discover_app_cursor_criteria(self):
+        # When:
+        reports = get_cursor_index_reports()
+
+        # Then:
+        self.assertIn(PointProductCursorCriteria, [report.cursor_criteria for report in reports])
@@ -1,7 +1,14 @@
+import inspect
 from collections import defaultdict
+from collections.abc import Mapping
 from functools import wraps
 from types import FunctionType
-from typing import Type
+from typing import (
+    Callable,
+    Optional,
+    Tuple,
+    Type,
+)
 
 from common.common_criteria.cursor_criteria import CursorCriteria
 from common.common_exceptions.exceptions import (
@@ -15,173 +22,207 @@ from rest_framework.exceptions import APIException
 from rest_framework.request import Request
 
 
-def mandatories(*keys):
-    def _mandatories(func):
+REQUEST_TYPES = (WSGIRequest, HttpRequest, Request)
+
+_NOT_LOADED = object()
+
+
+class RequestParameters:
+    """
+    요청 하나의 파라미터 조회
+
+    GET 요청은 request.GET, 나머지는 request.POST 를 먼저 보고 없으면 request.data 를 봅니다.
+    request.data 는 처음 필요할 때 한 번만 읽습니다.
+    """
+
+    def __init__(self, request) -> None:
+        self.request = request
+        self.params = request.GET if request.method == 'GET' else request.POST
+        self._data = _NOT_LOADED
+
+    @property
+    def data(self):
+        if self._data is _NOT_LOADED:
+            try:
+                self._data = self.request.data
+            except Exception:
+                self._data = None
+        return self._data
+
+    def get(self, key: str) -> Tuple[bool, Optional[object]]:
+        """
+        (찾았는지 여부, 값)
+        """
+        if key in self.params:
+            return True, self.params[key]
+        data = self.data
+        if isinstance(data, Mapping) and key in data:
+            return True, data[key]
+        return False, None
+
+
+class RequestParameterBinder:
+    """
+    view 함수 하나에 쌓인 파라미터 decorator 들의 추출 계획
+
+    decorator 가 적용될 때 request 인자 위치를 미리 찾아두고,
+    여러 decorator 를 쌓아도 wrapper 하나에서 request 를 한 번만 찾고 파라미터를 한 번만 읽습니다.
+    steps 는 바깥 decorator 부터 실행되며 각각 func 에 넘길 kwargs 를 반환합니다.
+    """
+
+    def __init__(self, func: Callable) -> None:
+        self.func = func
+        self.request_index = self._get_request_index(func)
+        self.steps = []
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Here we assume that the first argument is the request
-            request = next((x for x in args if isinstance(x, (WSGIRequest, HttpRequest, Request))), None)
+            request = self.get_request(args, kwargs)
             if request is None:
                 raise CodeInvalidateException()
-            mandatory = dict()
-            error_dict = defaultdict(list)
-            for key in keys:
-                try:
-                    if request.method == 'GET':
-                        data = request.GET[key]
-                    else:
-                        data = request.POST[key]
-                    if data in ['', None]:
-                        error_dict[key].append(f'{key} 입력값을 확인해주세요.')
-                        continue
-                except KeyError:
-                    try:
-                        json_body = request.data
-                        data = json_body[key]
-                        if data in ['', None]:
-                            error_dict[key].append(f'{key} 입력값을 확인해주세요.')
-                            continue
-                    except Exception:
-                        error_dict[key].append(f'{key} 입력값을 확인해주세요.')
-                        continue
-                mandatory[key] = data
-            if error_dict:
-                raise MissingMandatoryParameterException(
-                    errors=error_dict
-                )
-            return func(m=mandatory, *args, **kwargs)
-        return wrapper
-
+            parameters = RequestParameters(request)
+            for step in self.steps:
+                kwargs.update(step(parameters))
+            return self.func(*args, **kwargs)
+
+        wrapper.request_parameter_binder = self
+        self.wrapper = wrapper
+
+    @staticmethod
+    def _get_request_index(func: Callable) -> Optional[int]:
+        try:
+            parameter_names = list(inspect.signature(func).parameters)
+        except (TypeError, ValueError):
+            return None
+        if 'request' in parameter_names:
+            return parameter_names.index('request')
+        return None
+
+    def get_request(self, args: tuple, kwargs: dict):
+        request_index = self.request_index
+        if request_index is not None:
+            if request_index < len(args):
+                request = args[request_index]
+            else:
+                request = kwargs.get('request')
+            if isinstance(request, REQUEST_TYPES):
+                return request
+        # 서명으로 위치를 알 수 없으면 기존처럼 인자에서 찾습니다.
+        return next((x for x in args if isinstance(x, REQUEST_TYPES)), None)
+
+    @classmethod
+    def bind(cls, func: Callable, step: Callable[[RequestParameters], dict]) -> Callable:
+        """
+        func 가 이미 binder 의 wrapper 이면 step 을 앞에 추가하고, 아니면 새 wrapper 를 만듭니다.
+        """
+        binder = getattr(func, 'request_parameter_binder', None)
+        if binder is None or binder.wrapper is not func:
+            binder = cls(func)
+        binder.steps.insert(0, step)
+        return binder.wrapper
+
+
+def _bind_parameters(step: Callable[[RequestParameters], dict]):
     def decorator(cls_or_func):
         if isinstance(cls_or_func, FunctionType):
-            return _mandatories(cls_or_func)
+            return RequestParameterBinder.bind(cls_or_func, step)
         else:
             for attr_name, attr_value in cls_or_func.__dict__.items():
                 if callable(attr_value):
-                    setattr(cls_or_func, attr_name, _mandatories(attr_value))
+                    setattr(cls_or_func, attr_name, RequestParameterBinder.bind(attr_value, step))
             return cls_or_func
 
     return decorator
 
 
+def mandatories(*keys):
+    def _mandatories(parameters: RequestParameters) -> dict:
+        mandatory = dict()
+        error_dict = defaultdict(list)
+        for key in keys:
+            is_found, data = parameters.get(key)
+            if not is_found or data in ['', None]:
+                error_dict[key].append(f'{key} 입력값을 확인해주세요.')
+                continue
+            mandatory[key] = data
+        if error_dict:
+            raise MissingMandatoryParameterException(
+                errors=error_dict
+            )
+        return {'m': mandatory}
+
+    return _bind_parameters(_mandatories)
+
+
 def optionals(*keys):
-    def _optionals(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Here we assume that the first argument is the request
-            request = next((x for x in args if isinstance(x, (WSGIRequest, HttpRequest, Request))), None)
-            if request is None:
-                raise CodeInvalidateException()
-            optional = dict()
-            for arg in keys:
-                for key, val in arg.items():
-                    try:
-                        if request.method == 'GET':
-                            data = request.GET[key]
-                        else:
-                            data = request.POST[key]
-                        if data is None:
-                            data = val
-                    except KeyError:
-                        try:
-                            json_body = request.data
-                            data = json_body[key]
-                            if data is None:
-                                data = val
-                        except Exception:
-                            data = val
-                    optional[key] = data
-            return func(o=optional, *args, **kwargs)
-        return wrapper
+    defaults = tuple(
+        (key, val)
+        for arg in keys
+        for key, val in arg.items()
+    )
 
-    def decorator(cls_or_func):
-        if isinstance(cls_or_func, FunctionType):
-            return _optionals(cls_or_func)
-        else:
-            for attr_name, attr_value in cls_or_func.__dict__.items():
-                if callable(attr_value):
-                    setattr(cls_or_func, attr_name, _optionals(attr_value))
-            return cls_or_func
+    def _optionals(parameters: RequestParameters) -> dict:
+        optional = dict()
+        for key, val in defaults:
+            _, data = parameters.get(key)
+            optional[key] = val if data is None else data
+        return {'o': optional}
 
-    return decorator
+    return _bind_parameters(_optionals)
 
 
 def pagination(default_size=10):
-    def _paging(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Here we assume that the first argument is the request
-            request = next((x for x in args if isinstance(x, (WSGIRequest, HttpRequest, Request))), None)
-            if request is None:
-                raise CodeInvalidateException()
-            try:
-                page = int(request.GET.get('page', 1)) - 1
-                size = int(request.GET.get('size', default_size))
-                start_row = page * size
-                end_row = (page + 1) * size
-            except APIException as e:
-                raise APIException(e)
-            return func(start_row=start_row, end_row=end_row, *args, **kwargs)
-        return wrapper
-
-    def decorator(cls_or_func):
-        if isinstance(cls_or_func, FunctionType):
-            return _paging(cls_or_func)
-        else:
-            for attr_name, attr_value in cls_or_func.__dict__.items():
-                if callable(attr_value):
-                    setattr(cls_or_func, attr_name, _paging(attr_value))
-            return cls_or_func
+    def _paging(parameters: RequestParameters) -> dict:
+        request = parameters.request
+        try:
+            page = int(request.GET.get('page', 1)) - 1
+            size = int(request.GET.get('size', default_size))
+            start_row = page * size
+            end_row = (page + 1) * size
+        except APIException as e:
+            raise APIException(e)
+        return {'start_row': start_row, 'end_row': end_row}
 
-    return decorator
+    return _bind_parameters(_paging)
 
 
 def cursor_pagination(default_size=10, cursor_criteria: list[Type[CursorCriteria]] = None):
     if cursor_criteria is None:
         cursor_criteria = []
 
-    def _validate_criteria(_decoded_next_cursor: dict):
+    def _decode_next_cursor(base64_next_cursor: str) -> dict:
+        """
+        cursor_criteria 중 서명과 형식이 맞는 것으로 decode 합니다.
+        """
         if not cursor_criteria:
-            return
+            return urlsafe_base64_to_data(base64_next_cursor)
 
         for c in cursor_criteria:
-            if c.is_valid_decoded_cursor(_decoded_next_cursor):
-                return
+            try:
+                decoded_next_cursor = c.decode_cursor(base64_next_cursor)
+            except ValueError:
+                continue
+            if c.is_valid_decoded_cursor(decoded_next_cursor):
+                return decoded_next_cursor
 
         raise APIException('Invalid next_cursor.')
 
-    def _paging(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Here we assume that the first argument is the request
-            request = next((x for x in args if isinstance(x, (WSGIRequest, HttpRequest, Request))), None)
-            if request is None:
-                raise CodeInvalidateException()
-            base64_next_cursor = request.GET.get('next_cursor')
-            if base64_next_cursor is not None:
-                try:
-                    decoded_next_cursor = urlsafe_base64_to_data(base64_next_cursor)
-                    _validate_criteria(decoded_next_cursor)
-                except ValueError:
-                    raise APIException('Invalid next_cursor.')
-            else:
-                decoded_next_cursor = {}
-
+    def _paging(parameters: RequestParameters) -> dict:
+        request = parameters.request
+        base64_next_cursor = request.GET.get('next_cursor')
+        if base64_next_cursor is not None:
             try:
-                size = int(request.GET.get('size', default_size))
-            except (TypeError, ValueError):
-                raise APIException('Invalid size.')
+                decoded_next_cursor = _decode_next_cursor(base64_next_cursor)
+            except ValueError:
+                raise APIException('Invalid next_cursor.')
+        else:
+            decoded_next_cursor = {}
 
-            return func(decoded_next_cursor=decoded_next_cursor, size=size, *args, **kwargs)
-        return wrapper
+        try:
+            size = int(request.GET.get('size', default_size))
+        except (TypeError, ValueError):
+            raise APIException('Invalid size.')
 
-    def decorator(cls_or_func):
-        if isinstance(cls_or_func, FunctionType):
-            return _paging(cls_or_func)
-        else:
-            for attr_name, attr_value in cls_or_func.__dict__.items():
-                if callable(attr_value):
-                    setattr(cls_or_func, attr_name, _paging(attr_value))
-            return cls_or_func
+        return {'decoded_next_cursor': decoded_next_cursor, 'size': size}
 
-    return decorator
+    return _bind_parameters(_paging)
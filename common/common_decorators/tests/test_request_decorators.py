@@ -1,4 +1,8 @@
+from unittest.mock import patch
+
 from common.common_decorators.request_decorators import (
+    RequestParameters,
+    cursor_pagination,
     mandatories,
     optionals,
 )
@@ -7,7 +11,13 @@ from common.common_exceptions.exceptions import (
     MissingMandatoryParameterException,
 )
 from django.http import HttpRequest
-from django.test import TestCase
+from django.test import (
+    RequestFactory,
+    TestCase,
+)
+from rest_framework.exceptions import APIException
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
 
 
 @mandatories('param1', 'param2')
@@ -153,3 +163,86 @@ class TestOptionalsDecorator(TestCase):
 
         with self.assertRaises(CodeInvalidateException):
             InvalidViewClass().method()
+
+
+class MyStackedViewClass:
+    @cursor_pagination(default_size=20)
+    @mandatories('q')
+    @optionals({'map_id': None})
+    def my_method(self, request, decoded_next_cursor, size, m, o):
+        return decoded_next_cursor, size, m, o
+
+
+class TestStackedRequestDecorators(TestCase):
+
+    def test_stacked_decorators_should_share_single_wrapper(self):
+        # Given: 쌓인 decorator
+        binder = MyStackedViewClass.my_method.request_parameter_binder
+
+        # Then: wrapper 하나에 바깥 decorator 부터 추출 단계가 쌓입니다.
+        self.assertIs(binder.wrapper, MyStackedViewClass.my_method)
+        self.assertEqual(len(binder.steps), 3)
+        # And: request 위치는 decorator 적용 시점에 정해집니다.
+        self.assertEqual(binder.request_index, 1)
+
+    def test_stacked_decorators_should_read_request_once(self):
+        # Given: GET 요청
+        request = HttpRequest()
+        request.method = 'GET'
+        request.GET = {'q': 'keyword', 'size': '5'}
+
+        # When: 쌓인 decorator 가 적용된 메서드 호출
+        with patch(
+                'common.common_decorators.request_decorators.RequestParameters',
+                wraps=RequestParameters,
+        ) as mock_request_parameters:
+            response = MyStackedViewClass().my_method(request)
+
+        # Then: 모든 파라미터가 전달됩니다.
+        self.assertEqual(response, ({}, 5, {'q': 'keyword'}, {'map_id': None}))
+        # And: 요청 파라미터는 한 번만 읽습니다.
+        self.assertEqual(mock_request_parameters.call_count, 1)
+
+    def test_stacked_decorators_should_raise_outer_error_first(self):
+        # Given: 잘못된 size 와 누락된 필수값
+        request = HttpRequest()
+        request.method = 'GET'
+        request.GET = {'size': 'invalid'}
+
+        # Expect: 바깥 decorator 의 에러가 먼저 발생합니다.
+        with self.assertRaises(APIException) as e:
+            MyStackedViewClass().my_method(request)
+        self.assertEqual(str(e.exception.detail), 'Invalid size.')
+
+    def test_decorators_should_fall_back_to_json_body(self):
+        # Given: JSON body 요청
+        request = Request(
+            RequestFactory().post(
+                '/',
+                data={'param1': 'value1', 'param2': None},
+                content_type='application/json',
+            ),
+            parsers=[JSONParser()],
+        )
+
+        # When: 선택값 조회
+        optional = my_optional_view_function(request)
+
+        # Then: request.POST 에 없으면 request.data 에서 찾고, None 이면 기본값을 사용합니다.
+        self.assertEqual(optional, {'param1': 'value1', 'param2': 'default_value2'})
+        # And: 빈 값인 필수값은 에러입니다.
+        with self.assertRaises(MissingMandatoryParameterException) as e:
+            my_mandatories_view_function(request)
+        self.assertEqual(e.exception.errors, {'param2': ['param2 입력값을 확인해주세요.']})
+
+    def test_decorator_should_find_request_passed_as_keyword(self):
+        # Given: GET 요청
+        request = HttpRequest()
+        request.method = 'GET'
+        request.GET = {'param1': 'value1', 'param2': 'value2'}
+
+        # When: request 를 keyword 로 전달
+        response = my_mandatories_view_function(request=request)
+
+        # Then: request 를 찾아 필수값을 전달합니다.
+        self.assertEqual(response, {'param1': 'value1', 'param2': 'value2'})
@@ -3,7 +3,22 @@ from django.test import (
     Client,
     TestCase,
 )
-from member.models import Guest
+from map.models import Map
+from member.consts import AcquisitionPKType
+from member.models import (
+    Guest,
+    Member,
+    MemberMapSubscription,
+    MemberNodeAcquisition,
+)
+from network.models import (
+    Arrow,
+    ArrowAcquisitionQuestionAnswer,
+    ArrowAcquisitionQuestionRule,
+    ArrowAcquisitionRule,
+    Node,
+    NodeAcquisitionRule,
+)
 from order.models import (
     Order,
     OrderItem,
@@ -65,6 +80,91 @@ def test_case_create_order_item(
     )
 
 
+def test_case_create_map(created_by: Member, title: str = 'map', **kwargs) -> Map:
+    return Map.objects.create(
+        created_by=created_by,
+        title=title,
+        description=kwargs.get('description', title),
+        main_image_url=kwargs.get('main_image_url'),
+        is_deleted=kwargs.get('is_deleted', False),
+    )
+
+
+def test_case_create_node(map: Map, title: str, **kwargs) -> Node:
+    return Node.objects.create(
+        map=map,
+        created_by=kwargs.get('created_by', map.created_by),
+        simple_word=kwargs.get('simple_word', title),
+        title=title,
+        description=kwargs.get('description', title),
+        phase=kwargs.get('phase'),
+        is_deleted=kwargs.get('is_deleted', False),
+    )
+
+
+def test_case_create_arrow(source_node: Node, target_node: Node, **kwargs) -> Arrow:
+    title = kwargs.get('title', f'{source_node.title}-{target_node.title}')
+    return Arrow.objects.create(
+        map_id=source_node.map_id,
+        created_by=kwargs.get('created_by', source_node.created_by),
+        simple_word=kwargs.get('simple_word', title),
+        title=title,
+        description=kwargs.get('description', title),
+        source_node=source_node,
+        target_node=target_node,
+        is_deleted=kwargs.get('is_deleted', False),
+    )
+
+
+def test_case_create_node_acquisition_rule(node: Node, arrows: list, **kwargs) -> NodeAcquisitionRule:
+    node_acquisition_rule = NodeAcquisitionRule.objects.create(
+        node=node,
+        title=kwargs.get('title'),
+        is_deleted=kwargs.get('is_deleted', False),
+    )
+    node_acquisition_rule.arrows.set(arrows)
+    return node_acquisition_rule
+
+
+def test_case_create_member_node_acquisition(member_map_subscription: MemberMapSubscription,
+                                             node: Node,
+                                             **kwargs) -> MemberNodeAcquisition:
+    return MemberNodeAcquisition.objects.create(
+        member_map_subscription=member_map_subscription,
+        map_id=node.map_id,
+        node=node,
+        acquisition_pk=kwargs.get('acquisition_pk'),
+        acquisition_pk_type=kwargs.get('acquisition_pk_type', AcquisitionPKType.START_NODE.value),
+        is_deleted=kwargs.get('is_deleted', False),
+    )
+
+
+def test_case_create_arrow_acquisition_rule(arrow: Arrow, **kwargs) -> ArrowAcquisitionRule:
+    return ArrowAcquisitionRule.objects.create(
+        arrow=arrow,
+        is_deleted=kwargs.get('is_deleted', False),
+    )
+
+
+def test_case_create_arrow_acquisition_question_rule(arrow_acquisition_rule: ArrowAcquisitionRule,
+                                                     question: str,
+                                                     answers: list = None,
+                                                     **kwargs) -> ArrowAcquisitionQuestionRule:
+    question_rule = ArrowAcquisitionQuestionRule.objects.create(
+        arrow_acquisition_rule=arrow_acquisition_rule,
+        question=question,
+        is_auto_mark=kwargs.get('is_auto_mark', False),
+        is_always_correct=kwargs.get('is_always_correct', False),
+        is_deleted=kwargs.get('is_deleted', False),
+    )
+    for answer in answers or []:
+        ArrowAcquisitionQuestionAnswer.objects.create(
+            arrow_acquisition_question_rule=question_rule,
+            answer=answer,
+        )
+    return question_rule
+
+
 class GuestTokenMixin(TestCase):
     # 모킹할 메서드 생성
     def setUp(self):
@@ -1,6 +1,24 @@
 import base64
 import json
-from typing import Any
+import struct
+from datetime import (
+    date,
+    timedelta,
+)
+from typing import (
+    Any,
+    List,
+)
+
+from common.common_utils.encode_utils import (
+    EPOCH,
+    get_compact_cursor_mac,
+)
+from common.consts import (
+    COMPACT_CURSOR_MAC_SIZE,
+    COMPACT_CURSOR_VERSION,
+)
+from django.utils.crypto import constant_time_compare
 
 
 def urlsafe_base64_to_data(base64_str: str) -> Any:
@@ -11,3 +29,68 @@ def urlsafe_base64_to_data(base64_str: str) -> Any:
     except Exception:
         raise ValueError
     return data
+
+
+def _urlsafe_base64_to_bytes(base64_str: str) -> bytes:
+    try:
+        return base64.urlsafe_b64decode(base64_str.encode('utf-8') + b'=' * (-len(base64_str) % 4))
+    except Exception:
+        raise ValueError
+
+
+def is_compact_cursor(base64_str: str) -> bool:
+    """
+    JSON cursor 는 '{' 로 시작하므로 첫 byte 로 구분합니다.
+    """
+    try:
+        payload = _urlsafe_base64_to_bytes(base64_str[:4])
+    except ValueError:
+        return False
+    return bool(payload) and payload[0] == COMPACT_CURSOR_VERSION
+
+
+def _unpack_cursor_values(payload: bytes) -> List[Any]:
+    values = []
+    offset = 1
+    while offset < len(payload):
+        tag = payload[offset:offset + 1]
+        offset += 1
+        if tag == b'n':
+            values.append(None)
+            continue
+        if tag == b's':
+            (length,) = struct.unpack_from('>H', payload, offset)
+            offset += 2
+            if offset + length > len(payload):
+                raise ValueError
+            values.append(payload[offset:offset + length].decode('utf-8'))
+            offset += length
+            continue
+
+        fmt = {b'b': '>?', b'i': '>i', b'q': '>q', b'f': '>d', b't': '>q', b'd': '>i'}.get(tag)
+        if fmt is None:
+            raise ValueError
+        (value,) = struct.unpack_from(fmt, payload, offset)
+        offset += struct.calcsize(fmt)
+        if tag == b't':
+            value = EPOCH + timedelta(microseconds=value)
+        elif tag == b'd':
+            value = date.fromordinal(value)
+        values.append(value)
+    return values
+
+
+def compact_cursor_to_values(base64_str: str, salt: str) -> List[Any]:
+    """
+    values_to_compact_cursor 로 만든 cursor 의 HMAC 을 확인하고 값 목록을 반환합니다.
+    """
+    raw = _urlsafe_base64_to_bytes(base64_str)
+    payload, mac = raw[:-COMPACT_CURSOR_MAC_SIZE], raw[-COMPACT_CURSOR_MAC_SIZE:]
+    if not payload or payload[0] != COMPACT_CURSOR_VERSION:
+        raise ValueError
+    if not constant_time_compare(mac, get_compact_cursor_mac(payload, salt)):
+        raise ValueError
+    try:
+        return _unpack_cursor_values(payload)
+    except (struct.error, UnicodeDecodeError, OverflowError):
+        raise ValueError
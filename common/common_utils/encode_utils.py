@@ -1,6 +1,25 @@
 import base64
 import json
-from typing import Any
+import struct
+from datetime import (
+    date,
+    datetime,
+    timezone as dt_timezone,
+)
+from typing import (
+    Any,
+    Iterable,
+)
+
+from common.consts import (
+    COMPACT_CURSOR_MAC_SIZE,
+    COMPACT_CURSOR_VERSION,
+)
+from django.utils import timezone
+from django.utils.crypto import salted_hmac
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
 
 
 def data_to_urlsafe_base64(data: Any) -> str:
@@ -8,3 +27,40 @@ def data_to_urlsafe_base64(data: Any) -> str:
     json_bytes = json_str.encode('utf-8')
     base64_str = base64.urlsafe_b64encode(json_bytes).decode('utf-8')
     return base64_str
+
+
+def _pack_cursor_value(value: Any) -> bytes:
+    if value is None:
+        return b'n'
+    if isinstance(value, bool):
+        return b'b' + struct.pack('>?', value)
+    if isinstance(value, int):
+        if -2 ** 31 <= value < 2 ** 31:
+            return b'i' + struct.pack('>i', value)
+        return b'q' + struct.pack('>q', value)
+    if isinstance(value, float):
+        return b'f' + struct.pack('>d', value)
+    if isinstance(value, datetime):
+        if timezone.is_naive(value):
+            value = timezone.make_aware(value)
+        delta = value - EPOCH
+        return b't' + struct.pack('>q', (delta.days * 86400 + delta.seconds) * 10 ** 6 + delta.microseconds)
+    if isinstance(value, date):
+        return b'd' + struct.pack('>i', value.toordinal())
+    if isinstance(value, str):
+        encoded_value = value.encode('utf-8')
+        return b's' + struct.pack('>H', len(encoded_value)) + encoded_value
+    raise ValueError(f'Unsupported cursor value type: {type(value).__name__}')
+
+
+def get_compact_cursor_mac(payload: bytes, salt: str) -> bytes:
+    return salted_hmac(salt, payload, algorithm='sha256').digest()[:COMPACT_CURSOR_MAC_SIZE]
+
+
+def values_to_compact_cursor(values: Iterable[Any], salt: str) -> str:
+    """
+    key 이름 없이 값만 순서대로 struct 로 묶고 salt 별 HMAC 을 붙인 urlsafe base64 (padding 제외)
+    datetime 은 epoch microsecond 로 담습니다.
+    """
+    payload = bytes([COMPACT_CURSOR_VERSION]) + b''.join(_pack_cursor_value(value) for value in values)
+    return base64.urlsafe_b64encode(payload + get_compact_cursor_mac(payload, salt)).decode('utf-8').rstrip('=')
@@ -50,3 +50,20 @@ def upload_file_to_pre_signed_url(pre_signed_url: str, pre_signed_data: dict, fi
         return response.status_code == 204
     except Exception:
         return False
+
+
+def upload_file_to_s3(file_name: str, file: bytes, _type: str = 'common', unique: str = '0') -> bool:
+    """
+    {_type}/{unique}/{file_name} 에 업로드합니다.
+    """
+    pre_signed_url_info = generate_pre_signed_url_info(
+        file_name,
+        _type=_type,
+        unique=unique,
+        same_file_name=True,
+    )
+    return upload_file_to_pre_signed_url(
+        pre_signed_url_info['url'],
+        pre_signed_url_info['fields'],
+        file,
+    )
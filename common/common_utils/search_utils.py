@@ -0,0 +1,33 @@
+import hashlib
+
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import (
+    FloatField,
+    Func,
+)
+from django.db.models.functions import (
+    Cast,
+    Greatest,
+)
+
+
+def normalize_search_query(query: str) -> str:
+    return ' '.join(query.split()).lower()
+
+
+def get_trigram_rank(query: str, *fields: str) -> Func:
+    """
+    필드별 트라이그램 유사도 중 가장 큰 값
+    cursor 에 그대로 담아 다시 비교할 수 있도록 double precision 으로 변환합니다.
+    """
+    similarities = [TrigramSimilarity(field, query) for field in fields]
+    return Cast(
+        Greatest(*similarities) if len(similarities) > 1 else similarities[0],
+        FloatField(),
+    )
+
+
+def get_search_cache_key(key_format: str, *args) -> str:
+    return key_format.format(
+        hashlib.md5('|'.join(str(arg) for arg in args).encode('utf-8')).hexdigest()
+    )
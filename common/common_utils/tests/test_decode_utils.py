@@ -1,7 +1,20 @@
 import base64
 import json
+from datetime import (
+    date,
+    datetime,
+    timezone,
+)
 
-from common.common_utils.decode_utils import urlsafe_base64_to_data
+from common.common_utils.decode_utils import (
+    compact_cursor_to_values,
+    is_compact_cursor,
+    urlsafe_base64_to_data,
+)
+from common.common_utils.encode_utils import (
+    data_to_urlsafe_base64,
+    values_to_compact_cursor,
+)
 from django.test import TestCase
 
 
@@ -37,3 +50,53 @@ class TestUrlSafeBase64ToData(TestCase):
         # 함수 테스트 및 예외 검증
         with self.assertRaises(ValueError):
             urlsafe_base64_to_data(invalid_base64_str)
+
+
+class TestCompactCursorToValues(TestCase):
+    def test_compact_cursor_round_trip(self):
+        # Given: 타입별 값
+        values = [
+            1,
+            2 ** 40,
+            -3,
+            0.25,
+            'rank',
+            None,
+            True,
+            datetime(2021, 8, 1, 3, 0, 0, 123, tzinfo=timezone.utc),
+            date(2021, 8, 1),
+        ]
+
+        # When:
+        cursor = values_to_compact_cursor(values, 'salt')
+
+        # Then: 값이 그대로 복원됩니다.
+        self.assertTrue(is_compact_cursor(cursor))
+        self.assertEqual(compact_cursor_to_values(cursor, 'salt'), values)
+
+    def test_compact_cursor_should_be_smaller_than_json_cursor(self):
+        # Given:
+        data = {'ordering__gt': 1, 'id__gt': 12345}
+
+        # When:
+        compact_cursor = values_to_compact_cursor(data.values(), 'salt')
+        json_cursor = data_to_urlsafe_base64(data)
+
+        # Then:
+        self.assertLess(len(compact_cursor), len(json_cursor))
+        self.assertFalse(is_compact_cursor(json_cursor))
+
+    def test_compact_cursor_should_raise_when_salt_is_different(self):
+        # Given:
+        cursor = values_to_compact_cursor([1], 'salt')
+
+        # Expect:
+        with self.assertRaises(ValueError):
+            compact_cursor_to_values(cursor, 'other_salt')
+
+    def test_compact_cursor_should_raise_when_cursor_is_broken(self):
+        # Expect:
+        with self.assertRaises(ValueError):
+            compact_cursor_to_values('AQ', 'salt')
+        with self.assertRaises(ValueError):
+            compact_cursor_to_values('이건 잘못된 cursor', 'salt')
@@ -9,6 +9,7 @@ from botocore.exceptions import NoCredentialsError
 from common.common_utils.s3_utils import (
     generate_pre_signed_url_info,
     upload_file_to_pre_signed_url,
+    upload_file_to_s3,
 )
 from django.conf import settings
 from django.test import TestCase
@@ -112,3 +113,32 @@ class TestUploadFileToPreSignedURL(unittest.TestCase):
 
         # Then: Assert that the function returns False when an exception occurs
         self.assertFalse(result)
+
+
+class TestUploadFileToS3(TestCase):
+    @patch('common.common_utils.s3_utils.upload_file_to_pre_signed_url')
+    @patch('common.common_utils.s3_utils.generate_pre_signed_url_info')
+    def test_upload_file_to_s3(self, mock_generate_pre_signed_url_info, mock_upload_file_to_pre_signed_url):
+        # Given:
+        mock_generate_pre_signed_url_info.return_value = {
+            'url': 'https://s3-bucket-url.com',
+            'fields': {'key': 'test/123/test.csv'},
+        }
+        mock_upload_file_to_pre_signed_url.return_value = True
+
+        # When:
+        result = upload_file_to_s3('test.csv', b'file_content', 'test', '123')
+
+        # Then: 같은 파일 이름으로 업로드
+        self.assertTrue(result)
+        mock_generate_pre_signed_url_info.assert_called_once_with(
+            'test.csv',
+            _type='test',
+            unique='123',
+            same_file_name=True,
+        )
+        mock_upload_file_to_pre_signed_url.assert_called_once_with(
+            'https://s3-bucket-url.com',
+            {'key': 'test/123/test.csv'},
+            b'file_content',
+        )
@@ -8,7 +8,10 @@ from common.common_utils.token_utils import (
     jwt_payload_handler,
 )
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import (
+    TestCase,
+    override_settings,
+)
 from freezegun import freeze_time
 from member.models import Guest
 from rest_framework_jwt.settings import api_settings
@@ -84,3 +87,20 @@ class JWTPayloadHandlerTest(TestCase):
                 'exp': datetime.utcnow() + api_settings.JWT_EXPIRATION_DELTA,
             }
         )
+
+    @freeze_time('2020-01-01 00:00:00')
+    @override_settings(JWT_STATUS_CLAIMS_ENABLED=True)
+    @patch('common.common_utils.token_utils.get_guest_revocation_version', return_value=7)
+    def test_jwt_payload_handler_with_status_claims(self, mock_get_guest_revocation_version):
+        # When:
+        payload = jwt_payload_handler(self.guest)
+
+        # Then: 서명되는 status claim 포함
+        self.assertDictEqual(
+            payload['status'],
+            {
+                'is_blacklisted': False,
+                'member_status_id': self.guest.member.member_status_id,
+                'revocation_version': 7,
+            }
+        )
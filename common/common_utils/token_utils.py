@@ -3,6 +3,8 @@ from datetime import (
     timedelta,
 )
 
+from django.conf import settings
+from member.helpers.revocation_helpers import get_guest_revocation_version
 from rest_framework_jwt.settings import api_settings
 
 
@@ -15,6 +17,13 @@ def jwt_payload_handler(guest: 'Guest') -> dict:  # noqa
         'member_id': guest.member_id,
         'exp': datetime.utcnow() + api_settings.JWT_EXPIRATION_DELTA,
     }
+    if settings.JWT_STATUS_CLAIMS_ENABLED:
+        # 서명된 claim 이므로 발급 이후 차단되지 않았다면(revocation_version) DB 조회 없이 신뢰할 수 있습니다.
+        payload['status'] = {
+            'is_blacklisted': guest.is_blacklisted,
+            'member_status_id': guest.member.member_status_id if guest.member_id else None,
+            'revocation_version': get_guest_revocation_version(),
+        }
     return payload
 
 
@@ -1,3 +1,26 @@
 IMAGE_CONSTANCE_TYPES = {
     'member-image',
 }
+
+# 버퍼링 후 일괄 반영하는 카운터 {model label: (field, ...)}
+BUFFERED_COUNTER_FIELDS = {
+    'network.Node': ('total_acquisition_count',),
+    'network.Arrow': ('total_acquisition_count',),
+    'map.Map': ('subscribed_count', 'once_subscribed_count'),
+    'product.PointProduct': ('bought_count',),
+}
+COUNTER_BUFFER_KEY = 'counter:buffer'
+COUNTER_BUFFER_FLUSHING_KEY = 'counter:buffer:flushing'
+COUNTER_BUFFER_BATCH_ID_FIELD = 'batch_id'
+COUNTER_BUFFER_FIELD_FORMAT = '{}|{}|{}'
+# 동시에 하나의 flush 만 실행되도록 잡는 lock
+COUNTER_FLUSH_LOCK_KEY = 'counter:flush:lock'
+COUNTER_FLUSH_LOCK_TIMEOUT_MS = 5 * 60 * 1000
+
+# 트라이그램 검색
+SEARCH_SIMILARITY_THRESHOLD = 0.3
+SEARCH_CACHE_TTL = 30
+
+# 압축 cursor: version(1 byte) + (type tag + struct 값)... + HMAC-SHA256 앞 8 byte
+COMPACT_CURSOR_VERSION = 1
+COMPACT_CURSOR_MAC_SIZE = 8
@@ -0,0 +1,148 @@
+import uuid
+from collections import defaultdict
+from typing import (
+    Dict,
+    Iterable,
+)
+
+from common.consts import (
+    BUFFERED_COUNTER_FIELDS,
+    COUNTER_BUFFER_BATCH_ID_FIELD,
+    COUNTER_BUFFER_FIELD_FORMAT,
+    COUNTER_BUFFER_FLUSHING_KEY,
+    COUNTER_BUFFER_KEY,
+    COUNTER_FLUSH_LOCK_KEY,
+    COUNTER_FLUSH_LOCK_TIMEOUT_MS,
+)
+from common.models import CounterFlushLog
+from django.apps import apps
+from django.db import (
+    IntegrityError,
+    transaction,
+)
+from django.db.models import F
+from django_redis import get_redis_connection
+from redis.exceptions import ResponseError
+
+
+# flushing key 의 batch_id 가 같을 때만 삭제합니다.
+DELETE_FLUSHING_BATCH_SCRIPT = """
+if redis.call('HGET', KEYS[1], ARGV[1]) == ARGV[2] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+# lock 을 잡은 flush 의 token 일 때만 lock 을 해제합니다.
+RELEASE_FLUSH_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def _get_redis():
+    return get_redis_connection('default')
+
+
+def increase_counters(model_label: str, field: str, pks: Iterable[int], delta: int = 1) -> None:
+    """
+    카운터 증가분을 Redis 버퍼에 누적합니다. DB 에는 flush_counter_buffer 에서 반영됩니다.
+    """
+    if field not in BUFFERED_COUNTER_FIELDS.get(model_label, ()):
+        raise ValueError(f'{model_label}.{field} is not a buffered counter.')
+
+    pipeline = _get_redis().pipeline(transaction=False)
+    for pk in pks:
+        pipeline.hincrby(COUNTER_BUFFER_KEY, COUNTER_BUFFER_FIELD_FORMAT.format(model_label, field, pk), delta)
+    pipeline.execute()
+
+
+def increase_counters_on_commit(model_label: str, field: str, pks: Iterable[int], delta: int = 1) -> None:
+    """
+    롤백된 트랜잭션의 증가분은 누적하지 않도록 커밋 이후에 누적합니다.
+    """
+    pks = list(pks)
+    if pks:
+        transaction.on_commit(lambda: increase_counters(model_label, field, pks, delta))
+
+
+def _apply_counter_deltas(batch_id: str, deltas: Dict[str, int]) -> int:
+    """
+    batch 의 증가분을 Row 당 UPDATE 한 번으로 반영합니다.
+    이미 반영된 batch 이면 아무것도 하지 않고 0 을 반환합니다.
+    """
+    pk_deltas_by_counter = defaultdict(dict)
+    for counter_field, delta in deltas.items():
+        model_label, field, pk = counter_field.split('|')
+        if delta:
+            pk_deltas_by_counter[(model_label, field)][int(pk)] = delta
+
+    with transaction.atomic():
+        try:
+            with transaction.atomic():
+                CounterFlushLog.objects.create(batch_id=batch_id, counter_count=len(deltas))
+        except IntegrityError:
+            return 0
+
+        updated_count = 0
+        for (model_label, field), pk_deltas in sorted(pk_deltas_by_counter.items()):
+            # Map 버전을 올리지 않도록 기본 QuerySet 으로 UPDATE 합니다.
+            model_base_manager = apps.get_model(model_label)._base_manager
+            for pk in sorted(pk_deltas):
+                updated_count += model_base_manager.filter(pk=pk).update(
+                    **{field: F(field) + pk_deltas[pk]}
+                )
+        return updated_count
+
+
+def _delete_flushing_batch(redis, batch_id: str) -> None:
+    """
+    반영한 batch 만 삭제합니다. 그사이 다음 batch 가 flushing key 로 옮겨졌다면 남겨 둡니다.
+    """
+    redis.eval(DELETE_FLUSHING_BATCH_SCRIPT, 1, COUNTER_BUFFER_FLUSHING_KEY, COUNTER_BUFFER_BATCH_ID_FIELD, batch_id)
+
+
+def _flush_flushing_batch(redis) -> int:
+    redis.hsetnx(COUNTER_BUFFER_FLUSHING_KEY, COUNTER_BUFFER_BATCH_ID_FIELD, uuid.uuid4().hex)
+    buffered = {
+        key.decode('utf-8'): value.decode('utf-8')
+        for key, value in redis.hgetall(COUNTER_BUFFER_FLUSHING_KEY).items()
+    }
+    batch_id = buffered.pop(COUNTER_BUFFER_BATCH_ID_FIELD)
+    updated_count = _apply_counter_deltas(
+        batch_id,
+        {counter_field: int(delta) for counter_field, delta in buffered.items()},
+    )
+    _delete_flushing_batch(redis, batch_id)
+    return updated_count
+
+
+def flush_counter_buffer() -> int:
+    """
+    Redis 버퍼를 flushing key 로 옮긴 뒤 DB 에 반영하고 삭제합니다.
+    반영 도중 실패하면 flushing key 가 남아 다음 실행에서 같은 batch_id 로 다시 반영하며,
+    CounterFlushLog 로 이미 커밋된 batch 는 건너뛰므로 증가분이 유실되거나 중복되지 않습니다.
+    flush lock(SET NX PX) 을 잡지 못하면 다른 flush 가 실행 중이므로 0 을 반환합니다.
+    반영한 Row 수를 반환합니다.
+    """
+    redis = _get_redis()
+    lock_token = uuid.uuid4().hex
+    if not redis.set(COUNTER_FLUSH_LOCK_KEY, lock_token, nx=True, px=COUNTER_FLUSH_LOCK_TIMEOUT_MS):
+        return 0
+
+    try:
+        updated_count = 0
+        if redis.exists(COUNTER_BUFFER_FLUSHING_KEY):
+            updated_count += _flush_flushing_batch(redis)
+
+        try:
+            is_renamed = redis.renamenx(COUNTER_BUFFER_KEY, COUNTER_BUFFER_FLUSHING_KEY)
+        except ResponseError:
+            # 누적된 버퍼가 없습니다.
+            return updated_count
+        if is_renamed:
+            updated_count += _flush_flushing_batch(redis)
+        return updated_count
+    finally:
+        redis.eval(RELEASE_FLUSH_LOCK_SCRIPT, 1, COUNTER_FLUSH_LOCK_KEY, lock_token)
@@ -0,0 +1,162 @@
+from unittest.mock import patch
+
+from common.common_testcase_helpers.testcase_helpers import (
+    test_case_create_arrow,
+    test_case_create_map,
+    test_case_create_node,
+)
+from common.consts import (
+    COUNTER_BUFFER_BATCH_ID_FIELD,
+    COUNTER_BUFFER_FLUSHING_KEY,
+    COUNTER_BUFFER_KEY,
+    COUNTER_FLUSH_LOCK_KEY,
+)
+from common.helpers.counter_helpers import (
+    _delete_flushing_batch,
+    flush_counter_buffer,
+    increase_counters,
+    increase_counters_on_commit,
+)
+from common.models import CounterFlushLog
+from django.test import TestCase
+from django_redis import get_redis_connection
+from member.models import Member
+from network.helpers.map_version_helpers import get_map_version
+
+
+class CounterBufferTestCase(TestCase):
+    def setUp(self):
+        self.redis = get_redis_connection('default')
+        self.redis.delete(COUNTER_BUFFER_KEY, COUNTER_BUFFER_FLUSHING_KEY, COUNTER_FLUSH_LOCK_KEY)
+        self.member = Member.objects.first()
+        self.map = test_case_create_map(self.member)
+        self.node1 = test_case_create_node(self.map, '1')
+        self.node2 = test_case_create_node(self.map, '2')
+        self.arrow = test_case_create_arrow(self.node1, self.node2)
+
+    def tearDown(self):
+        self.redis.delete(COUNTER_BUFFER_KEY, COUNTER_BUFFER_FLUSHING_KEY, COUNTER_FLUSH_LOCK_KEY)
+
+    def test_increase_counters_should_raise_value_error_when_not_buffered_counter(self):
+        # Given:
+        # When:
+        # Then:
+        with self.assertRaises(ValueError):
+            increase_counters('network.Node', 'size', [self.node1.id])
+
+    def test_flush_counter_buffer_should_apply_accumulated_deltas(self):
+        # Given: node1 +2, node2 +1, map +1
+        increase_counters('network.Node', 'total_acquisition_count', [self.node1.id, self.node2.id])
+        increase_counters('network.Node', 'total_acquisition_count', [self.node1.id])
+        increase_counters('map.Map', 'subscribed_count', [self.map.id])
+        map_version = get_map_version(self.map.id)
+
+        # When:
+        with self.captureOnCommitCallbacks(execute=True):
+            updated_count = flush_counter_buffer()
+
+        # Then: Row 당 한 번 UPDATE
+        self.assertEqual(updated_count, 3)
+        self.node1.refresh_from_db()
+        self.node2.refresh_from_db()
+        self.map.refresh_from_db()
+        self.assertEqual(self.node1.total_acquisition_count, 2)
+        self.assertEqual(self.node2.total_acquisition_count, 1)
+        self.assertEqual(self.map.subscribed_count, 1)
+        # And: 버퍼 비움
+        self.assertFalse(self.redis.exists(COUNTER_BUFFER_KEY))
+        self.assertFalse(self.redis.exists(COUNTER_BUFFER_FLUSHING_KEY))
+        # And: 카운터 변경으로 Map 버전이 올라가지 않음
+        self.assertEqual(get_map_version(self.map.id), map_version)
+
+    def test_flush_counter_buffer_should_return_0_when_buffer_is_empty(self):
+        # Given:
+        # When:
+        updated_count = flush_counter_buffer()
+
+        # Then:
+        self.assertEqual(updated_count, 0)
+        self.assertFalse(CounterFlushLog.objects.exists())
+
+    def test_flush_counter_buffer_should_replay_failed_batch(self):
+        # Given: 반영 도중 실패
+        increase_counters('network.Arrow', 'total_acquisition_count', [self.arrow.id])
+        with patch('common.helpers.counter_helpers._apply_counter_deltas', side_effect=Exception):
+            with self.assertRaises(Exception):
+                flush_counter_buffer()
+        # And: 실패 이후 누적
+        increase_counters('network.Arrow', 'total_acquisition_count', [self.arrow.id])
+
+        # When:
+        flush_counter_buffer()
+
+        # Then: 실패한 batch 와 이후 누적분 모두 반영
+        self.arrow.refresh_from_db()
+        self.assertEqual(self.arrow.total_acquisition_count, 2)
+        self.assertEqual(CounterFlushLog.objects.count(), 2)
+
+    def test_flush_counter_buffer_should_not_apply_committed_batch_twice(self):
+        # Given: DB 반영 후 flushing key 삭제 전에 실패
+        increase_counters('network.Arrow', 'total_acquisition_count', [self.arrow.id])
+        with patch('common.helpers.counter_helpers._delete_flushing_batch', side_effect=Exception):
+            with self.assertRaises(Exception):
+                flush_counter_buffer()
+        self.assertTrue(self.redis.exists(COUNTER_BUFFER_FLUSHING_KEY))
+
+        # When: 재실행
+        updated_count = flush_counter_buffer()
+
+        # Then: 한 번만 반영
+        self.assertEqual(updated_count, 0)
+        self.arrow.refresh_from_db()
+        self.assertEqual(self.arrow.total_acquisition_count, 1)
+        self.assertFalse(self.redis.exists(COUNTER_BUFFER_FLUSHING_KEY))
+
+    def test_flush_counter_buffer_should_skip_when_another_flush_holds_lock(self):
+        # Given: 다른 flush 가 실행 중
+        increase_counters('network.Arrow', 'total_acquisition_count', [self.arrow.id])
+        self.redis.set(COUNTER_FLUSH_LOCK_KEY, 'other')
+
+        # When:
+        updated_count = flush_counter_buffer()
+
+        # Then: 반영하지 않고 버퍼와 다른 flush 의 lock 을 그대로 둡니다.
+        self.assertEqual(updated_count, 0)
+        self.assertTrue(self.redis.exists(COUNTER_BUFFER_KEY))
+        self.assertEqual(self.redis.get(COUNTER_FLUSH_LOCK_KEY), b'other')
+
+    def test_flush_counter_buffer_should_release_lock(self):
+        # Given:
+        increase_counters('network.Arrow', 'total_acquisition_count', [self.arrow.id])
+
+        # When:
+        flush_counter_buffer()
+
+        # Then:
+        self.assertFalse(self.redis.exists(COUNTER_FLUSH_LOCK_KEY))
+
+    def test_delete_flushing_batch_should_keep_next_batch(self):
+        # Given: 다음 batch 가 이미 flushing key 로 옮겨짐
+        self.redis.hset(COUNTER_BUFFER_FLUSHING_KEY, COUNTER_BUFFER_BATCH_ID_FIELD, 'next')
+
+        # When: 이전 batch 삭제
+        _delete_flushing_batch(self.redis, 'previous')
+
+        # Then: 다음 batch 는 남아 있습니다.
+        self.assertTrue(self.redis.exists(COUNTER_BUFFER_FLUSHING_KEY))
+
+        # When: 같은 batch 삭제
+        _delete_flushing_batch(self.redis, 'next')
+
+        # Then:
+        self.assertFalse(self.redis.exists(COUNTER_BUFFER_FLUSHING_KEY))
+
+    def test_increase_counters_on_commit_should_not_accumulate_before_commit(self):
+        # Given:
+        # When:
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            increase_counters_on_commit('network.Node', 'total_acquisition_count', [self.node1.id])
+
+        # Then:
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(self.redis.exists(COUNTER_BUFFER_KEY))
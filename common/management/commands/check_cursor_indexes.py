@@ -0,0 +1,21 @@
+from common.common_criteria.index_helpers import get_cursor_index_reports
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+
+
+class Command(BaseCommand):
+    help = '등록된 CursorCriteria 마다 keyset 페이지네이션을 지원하는 인덱스가 있는지 점검합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fail-on-missing', action='store_true', help='지원하는 인덱스가 없으면 실패합니다.')
+
+    def handle(self, *args, **options):
+        reports = get_cursor_index_reports()
+        for report in reports:
+            self.stdout.write(str(report))
+
+        missing_count = len([report for report in reports if not report.is_supported])
+        if missing_count and options['fail_on_missing']:
+            raise CommandError(f'{missing_count} 개의 CursorCriteria 에 지원하는 인덱스가 없습니다.')
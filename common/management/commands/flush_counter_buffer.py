@@ -0,0 +1,9 @@
+from common.tasks import flush_counter_buffer_task
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Redis 에 누적된 카운터 증가분을 DB 에 반영하는 Celery 작업을 요청합니다. (crontab 에서 매분 실행)'
+
+    def handle(self, *args, **options):
+        flush_counter_buffer_task.delay()
@@ -0,0 +1,26 @@
+# Generated by Django 4.1.10 on 2026-10-18 18:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0002_create_common_black_lists'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CounterFlushLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('batch_id', models.CharField(max_length=32, unique=True)),
+                ('counter_count', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': '카운터 반영 기록',
+                'verbose_name_plural': '카운터 반영 기록',
+            },
+        ),
+    ]
@@ -28,3 +28,17 @@ class BlackListWord(models.Model):
     class Meta:
         verbose_name = '블랙리스트 문구'
         verbose_name_plural = '블랙리스트 문구'
+
+
+class CounterFlushLog(models.Model):
+    u"""
+    카운터 버퍼 반영 기록
+    같은 batch 가 두 번 반영되지 않도록 카운터 UPDATE 와 같은 트랜잭션에서 생성합니다.
+    """
+    batch_id = models.CharField(max_length=32, unique=True)
+    counter_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = '카운터 반영 기록'
+        verbose_name_plural = '카운터 반영 기록'
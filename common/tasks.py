@@ -0,0 +1,7 @@
+from common.helpers.counter_helpers import flush_counter_buffer
+from config.celery import app
+
+
+@app.task
+def flush_counter_buffer_task() -> int:
+    return flush_counter_buffer()
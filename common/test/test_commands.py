@@ -0,0 +1,15 @@
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+
+class FlushCounterBufferCommandTestCase(TestCase):
+    @patch('common.management.commands.flush_counter_buffer.flush_counter_buffer_task.delay')
+    def test_flush_counter_buffer_should_request_celery_task(self, mock_delay):
+        # Given:
+        # When:
+        call_command('flush_counter_buffer')
+
+        # Then:
+        mock_delay.assert_called_once_with()
@@ -3,13 +3,20 @@ from django.apps import apps
 from django.contrib.auth.middleware import AuthenticationMiddleware
 from django.utils.encoding import smart_str
 from django.utils.translation import gettext as _
+from member.consts import MemberStatusEnum
 from member.exceptions import BlackMemberException
+from member.helpers.identity_helpers import get_guest_identity
+from member.helpers.revocation_helpers import (
+    get_guest_revocation_version,
+    is_guest_revoked,
+)
 from rest_framework import exceptions
 from rest_framework.authentication import (
     BaseAuthentication,
     get_authorization_header,
 )
 from rest_framework.exceptions import APIException
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework_jwt.settings import api_settings
 
 jwt_decode_handler = api_settings.JWT_DECODE_HANDLER
@@ -17,8 +24,28 @@ jwt_decode_handler = api_settings.JWT_DECODE_HANDLER
 
 class DefaultAuthentication(BaseAuthentication):
     www_authenticate_realm = 'api'
-
-    def authenticate(self, request):
+    # JWTAuthenticationMiddleware 와 DRF 가 같은 요청을 다시 인증하지 않도록 결과(또는 예외)를 요청에 저장합니다.
+    authentication_result_attribute = '_jwt_authentication_result'
+
+    def authenticate(self, request, allow_stateless=False):
+        """
+        allow_stateless: 토큰의 status claim 으로 DB 조회 없이 인증합니다. (JWTAuthenticationMiddleware 에서 결정)
+        """
+        # DRF Request 는 Django HttpRequest 를 감싸고 있으므로 원본 요청에 저장합니다.
+        http_request = getattr(request, '_request', request)
+        if not hasattr(http_request, self.authentication_result_attribute):
+            try:
+                result = self._authenticate(http_request, allow_stateless)
+            except APIException as e:
+                result = e
+            setattr(http_request, self.authentication_result_attribute, result)
+
+        result = getattr(http_request, self.authentication_result_attribute)
+        if isinstance(result, APIException):
+            raise result
+        return result
+
+    def _authenticate(self, request, allow_stateless):
         jwt_value = self.get_jwt_value(request)
 
         if jwt_value is None:
@@ -36,7 +63,9 @@ class DefaultAuthentication(BaseAuthentication):
             msg = _('유효하지 않은 토큰 입니다.')
             raise exceptions.AuthenticationFailed(msg)
 
-        guest = self.authenticate_credentials(payload)
+        guest = self.authenticate_stateless_credentials(payload) if allow_stateless else None
+        if guest is None:
+            guest = self.authenticate_credentials(payload)
         request.guest = guest
         if guest.is_blacklisted:
             raise BlackMemberException()
@@ -74,25 +103,55 @@ class DefaultAuthentication(BaseAuthentication):
         return '{0} realm="{1}"'.format(api_settings.JWT_AUTH_HEADER_PREFIX, self.www_authenticate_realm)
 
     def authenticate_credentials(self, payload):
-        Guest = apps.get_model('member', 'Guest')
         guest_id = payload.get('guest_id')
 
         if not guest_id:
             msg = _('잘못된 Token 입니다.')
             raise exceptions.AuthenticationFailed(msg)
 
-        try:
-            guest = Guest.objects.select_related('member').get(id=guest_id)
-        except Guest.DoesNotExist:
+        guest = get_guest_identity(guest_id)
+        if guest is None:
             msg = _('존재하지 않는 사용자입니다.')
             raise exceptions.AuthenticationFailed(msg)
 
         return guest
 
+    def authenticate_stateless_credentials(self, payload):
+        """
+        status claim 이 정상이고 발급 이후 차단되지 않았으면 DB 조회 없이 id 만 가진 Guest / Member 를 반환합니다.
+        claim 이 없거나 차단되었을 수 있으면 None 을 반환하여 DB 에서 확인합니다.
+        """
+        claims = payload.get('status')
+        guest_id = payload.get('guest_id')
+        member_id = payload.get('member_id')
+        if not claims or not guest_id or claims.get('is_blacklisted'):
+            return None
+        if member_id and claims.get('member_status_id') != MemberStatusEnum.NORMAL_MEMBER.value:
+            return None
+        # 발급 이후 차단된 Guest 가 없으면 차단 목록을 확인하지 않습니다.
+        if claims.get('revocation_version') != get_guest_revocation_version() and is_guest_revoked(guest_id):
+            return None
+
+        Guest = apps.get_model('member', 'Guest')
+        Member = apps.get_model('member', 'Member')
+        guest = Guest(id=guest_id, member_id=member_id, is_blacklisted=False)
+        if member_id:
+            guest.member = Member(id=member_id, member_status_id=claims['member_status_id'])
+        return guest
+
 
 class JWTAuthenticationMiddleware(AuthenticationMiddleware):
     def process_request(self, request):
+        # 세션 기반 인증을 사용하지 않으며, 인증은 process_view 에서 합니다.
+        pass
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """
+        View 의 allow_stateless_authentication 을 확인하기 위해 URL 이 결정된 이후 인증합니다.
+        """
+        view_class = getattr(view_func, 'cls', None)
+        allow_stateless = request.method in SAFE_METHODS and getattr(view_class, 'allow_stateless_authentication', False)
         try:
-            DefaultAuthentication().authenticate(request)
+            DefaultAuthentication().authenticate(request, allow_stateless)
         except APIException:
             pass
@@ -0,0 +1,109 @@
+import json
+from unittest.mock import patch
+
+from common.common_testcase_helpers.testcase_helpers import (
+    GuestTokenMixin,
+    test_case_create_map,
+)
+from config.middlewares.authentications import (
+    DefaultAuthentication,
+    jwt_decode_handler,
+)
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from django.urls import reverse
+from member.exceptions import BlackMemberException
+from member.helpers.identity_helpers import (
+    get_guest_identity,
+    invalidate_guest_identities,
+)
+from member.helpers.revocation_helpers import restore_guests
+from member.models import (
+    Guest,
+    MemberMapSubscription,
+)
+
+
+class DefaultAuthenticationTestCase(GuestTokenMixin, TestCase):
+    def setUp(self):
+        super(DefaultAuthenticationTestCase, self).setUp()
+        self.guest = Guest.objects.all().first()
+        self.map = test_case_create_map(self.guest.member)
+        MemberMapSubscription.objects.create(member=self.guest.member, map=self.map)
+
+    def tearDown(self):
+        # DB 는 rollback 되지만 캐시는 남으므로 삭제합니다.
+        invalidate_guest_identities([self.guest.id])
+        restore_guests([self.guest.id])
+        super(DefaultAuthenticationTestCase, self).tearDown()
+
+    @patch('config.middlewares.authentications.get_guest_identity', wraps=get_guest_identity)
+    @patch('config.middlewares.authentications.jwt_decode_handler', wraps=jwt_decode_handler)
+    def test_authenticate_should_run_once_per_request(self, mock_jwt_decode_handler, mock_get_guest_identity):
+        # Given:
+        self.login_guest(self.guest)
+
+        # When: 미들웨어, DRF 모두 인증
+        response = self.client.get(reverse('network:map_progress', args=[self.map.id]))
+
+        # Then: 한 번만 디코딩, 조회
+        self.assertEqual(response.status_code, 200)
+        mock_jwt_decode_handler.assert_called_once()
+        mock_get_guest_identity.assert_called_once_with(self.guest.id)
+
+    @patch('config.middlewares.authentications.jwt_decode_handler', wraps=jwt_decode_handler)
+    def test_authenticate_should_reraise_memoized_exception(self, mock_jwt_decode_handler):
+        # Given: 블랙리스트
+        self.guest.is_blacklisted = True
+        self.guest.save()
+        self.login_guest(self.guest)
+
+        # When:
+        response = self.client.get(reverse('network:map_progress', args=[self.map.id]))
+
+        # Then: 미들웨어에서 발생한 예외를 DRF 에서 다시 발생
+        self.assertEqual(response.status_code, 400)
+        content = json.loads(response.content)
+        self.assertEqual(content['message'], BlackMemberException.default_detail)
+        mock_jwt_decode_handler.assert_called_once()
+
+    def test_authenticate_should_return_none_without_token(self):
+        # Given:
+        request = self.client.get('/').wsgi_request
+
+        # When:
+        result = DefaultAuthentication().authenticate(request)
+
+        # Then:
+        self.assertEqual(result, (None, None))
+
+    @override_settings(JWT_STATUS_CLAIMS_ENABLED=True)
+    @patch('config.middlewares.authentications.get_guest_identity', wraps=get_guest_identity)
+    def test_authenticate_should_skip_db_with_status_claims(self, mock_get_guest_identity):
+        # Given: status claim 이 있는 토큰
+        self.login_guest(self.guest)
+
+        # When: allow_stateless_authentication 인 조회 API
+        response = self.client.get(reverse('network:map_progress', args=[self.map.id]))
+
+        # Then: Guest 조회 없이 인증
+        self.assertEqual(response.status_code, 200)
+        mock_get_guest_identity.assert_not_called()
+
+    @override_settings(JWT_STATUS_CLAIMS_ENABLED=True)
+    def test_authenticate_should_check_db_when_guest_revoked(self):
+        # Given: 토큰 발급 이후 블랙리스트
+        self.login_guest(self.guest)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.guest.is_blacklisted = True
+            self.guest.save()
+
+        # When:
+        response = self.client.get(reverse('network:map_progress', args=[self.map.id]))
+
+        # Then: DB 에서 확인하여 차단
+        self.assertEqual(response.status_code, 400)
+        content = json.loads(response.content)
+        self.assertEqual(content['message'], BlackMemberException.default_detail)
@@ -20,6 +20,7 @@ DJANGO_APPS = [
     'django.contrib.staticfiles',
     'django.contrib.sites',
     'django.contrib.humanize',
+    'django.contrib.postgres',
 ]
 
 THIRD_APPS = [
@@ -123,6 +124,10 @@ AUTHENTICATION_BACKENDS = (
 JWT_AUTH = {
     'JWT_EXPIRATION_DELTA': datetime.timedelta(seconds=7200),  # 2 hours
 }
+# 토큰에 블랙리스트 / 회원 상태 claim 을 포함하여 allow_stateless_authentication 인 조회 API 에서 DB 조회 없이 인증합니다.
+JWT_STATUS_CLAIMS_ENABLED = False
+# 서명 없는 이전 JSON next_cursor 허용 여부 (이전 cursor 가 모두 만료되면 False 로 변경)
+LEGACY_CURSOR_ENABLED = True
 
 SITE_ID = 1
 
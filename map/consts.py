@@ -0,0 +1 @@
+MAP_SEARCH_CACHE_KEY = 'map:search:{}'
@@ -0,0 +1,10 @@
+from common.common_criteria.cursor_criteria import CursorCriteria
+from map.models import Map
+
+
+class MapSearchCursorCriteria(CursorCriteria):
+    cursor_keys = [
+        'rank__lt',
+        'id__lt',
+    ]
+    model = Map
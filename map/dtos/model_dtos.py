@@ -0,0 +1,26 @@
+from typing import Optional
+
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+
+class MapSearchItem(BaseModel):
+    id: int = Field(...)
+    title: str = Field(...)
+    description: str = Field(...)
+    main_image_url: Optional[str] = None
+    subscribed_count: int = Field(...)
+    similarity: float = Field(...)
+
+    @classmethod
+    def of(cls, map: 'Map') -> 'MapSearchItem':  # noqa
+        return cls(
+            id=map.id,
+            title=map.title,
+            description=map.description,
+            main_image_url=map.main_image_url,
+            subscribed_count=map.subscribed_count,
+            similarity=map.rank,
+        )
@@ -0,0 +1,13 @@
+from typing import (
+    List,
+    Optional,
+)
+
+from map.dtos.model_dtos import MapSearchItem
+from pydantic import BaseModel, Field
+
+
+class MapSearchResponse(BaseModel):
+    maps: List[MapSearchItem] = Field(...)
+    has_more: bool = Field(...)
+    next_cursor: Optional[str] = None
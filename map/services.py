@@ -0,0 +1,28 @@
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+
+from common.common_paginations.cursor_pagination_helpers import get_objects_with_cursor_pagination
+from common.common_utils.search_utils import get_trigram_rank
+from common.consts import SEARCH_SIMILARITY_THRESHOLD
+from map.cursor_criteria import MapSearchCursorCriteria
+from map.models import Map
+
+
+def search_maps(query: str, decoded_next_cursor: dict, size: int) -> Tuple[List[Map], bool, Optional[str]]:
+    """
+    title_gin_idx 를 사용하는 트라이그램 검색
+    유사도(rank) 내림차순, id 내림차순으로 keyset 페이지네이션 합니다.
+    """
+    qs = Map.objects.filter(
+        title__trigram_similar=query,
+        is_deleted=False,
+    ).annotate(
+        rank=get_trigram_rank(query, 'title'),
+    ).filter(
+        MapSearchCursorCriteria.get_filtering_q(decoded_next_cursor),
+        rank__gte=SEARCH_SIMILARITY_THRESHOLD,
+    )
+    return get_objects_with_cursor_pagination(qs, MapSearchCursorCriteria, {}, size)
@@ -0,0 +1,55 @@
+from common.common_testcase_helpers.testcase_helpers import test_case_create_map
+from django.test import TestCase
+from map.cursor_criteria import MapSearchCursorCriteria
+from map.services import search_maps
+from member.models import Member
+
+
+class SearchMapsTestCase(TestCase):
+    def setUp(self):
+        self.member = Member.objects.first()
+        self.python_map = test_case_create_map(self.member, title='python')
+        self.python_basic_map = test_case_create_map(self.member, title='python basic')
+        self.python_basic_map2 = test_case_create_map(self.member, title='python basic')
+        self.java_map = test_case_create_map(self.member, title='java')
+
+    def test_search_maps_should_order_by_similarity_and_id(self):
+        # Given:
+        # When:
+        maps, has_more, next_cursor = search_maps('python', {}, 10)
+
+        # Then: 유사도 내림차순, 같은 유사도는 id 내림차순
+        self.assertEqual(
+            [map.id for map in maps],
+            [self.python_map.id, self.python_basic_map2.id, self.python_basic_map.id],
+        )
+        self.assertFalse(has_more)
+        self.assertIsNone(next_cursor)
+        self.assertEqual(maps[0].rank, 1.0)
+
+    def test_search_maps_should_exclude_deleted_map(self):
+        # Given:
+        self.python_map.is_deleted = True
+        self.python_map.save()
+
+        # When:
+        maps, _, _ = search_maps('python', {}, 10)
+
+        # Then:
+        self.assertNotIn(self.python_map.id, [map.id for map in maps])
+
+    def test_search_maps_should_paginate_with_keyset_cursor(self):
+        # Given: 첫 페이지
+        first_maps, has_more, next_cursor = search_maps('python', {}, 2)
+        self.assertTrue(has_more)
+
+        # When: 다음 페이지
+        second_maps, has_more, next_cursor = search_maps('python', MapSearchCursorCriteria.decode_cursor(next_cursor), 2)
+
+        # Then: 같은 유사도 사이에서도 누락/중복 없음
+        self.assertEqual(
+            [map.id for map in first_maps + second_maps],
+            [self.python_map.id, self.python_basic_map2.id, self.python_basic_map.id],
+        )
+        self.assertFalse(has_more)
+        self.assertIsNone(next_cursor)
@@ -0,0 +1,53 @@
+import json
+from unittest.mock import patch
+
+from common.common_testcase_helpers.testcase_helpers import test_case_create_map
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from map.services import search_maps
+from member.models import Member
+
+
+class MapSearchAPIViewTestCase(TestCase):
+    def setUp(self):
+        cache.delete_pattern('map:search:*')
+        self.member = Member.objects.first()
+        self.python_map = test_case_create_map(self.member, title='python')
+        self.java_map = test_case_create_map(self.member, title='java')
+
+    def tearDown(self):
+        cache.delete_pattern('map:search:*')
+
+    def test_map_search_should_return_ranked_maps(self):
+        # Given:
+        # When:
+        response = self.client.get(reverse('map:search'), {'q': '  Python '})
+
+        # Then:
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content)
+        self.assertEqual([map['id'] for map in content['maps']], [self.python_map.id])
+        self.assertEqual(content['maps'][0]['similarity'], 1.0)
+        self.assertFalse(content['has_more'])
+        self.assertIsNone(content['next_cursor'])
+
+    def test_map_search_should_return_400_when_q_not_exists(self):
+        # Given:
+        # When:
+        response = self.client.get(reverse('map:search'))
+
+        # Then:
+        self.assertEqual(response.status_code, 400)
+
+    @patch('map.views.search_maps', wraps=search_maps)
+    def test_map_search_should_cache_hot_query(self, mock_search_maps):
+        # Given: 같은 검색어 (정규화 후 동일)
+        self.client.get(reverse('map:search'), {'q': 'python'})
+
+        # When:
+        response = self.client.get(reverse('map:search'), {'q': 'PYTHON'})
+
+        # Then: 한 번만 검색
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_search_maps.call_count, 1)
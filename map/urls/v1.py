@@ -1,4 +1,9 @@
+from django.urls import path
+from map.views import MapSearchAPIView
+
 app_name = 'map'
 
 
-urlpatterns = []
+urlpatterns = [
+    path('search', MapSearchAPIView.as_view(), name='search'),
+]
@@ -0,0 +1,41 @@
+from common.common_decorators.request_decorators import (
+    cursor_pagination,
+    mandatories,
+)
+from common.common_utils.search_utils import (
+    get_search_cache_key,
+    normalize_search_query,
+)
+from common.consts import SEARCH_CACHE_TTL
+from django.core.cache import cache
+from map.consts import MAP_SEARCH_CACHE_KEY
+from map.cursor_criteria import MapSearchCursorCriteria
+from map.dtos.model_dtos import MapSearchItem
+from map.dtos.response_dtos import MapSearchResponse
+from map.services import search_maps
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class MapSearchAPIView(APIView):
+    @cursor_pagination(default_size=20, cursor_criteria=[MapSearchCursorCriteria])
+    @mandatories('q')
+    def get(self, request, decoded_next_cursor, size, m):
+        query = normalize_search_query(m['q'])
+
+        def _search():
+            maps, has_more, next_cursor = search_maps(query, decoded_next_cursor, size)
+            return MapSearchResponse(
+                maps=[MapSearchItem.of(map) for map in maps],
+                has_more=has_more,
+                next_cursor=next_cursor,
+            ).model_dump()
+
+        return Response(
+            cache.get_or_set(
+                get_search_cache_key(MAP_SEARCH_CACHE_KEY, query, request.GET.get('next_cursor'), size),
+                _search,
+                SEARCH_CACHE_TTL,
+            ),
+            status=200,
+        )
@@ -98,3 +98,11 @@ PASSWORD_MAX_LENGTH = 30
 class AcquisitionPKType(StrValueLabel):
     START_NODE = ('START_NODE', 'START_NODE')
     NODE_ACQUISITION_RULE = ('NODE_ACQUISITION_RULE', 'NODE_ACQUISITION_RULE')
+
+
+GUEST_IDENTITY_CACHE_KEY = 'guest:{}:identity'
+GUEST_IDENTITY_CACHE_TTL = 60
+REVOKED_GUEST_IDS_KEY = 'guest:revoked_ids'
+GUEST_REVOCATION_VERSION_KEY = 'guest:revocation_version'
+# Process 에서 revocation version 을 재사용하는 시간(초) 으로 블랙리스트는 최대 이 시간 안에 반영됩니다.
+GUEST_REVOCATION_VERSION_LOCAL_TTL = 3
@@ -0,0 +1,40 @@
+from typing import (
+    Iterable,
+    Optional,
+)
+
+from django.core.cache import cache
+from django.db import transaction
+from member.consts import (
+    GUEST_IDENTITY_CACHE_KEY,
+    GUEST_IDENTITY_CACHE_TTL,
+)
+from member.models import Guest
+
+
+def get_guest_identity(guest_id: int) -> Optional[Guest]:
+    """
+    인증에 사용하는 Guest (member 포함) 를 짧은 TTL 로 캐싱합니다.
+    블랙리스트, 회원 상태가 바뀌면 signal 에서 캐시를 삭제합니다.
+    """
+    key = GUEST_IDENTITY_CACHE_KEY.format(guest_id)
+    guest = cache.get(key)
+    if guest is not None:
+        return guest
+
+    guest = Guest.objects.select_related('member').filter(id=guest_id).first()
+    if guest is not None:
+        cache.set(key, guest, GUEST_IDENTITY_CACHE_TTL)
+    return guest
+
+
+def invalidate_guest_identities(guest_ids: Iterable[int]) -> None:
+    cache.delete_many([GUEST_IDENTITY_CACHE_KEY.format(guest_id) for guest_id in set(guest_ids)])
+
+
+def invalidate_guest_identities_on_commit(guest_ids: Iterable[int]) -> None:
+    # commit 전까지 다른 요청이 변경 전 데이터를 다시 캐싱할 수 있으므로 commit 이후에 한 번 더 삭제합니다.
+    guest_ids = [guest_id for guest_id in set(guest_ids) if guest_id is not None]
+    if guest_ids:
+        invalidate_guest_identities(guest_ids)
+        transaction.on_commit(lambda: invalidate_guest_identities(guest_ids))
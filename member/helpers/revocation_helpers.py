@@ -0,0 +1,64 @@
+import time
+from typing import Iterable
+
+from django.db import transaction
+from django_redis import get_redis_connection
+from member.consts import (
+    GUEST_REVOCATION_VERSION_KEY,
+    GUEST_REVOCATION_VERSION_LOCAL_TTL,
+    REVOKED_GUEST_IDS_KEY,
+)
+
+
+# Process 별 (revocation version, 조회 시각)
+_local_revocation_version = [0, 0.0]
+
+
+def get_guest_revocation_version() -> int:
+    """
+    Guest 가 차단(블랙리스트, 비정상 회원 상태)될 때마다 올라가는 버전
+    Redis 조회를 줄이기 위해 Process 에서 GUEST_REVOCATION_VERSION_LOCAL_TTL 초 동안 재사용합니다.
+    """
+    now = time.monotonic()
+    if now - _local_revocation_version[1] >= GUEST_REVOCATION_VERSION_LOCAL_TTL:
+        _local_revocation_version[0] = int(get_redis_connection('default').get(GUEST_REVOCATION_VERSION_KEY) or 0)
+        _local_revocation_version[1] = now
+    return _local_revocation_version[0]
+
+
+def is_guest_revoked(guest_id: int) -> bool:
+    return bool(get_redis_connection('default').sismember(REVOKED_GUEST_IDS_KEY, guest_id))
+
+
+def revoke_guests(guest_ids: Iterable[int]) -> None:
+    guest_ids = list(guest_ids)
+    if not guest_ids:
+        return
+    pipeline = get_redis_connection('default').pipeline()
+    pipeline.sadd(REVOKED_GUEST_IDS_KEY, *guest_ids)
+    pipeline.incr(GUEST_REVOCATION_VERSION_KEY)
+    pipeline.execute()
+    # 현재 Process 에는 바로 반영합니다.
+    _local_revocation_version[1] = 0.0
+
+
+def restore_guests(guest_ids: Iterable[int]) -> None:
+    """
+    차단이 풀린 Guest 는 토큰의 claim 이 다시 유효하므로 버전을 올리지 않습니다.
+    """
+    guest_ids = list(guest_ids)
+    if guest_ids:
+        get_redis_connection('default').srem(REVOKED_GUEST_IDS_KEY, *guest_ids)
+
+
+def update_guest_revocations_on_commit(revoked_guest_ids: Iterable[int], restored_guest_ids: Iterable[int]) -> None:
+    revoked_guest_ids = [guest_id for guest_id in set(revoked_guest_ids) if guest_id is not None]
+    restored_guest_ids = [guest_id for guest_id in set(restored_guest_ids) if guest_id is not None]
+    if not revoked_guest_ids and not restored_guest_ids:
+        return
+
+    def _update_guest_revocations():
+        revoke_guests(revoked_guest_ids)
+        restore_guests(restored_guest_ids)
+
+    transaction.on_commit(_update_guest_revocations)
@@ -0,0 +1,55 @@
+# Generated by Django 4.1.10 on 2026-10-18 19:50
+
+from django.db import migrations, models
+from django.db.models import (
+    Count,
+    Min,
+)
+
+
+def forward(apps, schema_editor):
+    """
+    같은 Arrow 를 중복 획득한 Row 는 먼저 생성된 Row 만 남기고 삭제 처리합니다.
+    """
+    MemberArrowAcquisition = apps.get_model('member', 'MemberArrowAcquisition')
+
+    duplicates = MemberArrowAcquisition.objects.filter(
+        is_deleted=False,
+    ).values(
+        'member_map_subscription_id',
+        'arrow_id',
+    ).annotate(
+        first_id=Min('id'),
+        acquisition_count=Count('id'),
+    ).filter(
+        acquisition_count__gt=1,
+    )
+    for duplicate in duplicates.iterator():
+        MemberArrowAcquisition.objects.filter(
+            member_map_subscription_id=duplicate['member_map_subscription_id'],
+            arrow_id=duplicate['arrow_id'],
+            is_deleted=False,
+        ).exclude(
+            id=duplicate['first_id'],
+        ).update(
+            is_deleted=True,
+        )
+
+
+def backward(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('member', '0005_membernodeacquisition_memberarrowacquisition'),
+    ]
+
+    operations = [
+        migrations.RunPython(forward, backward),
+        migrations.AddConstraint(
+            model_name='memberarrowacquisition',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('member_map_subscription', 'arrow'), name='member_arrow_acquisition_unique'),
+        ),
+    ]
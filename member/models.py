@@ -163,6 +163,14 @@ class MemberArrowAcquisition(models.Model):
     class Meta:
         verbose_name = '회원 Arrow 획득'
         verbose_name_plural = '회원 Arrow 획득'
+        constraints = [
+            # 동시에 같은 Arrow 를 획득해도 획득 Row 는 하나입니다. (get_or_create)
+            models.UniqueConstraint(
+                fields=['member_map_subscription', 'arrow'],
+                condition=models.Q(is_deleted=False),
+                name='member_arrow_acquisition_unique',
+            ),
+        ]
 
     def __str__(self):
         return f'member: {self.member_map_subscription.member_id} / arrow_id: {self.arrow_id}'
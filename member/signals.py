@@ -0,0 +1,62 @@
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+)
+from django.dispatch import receiver
+from member.consts import MemberStatusEnum
+from member.helpers.identity_helpers import invalidate_guest_identities_on_commit
+from member.helpers.revocation_helpers import update_guest_revocations_on_commit
+from member.models import (
+    Guest,
+    Member,
+)
+
+
+@receiver(post_save, sender=Guest)
+def update_guest_identity_on_guest_save(sender, instance, **kwargs):
+    invalidate_guest_identities_on_commit([instance.id])
+    is_revoked = instance.is_blacklisted or bool(
+        instance.member_id and instance.member.member_status_id != MemberStatusEnum.NORMAL_MEMBER.value
+    )
+    if is_revoked:
+        update_guest_revocations_on_commit([instance.id], [])
+    else:
+        update_guest_revocations_on_commit([], [instance.id])
+
+
+@receiver(post_delete, sender=Guest)
+def update_guest_identity_on_guest_delete(sender, instance, **kwargs):
+    invalidate_guest_identities_on_commit([instance.id])
+    update_guest_revocations_on_commit([instance.id], [])
+
+
+@receiver(post_save, sender=Member)
+def update_guest_identity_on_member_save(sender, instance, **kwargs):
+    guests = list(
+        Guest.objects.filter(
+            member_id=instance.id,
+        ).values_list(
+            'id',
+            'is_blacklisted',
+        )
+    )
+    invalidate_guest_identities_on_commit(guest_id for guest_id, _ in guests)
+    is_member_revoked = instance.member_status_id != MemberStatusEnum.NORMAL_MEMBER.value
+    update_guest_revocations_on_commit(
+        [guest_id for guest_id, is_blacklisted in guests if is_member_revoked or is_blacklisted],
+        [guest_id for guest_id, is_blacklisted in guests if not (is_member_revoked or is_blacklisted)],
+    )
+
+
+@receiver(post_delete, sender=Member)
+def update_guest_identity_on_member_delete(sender, instance, **kwargs):
+    guest_ids = list(
+        Guest.objects.filter(
+            member_id=instance.id,
+        ).values_list(
+            'id',
+            flat=True,
+        )
+    )
+    invalidate_guest_identities_on_commit(guest_ids)
+    update_guest_revocations_on_commit(guest_ids, [])
@@ -0,0 +1,59 @@
+from django.test import TestCase
+from member.helpers.identity_helpers import (
+    get_guest_identity,
+    invalidate_guest_identities,
+)
+from member.models import Guest
+
+
+class GuestIdentityTestCase(TestCase):
+    def setUp(self):
+        self.guest = Guest.objects.all().first()
+
+    def tearDown(self):
+        # DB 는 rollback 되지만 캐시는 남으므로 삭제합니다.
+        invalidate_guest_identities([self.guest.id])
+
+    def test_get_guest_identity_should_be_cached(self):
+        # Given:
+        get_guest_identity(self.guest.id)
+
+        # When:
+        with self.assertNumQueries(0):
+            guest = get_guest_identity(self.guest.id)
+
+        # Then: member 포함 캐싱
+        self.assertEqual(guest.id, self.guest.id)
+        with self.assertNumQueries(0):
+            self.assertEqual(guest.member.id, self.guest.member_id)
+
+    def test_get_guest_identity_should_return_none_when_not_exists(self):
+        # Given:
+        # When:
+        # Then:
+        self.assertIsNone(get_guest_identity(0))
+
+    def test_get_guest_identity_should_be_invalidated_when_blacklisted(self):
+        # Given:
+        get_guest_identity(self.guest.id)
+
+        # When:
+        with self.captureOnCommitCallbacks(execute=True):
+            self.guest.is_blacklisted = True
+            self.guest.save()
+
+        # Then:
+        self.assertTrue(get_guest_identity(self.guest.id).is_blacklisted)
+
+    def test_get_guest_identity_should_be_invalidated_when_member_status_changed(self):
+        # Given:
+        get_guest_identity(self.guest.id)
+        member = self.guest.member
+
+        # When:
+        with self.captureOnCommitCallbacks(execute=True):
+            member.member_status_id = 2
+            member.save()
+
+        # Then:
+        self.assertEqual(get_guest_identity(self.guest.id).member.member_status_id, 2)
@@ -0,0 +1,93 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django_redis import get_redis_connection
+from member.consts import (
+    GUEST_REVOCATION_VERSION_KEY,
+    REVOKED_GUEST_IDS_KEY,
+)
+from member.helpers import revocation_helpers
+from member.helpers.revocation_helpers import (
+    get_guest_revocation_version,
+    is_guest_revoked,
+    restore_guests,
+    revoke_guests,
+)
+from member.models import Guest
+
+
+class GuestRevocationTestCase(TestCase):
+    def setUp(self):
+        get_redis_connection('default').delete(REVOKED_GUEST_IDS_KEY, GUEST_REVOCATION_VERSION_KEY)
+        revocation_helpers._local_revocation_version[1] = 0.0
+        self.guest = Guest.objects.all().first()
+
+    def tearDown(self):
+        get_redis_connection('default').delete(REVOKED_GUEST_IDS_KEY, GUEST_REVOCATION_VERSION_KEY)
+        revocation_helpers._local_revocation_version[1] = 0.0
+
+    def test_revoke_guests_should_add_guest_and_bump_version(self):
+        # Given:
+        version = get_guest_revocation_version()
+
+        # When:
+        revoke_guests([1, 2])
+
+        # Then:
+        self.assertTrue(is_guest_revoked(1))
+        self.assertFalse(is_guest_revoked(3))
+        self.assertEqual(get_guest_revocation_version(), version + 1)
+
+    def test_restore_guests_should_remove_guest(self):
+        # Given:
+        revoke_guests([1])
+
+        # When:
+        restore_guests([1])
+
+        # Then:
+        self.assertFalse(is_guest_revoked(1))
+
+    @patch('member.helpers.revocation_helpers.time.monotonic')
+    def test_get_guest_revocation_version_should_be_reused_in_process(self, mock_monotonic):
+        # Given: 다른 Process 에서 차단
+        mock_monotonic.return_value = 1000.0
+        version = get_guest_revocation_version()
+        get_redis_connection('default').incr(GUEST_REVOCATION_VERSION_KEY)
+
+        # When:
+        # Then: TTL 동안 재사용
+        self.assertEqual(get_guest_revocation_version(), version)
+        # And: TTL 이후 반영
+        mock_monotonic.return_value = 1010.0
+        self.assertEqual(get_guest_revocation_version(), version + 1)
+
+    def test_guest_blacklist_should_revoke_guest_on_commit(self):
+        # Given:
+        # When:
+        with self.captureOnCommitCallbacks(execute=True):
+            self.guest.is_blacklisted = True
+            self.guest.save()
+
+        # Then:
+        self.assertTrue(is_guest_revoked(self.guest.id))
+
+        # When: 블랙리스트 해제
+        with self.captureOnCommitCallbacks(execute=True):
+            self.guest.is_blacklisted = False
+            self.guest.save()
+
+        # Then:
+        self.assertFalse(is_guest_revoked(self.guest.id))
+
+    def test_member_status_change_should_revoke_guest_on_commit(self):
+        # Given:
+        member = self.guest.member
+
+        # When:
+        with self.captureOnCommitCallbacks(execute=True):
+            member.member_status_id = 3
+            member.save()
+
+        # Then:
+        self.assertTrue(is_guest_revoked(self.guest.id))
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class NetworkConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'network'
+
+    def ready(self):
+        import network.signals  # noqa: F401
@@ -10,3 +10,25 @@ class QuestionMemberResponseStatus(StrValueLabel):
     PENDING = ('PENDING', '답변중')
     CORRECT = ('CORRECT', '정답')
     WRONG = ('WRONG', '오답')
+
+
+MAP_VERSION_CACHE_KEY = 'map:{}:version'
+MAP_SNAPSHOT_CACHE_KEY = 'map:{}:snapshot:{}'
+MAP_SNAPSHOT_CACHE_TTL = 60 * 60 * 24
+NODE_SEARCH_CACHE_KEY = 'node:search:{}'
+QUESTION_RESPONSE_LEASE_SECONDS = 60 * 10
+QUESTION_RESPONSE_LEASE_MAX_SIZE = 100
+
+
+class MapTransferRecordType(StrValueLabel):
+    MAP = ('map', '맵')
+    NODE = ('node', 'Node')
+    ARROW = ('arrow', 'Arrow')
+    NODE_ACQUISITION_RULE = ('node_acquisition_rule', 'Node 획득 조건')
+    ARROW_ACQUISITION_RULE = ('arrow_acquisition_rule', 'Arrow 획득 조건')
+    ARROW_ACQUISITION_QUESTION_RULE = ('arrow_acquisition_question_rule', 'Arrow 획득 조건 문제')
+    ARROW_ACQUISITION_QUESTION_ANSWER = ('arrow_acquisition_question_answer', 'Arrow 획득 조건 문제 정답')
+
+
+MAP_TRANSFER_FORMAT_VERSION = 1
+MAP_TRANSFER_CHUNK_SIZE = 1000
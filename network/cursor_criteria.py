@@ -0,0 +1,10 @@
+from common.common_criteria.cursor_criteria import CursorCriteria
+from network.models import Node
+
+
+class NodeSearchCursorCriteria(CursorCriteria):
+    cursor_keys = [
+        'rank__lt',
+        'id__lt',
+    ]
+    model = Node
@@ -0,0 +1,61 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+
+class NodeSearchItem(BaseModel):
+    id: int = Field(...)
+    map_id: int = Field(...)
+    simple_word: str = Field(...)
+    title: str = Field(...)
+    similarity: float = Field(...)
+
+    @classmethod
+    def of(cls, node: 'Node') -> 'NodeSearchItem':  # noqa
+        return cls(
+            id=node.id,
+            map_id=node.map_id,
+            simple_word=node.simple_word,
+            title=node.title,
+            similarity=node.rank,
+        )
+
+
+class ArrowQuestionMemberResponseItem(BaseModel):
+    id: int = Field(...)
+    question_id: int = Field(...)
+    response: Optional[str] = Field(None)
+    status: str = Field(..., description='CORRECT / WRONG / PENDING(채점 대기)')
+
+    @classmethod
+    def of(cls, member_response: 'ArrowAcquisitionQuestionMemberResponse') -> 'ArrowQuestionMemberResponseItem':  # noqa
+        return cls(
+            id=member_response.id,
+            question_id=member_response.arrow_acquisition_question_rule_id,
+            response=member_response.response,
+            status=member_response.status,
+        )
+
+
+class LeasedQuestionResponseItem(BaseModel):
+    id: int = Field(...)
+    member_map_subscription_id: int = Field(...)
+    question_id: int = Field(...)
+    question: str = Field(...)
+    response: Optional[str] = Field(None)
+    lease_expires_at: datetime = Field(..., description='이 시각까지 답변하지 않으면 다른 채점자에게 넘어갑니다.')
+
+    @classmethod
+    def of(cls, member_response: 'ArrowAcquisitionQuestionMemberResponse') -> 'LeasedQuestionResponseItem':  # noqa
+        return cls(
+            id=member_response.id,
+            member_map_subscription_id=member_response.member_map_subscription_id,
+            question_id=member_response.arrow_acquisition_question_rule_id,
+            question=member_response.arrow_acquisition_question_rule.question,
+            response=member_response.response,
+            lease_expires_at=member_response.lease_expires_at,
+        )
@@ -0,0 +1,37 @@
+from typing import (
+    List,
+    Optional,
+)
+
+from common.common_consts.common_error_messages import ErrorMessage
+from network.consts import QuestionMemberResponseStatus
+from pydantic import (
+    BaseModel,
+    Field,
+    field_validator,
+)
+
+
+class ArrowQuestionResponseItem(BaseModel):
+    question_id: int = Field(..., description='ArrowAcquisitionQuestionRule id')
+    response: Optional[str] = Field(None, max_length=256)
+
+
+class ArrowQuestionResponsesRequest(BaseModel):
+    responses: List[ArrowQuestionResponseItem] = Field(..., min_length=1)
+
+
+class QuestionResponseReplyItem(BaseModel):
+    response_id: int = Field(..., description='ArrowAcquisitionQuestionMemberResponse id')
+    status: str = Field(..., description='CORRECT / WRONG')
+    reply: Optional[str] = Field(None)
+
+    @field_validator('status')
+    def check_status(cls, v):
+        if v not in (QuestionMemberResponseStatus.CORRECT.value, QuestionMemberResponseStatus.WRONG.value):
+            raise ValueError(ErrorMessage.INVALID_INPUT_ERROR_MESSAGE.label)
+        return v
+
+
+class QuestionResponseRepliesRequest(BaseModel):
+    replies: List[QuestionResponseReplyItem] = Field(..., min_length=1)
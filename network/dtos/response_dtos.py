@@ -0,0 +1,116 @@
+from typing import (
+    List,
+    Optional,
+)
+
+from network.dtos.model_dtos import (
+    ArrowQuestionMemberResponseItem,
+    LeasedQuestionResponseItem,
+    NodeSearchItem,
+)
+from network.helpers.prerequisite_helpers import NodeRequirement
+from network.helpers.progress_helpers import (
+    MapProgress,
+    encode_bitset,
+)
+from pydantic import BaseModel, Field
+
+
+class MapProgressBitsets(BaseModel):
+    acquired: str = Field(..., description='획득 bitset (urlsafe base64, little endian)')
+    acquirable: str = Field(..., description='획득 가능 bitset (urlsafe base64, little endian)')
+    locked: str = Field(..., description='잠김 bitset (urlsafe base64, little endian)')
+
+
+class MapProgressItems(BaseModel):
+    acquired_ids: List[int] = Field(...)
+    acquirable_ids: List[int] = Field(...)
+    locked_ids: List[int] = Field(...)
+    bitsets: MapProgressBitsets = Field(...)
+
+
+class MapProgressResponse(BaseModel):
+    map_id: int = Field(...)
+    version: int = Field(..., description='Map 버전 (bitset ordinal 기준)')
+    node_ids: List[int] = Field(..., description='ordinal 순서의 Node id 목록')
+    arrow_ids: List[int] = Field(..., description='ordinal 순서의 Arrow id 목록')
+    nodes: MapProgressItems = Field(...)
+    arrows: MapProgressItems = Field(...)
+
+    @classmethod
+    def of(cls, map_id: int, map_progress: MapProgress) -> 'MapProgressResponse':
+        map_graph = map_progress.map_graph
+        return cls(
+            map_id=map_id,
+            version=map_progress.version,
+            node_ids=list(map_graph.node_ids),
+            arrow_ids=list(map_graph.arrow_ids),
+            nodes=MapProgressItems(
+                acquired_ids=map_progress.get_node_ids(map_progress.acquired_node_bitset),
+                acquirable_ids=map_progress.get_node_ids(map_progress.acquirable_node_bitset),
+                locked_ids=map_progress.get_node_ids(map_progress.locked_node_bitset),
+                bitsets=MapProgressBitsets(
+                    acquired=encode_bitset(map_progress.acquired_node_bitset, map_graph.node_count),
+                    acquirable=encode_bitset(map_progress.acquirable_node_bitset, map_graph.node_count),
+                    locked=encode_bitset(map_progress.locked_node_bitset, map_graph.node_count),
+                ),
+            ),
+            arrows=MapProgressItems(
+                acquired_ids=map_progress.get_arrow_ids(map_progress.acquired_arrow_bitset),
+                acquirable_ids=map_progress.get_arrow_ids(map_progress.acquirable_arrow_bitset),
+                locked_ids=map_progress.get_arrow_ids(map_progress.locked_arrow_bitset),
+                bitsets=MapProgressBitsets(
+                    acquired=encode_bitset(map_progress.acquired_arrow_bitset, map_graph.arrow_count),
+                    acquirable=encode_bitset(map_progress.acquirable_arrow_bitset, map_graph.arrow_count),
+                    locked=encode_bitset(map_progress.locked_arrow_bitset, map_graph.arrow_count),
+                ),
+            ),
+        )
+
+
+class NodeSearchResponse(BaseModel):
+    nodes: List[NodeSearchItem] = Field(...)
+    has_more: bool = Field(...)
+    next_cursor: Optional[str] = None
+
+
+class MapImportResponse(BaseModel):
+    map_id: int = Field(...)
+
+
+class NodeRequirementResponse(BaseModel):
+    node_id: int = Field(...)
+    is_acquired: bool = Field(...)
+    is_acquirable: bool = Field(..., description='획득 가능한 경로가 있는지 여부')
+    required_node_ids: List[int] = Field(..., description='획득해야 하는 Node (대상 Node 포함)')
+    required_arrow_ids: List[int] = Field(..., description='획득해야 하는 Arrow')
+    next_node_ids: List[int] = Field(..., description='지금 바로 획득할 수 있는 Node')
+    next_arrow_ids: List[int] = Field(..., description='지금 바로 획득할 수 있는 Arrow')
+
+    @classmethod
+    def of(cls, node_id: int, node_requirement: NodeRequirement) -> 'NodeRequirementResponse':
+        return cls(
+            node_id=node_id,
+            is_acquired=node_requirement.is_acquired,
+            is_acquirable=node_requirement.is_acquirable,
+            required_node_ids=node_requirement.get_node_ids(node_requirement.required_node_bitset),
+            required_arrow_ids=node_requirement.get_arrow_ids(node_requirement.required_arrow_bitset),
+            next_node_ids=node_requirement.get_node_ids(node_requirement.next_node_bitset),
+            next_arrow_ids=node_requirement.get_arrow_ids(node_requirement.next_arrow_bitset),
+        )
+
+
+class ArrowQuestionResponsesResponse(BaseModel):
+    arrow_id: int = Field(...)
+    is_arrow_acquired: bool = Field(..., description='Arrow 의 문제를 모두 맞혀 Arrow 를 획득했는지 여부')
+    acquired_node_ids: List[int] = Field(..., description='Arrow 획득으로 새롭게 획득한 Node')
+    responses: List[ArrowQuestionMemberResponseItem] = Field(...)
+
+
+class QuestionResponseLeaseResponse(BaseModel):
+    responses: List[LeasedQuestionResponseItem] = Field(...)
+
+
+class QuestionResponseReplyResponse(BaseModel):
+    responses: List[ArrowQuestionMemberResponseItem] = Field(...)
+    acquired_arrow_count: int = Field(..., description='정답 처리로 회원들이 획득한 Arrow 수')
@@ -0,0 +1,49 @@
+from common.common_exceptions import CommonAPIException
+
+
+class MemberMapSubscriptionNotExistsException(CommonAPIException):
+    status_code = 400
+    default_detail = '구독하지 않은 맵입니다.'
+    default_code = 'member-map-subscription-not-exists'
+
+
+class MapNotExistsException(CommonAPIException):
+    status_code = 400
+    default_detail = '존재하지 않는 맵입니다.'
+    default_code = 'map-not-exists'
+
+
+class MapPermissionDeniedException(CommonAPIException):
+    status_code = 403
+    default_detail = '맵에 대한 권한이 없습니다.'
+    default_code = 'map-permission-denied'
+
+
+class MapImportFormatException(CommonAPIException):
+    status_code = 400
+    default_detail = '맵 가져오기 형식이 올바르지 않습니다.'
+    default_code = 'map-import-format-error'
+
+
+class NodeNotExistsException(CommonAPIException):
+    status_code = 400
+    default_detail = '존재하지 않는 Node 입니다.'
+    default_code = 'node-not-exists'
+
+
+class ArrowQuestionNotExistsException(CommonAPIException):
+    status_code = 400
+    default_detail = '존재하지 않는 문제입니다.'
+    default_code = 'arrow-question-not-exists'
+
+
+class ArrowSourceNodeNotAcquiredException(CommonAPIException):
+    status_code = 400
+    default_detail = 'Arrow 의 출발 Node 를 먼저 획득해야 합니다.'
+    default_code = 'arrow-source-node-not-acquired'
+
+
+class QuestionResponseLeaseExpiredException(CommonAPIException):
+    status_code = 400
+    default_detail = '채점 시간이 만료되었거나 채점할 수 없는 답지입니다.'
+    default_code = 'question-response-lease-expired'
@@ -0,0 +1,76 @@
+from collections import defaultdict
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Set,
+    Tuple,
+)
+
+from network.helpers.snapshot_helpers import build_map_snapshot
+
+
+class NodeAcquisitionRuleIndex:
+    """
+    Map 하나의 NodeAcquisitionRule 을 Arrow 기준으로 역색인 합니다.
+
+    arrow_rule_ids: {arrow_id: (rule_id, ...)} Arrow 를 필요로 하는 Rule 목록
+    rule_arrow_ids: {rule_id: frozenset(arrow_id, ...)} Rule 을 만족하기 위해 필요한 Arrow 목록
+    rule_node_ids: {rule_id: node_id} Rule 을 만족하면 획득하는 Node
+    """
+
+    def __init__(self, rules: Iterable[Tuple[int, int, Iterable[int]]]) -> None:
+        """
+        rules: (rule_id, node_id, arrow_ids)
+        """
+        self.rule_node_ids = {}
+        self.rule_arrow_ids = {}
+        arrow_rule_ids = defaultdict(list)
+        for rule_id, node_id, arrow_ids in sorted(rules, key=lambda rule: rule[0]):
+            self.rule_node_ids[rule_id] = node_id
+            self.rule_arrow_ids[rule_id] = frozenset(arrow_ids)
+            for arrow_id in self.rule_arrow_ids[rule_id]:
+                arrow_rule_ids[arrow_id].append(rule_id)
+        self.arrow_rule_ids = {
+            arrow_id: tuple(rule_ids)
+            for arrow_id, rule_ids in arrow_rule_ids.items()
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> 'NodeAcquisitionRuleIndex':
+        return cls(
+            (rule['id'], rule['node_id'], rule['arrow_ids'])
+            for rule in snapshot['node_acquisition_rules']
+        )
+
+    @classmethod
+    def from_map(cls, map_id: int) -> 'NodeAcquisitionRuleIndex':
+        return cls.from_snapshot(build_map_snapshot(map_id))
+
+    def get_rule_ids_by_arrow_id(self, arrow_id: int) -> Tuple[int, ...]:
+        return self.arrow_rule_ids.get(arrow_id, ())
+
+    def get_related_arrow_ids(self, rule_ids: Iterable[int]) -> Set[int]:
+        related_arrow_ids = set()
+        for rule_id in rule_ids:
+            related_arrow_ids |= self.rule_arrow_ids[rule_id]
+        return related_arrow_ids
+
+    def get_satisfied_counts(self, rule_ids: Iterable[int], acquired_arrow_ids: Set[int]) -> Dict[int, int]:
+        """
+        {rule_id: 획득한 Arrow 수}
+        """
+        return {
+            rule_id: len(self.rule_arrow_ids[rule_id] & acquired_arrow_ids)
+            for rule_id in rule_ids
+        }
+
+    def get_satisfied_rule_ids(self, rule_ids: Iterable[int], acquired_arrow_ids: Set[int]) -> List[int]:
+        """
+        필요한 Arrow 를 모두 획득한 Rule 목록 (Arrow 가 없는 Rule 은 Arrow 획득으로 만족되지 않습니다.)
+        """
+        return [
+            rule_id
+            for rule_id, satisfied_count in self.get_satisfied_counts(rule_ids, acquired_arrow_ids).items()
+            if satisfied_count and satisfied_count == len(self.rule_arrow_ids[rule_id])
+        ]
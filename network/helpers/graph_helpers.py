@@ -0,0 +1,193 @@
+from array import array
+from collections import deque
+from typing import (
+    Iterable,
+    List,
+    Set,
+    Tuple,
+)
+
+from network.helpers.snapshot_helpers import build_map_snapshot
+
+
+class MapGraph:
+    """
+    Map 하나의 Node / Arrow 를 CSR(Compressed Sparse Row) 형태의 정수 배열로 보관합니다.
+
+    Node, Arrow 는 id 오름차순으로 0 부터 시작하는 dense ordinal 을 부여받습니다.
+    source: Arrow 의 출발지 Node (Node.source_arrows)
+    target: Arrow 의 도착지 Node (Node.target_arrows)
+    """
+
+    def __init__(self, node_ids: Iterable[int], arrows: Iterable[Tuple[int, int, int]]) -> None:
+        """
+        arrows: (arrow_id, source_node_id, target_node_id)
+        node_ids 에 없는 Node 를 가리키는 Arrow 는 무시합니다.
+        """
+        self.node_ids = array('q', sorted(set(node_ids)))
+        self.node_ordinals = {node_id: ordinal for ordinal, node_id in enumerate(self.node_ids)}
+
+        valid_arrows = sorted(
+            (arrow_id, self.node_ordinals[source_node_id], self.node_ordinals[target_node_id])
+            for arrow_id, source_node_id, target_node_id in arrows
+            if source_node_id in self.node_ordinals and target_node_id in self.node_ordinals
+        )
+        self.arrow_ids = array('q', (arrow_id for arrow_id, _, _ in valid_arrows))
+        self.arrow_ordinals = {arrow_id: ordinal for ordinal, arrow_id in enumerate(self.arrow_ids)}
+        self.arrow_sources = array('l', (source for _, source, _ in valid_arrows))
+        self.arrow_targets = array('l', (target for _, _, target in valid_arrows))
+
+        self.source_offsets, self.source_arrows = self._build_csr(self.arrow_sources)
+        self.target_offsets, self.target_arrows = self._build_csr(self.arrow_targets)
+
+    def _build_csr(self, arrow_nodes: array) -> Tuple[array, array]:
+        offsets = array('l', [0] * (len(self.node_ids) + 1))
+        for node_ordinal in arrow_nodes:
+            offsets[node_ordinal + 1] += 1
+        for node_ordinal in range(len(self.node_ids)):
+            offsets[node_ordinal + 1] += offsets[node_ordinal]
+
+        cursor = array('l', offsets[:-1])
+        arrow_ordinals = array('l', [0] * len(arrow_nodes))
+        for arrow_ordinal, node_ordinal in enumerate(arrow_nodes):
+            arrow_ordinals[cursor[node_ordinal]] = arrow_ordinal
+            cursor[node_ordinal] += 1
+        return offsets, arrow_ordinals
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> 'MapGraph':
+        return cls(
+            node_ids=(node['id'] for node in snapshot['nodes']),
+            arrows=(
+                (arrow['id'], arrow['source_node_id'], arrow['target_node_id'])
+                for arrow in snapshot['arrows']
+            ),
+        )
+
+    @classmethod
+    def from_map(cls, map_id: int) -> 'MapGraph':
+        return cls.from_snapshot(build_map_snapshot(map_id))
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def arrow_count(self) -> int:
+        return len(self.arrow_ids)
+
+    def has_node(self, node_id: int) -> bool:
+        return node_id in self.node_ordinals
+
+    def has_arrow(self, arrow_id: int) -> bool:
+        return arrow_id in self.arrow_ordinals
+
+    def get_source_arrow_ordinals(self, node_ordinal: int) -> array:
+        return self.source_arrows[self.source_offsets[node_ordinal]:self.source_offsets[node_ordinal + 1]]
+
+    def get_target_arrow_ordinals(self, node_ordinal: int) -> array:
+        return self.target_arrows[self.target_offsets[node_ordinal]:self.target_offsets[node_ordinal + 1]]
+
+    def get_source_arrow_ids(self, node_id: int) -> List[int]:
+        """
+        node_id 에서 출발하는 Arrow id 목록
+        """
+        return [
+            self.arrow_ids[arrow_ordinal]
+            for arrow_ordinal in self.get_source_arrow_ordinals(self.node_ordinals[node_id])
+        ]
+
+    def get_target_arrow_ids(self, node_id: int) -> List[int]:
+        """
+        node_id 로 도착하는 Arrow id 목록
+        """
+        return [
+            self.arrow_ids[arrow_ordinal]
+            for arrow_ordinal in self.get_target_arrow_ordinals(self.node_ordinals[node_id])
+        ]
+
+    def get_next_node_ids(self, node_id: int) -> List[int]:
+        return [
+            self.node_ids[self.arrow_targets[arrow_ordinal]]
+            for arrow_ordinal in self.get_source_arrow_ordinals(self.node_ordinals[node_id])
+        ]
+
+    def get_previous_node_ids(self, node_id: int) -> List[int]:
+        return [
+            self.node_ids[self.arrow_sources[arrow_ordinal]]
+            for arrow_ordinal in self.get_target_arrow_ordinals(self.node_ordinals[node_id])
+        ]
+
+    def get_arrow_node_ids(self, arrow_id: int) -> Tuple[int, int]:
+        """
+        (source_node_id, target_node_id)
+        """
+        arrow_ordinal = self.arrow_ordinals[arrow_id]
+        return (
+            self.node_ids[self.arrow_sources[arrow_ordinal]],
+            self.node_ids[self.arrow_targets[arrow_ordinal]],
+        )
+
+    def get_topological_order(self) -> List[int]:
+        """
+        Kahn 알고리즘으로 Node id 를 위상 정렬합니다.
+        같은 단계에서는 id 가 작은 Node 가 먼저 옵니다.
+        순환(cycle)이 있으면 ValueError 를 발생시킵니다.
+        """
+        in_degrees = array(
+            'l',
+            (
+                self.target_offsets[node_ordinal + 1] - self.target_offsets[node_ordinal]
+                for node_ordinal in range(self.node_count)
+            )
+        )
+        # 단계마다 진입 차수가 0 이 된 Node 를 모아 ordinal(= id) 순서로 정렬합니다.
+        level = [
+            node_ordinal
+            for node_ordinal in range(self.node_count)
+            if not in_degrees[node_ordinal]
+        ]
+        ordered_node_ids = []
+        while level:
+            next_level = []
+            for node_ordinal in level:
+                ordered_node_ids.append(self.node_ids[node_ordinal])
+                for arrow_ordinal in self.get_source_arrow_ordinals(node_ordinal):
+                    target_ordinal = self.arrow_targets[arrow_ordinal]
+                    in_degrees[target_ordinal] -= 1
+                    if not in_degrees[target_ordinal]:
+                        next_level.append(target_ordinal)
+            level = sorted(next_level)
+
+        if len(ordered_node_ids) != self.node_count:
+            raise ValueError('Map graph has a cycle.')
+        return ordered_node_ids
+
+    def get_reachable_node_ids(self, start_node_ids: Iterable[int]) -> Set[int]:
+        """
+        start_node_ids 에서 Arrow 방향을 따라 도달 가능한 모든 Node id (시작 Node 포함)
+        """
+        visited = bytearray(self.node_count)
+        queue = deque()
+        for node_id in start_node_ids:
+            node_ordinal = self.node_ordinals.get(node_id)
+            if node_ordinal is not None and not visited[node_ordinal]:
+                visited[node_ordinal] = 1
+                queue.append(node_ordinal)
+
+        while queue:
+            node_ordinal = queue.popleft()
+            for arrow_ordinal in self.get_source_arrow_ordinals(node_ordinal):
+                target_ordinal = self.arrow_targets[arrow_ordinal]
+                if not visited[target_ordinal]:
+                    visited[target_ordinal] = 1
+                    queue.append(target_ordinal)
+
+        return {
+            self.node_ids[node_ordinal]
+            for node_ordinal in range(self.node_count)
+            if visited[node_ordinal]
+        }
+
+    def is_reachable(self, source_node_id: int, target_node_id: int) -> bool:
+        return target_node_id in self.get_reachable_node_ids([source_node_id])
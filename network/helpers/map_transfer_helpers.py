@@ -0,0 +1,360 @@
+import json
+from typing import (
+    Iterable,
+    Iterator,
+    Union,
+)
+
+from django.db import transaction
+from map.models import Map
+from member.models import Member
+from network.consts import (
+    MAP_TRANSFER_CHUNK_SIZE,
+    MAP_TRANSFER_FORMAT_VERSION,
+    MapTransferRecordType,
+)
+from network.exceptions import MapImportFormatException
+from network.models import (
+    Arrow,
+    ArrowAcquisitionQuestionAnswer,
+    ArrowAcquisitionQuestionRule,
+    ArrowAcquisitionRule,
+    Node,
+    NodeAcquisitionRule,
+)
+
+
+# 가져오기 시 참조 대상이 먼저 생성되도록 이 순서대로 내보냅니다.
+MAP_TRANSFER_RECORD_TYPES = [
+    MapTransferRecordType.MAP.value,
+    MapTransferRecordType.NODE.value,
+    MapTransferRecordType.ARROW.value,
+    MapTransferRecordType.NODE_ACQUISITION_RULE.value,
+    MapTransferRecordType.ARROW_ACQUISITION_RULE.value,
+    MapTransferRecordType.ARROW_ACQUISITION_QUESTION_RULE.value,
+    MapTransferRecordType.ARROW_ACQUISITION_QUESTION_ANSWER.value,
+]
+
+
+def _get_live_arrow_filters(prefix: str = '') -> dict:
+    return {
+        f'{prefix}is_deleted': False,
+        f'{prefix}source_node__is_deleted': False,
+        f'{prefix}target_node__is_deleted': False,
+    }
+
+
+def _to_line(record_type: str, record: dict) -> str:
+    return json.dumps({'type': record_type, **record}, ensure_ascii=False) + '\n'
+
+
+def iter_map_export_lines(map_id: int, chunk_size: int = MAP_TRANSFER_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Map 하나를 JSON Lines 로 내보냅니다.
+    server-side cursor(iterator) 로 chunk_size 씩 읽으므로 Map 크기와 관계없이 메모리 사용량이 일정합니다.
+    삭제된 데이터 및 삭제된 Node / Arrow 에 연결된 데이터는 제외합니다.
+    """
+    map_record = Map.objects.filter(
+        id=map_id,
+    ).values(
+        'id',
+        'title',
+        'description',
+        'main_image_url',
+    ).get()
+    yield _to_line(MapTransferRecordType.MAP.value, {'format_version': MAP_TRANSFER_FORMAT_VERSION, **map_record})
+
+    for node in Node.objects.filter(
+        map_id=map_id,
+        is_deleted=False,
+    ).order_by(
+        'id',
+    ).values(
+        'id',
+        'simple_word',
+        'title',
+        'description',
+        'is_acquisition_only_show_info',
+        'phase',
+        'size',
+    ).iterator(chunk_size=chunk_size):
+        yield _to_line(MapTransferRecordType.NODE.value, node)
+
+    for arrow in Arrow.objects.filter(
+        map_id=map_id,
+        **_get_live_arrow_filters(),
+    ).order_by(
+        'id',
+    ).values(
+        'id',
+        'simple_word',
+        'title',
+        'description',
+        'is_acquisition_only_show_info',
+        'source_node_id',
+        'target_node_id',
+    ).iterator(chunk_size=chunk_size):
+        yield _to_line(MapTransferRecordType.ARROW.value, arrow)
+
+    # Rule 과 Rule 의 Arrow 를 같은 순서로 읽으며 합칩니다.
+    rule_arrows = NodeAcquisitionRule.arrows.through.objects.filter(
+        nodeacquisitionrule__node__map_id=map_id,
+        nodeacquisitionrule__node__is_deleted=False,
+        nodeacquisitionrule__is_deleted=False,
+        **_get_live_arrow_filters('arrow__'),
+    ).order_by(
+        'nodeacquisitionrule_id',
+        'arrow_id',
+    ).values_list(
+        'nodeacquisitionrule_id',
+        'arrow_id',
+    ).iterator(chunk_size=chunk_size)
+    rule_arrow = next(rule_arrows, None)
+    for node_acquisition_rule in NodeAcquisitionRule.objects.filter(
+        node__map_id=map_id,
+        node__is_deleted=False,
+        is_deleted=False,
+    ).order_by(
+        'id',
+    ).values(
+        'id',
+        'node_id',
+        'title',
+    ).iterator(chunk_size=chunk_size):
+        arrow_ids = []
+        while rule_arrow is not None and rule_arrow[0] <= node_acquisition_rule['id']:
+            if rule_arrow[0] == node_acquisition_rule['id']:
+                arrow_ids.append(rule_arrow[1])
+            rule_arrow = next(rule_arrows, None)
+        yield _to_line(
+            MapTransferRecordType.NODE_ACQUISITION_RULE.value,
+            {**node_acquisition_rule, 'arrow_ids': arrow_ids},
+        )
+
+    for arrow_acquisition_rule in ArrowAcquisitionRule.objects.filter(
+        arrow__map_id=map_id,
+        is_deleted=False,
+        **_get_live_arrow_filters('arrow__'),
+    ).order_by(
+        'id',
+    ).values(
+        'id',
+        'arrow_id',
+    ).iterator(chunk_size=chunk_size):
+        yield _to_line(MapTransferRecordType.ARROW_ACQUISITION_RULE.value, arrow_acquisition_rule)
+
+    question_rule_filters = {
+        'arrow_acquisition_rule__arrow__map_id': map_id,
+        'arrow_acquisition_rule__is_deleted': False,
+        'is_deleted': False,
+        **_get_live_arrow_filters('arrow_acquisition_rule__arrow__'),
+    }
+    for question_rule in ArrowAcquisitionQuestionRule.objects.filter(
+        **question_rule_filters,
+    ).order_by(
+        'id',
+    ).values(
+        'id',
+        'arrow_acquisition_rule_id',
+        'question',
+        'is_auto_mark',
+        'is_always_correct',
+    ).iterator(chunk_size=chunk_size):
+        yield _to_line(MapTransferRecordType.ARROW_ACQUISITION_QUESTION_RULE.value, question_rule)
+
+    for answer in ArrowAcquisitionQuestionAnswer.objects.filter(
+        is_deleted=False,
+        **{
+            f'arrow_acquisition_question_rule__{lookup}': value
+            for lookup, value in question_rule_filters.items()
+        },
+    ).order_by(
+        'id',
+    ).values(
+        'id',
+        'arrow_acquisition_question_rule_id',
+        'answer',
+    ).iterator(chunk_size=chunk_size):
+        yield _to_line(MapTransferRecordType.ARROW_ACQUISITION_QUESTION_ANSWER.value, answer)
+
+
+class MapImporter:
+    """
+    JSON Lines 를 한 줄씩 읽어 레코드 종류별로 chunk_size 씩 bulk_create 합니다.
+    내보낸 id 는 새로 생성된 id 로 메모리에서 다시 매핑합니다. {record_type: {내보낸 id: 생성된 id}}
+    """
+
+    def __init__(self, created_by: Member, chunk_size: int = MAP_TRANSFER_CHUNK_SIZE) -> None:
+        self.created_by = created_by
+        self.chunk_size = chunk_size
+        self.map = None
+        self.id_maps = {record_type: {} for record_type in MAP_TRANSFER_RECORD_TYPES}
+        self.record_type_index = 0
+        self.pending_record_type = None
+        self.pending_records = []
+        self.pending_exported_ids = set()
+        self.pending_rule_arrow_ids = []
+
+    def _get_id(self, record_type: str, exported_id: int) -> int:
+        try:
+            return self.id_maps[record_type][exported_id]
+        except KeyError:
+            raise ValueError(f'{record_type} {exported_id} 를 찾을 수 없습니다.')
+
+    def _build_map(self, record: dict) -> Map:
+        if record.get('format_version') != MAP_TRANSFER_FORMAT_VERSION:
+            raise ValueError('지원하지 않는 format_version 입니다.')
+        return Map(
+            created_by=self.created_by,
+            title=record['title'],
+            description=record['description'],
+            main_image_url=record.get('main_image_url'),
+        )
+
+    def _build_node(self, record: dict) -> Node:
+        return Node(
+            map=self.map,
+            created_by=self.created_by,
+            simple_word=record['simple_word'],
+            title=record['title'],
+            description=record['description'],
+            is_acquisition_only_show_info=record.get('is_acquisition_only_show_info', False),
+            phase=record.get('phase'),
+            size=record.get('size', 1.0),
+        )
+
+    def _build_arrow(self, record: dict) -> Arrow:
+        return Arrow(
+            map=self.map,
+            created_by=self.created_by,
+            simple_word=record['simple_word'],
+            title=record['title'],
+            description=record['description'],
+            is_acquisition_only_show_info=record.get('is_acquisition_only_show_info', False),
+            source_node_id=self._get_id(MapTransferRecordType.NODE.value, record['source_node_id']),
+            target_node_id=self._get_id(MapTransferRecordType.NODE.value, record['target_node_id']),
+        )
+
+    def _build_node_acquisition_rule(self, record: dict) -> NodeAcquisitionRule:
+        # bulk_create 이후 through 테이블에 생성합니다.
+        self.pending_rule_arrow_ids.append(
+            [
+                self._get_id(MapTransferRecordType.ARROW.value, arrow_id)
+                for arrow_id in record.get('arrow_ids', [])
+            ]
+        )
+        return NodeAcquisitionRule(
+            node_id=self._get_id(MapTransferRecordType.NODE.value, record['node_id']),
+            title=record.get('title'),
+        )
+
+    def _build_arrow_acquisition_rule(self, record: dict) -> ArrowAcquisitionRule:
+        return ArrowAcquisitionRule(
+            arrow_id=self._get_id(MapTransferRecordType.ARROW.value, record['arrow_id']),
+        )
+
+    def _build_arrow_acquisition_question_rule(self, record: dict) -> ArrowAcquisitionQuestionRule:
+        return ArrowAcquisitionQuestionRule(
+            arrow_acquisition_rule_id=self._get_id(
+                MapTransferRecordType.ARROW_ACQUISITION_RULE.value,
+                record['arrow_acquisition_rule_id'],
+            ),
+            question=record['question'],
+            is_auto_mark=record.get('is_auto_mark', False),
+            is_always_correct=record.get('is_always_correct', False),
+        )
+
+    def _build_arrow_acquisition_question_answer(self, record: dict) -> ArrowAcquisitionQuestionAnswer:
+        return ArrowAcquisitionQuestionAnswer(
+            arrow_acquisition_question_rule_id=self._get_id(
+                MapTransferRecordType.ARROW_ACQUISITION_QUESTION_RULE.value,
+                record['arrow_acquisition_question_rule_id'],
+            ),
+            answer=record.get('answer'),
+        )
+
+    def _flush(self) -> None:
+        if not self.pending_records:
+            return
+
+        record_type = self.pending_record_type
+        objs = [obj for _, obj in self.pending_records]
+        type(objs[0]).objects.bulk_create(objs)
+        id_map = self.id_maps[record_type]
+        for exported_id, obj in self.pending_records:
+            id_map[exported_id] = obj.pk
+
+        if record_type == MapTransferRecordType.NODE_ACQUISITION_RULE.value:
+            rule_arrow_model = NodeAcquisitionRule.arrows.through
+            rule_arrow_model.objects.bulk_create(
+                [
+                    rule_arrow_model(nodeacquisitionrule_id=obj.pk, arrow_id=arrow_id)
+                    for obj, arrow_ids in zip(objs, self.pending_rule_arrow_ids)
+                    for arrow_id in arrow_ids
+                ],
+                batch_size=self.chunk_size,
+            )
+        self.pending_records = []
+        self.pending_exported_ids = set()
+        self.pending_rule_arrow_ids = []
+
+    def add_record(self, record: dict) -> None:
+        record_type = record['type']
+        if record_type not in MAP_TRANSFER_RECORD_TYPES:
+            raise ValueError(f'알 수 없는 type 입니다. ({record_type})')
+
+        record_type_index = MAP_TRANSFER_RECORD_TYPES.index(record_type)
+        if record_type_index < self.record_type_index:
+            raise ValueError(f'{record_type} 의 순서가 올바르지 않습니다.')
+        if record_type == MapTransferRecordType.MAP.value:
+            if self.map is not None:
+                raise ValueError('map 은 한 번만 입력할 수 있습니다.')
+            self.map = self._build_map(record)
+            self.map.save()
+            self.id_maps[record_type][record['id']] = self.map.id
+            return
+        if self.map is None:
+            raise ValueError('map 이 가장 먼저 입력되어야 합니다.')
+
+        if record_type != self.pending_record_type:
+            self._flush()
+            self.pending_record_type = record_type
+            self.record_type_index = record_type_index
+        exported_id = record['id']
+        if exported_id in self.id_maps[record_type] or exported_id in self.pending_exported_ids:
+            raise ValueError(f'{record_type} {exported_id} 가 중복되었습니다.')
+        self.pending_records.append((exported_id, getattr(self, f'_build_{record_type}')(record)))
+        self.pending_exported_ids.add(exported_id)
+        if len(self.pending_records) >= self.chunk_size:
+            self._flush()
+
+    def finish(self) -> Map:
+        if self.map is None:
+            raise ValueError('map 이 입력되지 않았습니다.')
+        self._flush()
+        return self.map
+
+
+@transaction.atomic
+def import_map_lines(lines: Iterable[Union[str, bytes]],
+                     created_by: Member,
+                     chunk_size: int = MAP_TRANSFER_CHUNK_SIZE) -> Map:
+    """
+    iter_map_export_lines 로 내보낸 JSON Lines 를 새로운 Map 으로 가져옵니다.
+    형식이 올바르지 않으면 MapImportFormatException 을 발생시키고 모두 롤백합니다.
+    """
+    importer = MapImporter(created_by, chunk_size)
+    for line_number, line in enumerate(lines, 1):
+        try:
+            if isinstance(line, bytes):
+                line = line.decode('utf-8')
+            if not line.strip():
+                continue
+            importer.add_record(json.loads(line))
+        except (KeyError, TypeError, ValueError) as e:
+            raise MapImportFormatException(error_summary=f'{line_number} 번째 줄의 형식이 올바르지 않습니다. ({e})')
+
+    try:
+        return importer.finish()
+    except ValueError as e:
+        raise MapImportFormatException(error_summary=f'맵 가져오기 형식이 올바르지 않습니다. ({e})')
@@ -0,0 +1,37 @@
+import time
+from typing import Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+from network.consts import MAP_VERSION_CACHE_KEY
+
+
+def _generate_initial_map_version() -> int:
+    # 캐시가 유실되어도 이전에 사용한 버전 값과 겹치지 않도록 시간 기반으로 시작합니다.
+    return int(time.time() * 1000)
+
+
+def get_map_version(map_id: int) -> int:
+    return cache.get_or_set(
+        MAP_VERSION_CACHE_KEY.format(map_id),
+        _generate_initial_map_version,
+        timeout=None,
+    )
+
+
+def bump_map_version(map_id: int) -> int:
+    key = MAP_VERSION_CACHE_KEY.format(map_id)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        version = _generate_initial_map_version()
+        cache.set(key, version, timeout=None)
+        return version
+
+
+def bump_map_versions_on_commit(map_ids: Iterable[int]) -> None:
+    # commit 이전에 버전을 올리면 다른 Process 가 변경 전 데이터를 새 버전으로 캐싱할 수 있습니다.
+    for map_id in set(map_ids):
+        if map_id is None:
+            continue
+        transaction.on_commit(lambda _map_id=map_id: bump_map_version(_map_id))
@@ -0,0 +1,130 @@
+import unicodedata
+from collections import defaultdict
+from typing import (
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from network.consts import QuestionMemberResponseStatus
+from network.helpers.snapshot_helpers import build_map_snapshot
+
+
+def normalize_answer(answer: Optional[str]) -> str:
+    """
+    전각/반각, 대소문자, 앞뒤 및 연속 공백 차이를 무시하도록 정규화합니다.
+    """
+    if not answer:
+        return ''
+    return ' '.join(unicodedata.normalize('NFKC', answer).casefold().split())
+
+
+class ArrowQuestionMarkingIndex:
+    """
+    Map 하나의 ArrowAcquisitionQuestionRule 을 채점할 수 있도록 미리 컴파일합니다.
+
+    arrow_question_rule_ids: {arrow_id: ((question_rule_id, ...), ...)} ArrowAcquisitionRule 별 문제 목록
+    question_rule_arrow_ids: {question_rule_id: arrow_id}
+    answer_sets: {question_rule_id: frozenset(정규화된 정답, ...)} 자동 채점 문제의 정답
+    always_correct_question_rule_ids: 항상 정답 처리하는 문제
+    """
+
+    def __init__(
+            self,
+            arrow_acquisition_rules: Iterable[Tuple[int, int]],
+            question_rules: Iterable[Tuple[int, int, bool, bool]],
+            answers: Iterable[Tuple[int, Optional[str]]],
+    ) -> None:
+        """
+        arrow_acquisition_rules: (arrow_acquisition_rule_id, arrow_id)
+        question_rules: (question_rule_id, arrow_acquisition_rule_id, is_auto_mark, is_always_correct)
+        answers: (question_rule_id, answer)
+        """
+        rule_arrow_ids = dict(arrow_acquisition_rules)
+        rule_question_rule_ids = defaultdict(list)
+        self.question_rule_arrow_ids = {}
+        self.always_correct_question_rule_ids = set()
+        auto_mark_question_rule_ids = set()
+        for question_rule_id, arrow_acquisition_rule_id, is_auto_mark, is_always_correct in question_rules:
+            if arrow_acquisition_rule_id not in rule_arrow_ids:
+                continue
+            rule_question_rule_ids[arrow_acquisition_rule_id].append(question_rule_id)
+            self.question_rule_arrow_ids[question_rule_id] = rule_arrow_ids[arrow_acquisition_rule_id]
+            if is_always_correct:
+                self.always_correct_question_rule_ids.add(question_rule_id)
+            elif is_auto_mark:
+                auto_mark_question_rule_ids.add(question_rule_id)
+
+        arrow_question_rule_ids = defaultdict(list)
+        for arrow_acquisition_rule_id, arrow_id in sorted(rule_arrow_ids.items()):
+            # 문제가 없는 ArrowAcquisitionRule 은 채점으로 만족할 수 없습니다.
+            if rule_question_rule_ids[arrow_acquisition_rule_id]:
+                arrow_question_rule_ids[arrow_id].append(tuple(sorted(rule_question_rule_ids[arrow_acquisition_rule_id])))
+        self.arrow_question_rule_ids = {
+            arrow_id: tuple(rules)
+            for arrow_id, rules in arrow_question_rule_ids.items()
+        }
+
+        answer_sets = defaultdict(set)
+        for question_rule_id, answer in answers:
+            normalized_answer = normalize_answer(answer)
+            if question_rule_id in auto_mark_question_rule_ids and normalized_answer:
+                answer_sets[question_rule_id].add(normalized_answer)
+        self.answer_sets = {
+            question_rule_id: frozenset(answer_sets[question_rule_id])
+            for question_rule_id in auto_mark_question_rule_ids
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> 'ArrowQuestionMarkingIndex':
+        return cls(
+            arrow_acquisition_rules=(
+                (rule['id'], rule['arrow_id'])
+                for rule in snapshot['arrow_acquisition_rules']
+            ),
+            question_rules=(
+                (rule['id'], rule['arrow_acquisition_rule_id'], rule['is_auto_mark'], rule['is_always_correct'])
+                for rule in snapshot['arrow_acquisition_question_rules']
+            ),
+            answers=(
+                (answer['arrow_acquisition_question_rule_id'], answer['answer'])
+                for answer in snapshot['arrow_acquisition_question_answers']
+            ),
+        )
+
+    @classmethod
+    def from_map(cls, map_id: int) -> 'ArrowQuestionMarkingIndex':
+        return cls.from_snapshot(build_map_snapshot(map_id))
+
+    def get_arrow_id(self, question_rule_id: int) -> Optional[int]:
+        return self.question_rule_arrow_ids.get(question_rule_id)
+
+    def get_question_rule_ids(self, arrow_id: int) -> Set[int]:
+        question_rule_ids = set()
+        for rule_question_rule_ids in self.arrow_question_rule_ids.get(arrow_id, ()):
+            question_rule_ids.update(rule_question_rule_ids)
+        return question_rule_ids
+
+    def mark(self, question_rule_id: int, response: Optional[str]) -> str:
+        """
+        항상 정답인 문제는 CORRECT, 자동 채점 문제는 정답 포함 여부에 따라 CORRECT / WRONG,
+        나머지는 채점자가 채점해야 하므로 PENDING 입니다.
+        """
+        if question_rule_id in self.always_correct_question_rule_ids:
+            return QuestionMemberResponseStatus.CORRECT.value
+        answer_set = self.answer_sets.get(question_rule_id)
+        if answer_set is None:
+            return QuestionMemberResponseStatus.PENDING.value
+        if normalize_answer(response) in answer_set:
+            return QuestionMemberResponseStatus.CORRECT.value
+        return QuestionMemberResponseStatus.WRONG.value
+
+    def is_arrow_satisfied(self, arrow_id: int, correct_question_rule_ids: Set[int]) -> bool:
+        """
+        ArrowAcquisitionRule 중 하나라도 모든 문제를 맞혔으면 Arrow 를 획득할 수 있습니다.
+        """
+        return any(
+            all(question_rule_id in correct_question_rule_ids for question_rule_id in question_rule_ids)
+            for question_rule_ids in self.arrow_question_rule_ids.get(arrow_id, ())
+        )
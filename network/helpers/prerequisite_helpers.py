@@ -0,0 +1,259 @@
+import heapq
+from typing import (
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from network.consts import NodePhase
+from network.helpers.acquisition_helpers import NodeAcquisitionRuleIndex
+from network.helpers.graph_helpers import MapGraph
+from network.helpers.progress_helpers import (
+    bitset_to_ordinals,
+    ordinals_to_bitset,
+)
+
+
+class NodeRequirement:
+    """
+    Node 를 획득하기 위해 아직 필요한 Node / Arrow (ordinal bitset)
+
+    is_acquired: 이미 획득했는지 여부
+    is_acquirable: 획득 가능한 경로가 있는지 여부
+    next: 필요한 것 중 지금 바로 획득할 수 있는 것
+    """
+
+    def __init__(
+            self,
+            map_graph: MapGraph,
+            is_acquired: bool,
+            is_acquirable: bool,
+            required_node_bitset: int = 0,
+            required_arrow_bitset: int = 0,
+            next_node_bitset: int = 0,
+            next_arrow_bitset: int = 0,
+    ) -> None:
+        self.map_graph = map_graph
+        self.is_acquired = is_acquired
+        self.is_acquirable = is_acquirable
+        self.required_node_bitset = required_node_bitset
+        self.required_arrow_bitset = required_arrow_bitset
+        self.next_node_bitset = next_node_bitset
+        self.next_arrow_bitset = next_arrow_bitset
+
+    def get_node_ids(self, node_bitset: int) -> List[int]:
+        return [self.map_graph.node_ids[ordinal] for ordinal in bitset_to_ordinals(node_bitset)]
+
+    def get_arrow_ids(self, arrow_bitset: int) -> List[int]:
+        return [self.map_graph.arrow_ids[ordinal] for ordinal in bitset_to_ordinals(arrow_bitset)]
+
+
+class MapPrerequisiteIndex:
+    """
+    Map 버전별로 한 번만 계산하는 Node 선행 조건 closure
+
+    Node 는 START Node 이거나 Rule 하나의 Arrow 를 모두 획득하면 획득할 수 있고,
+    Arrow 는 출발지 Node 를 획득하면 획득할 수 있습니다.
+
+    node_costs: Node ordinal 별로 아무것도 없는 상태에서 획득하기 위해 필요한 Node + Arrow 수 (획득할 수 없으면 None)
+    node_closures: Node ordinal 별로 아무것도 없는 상태에서 획득하기 위해 필요한
+        (Node bitset, Arrow bitset) 으로 자기 자신을 포함합니다. 획득할 수 없는 Node 는 None 입니다.
+    node_rules: Node ordinal 별 (rule_id, Arrow ordinal 목록)
+    """
+
+    def __init__(
+            self,
+            version: int,
+            map_graph: MapGraph,
+            node_acquisition_rule_index: NodeAcquisitionRuleIndex,
+            start_node_ids: Iterable[int],
+    ) -> None:
+        self.version = version
+        self.map_graph = map_graph
+        self.start_node_bitset = ordinals_to_bitset(
+            map_graph.node_ordinals[node_id]
+            for node_id in start_node_ids
+            if map_graph.has_node(node_id)
+        )
+        self.node_rules = [[] for _ in range(map_graph.node_count)]
+        for rule_id, node_id in node_acquisition_rule_index.rule_node_ids.items():
+            arrow_ordinals = tuple(
+                sorted(
+                    map_graph.arrow_ordinals[arrow_id]
+                    for arrow_id in node_acquisition_rule_index.rule_arrow_ids[rule_id]
+                    if map_graph.has_arrow(arrow_id)
+                )
+            )
+            # Arrow 가 없는 Rule 은 만족할 수 없습니다.
+            if map_graph.has_node(node_id) and arrow_ordinals:
+                self.node_rules[map_graph.node_ordinals[node_id]].append((rule_id, arrow_ordinals))
+        self.node_costs, self.node_closures = self._build_node_closures()
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> 'MapPrerequisiteIndex':
+        return cls(
+            version=snapshot['version'],
+            map_graph=MapGraph.from_snapshot(snapshot),
+            node_acquisition_rule_index=NodeAcquisitionRuleIndex.from_snapshot(snapshot),
+            start_node_ids=[
+                node['id']
+                for node in snapshot['nodes']
+                if node['phase'] == NodePhase.START.value
+            ],
+        )
+
+    def _build_node_closures(self) -> Tuple[List[Optional[int]], List[Optional[Tuple[int, int]]]]:
+        """
+        AND(Rule 의 Arrow) / OR(Node 의 Rule) 그래프에서 Knuth 의 일반화된 Dijkstra 로
+        Node 별 비용(필요한 Node + Arrow 수)이 가장 작은 Rule 을 고르고, 확정된 순서대로 closure 를 만듭니다.
+        순환에만 걸쳐 있는 Node 는 확정되지 않으므로 획득할 수 없습니다.
+        """
+        map_graph = self.map_graph
+        rule_remaining_counts = {}
+        rule_costs = {}
+        arrow_rules = [[] for _ in range(map_graph.arrow_count)]
+        for node_ordinal, rules in enumerate(self.node_rules):
+            for rule_id, arrow_ordinals in rules:
+                rule_remaining_counts[rule_id] = len(arrow_ordinals)
+                rule_costs[rule_id] = 0
+                for arrow_ordinal in arrow_ordinals:
+                    arrow_rules[arrow_ordinal].append((rule_id, node_ordinal, arrow_ordinals))
+
+        heap = [(1, node_ordinal, 0, ()) for node_ordinal in bitset_to_ordinals(self.start_node_bitset)]
+        heapq.heapify(heap)
+        node_costs = [None] * map_graph.node_count
+        node_closures = [None] * map_graph.node_count
+        while heap:
+            cost, node_ordinal, _, arrow_ordinals = heapq.heappop(heap)
+            if node_costs[node_ordinal] is not None:
+                continue
+            node_costs[node_ordinal] = cost
+
+            closure_node_bitset = 1 << node_ordinal
+            closure_arrow_bitset = 0
+            for arrow_ordinal in arrow_ordinals:
+                source_node_bitset, source_arrow_bitset = node_closures[map_graph.arrow_sources[arrow_ordinal]]
+                closure_node_bitset |= source_node_bitset
+                closure_arrow_bitset |= source_arrow_bitset | (1 << arrow_ordinal)
+            node_closures[node_ordinal] = (closure_node_bitset, closure_arrow_bitset)
+
+            for arrow_ordinal in map_graph.get_source_arrow_ordinals(node_ordinal):
+                for rule_id, target_ordinal, rule_arrow_ordinals in arrow_rules[arrow_ordinal]:
+                    rule_remaining_counts[rule_id] -= 1
+                    rule_costs[rule_id] += 1 + cost
+                    if not rule_remaining_counts[rule_id] and node_costs[target_ordinal] is None:
+                        heapq.heappush(heap, (rule_costs[rule_id] + 1, target_ordinal, rule_id, rule_arrow_ordinals))
+        return node_costs, node_closures
+
+    def _get_rule_closure(self,
+                          node_ordinal: int,
+                          arrow_ordinals: Tuple[int, ...],
+                          acquired_node_bitset: int) -> Optional[Tuple[int, int]]:
+        """
+        출발지 Node 가 이미 획득했거나 비용이 node_ordinal 보다 작은 Rule 의 closure
+        획득하지 않은 Node 는 비용이 줄어드는 방향으로만 따라가므로 선행 조건에 순환이 생기지 않습니다.
+        """
+        node_cost = self.node_costs[node_ordinal]
+        rule_node_bitset = 0
+        rule_arrow_bitset = 0
+        for arrow_ordinal in arrow_ordinals:
+            source_ordinal = self.map_graph.arrow_sources[arrow_ordinal]
+            source_cost = self.node_costs[source_ordinal]
+            if source_cost is None:
+                return None
+            if source_cost >= node_cost and not acquired_node_bitset >> source_ordinal & 1:
+                return None
+            source_node_bitset, source_arrow_bitset = self.node_closures[source_ordinal]
+            rule_node_bitset |= source_node_bitset
+            rule_arrow_bitset |= source_arrow_bitset | (1 << arrow_ordinal)
+        return rule_node_bitset, rule_arrow_bitset
+
+    def _get_best_rule_arrow_ordinals(self,
+                                      node_ordinal: int,
+                                      acquired_node_bitset: int,
+                                      acquired_arrow_bitset: int) -> Optional[Tuple[int, ...]]:
+        """
+        이미 획득한 것을 제외하고 남은 closure 가 가장 작은 Rule 의 Arrow ordinal 목록
+        """
+        best_cost = None
+        best_arrow_ordinals = None
+        for _, arrow_ordinals in self.node_rules[node_ordinal]:
+            rule_closure = self._get_rule_closure(node_ordinal, arrow_ordinals, acquired_node_bitset)
+            if rule_closure is None:
+                continue
+            cost = (
+                (rule_closure[0] & ~acquired_node_bitset).bit_count()
+                + (rule_closure[1] & ~acquired_arrow_bitset).bit_count()
+            )
+            if best_cost is None or cost < best_cost:
+                best_cost = cost
+                best_arrow_ordinals = arrow_ordinals
+        return best_arrow_ordinals
+
+    def get_requirement(self,
+                        node_id: int,
+                        acquired_node_ids: Iterable[int],
+                        acquired_arrow_ids: Iterable[int]) -> NodeRequirement:
+        """
+        이미 획득한 Node / Arrow 를 제외하고 node_id 를 획득하기 위해 필요한 Node / Arrow 를 반환합니다.
+        획득한 Node 의 선행 조건은 더 이상 필요하지 않으므로 탐색하지 않습니다.
+        """
+        map_graph = self.map_graph
+        target_ordinal = map_graph.node_ordinals[node_id]
+        acquired_node_bitset = ordinals_to_bitset(
+            map_graph.node_ordinals[acquired_node_id]
+            for acquired_node_id in acquired_node_ids
+            if map_graph.has_node(acquired_node_id)
+        )
+        acquired_arrow_bitset = ordinals_to_bitset(
+            map_graph.arrow_ordinals[acquired_arrow_id]
+            for acquired_arrow_id in acquired_arrow_ids
+            if map_graph.has_arrow(acquired_arrow_id)
+        )
+        if acquired_node_bitset >> target_ordinal & 1:
+            return NodeRequirement(map_graph, is_acquired=True, is_acquirable=True)
+        if self.node_closures[target_ordinal] is None:
+            return NodeRequirement(map_graph, is_acquired=False, is_acquirable=False)
+
+        required_node_bitset = 0
+        required_arrow_bitset = 0
+        next_node_bitset = 0
+        next_arrow_bitset = 0
+        stack = [target_ordinal]
+        while stack:
+            node_ordinal = stack.pop()
+            if required_node_bitset >> node_ordinal & 1:
+                continue
+            required_node_bitset |= 1 << node_ordinal
+            if self.start_node_bitset >> node_ordinal & 1:
+                next_node_bitset |= 1 << node_ordinal
+                continue
+
+            is_next_node = True
+            for arrow_ordinal in self._get_best_rule_arrow_ordinals(
+                    node_ordinal,
+                    acquired_node_bitset,
+                    acquired_arrow_bitset,
+            ):
+                if acquired_arrow_bitset >> arrow_ordinal & 1:
+                    continue
+                is_next_node = False
+                required_arrow_bitset |= 1 << arrow_ordinal
+                source_ordinal = map_graph.arrow_sources[arrow_ordinal]
+                if acquired_node_bitset >> source_ordinal & 1:
+                    next_arrow_bitset |= 1 << arrow_ordinal
+                else:
+                    stack.append(source_ordinal)
+            if is_next_node:
+                next_node_bitset |= 1 << node_ordinal
+
+        return NodeRequirement(
+            map_graph,
+            is_acquired=False,
+            is_acquirable=True,
+            required_node_bitset=required_node_bitset,
+            required_arrow_bitset=required_arrow_bitset,
+            next_node_bitset=next_node_bitset,
+            next_arrow_bitset=next_arrow_bitset,
+        )
@@ -0,0 +1,168 @@
+import base64
+from typing import (
+    Iterable,
+    List,
+)
+
+from network.consts import NodePhase
+from network.helpers.acquisition_helpers import NodeAcquisitionRuleIndex
+from network.helpers.graph_helpers import MapGraph
+
+
+def ordinals_to_bitset(ordinals: Iterable[int]) -> int:
+    bitset = 0
+    for ordinal in ordinals:
+        bitset |= 1 << ordinal
+    return bitset
+
+
+def bitset_to_ordinals(bitset: int) -> List[int]:
+    ordinals = []
+    while bitset:
+        lowest_bit = bitset & -bitset
+        ordinals.append(lowest_bit.bit_length() - 1)
+        bitset ^= lowest_bit
+    return ordinals
+
+
+def encode_bitset(bitset: int, size: int) -> str:
+    """
+    ordinal 0 이 첫 번째 byte 의 최하위 bit 인 little endian 바이트를 urlsafe base64 로 인코딩합니다.
+    """
+    return base64.urlsafe_b64encode(bitset.to_bytes((size + 7) // 8, 'little')).decode('utf-8')
+
+
+def decode_bitset(encoded_bitset: str) -> int:
+    try:
+        return int.from_bytes(base64.b64decode(encoded_bitset, altchars=b'-_', validate=True), 'little')
+    except Exception:
+        raise ValueError
+
+
+class MapProgress:
+    """
+    Node / Arrow 각각의 dense ordinal 기준 bitset
+
+    acquired: 획득함
+    acquirable: 획득하지 않았지만 지금 획득할 수 있음
+    locked: 나머지
+    """
+
+    def __init__(
+            self,
+            version: int,
+            map_graph: MapGraph,
+            acquired_node_bitset: int,
+            acquirable_node_bitset: int,
+            acquired_arrow_bitset: int,
+            acquirable_arrow_bitset: int,
+    ) -> None:
+        self.version = version
+        self.map_graph = map_graph
+        self.acquired_node_bitset = acquired_node_bitset
+        self.acquirable_node_bitset = acquirable_node_bitset
+        self.locked_node_bitset = (
+            ((1 << map_graph.node_count) - 1) & ~(acquired_node_bitset | acquirable_node_bitset)
+        )
+        self.acquired_arrow_bitset = acquired_arrow_bitset
+        self.acquirable_arrow_bitset = acquirable_arrow_bitset
+        self.locked_arrow_bitset = (
+            ((1 << map_graph.arrow_count) - 1) & ~(acquired_arrow_bitset | acquirable_arrow_bitset)
+        )
+
+    def get_node_ids(self, node_bitset: int) -> List[int]:
+        return [self.map_graph.node_ids[ordinal] for ordinal in bitset_to_ordinals(node_bitset)]
+
+    def get_arrow_ids(self, arrow_bitset: int) -> List[int]:
+        return [self.map_graph.arrow_ids[ordinal] for ordinal in bitset_to_ordinals(arrow_bitset)]
+
+
+class MapProgressIndex:
+    """
+    Map 버전별로 한 번만 계산하는 진행도 계산용 bitset 모음 (ordinal 은 version 의 MapGraph 기준)
+
+    start_node_bitset: START phase Node
+    source_arrow_bitsets: Node ordinal 별로 해당 Node 에서 출발하는 Arrow bitset
+    rule_bitsets: (Node ordinal, Rule 에 필요한 Arrow bitset)
+    """
+
+    def __init__(
+            self,
+            version: int,
+            map_graph: MapGraph,
+            node_acquisition_rule_index: NodeAcquisitionRuleIndex,
+            start_node_ids: Iterable[int],
+    ) -> None:
+        self.version = version
+        self.map_graph = map_graph
+        self.start_node_bitset = ordinals_to_bitset(
+            map_graph.node_ordinals[node_id]
+            for node_id in start_node_ids
+            if map_graph.has_node(node_id)
+        )
+        self.source_arrow_bitsets = [
+            ordinals_to_bitset(map_graph.get_source_arrow_ordinals(node_ordinal))
+            for node_ordinal in range(map_graph.node_count)
+        ]
+        self.rule_bitsets = [
+            (
+                map_graph.node_ordinals[node_id],
+                ordinals_to_bitset(
+                    map_graph.arrow_ordinals[arrow_id]
+                    for arrow_id in node_acquisition_rule_index.rule_arrow_ids[rule_id]
+                    if map_graph.has_arrow(arrow_id)
+                ),
+            )
+            for rule_id, node_id in node_acquisition_rule_index.rule_node_ids.items()
+            if map_graph.has_node(node_id)
+        ]
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> 'MapProgressIndex':
+        return cls(
+            version=snapshot['version'],
+            map_graph=MapGraph.from_snapshot(snapshot),
+            node_acquisition_rule_index=NodeAcquisitionRuleIndex.from_snapshot(snapshot),
+            start_node_ids=[
+                node['id']
+                for node in snapshot['nodes']
+                if node['phase'] == NodePhase.START.value
+            ],
+        )
+
+    def get_progress(self, acquired_node_ids: Iterable[int], acquired_arrow_ids: Iterable[int]) -> MapProgress:
+        """
+        Arrow 는 출발지 Node 를 획득했으면 획득 가능합니다.
+        Node 는 START Node 이거나, 필요한 Arrow 를 모두 획득했거나 획득 가능한 Rule 이 있으면 획득 가능합니다.
+        """
+        acquired_node_bitset = ordinals_to_bitset(
+            self.map_graph.node_ordinals[node_id]
+            for node_id in acquired_node_ids
+            if self.map_graph.has_node(node_id)
+        )
+        acquired_arrow_bitset = ordinals_to_bitset(
+            self.map_graph.arrow_ordinals[arrow_id]
+            for arrow_id in acquired_arrow_ids
+            if self.map_graph.has_arrow(arrow_id)
+        )
+
+        reachable_arrow_bitset = 0
+        for node_ordinal in bitset_to_ordinals(acquired_node_bitset):
+            reachable_arrow_bitset |= self.source_arrow_bitsets[node_ordinal]
+        acquirable_arrow_bitset = reachable_arrow_bitset & ~acquired_arrow_bitset
+        reachable_arrow_bitset |= acquired_arrow_bitset
+
+        acquirable_node_bitset = self.start_node_bitset
+        for node_ordinal, rule_arrow_bitset in self.rule_bitsets:
+            if rule_arrow_bitset and not rule_arrow_bitset & ~reachable_arrow_bitset:
+                acquirable_node_bitset |= 1 << node_ordinal
+        acquirable_node_bitset &= ~acquired_node_bitset
+
+        return MapProgress(
+            version=self.version,
+            map_graph=self.map_graph,
+            acquired_node_bitset=acquired_node_bitset,
+            acquirable_node_bitset=acquirable_node_bitset,
+            acquired_arrow_bitset=acquired_arrow_bitset,
+            acquirable_arrow_bitset=acquirable_arrow_bitset,
+        )
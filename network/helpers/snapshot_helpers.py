@@ -0,0 +1,130 @@
+from collections import defaultdict
+
+from network.models import (
+    Arrow,
+    ArrowAcquisitionQuestionAnswer,
+    ArrowAcquisitionQuestionRule,
+    ArrowAcquisitionRule,
+    Node,
+    NodeAcquisitionRule,
+)
+
+
+def build_map_snapshot(map_id: int, version: int = None) -> dict:
+    """
+    Map 하나의 읽기 모델(Node, Arrow, 획득 조건, 문제, 정답)을 하나의 dict 로 만듭니다.
+    삭제된 데이터 및 삭제된 Node / Arrow 에 연결된 데이터는 제외합니다.
+    획득 수와 같이 자주 바뀌는 집계 값은 포함하지 않습니다.
+    """
+    nodes = list(
+        Node.objects.filter(
+            map_id=map_id,
+            is_deleted=False,
+        ).order_by(
+            'id',
+        ).values(
+            'id',
+            'simple_word',
+            'title',
+            'description',
+            'is_acquisition_only_show_info',
+            'phase',
+            'size',
+        )
+    )
+    node_ids = {node['id'] for node in nodes}
+
+    arrows = [
+        arrow
+        for arrow in Arrow.objects.filter(
+            map_id=map_id,
+            is_deleted=False,
+        ).order_by(
+            'id',
+        ).values(
+            'id',
+            'simple_word',
+            'title',
+            'description',
+            'is_acquisition_only_show_info',
+            'source_node_id',
+            'target_node_id',
+        )
+        if arrow['source_node_id'] in node_ids and arrow['target_node_id'] in node_ids
+    ]
+    arrow_ids = {arrow['id'] for arrow in arrows}
+
+    node_acquisition_rules = list(
+        NodeAcquisitionRule.objects.filter(
+            node_id__in=node_ids,
+            is_deleted=False,
+        ).order_by(
+            'id',
+        ).values(
+            'id',
+            'node_id',
+            'title',
+        )
+    )
+    rule_arrow_ids = defaultdict(list)
+    for rule_id, arrow_id in NodeAcquisitionRule.arrows.through.objects.filter(
+        nodeacquisitionrule_id__in=[rule['id'] for rule in node_acquisition_rules],
+    ).order_by(
+        'arrow_id',
+    ).values_list(
+        'nodeacquisitionrule_id',
+        'arrow_id',
+    ):
+        if arrow_id in arrow_ids:
+            rule_arrow_ids[rule_id].append(arrow_id)
+    for rule in node_acquisition_rules:
+        rule['arrow_ids'] = rule_arrow_ids[rule['id']]
+
+    arrow_acquisition_rules = list(
+        ArrowAcquisitionRule.objects.filter(
+            arrow_id__in=arrow_ids,
+            is_deleted=False,
+        ).order_by(
+            'id',
+        ).values(
+            'id',
+            'arrow_id',
+        )
+    )
+    arrow_acquisition_question_rules = list(
+        ArrowAcquisitionQuestionRule.objects.filter(
+            arrow_acquisition_rule_id__in=[rule['id'] for rule in arrow_acquisition_rules],
+            is_deleted=False,
+        ).order_by(
+            'id',
+        ).values(
+            'id',
+            'arrow_acquisition_rule_id',
+            'question',
+            'is_auto_mark',
+            'is_always_correct',
+        )
+    )
+    arrow_acquisition_question_answers = list(
+        ArrowAcquisitionQuestionAnswer.objects.filter(
+            arrow_acquisition_question_rule_id__in=[rule['id'] for rule in arrow_acquisition_question_rules],
+            is_deleted=False,
+        ).order_by(
+            'id',
+        ).values(
+            'id',
+            'arrow_acquisition_question_rule_id',
+            'answer',
+        )
+    )
+
+    return {
+        'map_id': map_id,
+        'version': version,
+        'nodes': nodes,
+        'arrows': arrows,
+        'node_acquisition_rules': node_acquisition_rules,
+        'arrow_acquisition_rules': arrow_acquisition_rules,
+        'arrow_acquisition_question_rules': arrow_acquisition_question_rules,
+        'arrow_acquisition_question_answers': arrow_acquisition_question_answers,
+    }
@@ -0,0 +1,26 @@
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+from map.models import Map
+from network.helpers.map_transfer_helpers import iter_map_export_lines
+
+
+class Command(BaseCommand):
+    help = 'Map 의 Node, Arrow, 획득 조건, 문제, 정답을 JSON Lines 로 내보냅니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('map_id', type=int)
+        parser.add_argument('--output', help='저장할 파일 경로 (없으면 stdout)')
+
+    def handle(self, *args, **options):
+        map_id = options['map_id']
+        if not Map.objects.filter(id=map_id).exists():
+            raise CommandError(f'Map {map_id} 가 존재하지 않습니다.')
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.writelines(iter_map_export_lines(map_id))
+        else:
+            for line in iter_map_export_lines(map_id):
+                self.stdout.write(line, ending='')
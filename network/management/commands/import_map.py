@@ -0,0 +1,27 @@
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+from member.models import Member
+from network.exceptions import MapImportFormatException
+from network.helpers.map_transfer_helpers import import_map_lines
+
+
+class Command(BaseCommand):
+    help = 'export_map 으로 내보낸 JSON Lines 파일을 새로운 Map 으로 가져옵니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--member-id', type=int, required=True, help='Map 을 생성할 회원 id')
+
+    def handle(self, *args, **options):
+        member = Member.objects.filter(id=options['member_id']).first()
+        if not member:
+            raise CommandError(f'Member {options["member_id"]} 가 존재하지 않습니다.')
+
+        try:
+            with open(options['path'], 'r', encoding='utf-8') as f:
+                map = import_map_lines(f, member)
+        except MapImportFormatException as e:
+            raise CommandError(e.detail)
+        self.stdout.write(self.style.SUCCESS(f'Map {map.id} 를 가져왔습니다.'))
@@ -0,0 +1,50 @@
+from typing import Set
+
+from django.db.models import QuerySet
+from network.helpers.map_version_helpers import bump_map_versions_on_commit
+
+
+class MapVersionQuerySet(QuerySet):
+    """
+    signal 이 발생하지 않는 update(soft delete 포함), bulk_update, bulk_create 에서도 Map 버전을 올립니다.
+    """
+    map_id_lookup = 'map_id'
+
+    def get_map_ids(self) -> Set[int]:
+        return set(
+            self.order_by().values_list(
+                self.map_id_lookup,
+                flat=True,
+            ).distinct()
+        )
+
+    def update(self, **kwargs):
+        map_ids = self.get_map_ids()
+        rows = super().update(**kwargs)
+        bump_map_versions_on_commit(map_ids)
+        return rows
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        bump_map_versions_on_commit(
+            self.model.objects.filter(
+                pk__in=[obj.pk for obj in objs if obj.pk is not None],
+            ).get_map_ids()
+        )
+        return objs
+
+
+class NodeAcquisitionRuleQuerySet(MapVersionQuerySet):
+    map_id_lookup = 'node__map_id'
+
+
+class ArrowAcquisitionRuleQuerySet(MapVersionQuerySet):
+    map_id_lookup = 'arrow__map_id'
+
+
+class ArrowAcquisitionQuestionRuleQuerySet(MapVersionQuerySet):
+    map_id_lookup = 'arrow_acquisition_rule__arrow__map_id'
+
+
+class ArrowAcquisitionQuestionAnswerQuerySet(MapVersionQuerySet):
+    map_id_lookup = 'arrow_acquisition_question_rule__arrow_acquisition_rule__arrow__map_id'
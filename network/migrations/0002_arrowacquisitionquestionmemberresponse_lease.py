@@ -0,0 +1,29 @@
+# Generated by Django 4.1.10 on 2026-10-18 19:02
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('network', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='arrowacquisitionquestionmemberresponse',
+            name='lease_expires_at',
+            field=models.DateTimeField(blank=True, help_text='채점 점유 만료 시각 (만료되면 다른 채점자가 가져갈 수 있습니다.)', null=True),
+        ),
+        migrations.AddField(
+            model_name='arrowacquisitionquestionmemberresponse',
+            name='leased_by',
+            field=models.ForeignKey(blank=True, help_text='채점 중인 채점자', null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='arrowacquisitionquestionmemberresponse',
+            index=models.Index(condition=models.Q(('is_deleted', False), ('status', 'PENDING')), fields=['id'], name='question_response_pending_idx'),
+        ),
+    ]
@@ -4,6 +4,13 @@ from network.consts import (
     NodePhase,
     QuestionMemberResponseStatus,
 )
+from network.managers import (
+    ArrowAcquisitionQuestionAnswerQuerySet,
+    ArrowAcquisitionQuestionRuleQuerySet,
+    ArrowAcquisitionRuleQuerySet,
+    MapVersionQuerySet,
+    NodeAcquisitionRuleQuerySet,
+)
 
 
 class Node(models.Model):
@@ -28,6 +35,8 @@ class Node(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = MapVersionQuerySet.as_manager()
+
     class Meta:
         indexes = [
             GinIndex(
@@ -76,6 +85,8 @@ class Arrow(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = MapVersionQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Arrow'
         verbose_name_plural = 'Arrow'
@@ -98,6 +109,8 @@ class NodeAcquisitionRule(models.Model):
         help_text='노드 획득을 위한 필요한 획득 Arrow',
     )
 
+    objects = NodeAcquisitionRuleQuerySet.as_manager()
+
     def __str__(self):
         return f'id: {self.id} / node_id: {self.node_id} / title: {self.title}'
 
@@ -112,6 +125,8 @@ class ArrowAcquisitionRule(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ArrowAcquisitionRuleQuerySet.as_manager()
+
     def __str__(self):
         return f'id: {self.id} / arrow_id: {self.arrow_id}'
 
@@ -129,6 +144,8 @@ class ArrowAcquisitionQuestionRule(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ArrowAcquisitionQuestionRuleQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Arrow 획득을 위한 조건 중 문제형: 문제'
         verbose_name_plural = 'Arrow 획득을 위한 조건 중 문제형: 문제'
@@ -148,6 +165,8 @@ class ArrowAcquisitionQuestionAnswer(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ArrowAcquisitionQuestionAnswerQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Arrow 획득을 위한 조건 중 문제형: 정답'
         verbose_name_plural = 'Arrow 획득을 위한 조건 중 문제형: 정답'
@@ -174,11 +193,31 @@ class ArrowAcquisitionQuestionMemberResponse(models.Model):
         blank=True,
         null=True,
     )
+    leased_by = models.ForeignKey(
+        'member.Member',
+        on_delete=models.DO_NOTHING,
+        related_name='+',
+        blank=True,
+        null=True,
+        help_text='채점 중인 채점자',
+    )
+    lease_expires_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text='채점 점유 만료 시각 (만료되면 다른 채점자가 가져갈 수 있습니다.)',
+    )
     is_deleted = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
+        indexes = [
+            models.Index(
+                fields=['id'],
+                name='question_response_pending_idx',
+                condition=models.Q(status=QuestionMemberResponseStatus.PENDING.value, is_deleted=False),
+            ),
+        ]
         verbose_name = 'Arrow 획득을 위한 조건 중 문제형: 사용자 답지'
         verbose_name_plural = 'Arrow 획득을 위한 조건 중 문제형: 사용자 답지'
 
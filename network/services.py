@@ -0,0 +1,516 @@
+from collections import defaultdict
+from datetime import timedelta
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from common.common_paginations.cursor_pagination_helpers import get_objects_with_cursor_pagination
+from common.common_utils.search_utils import get_trigram_rank
+from common.consts import SEARCH_SIMILARITY_THRESHOLD
+from common.helpers.counter_helpers import increase_counters_on_commit
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from map.models import Map
+from member.consts import AcquisitionPKType
+from member.models import (
+    Member,
+    MemberArrowAcquisition,
+    MemberMapSubscription,
+    MemberNodeAcquisition,
+)
+from network.consts import (
+    MAP_SNAPSHOT_CACHE_KEY,
+    MAP_SNAPSHOT_CACHE_TTL,
+    QUESTION_RESPONSE_LEASE_SECONDS,
+    QuestionMemberResponseStatus,
+)
+from network.cursor_criteria import NodeSearchCursorCriteria
+from network.exceptions import (
+    ArrowQuestionNotExistsException,
+    ArrowSourceNodeNotAcquiredException,
+    MapNotExistsException,
+    MapPermissionDeniedException,
+    MemberMapSubscriptionNotExistsException,
+    QuestionResponseLeaseExpiredException,
+)
+from network.helpers.acquisition_helpers import NodeAcquisitionRuleIndex
+from network.helpers.graph_helpers import MapGraph
+from network.helpers.map_version_helpers import get_map_version
+from network.helpers.marking_helpers import ArrowQuestionMarkingIndex
+from network.helpers.prerequisite_helpers import (
+    MapPrerequisiteIndex,
+    NodeRequirement,
+)
+from network.helpers.progress_helpers import (
+    MapProgress,
+    MapProgressIndex,
+)
+from network.helpers.snapshot_helpers import build_map_snapshot
+from network.models import (
+    ArrowAcquisitionQuestionMemberResponse,
+    ArrowAcquisitionQuestionMemberResponseReply,
+    Node,
+)
+
+
+# Process 별로 Map 버전당 한 번만 적재합니다. {map_id: (version, value)}
+_map_graphs = {}
+_node_acquisition_rule_indexes = {}
+_map_progress_indexes = {}
+_map_prerequisite_indexes = {}
+_arrow_question_marking_indexes = {}
+
+
+def get_map_snapshot(map_id: int, version: int = None) -> dict:
+    """
+    Map 버전별 스냅샷을 캐시에서 가져오고, 없으면 생성하여 캐싱합니다.
+    변경이 생기면 버전이 올라가므로 이전 버전의 스냅샷은 다시 조회되지 않습니다.
+    """
+    if version is None:
+        version = get_map_version(map_id)
+    key = MAP_SNAPSHOT_CACHE_KEY.format(map_id, version)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = build_map_snapshot(map_id, version)
+        cache.set(key, snapshot, MAP_SNAPSHOT_CACHE_TTL)
+    return snapshot
+
+
+def _get_by_map_version(store: dict, map_id: int, loader: Callable[[dict], Any]) -> Any:
+    version = get_map_version(map_id)
+    cached = store.get(map_id)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    value = loader(get_map_snapshot(map_id, version))
+    store[map_id] = (version, value)
+    return value
+
+
+def get_map_graph(map_id: int) -> MapGraph:
+    return _get_by_map_version(_map_graphs, map_id, MapGraph.from_snapshot)
+
+
+def get_node_acquisition_rule_index(map_id: int) -> NodeAcquisitionRuleIndex:
+    return _get_by_map_version(_node_acquisition_rule_indexes, map_id, NodeAcquisitionRuleIndex.from_snapshot)
+
+
+def get_map_progress_index(map_id: int) -> MapProgressIndex:
+    return _get_by_map_version(_map_progress_indexes, map_id, MapProgressIndex.from_snapshot)
+
+
+def get_map_prerequisite_index(map_id: int) -> MapPrerequisiteIndex:
+    return _get_by_map_version(_map_prerequisite_indexes, map_id, MapPrerequisiteIndex.from_snapshot)
+
+
+def get_arrow_question_marking_index(map_id: int) -> ArrowQuestionMarkingIndex:
+    return _get_by_map_version(_arrow_question_marking_indexes, map_id, ArrowQuestionMarkingIndex.from_snapshot)
+
+
+def get_member_map_subscription(member: Member, map_id: int) -> MemberMapSubscription:
+    member_map_subscription = MemberMapSubscription.objects.filter(
+        member=member,
+        map_id=map_id,
+        is_deleted=False,
+    ).first()
+    if not member_map_subscription:
+        raise MemberMapSubscriptionNotExistsException()
+    return member_map_subscription
+
+
+def get_created_map(member: Member, map_id: int) -> Map:
+    """
+    member 가 만든 Map (Map 을 만든 회원만 내보내기, 채점을 할 수 있습니다.)
+    """
+    map = Map.objects.filter(id=map_id, is_deleted=False).first()
+    if not map:
+        raise MapNotExistsException()
+    if map.created_by_id != member.id:
+        raise MapPermissionDeniedException()
+    return map
+
+
+def get_member_acquired_ids(member_map_subscription: MemberMapSubscription) -> Tuple[List[int], List[int]]:
+    """
+    회원이 획득한 (Node id 목록, Arrow id 목록)
+    """
+    acquired_node_ids = list(
+        MemberNodeAcquisition.objects.filter(
+            member_map_subscription=member_map_subscription,
+            is_deleted=False,
+        ).values_list(
+            'node_id',
+            flat=True,
+        )
+    )
+    acquired_arrow_ids = list(
+        MemberArrowAcquisition.objects.filter(
+            member_map_subscription=member_map_subscription,
+            is_deleted=False,
+        ).values_list(
+            'arrow_id',
+            flat=True,
+        )
+    )
+    return acquired_node_ids, acquired_arrow_ids
+
+
+def get_member_map_progress(member_map_subscription: MemberMapSubscription) -> MapProgress:
+    """
+    회원이 획득한 Node / Arrow id 만 조회하여 Map 진행도 bitset 을 계산합니다.
+    """
+    return get_map_progress_index(member_map_subscription.map_id).get_progress(
+        *get_member_acquired_ids(member_map_subscription)
+    )
+
+
+def get_member_node_requirement(member_map_subscription: MemberMapSubscription, node_id: int) -> NodeRequirement:
+    """
+    Map 버전별로 미리 계산한 선행 조건 closure 에서 회원이 이미 획득한 것을 제외하여
+    node_id 를 획득하기 위해 필요한 Node / Arrow 를 계산합니다.
+    """
+    return get_map_prerequisite_index(member_map_subscription.map_id).get_requirement(
+        node_id,
+        *get_member_acquired_ids(member_map_subscription)
+    )
+
+
+@transaction.atomic
+def acquire_arrow(member_map_subscription: MemberMapSubscription, arrow_id: int) -> List[MemberNodeAcquisition]:
+    """
+    Arrow 를 획득하고, 해당 Arrow 를 필요로 하는 NodeAcquisitionRule 만 확인하여
+    새롭게 획득한 Node 의 MemberNodeAcquisition 목록을 반환합니다.
+    """
+    map_id = member_map_subscription.map_id
+    _, is_created = MemberArrowAcquisition.objects.get_or_create(
+        member_map_subscription=member_map_subscription,
+        map_id=map_id,
+        arrow_id=arrow_id,
+        is_deleted=False,
+    )
+    if is_created:
+        increase_counters_on_commit('network.Arrow', 'total_acquisition_count', [arrow_id])
+
+    rule_index = get_node_acquisition_rule_index(map_id)
+    rule_ids = rule_index.get_rule_ids_by_arrow_id(arrow_id)
+    if not rule_ids:
+        return []
+
+    acquired_arrow_ids = set(
+        MemberArrowAcquisition.objects.filter(
+            member_map_subscription=member_map_subscription,
+            arrow_id__in=rule_index.get_related_arrow_ids(rule_ids),
+            is_deleted=False,
+        ).values_list(
+            'arrow_id',
+            flat=True,
+        )
+    )
+    satisfied_rule_ids_by_node_id = {}
+    for rule_id in rule_index.get_satisfied_rule_ids(rule_ids, acquired_arrow_ids):
+        satisfied_rule_ids_by_node_id.setdefault(rule_index.rule_node_ids[rule_id], rule_id)
+    if not satisfied_rule_ids_by_node_id:
+        return []
+
+    already_acquired_node_ids = set(
+        MemberNodeAcquisition.objects.filter(
+            member_map_subscription=member_map_subscription,
+            node_id__in=satisfied_rule_ids_by_node_id.keys(),
+            is_deleted=False,
+        ).values_list(
+            'node_id',
+            flat=True,
+        )
+    )
+    member_node_acquisitions = MemberNodeAcquisition.objects.bulk_create(
+        [
+            MemberNodeAcquisition(
+                member_map_subscription=member_map_subscription,
+                map_id=map_id,
+                node_id=node_id,
+                acquisition_pk=str(rule_id),
+                acquisition_pk_type=AcquisitionPKType.NODE_ACQUISITION_RULE.value,
+            )
+            for node_id, rule_id in satisfied_rule_ids_by_node_id.items()
+            if node_id not in already_acquired_node_ids
+        ]
+    )
+    increase_counters_on_commit(
+        'network.Node',
+        'total_acquisition_count',
+        [member_node_acquisition.node_id for member_node_acquisition in member_node_acquisitions],
+    )
+    return member_node_acquisitions
+
+
+def _get_source_node_acquired_arrows(map_id: int,
+                                     arrow_ids_by_subscription_id: Dict[int, Iterable[int]]) -> Set[Tuple[int, int]]:
+    """
+    arrow_ids_by_subscription_id: {member_map_subscription_id: arrow_ids}
+    Arrow 의 출발 Node 를 획득한 (member_map_subscription_id, arrow_id) 집합을 반환합니다.
+    """
+    map_graph = get_map_graph(map_id)
+    source_node_ids_by_arrow_id = {
+        arrow_id: map_graph.get_arrow_node_ids(arrow_id)[0]
+        for arrow_ids in arrow_ids_by_subscription_id.values()
+        for arrow_id in arrow_ids
+        if map_graph.has_arrow(arrow_id)
+    }
+    acquired_node_ids_by_subscription_id = defaultdict(set)
+    for member_map_subscription_id, node_id in MemberNodeAcquisition.objects.filter(
+        member_map_subscription_id__in=arrow_ids_by_subscription_id.keys(),
+        node_id__in=set(source_node_ids_by_arrow_id.values()),
+        is_deleted=False,
+    ).values_list(
+        'member_map_subscription_id',
+        'node_id',
+    ):
+        acquired_node_ids_by_subscription_id[member_map_subscription_id].add(node_id)
+    return {
+        (member_map_subscription_id, arrow_id)
+        for member_map_subscription_id, arrow_ids in arrow_ids_by_subscription_id.items()
+        for arrow_id in arrow_ids
+        if arrow_id in source_node_ids_by_arrow_id
+        and source_node_ids_by_arrow_id[arrow_id] in acquired_node_ids_by_subscription_id[member_map_subscription_id]
+    }
+
+
+@transaction.atomic
+def submit_arrow_question_responses(
+        member_map_subscription: MemberMapSubscription,
+        arrow_id: int,
+        responses: Iterable[Tuple[int, Optional[str]]],
+) -> Tuple[List[ArrowAcquisitionQuestionMemberResponse], List[MemberNodeAcquisition], bool]:
+    """
+    responses: (question_rule_id, response)
+    Map 버전별로 컴파일된 정답 집합으로 채점하여 답지를 한 번에 저장하고,
+    Arrow 의 문제를 모두 맞혔으면 같은 트랜잭션에서 Arrow 를 획득합니다.
+    Arrow 의 출발 Node 를 획득하지 않았으면 ArrowSourceNodeNotAcquiredException 입니다.
+    (답지 목록, 새롭게 획득한 Node 의 MemberNodeAcquisition 목록, Arrow 획득 여부) 를 반환합니다.
+    """
+    if not _get_source_node_acquired_arrows(
+        member_map_subscription.map_id,
+        {member_map_subscription.id: [arrow_id]},
+    ):
+        raise ArrowSourceNodeNotAcquiredException()
+
+    marking_index = get_arrow_question_marking_index(member_map_subscription.map_id)
+    member_responses = []
+    for question_rule_id, response in responses:
+        if marking_index.get_arrow_id(question_rule_id) != arrow_id:
+            raise ArrowQuestionNotExistsException()
+        member_responses.append(
+            ArrowAcquisitionQuestionMemberResponse(
+                arrow_acquisition_question_rule_id=question_rule_id,
+                member_map_subscription=member_map_subscription,
+                response=response,
+                status=marking_index.mark(question_rule_id, response),
+            )
+        )
+    member_responses = ArrowAcquisitionQuestionMemberResponse.objects.bulk_create(member_responses)
+
+    correct_question_rule_ids = {
+        member_response.arrow_acquisition_question_rule_id
+        for member_response in member_responses
+        if member_response.status == QuestionMemberResponseStatus.CORRECT.value
+    }
+    # 이번에 맞힌 문제만으로 부족한 경우에만 이전에 맞힌 문제를 조회합니다.
+    if not marking_index.is_arrow_satisfied(arrow_id, correct_question_rule_ids):
+        correct_question_rule_ids.update(
+            ArrowAcquisitionQuestionMemberResponse.objects.filter(
+                member_map_subscription=member_map_subscription,
+                arrow_acquisition_question_rule_id__in=marking_index.get_question_rule_ids(arrow_id),
+                status=QuestionMemberResponseStatus.CORRECT.value,
+                is_deleted=False,
+            ).values_list(
+                'arrow_acquisition_question_rule_id',
+                flat=True,
+            )
+        )
+    if not marking_index.is_arrow_satisfied(arrow_id, correct_question_rule_ids):
+        return member_responses, [], False
+    return member_responses, acquire_arrow(member_map_subscription, arrow_id), True
+
+
+@transaction.atomic
+def lease_pending_question_responses(grader: Member,
+                                     map_id: int,
+                                     size: int) -> List[ArrowAcquisitionQuestionMemberResponse]:
+    """
+    채점 대기(PENDING) 답지 중 점유되지 않았거나 점유가 만료된 답지를 id 순서로 size 개 점유합니다.
+    SELECT ... FOR UPDATE SKIP LOCKED 로 다른 채점자가 동시에 점유 중인 행은 기다리지 않고 건너뛰며,
+    이미 점유한 답지는 다시 가져오면서 점유 시간을 연장합니다.
+    """
+    now = timezone.now()
+    leased_ids = list(
+        ArrowAcquisitionQuestionMemberResponse.objects.select_for_update(
+            skip_locked=True,
+            of=('self',),
+        ).filter(
+            Q(lease_expires_at__isnull=True) | Q(lease_expires_at__lt=now) | Q(leased_by=grader),
+            member_map_subscription__map_id=map_id,
+            status=QuestionMemberResponseStatus.PENDING.value,
+            is_deleted=False,
+        ).order_by(
+            'id',
+        ).values_list(
+            'id',
+            flat=True,
+        )[:size]
+    )
+    if not leased_ids:
+        return []
+
+    ArrowAcquisitionQuestionMemberResponse.objects.filter(
+        id__in=leased_ids,
+    ).update(
+        leased_by=grader,
+        lease_expires_at=now + timedelta(seconds=QUESTION_RESPONSE_LEASE_SECONDS),
+        updated_at=now,
+    )
+    return list(
+        ArrowAcquisitionQuestionMemberResponse.objects.select_related(
+            'arrow_acquisition_question_rule',
+        ).filter(
+            id__in=leased_ids,
+        ).order_by(
+            'id',
+        )
+    )
+
+
+@transaction.atomic
+def reply_question_responses(
+        grader: Member,
+        map_id: int,
+        replies: Iterable[Tuple[int, str, Optional[str]]],
+) -> Tuple[List[ArrowAcquisitionQuestionMemberResponse], int]:
+    """
+    replies: (answer id, CORRECT / WRONG, reply)
+    점유 중인 답지에 한 번에 답변하고 점유를 해제합니다. 점유가 만료된 답지가 있으면 아무것도 반영하지 않습니다.
+    정답 처리로 Arrow 의 문제를 모두 맞힌 회원은 같은 트랜잭션에서 Arrow 를 획득합니다.
+    Arrow 의 출발 Node 를 획득하지 않은 회원은 답변만 반영하고 Arrow 를 획득하지 않습니다.
+    (답변한 답지 목록, 획득한 Arrow 수) 를 반환합니다.
+    """
+    replies_by_response_id = {
+        response_id: (replied_status, reply)
+        for response_id, replied_status, reply in replies
+    }
+    now = timezone.now()
+    member_responses = list(
+        ArrowAcquisitionQuestionMemberResponse.objects.select_for_update(
+            of=('self',),
+        ).select_related(
+            'member_map_subscription',
+        ).filter(
+            id__in=replies_by_response_id.keys(),
+            member_map_subscription__map_id=map_id,
+            status=QuestionMemberResponseStatus.PENDING.value,
+            leased_by=grader,
+            lease_expires_at__gte=now,
+            is_deleted=False,
+        ).order_by(
+            'id',
+        )
+    )
+    if len(member_responses) != len(replies_by_response_id):
+        raise QuestionResponseLeaseExpiredException()
+
+    response_replies = ArrowAcquisitionQuestionMemberResponseReply.objects.bulk_create(
+        [
+            ArrowAcquisitionQuestionMemberResponseReply(
+                arrow_acquisition_question_member_response=member_response,
+                replied_member=grader,
+                reply=replies_by_response_id[member_response.id][1],
+                replied_status=replies_by_response_id[member_response.id][0],
+            )
+            for member_response in member_responses
+        ]
+    )
+    for member_response, response_reply in zip(member_responses, response_replies):
+        member_response.status = response_reply.replied_status
+        member_response.question_member_response_reply = response_reply
+        member_response.leased_by = None
+        member_response.lease_expires_at = None
+        member_response.updated_at = now
+    ArrowAcquisitionQuestionMemberResponse.objects.bulk_update(
+        member_responses,
+        ['status', 'question_member_response_reply', 'leased_by', 'lease_expires_at', 'updated_at'],
+    )
+
+    marking_index = get_arrow_question_marking_index(map_id)
+    member_map_subscriptions = {}
+    correct_arrow_ids_by_subscription_id = defaultdict(set)
+    for member_response in member_responses:
+        arrow_id = marking_index.get_arrow_id(member_response.arrow_acquisition_question_rule_id)
+        if member_response.status == QuestionMemberResponseStatus.CORRECT.value and arrow_id is not None:
+            member_map_subscriptions[member_response.member_map_subscription_id] = member_response.member_map_subscription
+            correct_arrow_ids_by_subscription_id[member_response.member_map_subscription_id].add(arrow_id)
+    if not correct_arrow_ids_by_subscription_id:
+        return member_responses, 0
+
+    question_rule_ids = set()
+    for arrow_ids in correct_arrow_ids_by_subscription_id.values():
+        for arrow_id in arrow_ids:
+            question_rule_ids |= marking_index.get_question_rule_ids(arrow_id)
+    correct_question_rule_ids_by_subscription_id = defaultdict(set)
+    for member_map_subscription_id, question_rule_id in ArrowAcquisitionQuestionMemberResponse.objects.filter(
+        member_map_subscription_id__in=correct_arrow_ids_by_subscription_id.keys(),
+        arrow_acquisition_question_rule_id__in=question_rule_ids,
+        status=QuestionMemberResponseStatus.CORRECT.value,
+        is_deleted=False,
+    ).values_list(
+        'member_map_subscription_id',
+        'arrow_acquisition_question_rule_id',
+    ):
+        correct_question_rule_ids_by_subscription_id[member_map_subscription_id].add(question_rule_id)
+
+    source_node_acquired_arrows = _get_source_node_acquired_arrows(
+        map_id,
+        correct_arrow_ids_by_subscription_id,
+    )
+    acquired_arrow_count = 0
+    for member_map_subscription_id, arrow_ids in correct_arrow_ids_by_subscription_id.items():
+        for arrow_id in sorted(arrow_ids):
+            if (member_map_subscription_id, arrow_id) not in source_node_acquired_arrows:
+                continue
+            if marking_index.is_arrow_satisfied(
+                arrow_id,
+                correct_question_rule_ids_by_subscription_id[member_map_subscription_id],
+            ):
+                acquire_arrow(member_map_subscriptions[member_map_subscription_id], arrow_id)
+                acquired_arrow_count += 1
+    return member_responses, acquired_arrow_count
+
+
+def search_nodes(query: str,
+                 decoded_next_cursor: dict,
+                 size: int,
+                 map_id: Optional[int] = None) -> Tuple[List[Node], bool, Optional[str]]:
+    """
+    node_title_gin_idx, node_simple_word_gin_idx 를 사용하는 트라이그램 검색
+    title, simple_word 중 큰 유사도(rank) 내림차순, id 내림차순으로 keyset 페이지네이션 합니다.
+    """
+    qs = Node.objects.filter(
+        Q(title__trigram_similar=query) | Q(simple_word__trigram_similar=query),
+        is_deleted=False,
+        map__is_deleted=False,
+    )
+    if map_id is not None:
+        qs = qs.filter(map_id=map_id)
+    qs = qs.annotate(
+        rank=get_trigram_rank(query, 'title', 'simple_word'),
+    ).filter(
+        NodeSearchCursorCriteria.get_filtering_q(decoded_next_cursor),
+        rank__gte=SEARCH_SIMILARITY_THRESHOLD,
+    )
+    return get_objects_with_cursor_pagination(qs, NodeSearchCursorCriteria, {}, size)
@@ -0,0 +1,49 @@
+from django.db.models.signals import (
+    m2m_changed,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+from network.helpers.map_version_helpers import bump_map_versions_on_commit
+from network.models import (
+    Arrow,
+    ArrowAcquisitionQuestionAnswer,
+    ArrowAcquisitionQuestionRule,
+    ArrowAcquisitionRule,
+    Node,
+    NodeAcquisitionRule,
+)
+
+
+MAP_VERSIONED_MODELS = (
+    Node,
+    Arrow,
+    NodeAcquisitionRule,
+    ArrowAcquisitionRule,
+    ArrowAcquisitionQuestionRule,
+    ArrowAcquisitionQuestionAnswer,
+)
+
+
+def bump_map_version_on_change(sender, instance, **kwargs):
+    if isinstance(instance, (Node, Arrow)):
+        map_ids = {instance.map_id}
+    else:
+        map_ids = sender.objects.filter(pk=instance.pk).get_map_ids()
+    bump_map_versions_on_commit(map_ids)
+
+
+for map_versioned_model in MAP_VERSIONED_MODELS:
+    post_save.connect(bump_map_version_on_change, sender=map_versioned_model)
+    # 삭제 이후에는 연결된 Map 을 찾을 수 없으므로 삭제 전에 확인합니다.
+    pre_delete.connect(bump_map_version_on_change, sender=map_versioned_model)
+
+
+@receiver(m2m_changed, sender=NodeAcquisitionRule.arrows.through)
+def bump_map_version_on_node_acquisition_rule_arrows_change(sender, instance, action, **kwargs):
+    if action not in {'post_add', 'post_remove', 'post_clear'}:
+        return
+    if isinstance(instance, NodeAcquisitionRule):
+        bump_map_versions_on_commit(NodeAcquisitionRule.objects.filter(pk=instance.pk).get_map_ids())
+    else:
+        bump_map_versions_on_commit({instance.map_id})
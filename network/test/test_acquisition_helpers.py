@@ -0,0 +1,76 @@
+from common.common_testcase_helpers.testcase_helpers import (
+    test_case_create_arrow,
+    test_case_create_map,
+    test_case_create_node,
+    test_case_create_node_acquisition_rule,
+)
+from django.test import TestCase
+from member.models import Member
+from network.helpers.acquisition_helpers import NodeAcquisitionRuleIndex
+
+
+class NodeAcquisitionRuleIndexTestCase(TestCase):
+    def setUp(self):
+        # rule 1: node 10 <- arrow 100, 101
+        # rule 2: node 11 <- arrow 101
+        # rule 3: node 12 <- (Arrow 없음)
+        self.rule_index = NodeAcquisitionRuleIndex(
+            [
+                (2, 11, [101]),
+                (1, 10, [100, 101]),
+                (3, 12, []),
+            ]
+        )
+
+    def test_get_rule_ids_by_arrow_id(self):
+        # Given:
+        # When:
+        # Then:
+        self.assertEqual(self.rule_index.get_rule_ids_by_arrow_id(101), (1, 2))
+        self.assertEqual(self.rule_index.get_rule_ids_by_arrow_id(100), (1,))
+        self.assertEqual(self.rule_index.get_rule_ids_by_arrow_id(999), ())
+
+    def test_get_related_arrow_ids(self):
+        # Given:
+        # When:
+        # Then:
+        self.assertEqual(self.rule_index.get_related_arrow_ids([1, 2]), {100, 101})
+
+    def test_get_satisfied_counts(self):
+        # Given:
+        # When:
+        satisfied_counts = self.rule_index.get_satisfied_counts([1, 2], {101})
+
+        # Then:
+        self.assertEqual(satisfied_counts, {1: 1, 2: 1})
+
+    def test_get_satisfied_rule_ids(self):
+        # Given:
+        # When:
+        # Then: 필요한 Arrow 를 모두 획득한 Rule 만 반환
+        self.assertEqual(self.rule_index.get_satisfied_rule_ids([1, 2], {101}), [2])
+        self.assertEqual(self.rule_index.get_satisfied_rule_ids([1, 2], {100, 101}), [1, 2])
+        # And: Arrow 가 없는 Rule 은 만족되지 않음
+        self.assertEqual(self.rule_index.get_satisfied_rule_ids([3], {100, 101}), [])
+
+
+class NodeAcquisitionRuleIndexFromMapTestCase(TestCase):
+    def setUp(self):
+        self.member = Member.objects.first()
+        self.map = test_case_create_map(self.member)
+        self.node1 = test_case_create_node(self.map, '1')
+        self.node2 = test_case_create_node(self.map, '2')
+        self.arrow = test_case_create_arrow(self.node1, self.node2)
+        self.deleted_arrow = test_case_create_arrow(self.node1, self.node2, is_deleted=True)
+        self.rule = test_case_create_node_acquisition_rule(self.node2, [self.arrow, self.deleted_arrow])
+        self.deleted_rule = test_case_create_node_acquisition_rule(self.node2, [self.arrow], is_deleted=True)
+
+    def test_from_map(self):
+        # Given:
+        # When:
+        rule_index = NodeAcquisitionRuleIndex.from_map(self.map.id)
+
+        # Then: 삭제된 Rule, 삭제된 Arrow 제외
+        self.assertEqual(rule_index.rule_node_ids, {self.rule.id: self.node2.id})
+        self.assertEqual(rule_index.rule_arrow_ids, {self.rule.id: frozenset([self.arrow.id])})
+        self.assertEqual(rule_index.get_rule_ids_by_arrow_id(self.arrow.id), (self.rule.id,))
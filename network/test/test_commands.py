@@ -0,0 +1,46 @@
+import os
+import tempfile
+from io import StringIO
+
+from common.common_testcase_helpers.testcase_helpers import (
+    test_case_create_arrow,
+    test_case_create_map,
+    test_case_create_node,
+)
+from django.core.management import (
+    CommandError,
+    call_command,
+)
+from django.test import TestCase
+from map.models import Map
+from member.models import Member
+from network.models import Arrow
+
+
+class MapTransferCommandTestCase(TestCase):
+    def setUp(self):
+        self.member = Member.objects.first()
+        self.map = test_case_create_map(self.member)
+        test_case_create_arrow(test_case_create_node(self.map, '1'), test_case_create_node(self.map, '2'))
+
+    def test_export_map_and_import_map(self):
+        # Given:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'map.jsonl')
+
+            # When:
+            call_command('export_map', self.map.id, output=path)
+            out = StringIO()
+            call_command('import_map', path, member_id=self.member.id, stdout=out)
+
+        # Then:
+        imported_map = Map.objects.exclude(id=self.map.id).latest('id')
+        self.assertIn(f'Map {imported_map.id}', out.getvalue())
+        self.assertEqual(Arrow.objects.filter(map=imported_map).count(), 1)
+
+    def test_export_map_should_raise_when_map_not_exists(self):
+        # Given:
+        # When:
+        # Then:
+        with self.assertRaises(CommandError):
+            call_command('export_map', 0, stdout=StringIO())
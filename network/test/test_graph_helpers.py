@@ -0,0 +1,136 @@
+from django.test import TestCase
+from map.models import Map
+from member.models import Member
+from network.helpers.graph_helpers import MapGraph
+from network.models import (
+    Arrow,
+    Node,
+)
+
+
+class MapGraphTestCase(TestCase):
+    def setUp(self):
+        # 1 -> 2 -> 4
+        # 1 -> 3 -> 4
+        # 5 (고립)
+        self.graph = MapGraph(
+            node_ids=[4, 2, 1, 3, 5],
+            arrows=[
+                (10, 1, 2),
+                (11, 1, 3),
+                (12, 2, 4),
+                (13, 3, 4),
+            ],
+        )
+
+    def test_dense_ordinals(self):
+        # Given:
+        # When:
+        # Then: id 오름차순으로 ordinal 부여
+        self.assertEqual(list(self.graph.node_ids), [1, 2, 3, 4, 5])
+        self.assertEqual(self.graph.node_ordinals[3], 2)
+        self.assertEqual(list(self.graph.arrow_ids), [10, 11, 12, 13])
+        self.assertEqual(self.graph.node_count, 5)
+        self.assertEqual(self.graph.arrow_count, 4)
+
+    def test_neighbors(self):
+        # Given:
+        # When:
+        # Then: 출발 / 도착 Arrow 조회
+        self.assertEqual(self.graph.get_source_arrow_ids(1), [10, 11])
+        self.assertEqual(self.graph.get_target_arrow_ids(4), [12, 13])
+        self.assertEqual(self.graph.get_source_arrow_ids(5), [])
+        # And: 다음 / 이전 Node 조회
+        self.assertEqual(self.graph.get_next_node_ids(1), [2, 3])
+        self.assertEqual(self.graph.get_previous_node_ids(4), [2, 3])
+        # And: Arrow 의 양 끝 Node
+        self.assertEqual(self.graph.get_arrow_node_ids(13), (3, 4))
+
+    def test_arrow_with_unknown_node_should_be_ignored(self):
+        # Given: 존재하지 않는 Node 를 가리키는 Arrow
+        graph = MapGraph(node_ids=[1, 2], arrows=[(1, 1, 2), (2, 2, 99)])
+
+        # When:
+        # Then:
+        self.assertEqual(graph.has_arrow(1), True)
+        self.assertEqual(graph.has_arrow(2), False)
+
+    def test_get_topological_order(self):
+        # Given:
+        # When:
+        order = self.graph.get_topological_order()
+
+        # Then:
+        self.assertEqual(order, [1, 5, 2, 3, 4])
+
+    def test_get_topological_order_should_order_same_level_by_id(self):
+        # Given: 1 -> 4, 2 -> 3 (4 를 먼저 발견하지만 3 과 같은 단계)
+        graph = MapGraph(node_ids=[1, 2, 3, 4], arrows=[(1, 1, 4), (2, 2, 3)])
+
+        # When:
+        order = graph.get_topological_order()
+
+        # Then: 같은 단계에서는 id 가 작은 Node 가 먼저 옵니다.
+        self.assertEqual(order, [1, 2, 3, 4])
+
+    def test_get_topological_order_should_raise_error_when_cycle_exists(self):
+        # Given: 1 -> 2 -> 1
+        graph = MapGraph(node_ids=[1, 2], arrows=[(1, 1, 2), (2, 2, 1)])
+
+        # Expect:
+        with self.assertRaises(ValueError):
+            graph.get_topological_order()
+
+    def test_get_reachable_node_ids(self):
+        # Given:
+        # When:
+        # Then:
+        self.assertEqual(self.graph.get_reachable_node_ids([2]), {2, 4})
+        self.assertEqual(self.graph.get_reachable_node_ids([1]), {1, 2, 3, 4})
+        self.assertEqual(self.graph.get_reachable_node_ids([999]), set())
+        self.assertEqual(self.graph.is_reachable(1, 4), True)
+        self.assertEqual(self.graph.is_reachable(4, 1), False)
+
+
+class MapGraphFromMapTestCase(TestCase):
+    def setUp(self):
+        self.member = Member.objects.first()
+        self.map = Map.objects.create(created_by=self.member, title='map', description='map')
+        self.node1 = Node.objects.create(map=self.map, created_by=self.member, simple_word='1', title='1', description='1')
+        self.node2 = Node.objects.create(map=self.map, created_by=self.member, simple_word='2', title='2', description='2')
+        self.deleted_node = Node.objects.create(
+            map=self.map,
+            created_by=self.member,
+            simple_word='3',
+            title='3',
+            description='3',
+            is_deleted=True,
+        )
+        self.arrow = Arrow.objects.create(
+            map=self.map,
+            created_by=self.member,
+            simple_word='1-2',
+            title='1-2',
+            description='1-2',
+            source_node=self.node1,
+            target_node=self.node2,
+        )
+        self.arrow_to_deleted_node = Arrow.objects.create(
+            map=self.map,
+            created_by=self.member,
+            simple_word='2-3',
+            title='2-3',
+            description='2-3',
+            source_node=self.node2,
+            target_node=self.deleted_node,
+        )
+
+    def test_from_map(self):
+        # Given:
+        # When:
+        graph = MapGraph.from_map(self.map.id)
+
+        # Then: 삭제된 Node 및 삭제된 Node 로 향하는 Arrow 는 제외
+        self.assertEqual(list(graph.node_ids), [self.node1.id, self.node2.id])
+        self.assertEqual(list(graph.arrow_ids), [self.arrow.id])
+        self.assertEqual(graph.get_next_node_ids(self.node1.id), [self.node2.id])
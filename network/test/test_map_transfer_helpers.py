@@ -0,0 +1,160 @@
+import json
+
+from common.common_testcase_helpers.testcase_helpers import (
+    test_case_create_arrow,
+    test_case_create_arrow_acquisition_question_rule,
+    test_case_create_arrow_acquisition_rule,
+    test_case_create_map,
+    test_case_create_node,
+    test_case_create_node_acquisition_rule,
+)
+from django.test import TestCase
+from member.models import Member
+from network.consts import NodePhase
+from network.exceptions import MapImportFormatException
+from network.helpers.map_transfer_helpers import (
+    import_map_lines,
+    iter_map_export_lines,
+)
+from network.models import (
+    Arrow,
+    ArrowAcquisitionQuestionAnswer,
+    ArrowAcquisitionQuestionRule,
+    Node,
+    NodeAcquisitionRule,
+)
+
+
+class MapTransferTestCase(TestCase):
+    def setUp(self):
+        # node1(START) -arrow1_2-> node2 -arrow2_3-> node3
+        # deleted_node, deleted_node 에 연결된 Arrow 는 제외
+        self.member = Member.objects.first()
+        self.map = test_case_create_map(self.member, title='map', main_image_url='image')
+        self.node1 = test_case_create_node(self.map, '1', phase=NodePhase.START.value)
+        self.node2 = test_case_create_node(self.map, '2')
+        self.node3 = test_case_create_node(self.map, '3')
+        self.deleted_node = test_case_create_node(self.map, 'deleted', is_deleted=True)
+        self.arrow1_2 = test_case_create_arrow(self.node1, self.node2)
+        self.arrow2_3 = test_case_create_arrow(self.node2, self.node3)
+        self.deleted_node_arrow = test_case_create_arrow(self.node1, self.deleted_node)
+        self.node2_rule = test_case_create_node_acquisition_rule(self.node2, [self.arrow1_2])
+        self.node3_rule = test_case_create_node_acquisition_rule(
+            self.node3,
+            [self.arrow1_2, self.arrow2_3, self.deleted_node_arrow],
+        )
+        self.arrow_rule = test_case_create_arrow_acquisition_rule(self.arrow1_2)
+        self.question_rule = test_case_create_arrow_acquisition_question_rule(
+            self.arrow_rule,
+            'question',
+            ['answer1', 'answer2'],
+            is_auto_mark=True,
+        )
+
+    def _export(self, chunk_size: int = 1000) -> list:
+        return [json.loads(line) for line in iter_map_export_lines(self.map.id, chunk_size=chunk_size)]
+
+    def test_iter_map_export_lines_should_export_live_records_in_order(self):
+        # Given:
+        # When:
+        records = self._export(chunk_size=1)
+
+        # Then: 참조 대상이 먼저 나옴
+        self.assertEqual(
+            [record['type'] for record in records],
+            [
+                'map',
+                'node', 'node', 'node',
+                'arrow', 'arrow',
+                'node_acquisition_rule', 'node_acquisition_rule',
+                'arrow_acquisition_rule',
+                'arrow_acquisition_question_rule',
+                'arrow_acquisition_question_answer', 'arrow_acquisition_question_answer',
+            ],
+        )
+        # And: 삭제된 Node 에 연결된 Arrow 는 Rule 에서도 제외
+        node_acquisition_rules = [record for record in records if record['type'] == 'node_acquisition_rule']
+        self.assertEqual(node_acquisition_rules[0]['arrow_ids'], [self.arrow1_2.id])
+        self.assertEqual(node_acquisition_rules[1]['arrow_ids'], [self.arrow1_2.id, self.arrow2_3.id])
+
+    def test_import_map_lines_should_recreate_map_with_remapped_ids(self):
+        # Given:
+        lines = list(iter_map_export_lines(self.map.id))
+
+        # When: chunk 경계를 넘도록 작은 chunk_size 로 가져오기
+        imported_map = import_map_lines(lines, self.member, chunk_size=2)
+
+        # Then: 새로운 Map 에 같은 내용이 생성됨
+        self.assertNotEqual(imported_map.id, self.map.id)
+        self.assertEqual(imported_map.title, 'map')
+        self.assertEqual(imported_map.main_image_url, 'image')
+        nodes = list(Node.objects.filter(map=imported_map).order_by('id'))
+        self.assertEqual([node.title for node in nodes], ['1', '2', '3'])
+        self.assertEqual(nodes[0].phase, NodePhase.START.value)
+        arrows = list(Arrow.objects.filter(map=imported_map).order_by('id'))
+        self.assertEqual(
+            [(arrow.source_node_id, arrow.target_node_id) for arrow in arrows],
+            [(nodes[0].id, nodes[1].id), (nodes[1].id, nodes[2].id)],
+        )
+        node3_rule = NodeAcquisitionRule.objects.get(node=nodes[2])
+        self.assertEqual(
+            sorted(node3_rule.arrows.values_list('id', flat=True)),
+            [arrows[0].id, arrows[1].id],
+        )
+        question_rule = ArrowAcquisitionQuestionRule.objects.get(
+            arrow_acquisition_rule__arrow__map=imported_map,
+        )
+        self.assertEqual(question_rule.arrow_acquisition_rule.arrow_id, arrows[0].id)
+        self.assertTrue(question_rule.is_auto_mark)
+        self.assertEqual(
+            sorted(
+                ArrowAcquisitionQuestionAnswer.objects.filter(
+                    arrow_acquisition_question_rule=question_rule,
+                ).values_list('answer', flat=True)
+            ),
+            ['answer1', 'answer2'],
+        )
+        # And: 다시 내보내면 같은 구조
+        self.assertEqual(
+            [record['type'] for record in self._export()],
+            [json.loads(line)['type'] for line in iter_map_export_lines(imported_map.id)],
+        )
+
+    def test_import_map_lines_should_rollback_when_reference_not_exists(self):
+        # Given: 존재하지 않는 Node 를 참조하는 Arrow
+        lines = [
+            json.dumps({'type': 'map', 'format_version': 1, 'id': 1, 'title': 'map', 'description': 'map'}),
+            json.dumps({'type': 'node', 'id': 1, 'simple_word': '1', 'title': '1', 'description': '1'}),
+            json.dumps(
+                {
+                    'type': 'arrow', 'id': 1, 'simple_word': '1', 'title': '1', 'description': '1',
+                    'source_node_id': 1, 'target_node_id': 2,
+                }
+            ),
+        ]
+        node_count = Node.objects.count()
+
+        # When:
+        with self.assertRaises(MapImportFormatException) as e:
+            import_map_lines(lines, self.member)
+
+        # Then: 3 번째 줄 오류, 모두 롤백
+        self.assertIn('3 번째 줄', e.exception.detail)
+        self.assertEqual(Node.objects.count(), node_count)
+
+    def test_import_map_lines_should_raise_when_order_is_invalid(self):
+        # Given: node 가 arrow 이후에 나옴
+        lines = [json.dumps(record) for record in self._export()]
+        lines[3], lines[4] = lines[4], lines[3]
+
+        # When:
+        # Then:
+        with self.assertRaises(MapImportFormatException):
+            import_map_lines(lines, self.member)
+
+    def test_import_map_lines_should_raise_when_map_not_exists(self):
+        # Given:
+        # When:
+        # Then:
+        with self.assertRaises(MapImportFormatException):
+            import_map_lines([], self.member)
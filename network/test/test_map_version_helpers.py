@@ -0,0 +1,123 @@
+from common.common_testcase_helpers.testcase_helpers import (
+    test_case_create_arrow,
+    test_case_create_map,
+    test_case_create_node,
+    test_case_create_node_acquisition_rule,
+)
+from django.test import TestCase
+from member.models import Member
+from network.helpers.map_version_helpers import (
+    bump_map_version,
+    get_map_version,
+)
+from network.models import (
+    ArrowAcquisitionQuestionAnswer,
+    ArrowAcquisitionQuestionRule,
+    ArrowAcquisitionRule,
+    Node,
+    NodeAcquisitionRule,
+)
+
+
+class MapVersionTestCase(TestCase):
+    def setUp(self):
+        self.member = Member.objects.first()
+        self.map = test_case_create_map(self.member)
+        self.node1 = test_case_create_node(self.map, '1')
+        self.node2 = test_case_create_node(self.map, '2')
+        self.arrow = test_case_create_arrow(self.node1, self.node2)
+        self.other_map = test_case_create_map(self.member, 'other')
+
+    def test_bump_map_version(self):
+        # Given:
+        version = get_map_version(self.map.id)
+
+        # When:
+        bumped_version = bump_map_version(self.map.id)
+
+        # Then:
+        self.assertEqual(bumped_version, version + 1)
+        self.assertEqual(get_map_version(self.map.id), version + 1)
+
+    def test_node_save_should_bump_map_version_after_commit(self):
+        # Given:
+        version = get_map_version(self.map.id)
+
+        # When: Node 생성
+        with self.captureOnCommitCallbacks(execute=True):
+            Node.objects.create(map=self.map, created_by=self.member, simple_word='3', title='3', description='3')
+
+        # Then: 버전 증가
+        self.assertEqual(get_map_version(self.map.id), version + 1)
+
+    def test_node_save_should_not_bump_map_version_before_commit(self):
+        # Given:
+        version = get_map_version(self.map.id)
+
+        # When: commit 전
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.node1.title = 'changed'
+            self.node1.save()
+
+        # Then: 버전 유지
+        self.assertEqual(get_map_version(self.map.id), version)
+        self.assertEqual(len(callbacks), 1)
+
+    def test_soft_delete_with_queryset_update_should_bump_map_version(self):
+        # Given:
+        version = get_map_version(self.map.id)
+        other_version = get_map_version(self.other_map.id)
+
+        # When: queryset update 로 soft delete
+        with self.captureOnCommitCallbacks(execute=True):
+            Node.objects.filter(id=self.node1.id).update(is_deleted=True)
+
+        # Then: 해당 Map 버전만 증가
+        self.assertEqual(get_map_version(self.map.id), version + 1)
+        self.assertEqual(get_map_version(self.other_map.id), other_version)
+
+    def test_node_acquisition_rule_change_should_bump_map_version(self):
+        # Given:
+        version = get_map_version(self.map.id)
+
+        # When: Rule 생성 및 Arrow 연결
+        with self.captureOnCommitCallbacks(execute=True):
+            test_case_create_node_acquisition_rule(self.node2, [self.arrow])
+
+        # Then: 생성, Arrow 연결 모두 버전 증가
+        self.assertEqual(get_map_version(self.map.id), version + 2)
+
+        # When: Rule queryset update 로 soft delete
+        with self.captureOnCommitCallbacks(execute=True):
+            NodeAcquisitionRule.objects.filter(node=self.node2).update(is_deleted=True)
+
+        # Then:
+        self.assertEqual(get_map_version(self.map.id), version + 3)
+
+    def test_arrow_acquisition_question_change_should_bump_map_version(self):
+        # Given:
+        arrow_acquisition_rule = ArrowAcquisitionRule.objects.create(arrow=self.arrow)
+        question_rule = ArrowAcquisitionQuestionRule.objects.create(
+            arrow_acquisition_rule=arrow_acquisition_rule,
+            question='question',
+        )
+        version = get_map_version(self.map.id)
+
+        # When: 정답 bulk_create
+        with self.captureOnCommitCallbacks(execute=True):
+            ArrowAcquisitionQuestionAnswer.objects.bulk_create(
+                [
+                    ArrowAcquisitionQuestionAnswer(arrow_acquisition_question_rule=question_rule, answer='a'),
+                    ArrowAcquisitionQuestionAnswer(arrow_acquisition_question_rule=question_rule, answer='b'),
+                ]
+            )
+
+        # Then: Map 단위로 한 번 증가
+        self.assertEqual(get_map_version(self.map.id), version + 1)
+
+        # When: 문제 삭제
+        with self.captureOnCommitCallbacks(execute=True):
+            ArrowAcquisitionQuestionAnswer.objects.filter(arrow_acquisition_question_rule=question_rule).delete()
+
+        # Then: 삭제된 정답마다 증가
+        self.assertEqual(get_map_version(self.map.id), version + 3)
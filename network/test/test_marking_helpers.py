@@ -0,0 +1,67 @@
+from django.test import TestCase
+from network.consts import QuestionMemberResponseStatus
+from network.helpers.marking_helpers import (
+    ArrowQuestionMarkingIndex,
+    normalize_answer,
+)
+
+
+class NormalizeAnswerTestCase(TestCase):
+    def test_normalize_answer(self):
+        # Given:
+        # When:
+        # Then: 대소문자, 전각, 공백 차이 무시
+        self.assertEqual(normalize_answer('  Hello   World '), 'hello world')
+        self.assertEqual(normalize_answer('ＡＢＣ'), 'abc')
+        self.assertEqual(normalize_answer(None), '')
+
+
+class ArrowQuestionMarkingIndexTestCase(TestCase):
+    def setUp(self):
+        # arrow_acquisition_rule 1: arrow 100 <- question 10(자동 채점), 11(항상 정답)
+        # arrow_acquisition_rule 2: arrow 100 <- question 12(채점자 채점)
+        # arrow_acquisition_rule 3: arrow 101 <- (문제 없음)
+        self.marking_index = ArrowQuestionMarkingIndex(
+            arrow_acquisition_rules=[(1, 100), (2, 100), (3, 101)],
+            question_rules=[
+                (10, 1, True, False),
+                (11, 1, False, True),
+                (12, 2, False, False),
+                (13, 999, True, False),
+            ],
+            answers=[(10, 'Apple'), (10, ' 사과 '), (10, None), (13, 'x')],
+        )
+
+    def test_answer_sets_should_be_normalized(self):
+        # Given:
+        # When:
+        # Then:
+        self.assertEqual(self.marking_index.answer_sets, {10: frozenset({'apple', '사과'})})
+
+    def test_mark(self):
+        # Given:
+        # When:
+        # Then:
+        self.assertEqual(self.marking_index.mark(10, 'APPLE'), QuestionMemberResponseStatus.CORRECT.value)
+        self.assertEqual(self.marking_index.mark(10, '사과'), QuestionMemberResponseStatus.CORRECT.value)
+        self.assertEqual(self.marking_index.mark(10, 'banana'), QuestionMemberResponseStatus.WRONG.value)
+        self.assertEqual(self.marking_index.mark(11, 'anything'), QuestionMemberResponseStatus.CORRECT.value)
+        self.assertEqual(self.marking_index.mark(12, 'apple'), QuestionMemberResponseStatus.PENDING.value)
+
+    def test_get_arrow_id(self):
+        # Given:
+        # When:
+        # Then: 존재하지 않는 ArrowAcquisitionRule 의 문제 제외
+        self.assertEqual(self.marking_index.get_arrow_id(12), 100)
+        self.assertIsNone(self.marking_index.get_arrow_id(13))
+        self.assertEqual(self.marking_index.get_question_rule_ids(100), {10, 11, 12})
+
+    def test_is_arrow_satisfied(self):
+        # Given:
+        # When:
+        # Then: ArrowAcquisitionRule 하나의 문제를 모두 맞혀야 함
+        self.assertFalse(self.marking_index.is_arrow_satisfied(100, {10}))
+        self.assertTrue(self.marking_index.is_arrow_satisfied(100, {10, 11}))
+        self.assertTrue(self.marking_index.is_arrow_satisfied(100, {12}))
+        # And: 문제가 없는 Rule 은 만족할 수 없음
+        self.assertFalse(self.marking_index.is_arrow_satisfied(101, set()))
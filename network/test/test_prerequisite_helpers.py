@@ -0,0 +1,128 @@
+from django.test import TestCase
+from network.helpers.acquisition_helpers import NodeAcquisitionRuleIndex
+from network.helpers.graph_helpers import MapGraph
+from network.helpers.prerequisite_helpers import MapPrerequisiteIndex
+
+
+class MapPrerequisiteIndexTestCase(TestCase):
+    def setUp(self):
+        # 1(START) -10-> 2 -11-> 3
+        # 1(START) -12-> 6 -16-> 4 -13-> 3
+        # 7 -17-> 8 -18-> 7 (순환)
+        # rule 1: node 2 <- 10
+        # rule 2: node 3 <- 11 (짧은 경로)
+        # rule 3: node 3 <- 13 (긴 경로)
+        # rule 4: node 6 <- 12
+        # rule 5: node 4 <- 16
+        # rule 6: node 7 <- 18
+        # rule 7: node 8 <- 17
+        self.prerequisite_index = MapPrerequisiteIndex(
+            version=1,
+            map_graph=MapGraph(
+                node_ids=[1, 2, 3, 4, 6, 7, 8],
+                arrows=[
+                    (10, 1, 2), (11, 2, 3), (12, 1, 6), (13, 4, 3), (16, 6, 4), (17, 7, 8), (18, 8, 7),
+                ],
+            ),
+            node_acquisition_rule_index=NodeAcquisitionRuleIndex(
+                [
+                    (1, 2, [10]),
+                    (2, 3, [11]),
+                    (3, 3, [13]),
+                    (4, 6, [12]),
+                    (5, 4, [16]),
+                    (6, 7, [18]),
+                    (7, 8, [17]),
+                ]
+            ),
+            start_node_ids=[1],
+        )
+
+    def test_node_closures_should_use_cheapest_rule(self):
+        # Given:
+        map_graph = self.prerequisite_index.map_graph
+
+        # When:
+        node_bitset, arrow_bitset = self.prerequisite_index.node_closures[map_graph.node_ordinals[3]]
+
+        # Then: 1 -> 2 -> 3 경로
+        self.assertEqual(
+            [map_graph.node_ids[ordinal] for ordinal in range(map_graph.node_count) if node_bitset >> ordinal & 1],
+            [1, 2, 3],
+        )
+        self.assertEqual(
+            [map_graph.arrow_ids[ordinal] for ordinal in range(map_graph.arrow_count) if arrow_bitset >> ordinal & 1],
+            [10, 11],
+        )
+
+    def test_node_closures_should_be_none_when_only_reachable_by_cycle(self):
+        # Given:
+        map_graph = self.prerequisite_index.map_graph
+
+        # When:
+        # Then:
+        self.assertIsNone(self.prerequisite_index.node_closures[map_graph.node_ordinals[7]])
+        self.assertIsNone(self.prerequisite_index.node_closures[map_graph.node_ordinals[8]])
+
+    def test_get_requirement_should_return_all_prerequisites_when_nothing_acquired(self):
+        # Given:
+        # When:
+        requirement = self.prerequisite_index.get_requirement(3, [], [])
+
+        # Then:
+        self.assertFalse(requirement.is_acquired)
+        self.assertTrue(requirement.is_acquirable)
+        self.assertEqual(requirement.get_node_ids(requirement.required_node_bitset), [1, 2, 3])
+        self.assertEqual(requirement.get_arrow_ids(requirement.required_arrow_bitset), [10, 11])
+        # And: START Node 만 바로 획득 가능
+        self.assertEqual(requirement.get_node_ids(requirement.next_node_bitset), [1])
+        self.assertEqual(requirement.get_arrow_ids(requirement.next_arrow_bitset), [])
+
+    def test_get_requirement_should_exclude_acquired(self):
+        # Given: START Node 획득
+        # When:
+        requirement = self.prerequisite_index.get_requirement(3, [1], [])
+
+        # Then:
+        self.assertEqual(requirement.get_node_ids(requirement.required_node_bitset), [2, 3])
+        self.assertEqual(requirement.get_arrow_ids(requirement.required_arrow_bitset), [10, 11])
+        self.assertEqual(requirement.get_node_ids(requirement.next_node_bitset), [])
+        self.assertEqual(requirement.get_arrow_ids(requirement.next_arrow_bitset), [10])
+
+    def test_get_requirement_should_choose_rule_with_least_remaining(self):
+        # Given: 긴 경로의 Node 4 까지 획득
+        # When:
+        requirement = self.prerequisite_index.get_requirement(3, [1, 6, 4], [12, 16])
+
+        # Then: Arrow 13 만 필요
+        self.assertEqual(requirement.get_node_ids(requirement.required_node_bitset), [3])
+        self.assertEqual(requirement.get_arrow_ids(requirement.required_arrow_bitset), [13])
+        self.assertEqual(requirement.get_arrow_ids(requirement.next_arrow_bitset), [13])
+
+    def test_get_requirement_should_return_next_node_when_rule_arrows_acquired(self):
+        # Given: Node 2 조건 Arrow 획득
+        # When:
+        requirement = self.prerequisite_index.get_requirement(2, [1], [10])
+
+        # Then:
+        self.assertEqual(requirement.get_node_ids(requirement.required_node_bitset), [2])
+        self.assertEqual(requirement.required_arrow_bitset, 0)
+        self.assertEqual(requirement.get_node_ids(requirement.next_node_bitset), [2])
+
+    def test_get_requirement_should_return_acquired(self):
+        # Given:
+        # When:
+        requirement = self.prerequisite_index.get_requirement(3, [3], [])
+
+        # Then:
+        self.assertTrue(requirement.is_acquired)
+        self.assertEqual(requirement.required_node_bitset, 0)
+
+    def test_get_requirement_should_return_not_acquirable_when_no_path(self):
+        # Given:
+        # When:
+        requirement = self.prerequisite_index.get_requirement(7, [1], [])
+
+        # Then:
+        self.assertFalse(requirement.is_acquired)
+        self.assertFalse(requirement.is_acquirable)
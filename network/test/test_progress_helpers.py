@@ -0,0 +1,114 @@
+from django.test import TestCase
+from network.helpers.acquisition_helpers import NodeAcquisitionRuleIndex
+from network.helpers.graph_helpers import MapGraph
+from network.helpers.progress_helpers import (
+    MapProgressIndex,
+    bitset_to_ordinals,
+    decode_bitset,
+    encode_bitset,
+    ordinals_to_bitset,
+)
+
+
+class BitsetTestCase(TestCase):
+    def test_ordinals_to_bitset_and_bitset_to_ordinals(self):
+        # Given:
+        ordinals = [0, 3, 64, 200]
+
+        # When:
+        bitset = ordinals_to_bitset(ordinals)
+
+        # Then:
+        self.assertEqual(bitset, (1 << 0) | (1 << 3) | (1 << 64) | (1 << 200))
+        self.assertEqual(bitset_to_ordinals(bitset), ordinals)
+        self.assertEqual(bitset_to_ordinals(0), [])
+
+    def test_encode_bitset_and_decode_bitset(self):
+        # Given: ordinal 0, 9
+        bitset = ordinals_to_bitset([0, 9])
+
+        # When:
+        encoded_bitset = encode_bitset(bitset, 10)
+
+        # Then: 10 bit -> 2 byte (little endian)
+        self.assertEqual(encoded_bitset, 'AQI=')
+        self.assertEqual(decode_bitset(encoded_bitset), bitset)
+
+    def test_decode_bitset_should_raise_value_error_when_invalid(self):
+        # Given:
+        # When:
+        # Then:
+        with self.assertRaises(ValueError):
+            decode_bitset('!')
+
+
+class MapProgressIndexTestCase(TestCase):
+    def setUp(self):
+        # 1(START) -100-> 2 -101-> 3
+        # 1(START) -102-> 3
+        # rule 1: node 2 <- arrow 100
+        # rule 2: node 3 <- arrow 101, 102
+        # rule 3: node 4 <- (Arrow 없음)
+        self.progress_index = MapProgressIndex(
+            version=1,
+            map_graph=MapGraph(
+                node_ids=[1, 2, 3, 4],
+                arrows=[(100, 1, 2), (101, 2, 3), (102, 1, 3)],
+            ),
+            node_acquisition_rule_index=NodeAcquisitionRuleIndex(
+                [
+                    (1, 2, [100]),
+                    (2, 3, [101, 102]),
+                    (3, 4, []),
+                ]
+            ),
+            start_node_ids=[1],
+        )
+
+    def test_get_progress_should_only_start_node_acquirable_when_nothing_acquired(self):
+        # Given:
+        # When:
+        progress = self.progress_index.get_progress([], [])
+
+        # Then:
+        self.assertEqual(progress.version, 1)
+        self.assertEqual(progress.get_node_ids(progress.acquired_node_bitset), [])
+        self.assertEqual(progress.get_node_ids(progress.acquirable_node_bitset), [1])
+        self.assertEqual(progress.get_node_ids(progress.locked_node_bitset), [2, 3, 4])
+        self.assertEqual(progress.get_arrow_ids(progress.acquirable_arrow_bitset), [])
+        self.assertEqual(progress.get_arrow_ids(progress.locked_arrow_bitset), [100, 101, 102])
+
+    def test_get_progress_should_open_arrows_of_acquired_node(self):
+        # Given: START Node 획득
+        # When:
+        progress = self.progress_index.get_progress([1], [])
+
+        # Then: Node 1 에서 출발하는 Arrow 획득 가능
+        self.assertEqual(progress.get_node_ids(progress.acquired_node_bitset), [1])
+        self.assertEqual(progress.get_arrow_ids(progress.acquirable_arrow_bitset), [100, 102])
+        self.assertEqual(progress.get_arrow_ids(progress.locked_arrow_bitset), [101])
+        # And: 필요한 Arrow 를 모두 획득할 수 있는 Node 2 획득 가능
+        self.assertEqual(progress.get_node_ids(progress.acquirable_node_bitset), [2])
+        self.assertEqual(progress.get_node_ids(progress.locked_node_bitset), [3, 4])
+
+    def test_get_progress_should_open_node_when_rule_arrows_acquired_or_acquirable(self):
+        # Given: Node 1, 2 / Arrow 100, 102 획득
+        # When:
+        progress = self.progress_index.get_progress([1, 2], [100, 102])
+
+        # Then: Arrow 101 획득 가능
+        self.assertEqual(progress.get_arrow_ids(progress.acquired_arrow_bitset), [100, 102])
+        self.assertEqual(progress.get_arrow_ids(progress.acquirable_arrow_bitset), [101])
+        self.assertEqual(progress.get_arrow_ids(progress.locked_arrow_bitset), [])
+        # And: Node 3 획득 가능, Arrow 가 없는 Rule 의 Node 4 는 잠김
+        self.assertEqual(progress.get_node_ids(progress.acquirable_node_bitset), [3])
+        self.assertEqual(progress.get_node_ids(progress.locked_node_bitset), [4])
+
+    def test_get_progress_should_ignore_ids_not_in_map(self):
+        # Given:
+        # When:
+        progress = self.progress_index.get_progress([1, 999], [999])
+
+        # Then:
+        self.assertEqual(progress.get_node_ids(progress.acquired_node_bitset), [1])
+        self.assertEqual(progress.acquired_arrow_bitset, 0)
@@ -0,0 +1,543 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from common.common_testcase_helpers.testcase_helpers import (
+    test_case_create_arrow,
+    test_case_create_arrow_acquisition_question_rule,
+    test_case_create_arrow_acquisition_rule,
+    test_case_create_map,
+    test_case_create_member_node_acquisition,
+    test_case_create_node,
+    test_case_create_node_acquisition_rule,
+)
+from django.db import (
+    IntegrityError,
+    connection,
+    transaction,
+)
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from map.models import Map
+from member.consts import AcquisitionPKType
+from member.models import (
+    Member,
+    MemberArrowAcquisition,
+    MemberMapSubscription,
+    MemberNodeAcquisition,
+)
+from network.consts import QuestionMemberResponseStatus
+from network.cursor_criteria import NodeSearchCursorCriteria
+from network.exceptions import (
+    ArrowQuestionNotExistsException,
+    ArrowSourceNodeNotAcquiredException,
+    QuestionResponseLeaseExpiredException,
+)
+from network.helpers.map_version_helpers import (
+    bump_map_version,
+    get_map_version,
+)
+from network.models import (
+    ArrowAcquisitionQuestionMemberResponse,
+    ArrowAcquisitionQuestionMemberResponseReply,
+)
+from network.services import (
+    acquire_arrow,
+    get_map_graph,
+    get_map_snapshot,
+    get_node_acquisition_rule_index,
+    lease_pending_question_responses,
+    reply_question_responses,
+    search_nodes,
+    submit_arrow_question_responses,
+)
+
+
+class MapSnapshotTestCase(TestCase):
+    def setUp(self):
+        self.member = Member.objects.first()
+        self.map = test_case_create_map(self.member)
+        self.node = test_case_create_node(self.map, '1')
+
+    def test_get_map_snapshot_should_be_cached_per_version(self):
+        # Given:
+        version = get_map_version(self.map.id)
+
+        # When: 같은 버전에서 두 번 조회
+        snapshot = get_map_snapshot(self.map.id)
+        with self.assertNumQueries(0):
+            cached_snapshot = get_map_snapshot(self.map.id)
+
+        # Then:
+        self.assertEqual(snapshot['version'], version)
+        self.assertEqual(cached_snapshot, snapshot)
+
+    def test_get_map_snapshot_should_not_serve_stale_snapshot_after_change(self):
+        # Given: 스냅샷 캐싱
+        get_map_snapshot(self.map.id)
+
+        # When: Node soft delete
+        with self.captureOnCommitCallbacks(execute=True):
+            self.node.is_deleted = True
+            self.node.save()
+
+        # Then: 새 버전의 스냅샷 반환
+        snapshot = get_map_snapshot(self.map.id)
+        self.assertEqual(snapshot['version'], get_map_version(self.map.id))
+        self.assertEqual(snapshot['nodes'], [])
+
+
+class MapGraphCacheTestCase(TestCase):
+    def setUp(self):
+        self.member = Member.objects.first()
+        self.map = Map.objects.create(created_by=self.member, title='map', description='map')
+
+    @patch('network.services.MapGraph.from_snapshot')
+    def test_get_map_graph_should_load_once_per_version(self, mock_from_snapshot):
+        # Given:
+        mock_from_snapshot.side_effect = lambda snapshot: object()
+
+        # When: 같은 버전에서 두 번 조회
+        graph1 = get_map_graph(self.map.id)
+        graph2 = get_map_graph(self.map.id)
+
+        # Then: 한 번만 적재
+        self.assertIs(graph1, graph2)
+        self.assertEqual(mock_from_snapshot.call_count, 1)
+
+        # When: 버전 변경 후 조회
+        bump_map_version(self.map.id)
+        graph3 = get_map_graph(self.map.id)
+
+        # Then: 다시 적재
+        self.assertIsNot(graph1, graph3)
+        self.assertEqual(mock_from_snapshot.call_count, 2)
+
+
+class AcquireArrowTestCase(TestCase):
+    def setUp(self):
+        # node1 -> node2 (arrow1_2)
+        # node1 -> node3 (arrow1_3)
+        # node3 -> node2 (arrow3_2)
+        # node2 획득 조건: arrow1_2 + arrow3_2
+        # node3 획득 조건: arrow1_3
+        self.member = Member.objects.first()
+        self.map = test_case_create_map(self.member)
+        self.node1 = test_case_create_node(self.map, '1')
+        self.node2 = test_case_create_node(self.map, '2')
+        self.node3 = test_case_create_node(self.map, '3')
+        self.arrow1_2 = test_case_create_arrow(self.node1, self.node2)
+        self.arrow1_3 = test_case_create_arrow(self.node1, self.node3)
+        self.arrow3_2 = test_case_create_arrow(self.node3, self.node2)
+        self.node2_rule = test_case_create_node_acquisition_rule(self.node2, [self.arrow1_2, self.arrow3_2])
+        self.node3_rule = test_case_create_node_acquisition_rule(self.node3, [self.arrow1_3])
+        self.member_map_subscription = MemberMapSubscription.objects.create(member=self.member, map=self.map)
+        bump_map_version(self.map.id)
+
+    def test_acquire_arrow_should_create_member_arrow_acquisition(self):
+        # Given:
+        # When:
+        acquire_arrow(self.member_map_subscription, self.arrow1_2.id)
+
+        # Then:
+        self.assertEqual(
+            MemberArrowAcquisition.objects.filter(
+                member_map_subscription=self.member_map_subscription,
+                arrow_id=self.arrow1_2.id,
+            ).count(),
+            1,
+        )
+
+    def test_member_arrow_acquisition_should_be_unique(self):
+        # Given:
+        acquire_arrow(self.member_map_subscription, self.arrow1_2.id)
+
+        # When: 동시에 획득하여 get 이후 같은 Row 를 생성
+        # Then: 중복 Row 는 생성되지 않음
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            MemberArrowAcquisition.objects.create(
+                member_map_subscription=self.member_map_subscription,
+                map=self.map,
+                arrow=self.arrow1_2,
+            )
+
+        # When: 삭제 처리된 획득은 다시 획득 가능
+        MemberArrowAcquisition.objects.update(is_deleted=True)
+        acquire_arrow(self.member_map_subscription, self.arrow1_2.id)
+
+        # Then:
+        self.assertEqual(
+            MemberArrowAcquisition.objects.filter(
+                member_map_subscription=self.member_map_subscription,
+                arrow_id=self.arrow1_2.id,
+                is_deleted=False,
+            ).count(),
+            1,
+        )
+
+    def test_acquire_arrow_should_not_acquire_node_when_rule_is_not_satisfied(self):
+        # Given:
+        # When: node2 조건 중 하나만 획득
+        member_node_acquisitions = acquire_arrow(self.member_map_subscription, self.arrow1_2.id)
+
+        # Then:
+        self.assertEqual(member_node_acquisitions, [])
+        self.assertEqual(MemberNodeAcquisition.objects.filter(node=self.node2).exists(), False)
+
+    def test_acquire_arrow_should_acquire_node_when_rule_is_satisfied(self):
+        # Given: node2 조건 중 하나 획득
+        acquire_arrow(self.member_map_subscription, self.arrow1_2.id)
+
+        # When: 나머지 조건 획득
+        member_node_acquisitions = acquire_arrow(self.member_map_subscription, self.arrow3_2.id)
+
+        # Then: node2 획득
+        self.assertEqual([acquisition.node_id for acquisition in member_node_acquisitions], [self.node2.id])
+        self.assertEqual(
+            MemberNodeAcquisition.objects.filter(
+                member_map_subscription=self.member_map_subscription,
+                map=self.map,
+                node=self.node2,
+                acquisition_pk=str(self.node2_rule.id),
+                acquisition_pk_type=AcquisitionPKType.NODE_ACQUISITION_RULE.value,
+            ).count(),
+            1,
+        )
+
+    def test_acquire_arrow_should_not_duplicate_node_acquisition(self):
+        # Given: node3 이미 획득
+        acquire_arrow(self.member_map_subscription, self.arrow1_3.id)
+
+        # When: 같은 Arrow 재획득
+        member_node_acquisitions = acquire_arrow(self.member_map_subscription, self.arrow1_3.id)
+
+        # Then: 추가 생성 없음
+        self.assertEqual(member_node_acquisitions, [])
+        self.assertEqual(MemberNodeAcquisition.objects.filter(node=self.node3).count(), 1)
+        self.assertEqual(MemberArrowAcquisition.objects.filter(arrow=self.arrow1_3).count(), 1)
+
+    def test_acquire_arrow_should_only_check_rules_referencing_arrow(self):
+        # Given:
+        rule_index = get_node_acquisition_rule_index(self.map.id)
+
+        # When:
+        with patch.object(rule_index, 'get_satisfied_rule_ids', wraps=rule_index.get_satisfied_rule_ids) as mock_satisfied:
+            acquire_arrow(self.member_map_subscription, self.arrow1_3.id)
+
+        # Then: arrow1_3 을 참조하는 Rule 만 확인
+        self.assertEqual(tuple(mock_satisfied.call_args[0][0]), (self.node3_rule.id,))
+
+    @patch('network.services.increase_counters_on_commit')
+    def test_acquire_arrow_should_buffer_acquisition_counters(self, mock_increase_counters_on_commit):
+        # Given: arrow1_3 획득 시 node3 획득
+        # When:
+        acquire_arrow(self.member_map_subscription, self.arrow1_3.id)
+
+        # Then: Arrow, Node 획득 카운터 누적
+        mock_increase_counters_on_commit.assert_any_call('network.Arrow', 'total_acquisition_count', [self.arrow1_3.id])
+        mock_increase_counters_on_commit.assert_any_call('network.Node', 'total_acquisition_count', [self.node3.id])
+
+        # When: 재획득
+        mock_increase_counters_on_commit.reset_mock()
+        acquire_arrow(self.member_map_subscription, self.arrow1_3.id)
+
+        # Then: 새로 획득한 Arrow, Node 가 없으므로 누적하지 않음
+        mock_increase_counters_on_commit.assert_called_once_with('network.Node', 'total_acquisition_count', [])
+
+
+class SubmitArrowQuestionResponsesTestCase(TestCase):
+    def setUp(self):
+        # node1 -> node2 (arrow)
+        # node2 획득 조건: arrow
+        # arrow 획득 조건: auto_question(자동 채점), manual_question(채점자 채점)
+        self.member = Member.objects.first()
+        self.map = test_case_create_map(self.member)
+        self.node1 = test_case_create_node(self.map, '1')
+        self.node2 = test_case_create_node(self.map, '2')
+        self.arrow = test_case_create_arrow(self.node1, self.node2)
+        test_case_create_node_acquisition_rule(self.node2, [self.arrow])
+        arrow_acquisition_rule = test_case_create_arrow_acquisition_rule(self.arrow)
+        self.auto_question = test_case_create_arrow_acquisition_question_rule(
+            arrow_acquisition_rule,
+            'auto',
+            answers=['Apple'],
+            is_auto_mark=True,
+        )
+        self.manual_question = test_case_create_arrow_acquisition_question_rule(arrow_acquisition_rule, 'manual')
+        self.member_map_subscription = MemberMapSubscription.objects.create(member=self.member, map=self.map)
+        test_case_create_member_node_acquisition(self.member_map_subscription, self.node1)
+        bump_map_version(self.map.id)
+
+    def test_submit_arrow_question_responses_should_mark_responses(self):
+        # Given:
+        # When:
+        member_responses, member_node_acquisitions, is_arrow_acquired = submit_arrow_question_responses(
+            self.member_map_subscription,
+            self.arrow.id,
+            [(self.auto_question.id, ' apple '), (self.manual_question.id, 'manual')],
+        )
+
+        # Then: 자동 채점 문제만 채점
+        self.assertEqual(
+            [member_response.status for member_response in member_responses],
+            [QuestionMemberResponseStatus.CORRECT.value, QuestionMemberResponseStatus.PENDING.value],
+        )
+        # And: 모든 문제를 맞히지 않았으므로 Arrow 미획득
+        self.assertFalse(is_arrow_acquired)
+        self.assertEqual(member_node_acquisitions, [])
+        self.assertFalse(MemberArrowAcquisition.objects.filter(arrow=self.arrow).exists())
+
+    def test_submit_arrow_question_responses_should_acquire_arrow_when_all_correct(self):
+        # Given: 채점자 채점 문제는 이미 정답 처리
+        submit_arrow_question_responses(
+            self.member_map_subscription,
+            self.arrow.id,
+            [(self.manual_question.id, 'manual')],
+        )
+        self.member_map_subscription.arrowacquisitionquestionmemberresponse_set.update(
+            status=QuestionMemberResponseStatus.CORRECT.value,
+        )
+
+        # When:
+        member_responses, member_node_acquisitions, is_arrow_acquired = submit_arrow_question_responses(
+            self.member_map_subscription,
+            self.arrow.id,
+            [(self.auto_question.id, 'APPLE')],
+        )
+
+        # Then: Arrow, Node 획득
+        self.assertTrue(is_arrow_acquired)
+        self.assertEqual([acquisition.node_id for acquisition in member_node_acquisitions], [self.node2.id])
+        self.assertTrue(
+            MemberArrowAcquisition.objects.filter(
+                member_map_subscription=self.member_map_subscription,
+                arrow=self.arrow,
+            ).exists()
+        )
+
+    def test_submit_arrow_question_responses_should_not_query_answers(self):
+        # Given: 정답 집합 캐싱
+        submit_arrow_question_responses(
+            self.member_map_subscription,
+            self.arrow.id,
+            [(self.auto_question.id, 'wrong')],
+        )
+
+        # When: 답지 여러 개 제출
+        # Then: 출발 Node 획득 확인(1) + 답지 저장(1) + 이전 정답 조회(1) 외에 정답 조회 없음 (savepoint 2)
+        with self.assertNumQueries(5):
+            member_responses, _, _ = submit_arrow_question_responses(
+                self.member_map_subscription,
+                self.arrow.id,
+                [(self.auto_question.id, 'wrong')] * 10,
+            )
+        self.assertEqual(
+            {member_response.status for member_response in member_responses},
+            {QuestionMemberResponseStatus.WRONG.value},
+        )
+
+    def test_submit_arrow_question_responses_should_raise_when_question_of_other_arrow(self):
+        # Given:
+        other_arrow = test_case_create_arrow(self.node2, self.node1)
+        other_question = test_case_create_arrow_acquisition_question_rule(
+            test_case_create_arrow_acquisition_rule(other_arrow),
+            'other',
+        )
+        bump_map_version(self.map.id)
+
+        # When:
+        # Then:
+        with self.assertRaises(ArrowQuestionNotExistsException):
+            submit_arrow_question_responses(
+                self.member_map_subscription,
+                self.arrow.id,
+                [(other_question.id, 'other')],
+            )
+
+    def test_submit_arrow_question_responses_should_raise_when_source_node_not_acquired(self):
+        # Given: 출발 Node 미획득
+        MemberNodeAcquisition.objects.filter(member_map_subscription=self.member_map_subscription).update(is_deleted=True)
+
+        # When:
+        # Then: 답지를 저장하지 않고 Arrow 를 획득하지 않음
+        with self.assertRaises(ArrowSourceNodeNotAcquiredException):
+            submit_arrow_question_responses(
+                self.member_map_subscription,
+                self.arrow.id,
+                [(self.auto_question.id, 'apple')],
+            )
+        self.assertFalse(ArrowAcquisitionQuestionMemberResponse.objects.exists())
+        self.assertFalse(MemberArrowAcquisition.objects.filter(arrow=self.arrow).exists())
+
+
+class QuestionResponseGradingTestCase(TestCase):
+    def setUp(self):
+        # node1 -> node2 (arrow)
+        # arrow 획득 조건: question(채점자 채점)
+        self.grader = Member.objects.first()
+        self.other_grader = Member.objects.create_user(username='other_grader')
+        self.map = test_case_create_map(self.grader)
+        self.node1 = test_case_create_node(self.map, '1')
+        self.node2 = test_case_create_node(self.map, '2')
+        self.arrow = test_case_create_arrow(self.node1, self.node2)
+        self.question = test_case_create_arrow_acquisition_question_rule(
+            test_case_create_arrow_acquisition_rule(self.arrow),
+            'question',
+        )
+        self.member_map_subscription = MemberMapSubscription.objects.create(member=self.grader, map=self.map)
+        test_case_create_member_node_acquisition(self.member_map_subscription, self.node1)
+        bump_map_version(self.map.id)
+        self.member_responses = [
+            ArrowAcquisitionQuestionMemberResponse.objects.create(
+                arrow_acquisition_question_rule=self.question,
+                member_map_subscription=self.member_map_subscription,
+                response=str(i),
+                status=QuestionMemberResponseStatus.PENDING.value,
+            )
+            for i in range(3)
+        ]
+
+    def test_lease_pending_question_responses_should_not_lease_leased_responses(self):
+        # Given: 2개 점유
+        leased = lease_pending_question_responses(self.grader, self.map.id, 2)
+
+        # When: 다른 채점자가 점유
+        other_leased = lease_pending_question_responses(self.other_grader, self.map.id, 2)
+
+        # Then: 겹치지 않음
+        self.assertEqual(
+            [member_response.id for member_response in leased],
+            [self.member_responses[0].id, self.member_responses[1].id],
+        )
+        self.assertEqual([member_response.id for member_response in other_leased], [self.member_responses[2].id])
+        self.assertEqual(leased[0].leased_by_id, self.grader.id)
+        self.assertIsNotNone(leased[0].lease_expires_at)
+
+    def test_lease_pending_question_responses_should_lease_expired_responses(self):
+        # Given: 점유 만료
+        lease_pending_question_responses(self.grader, self.map.id, 3)
+        ArrowAcquisitionQuestionMemberResponse.objects.filter(
+            id=self.member_responses[0].id,
+        ).update(
+            lease_expires_at=timezone.now() - timedelta(seconds=1),
+        )
+
+        # When:
+        other_leased = lease_pending_question_responses(self.other_grader, self.map.id, 3)
+
+        # Then: 만료된 답지만 점유
+        self.assertEqual([member_response.id for member_response in other_leased], [self.member_responses[0].id])
+
+    def test_lease_pending_question_responses_should_skip_locked_rows(self):
+        # Given:
+        # When:
+        with CaptureQueriesContext(connection) as context:
+            lease_pending_question_responses(self.grader, self.map.id, 3)
+
+        # Then: 다른 채점자가 잠근 행은 기다리지 않고 건너뜀
+        self.assertTrue(any('FOR UPDATE OF' in query['sql'] and 'SKIP LOCKED' in query['sql'] for query in context.captured_queries))
+
+    def test_reply_question_responses_should_reply_and_acquire_arrow(self):
+        # Given:
+        lease_pending_question_responses(self.grader, self.map.id, 3)
+
+        # When:
+        member_responses, acquired_arrow_count = reply_question_responses(
+            self.grader,
+            self.map.id,
+            [
+                (self.member_responses[0].id, QuestionMemberResponseStatus.WRONG.value, 'wrong'),
+                (self.member_responses[1].id, QuestionMemberResponseStatus.CORRECT.value, 'good'),
+            ],
+        )
+
+        # Then:
+        self.assertEqual(
+            [member_response.status for member_response in member_responses],
+            [QuestionMemberResponseStatus.WRONG.value, QuestionMemberResponseStatus.CORRECT.value],
+        )
+        self.assertEqual(acquired_arrow_count, 1)
+        self.assertEqual(ArrowAcquisitionQuestionMemberResponseReply.objects.filter(replied_member=self.grader).count(), 2)
+        # And: 점유 해제
+        member_response = ArrowAcquisitionQuestionMemberResponse.objects.get(id=self.member_responses[1].id)
+        self.assertIsNone(member_response.leased_by_id)
+        self.assertIsNone(member_response.lease_expires_at)
+        self.assertEqual(member_response.question_member_response_reply.reply, 'good')
+        # And: Arrow 획득
+        self.assertTrue(MemberArrowAcquisition.objects.filter(arrow=self.arrow).exists())
+
+    def test_reply_question_responses_should_not_acquire_arrow_when_source_node_not_acquired(self):
+        # Given: 출발 Node 미획득
+        MemberNodeAcquisition.objects.filter(member_map_subscription=self.member_map_subscription).update(is_deleted=True)
+        lease_pending_question_responses(self.grader, self.map.id, 1)
+
+        # When:
+        member_responses, acquired_arrow_count = reply_question_responses(
+            self.grader,
+            self.map.id,
+            [(self.member_responses[0].id, QuestionMemberResponseStatus.CORRECT.value, 'good')],
+        )
+
+        # Then: 답변은 반영하지만 Arrow 는 획득하지 않음
+        self.assertEqual(member_responses[0].status, QuestionMemberResponseStatus.CORRECT.value)
+        self.assertEqual(acquired_arrow_count, 0)
+        self.assertFalse(MemberArrowAcquisition.objects.filter(arrow=self.arrow).exists())
+
+    def test_reply_question_responses_should_raise_when_not_leased(self):
+        # Given: 다른 채점자가 점유
+        lease_pending_question_responses(self.other_grader, self.map.id, 1)
+
+        # When:
+        # Then:
+        with self.assertRaises(QuestionResponseLeaseExpiredException):
+            reply_question_responses(
+                self.grader,
+                self.map.id,
+                [(self.member_responses[0].id, QuestionMemberResponseStatus.CORRECT.value, None)],
+            )
+        self.assertFalse(ArrowAcquisitionQuestionMemberResponseReply.objects.exists())
+
+
+class SearchNodesTestCase(TestCase):
+    def setUp(self):
+        self.member = Member.objects.first()
+        self.map = test_case_create_map(self.member)
+        self.other_map = test_case_create_map(self.member)
+        self.title_node = test_case_create_node(self.map, 'python', simple_word='snake')
+        self.simple_word_node = test_case_create_node(self.map, 'language', simple_word='python')
+        self.other_map_node = test_case_create_node(self.other_map, 'python basic', simple_word='basic')
+        self.java_node = test_case_create_node(self.map, 'java', simple_word='java')
+
+    def test_search_nodes_should_match_title_and_simple_word(self):
+        # Given:
+        # When:
+        nodes, has_more, next_cursor = search_nodes('python', {}, 10)
+
+        # Then: title, simple_word 중 큰 유사도 기준 정렬
+        self.assertEqual(
+            [node.id for node in nodes],
+            [self.simple_word_node.id, self.title_node.id, self.other_map_node.id],
+        )
+        self.assertFalse(has_more)
+
+    def test_search_nodes_should_filter_by_map_id(self):
+        # Given:
+        # When:
+        nodes, _, _ = search_nodes('python', {}, 10, map_id=self.other_map.id)
+
+        # Then:
+        self.assertEqual([node.id for node in nodes], [self.other_map_node.id])
+
+    def test_search_nodes_should_paginate_with_keyset_cursor(self):
+        # Given:
+        first_nodes, has_more, next_cursor = search_nodes('python', {}, 1)
+        self.assertTrue(has_more)
+
+        # When:
+        second_nodes, _, _ = search_nodes('python', NodeSearchCursorCriteria.decode_cursor(next_cursor), 10)
+
+        # Then:
+        self.assertEqual(
+            [node.id for node in first_nodes + second_nodes],
+            [self.simple_word_node.id, self.title_node.id, self.other_map_node.id],
+        )
@@ -0,0 +1,115 @@
+from common.common_testcase_helpers.testcase_helpers import (
+    test_case_create_arrow,
+    test_case_create_map,
+    test_case_create_node,
+    test_case_create_node_acquisition_rule,
+)
+from django.test import TestCase
+from member.models import Member
+from network.consts import NodePhase
+from network.helpers.snapshot_helpers import build_map_snapshot
+from network.models import (
+    ArrowAcquisitionQuestionAnswer,
+    ArrowAcquisitionQuestionRule,
+    ArrowAcquisitionRule,
+)
+
+
+class BuildMapSnapshotTestCase(TestCase):
+    def setUp(self):
+        self.member = Member.objects.first()
+        self.map = test_case_create_map(self.member)
+        self.node1 = test_case_create_node(self.map, '1', phase=NodePhase.START.value)
+        self.node2 = test_case_create_node(self.map, '2')
+        self.deleted_node = test_case_create_node(self.map, '3', is_deleted=True)
+        self.arrow = test_case_create_arrow(self.node1, self.node2)
+        self.arrow_to_deleted_node = test_case_create_arrow(self.node2, self.deleted_node)
+        self.rule = test_case_create_node_acquisition_rule(self.node2, [self.arrow, self.arrow_to_deleted_node])
+        self.deleted_node_rule = test_case_create_node_acquisition_rule(self.deleted_node, [self.arrow_to_deleted_node])
+        self.arrow_acquisition_rule = ArrowAcquisitionRule.objects.create(arrow=self.arrow)
+        self.question_rule = ArrowAcquisitionQuestionRule.objects.create(
+            arrow_acquisition_rule=self.arrow_acquisition_rule,
+            question='question',
+            is_auto_mark=True,
+        )
+        ArrowAcquisitionQuestionRule.objects.create(
+            arrow_acquisition_rule=self.arrow_acquisition_rule,
+            question='deleted',
+            is_deleted=True,
+        )
+        self.answer = ArrowAcquisitionQuestionAnswer.objects.create(
+            arrow_acquisition_question_rule=self.question_rule,
+            answer='answer',
+        )
+        ArrowAcquisitionQuestionAnswer.objects.create(
+            arrow_acquisition_question_rule=self.question_rule,
+            answer='deleted',
+            is_deleted=True,
+        )
+
+    def test_build_map_snapshot(self):
+        # Given:
+        # When:
+        snapshot = build_map_snapshot(self.map.id, 10)
+
+        # Then:
+        self.assertEqual(snapshot['map_id'], self.map.id)
+        self.assertEqual(snapshot['version'], 10)
+        # And: 삭제된 Node 제외
+        self.assertEqual([node['id'] for node in snapshot['nodes']], [self.node1.id, self.node2.id])
+        self.assertEqual(snapshot['nodes'][0]['phase'], NodePhase.START.value)
+        # And: 삭제된 Node 에 연결된 Arrow 제외
+        self.assertEqual(
+            snapshot['arrows'],
+            [
+                {
+                    'id': self.arrow.id,
+                    'simple_word': '1-2',
+                    'title': '1-2',
+                    'description': '1-2',
+                    'is_acquisition_only_show_info': False,
+                    'source_node_id': self.node1.id,
+                    'target_node_id': self.node2.id,
+                },
+            ],
+        )
+        # And: 삭제된 Node 의 Rule, 제외된 Arrow 제외
+        self.assertEqual(
+            snapshot['node_acquisition_rules'],
+            [
+                {
+                    'id': self.rule.id,
+                    'node_id': self.node2.id,
+                    'title': None,
+                    'arrow_ids': [self.arrow.id],
+                },
+            ],
+        )
+        self.assertEqual(
+            snapshot['arrow_acquisition_rules'],
+            [{'id': self.arrow_acquisition_rule.id, 'arrow_id': self.arrow.id}],
+        )
+        # And: 삭제된 문제 제외
+        self.assertEqual(
+            snapshot['arrow_acquisition_question_rules'],
+            [
+                {
+                    'id': self.question_rule.id,
+                    'arrow_acquisition_rule_id': self.arrow_acquisition_rule.id,
+                    'question': 'question',
+                    'is_auto_mark': True,
+                    'is_always_correct': False,
+                },
+            ],
+        )
+        # And: 삭제된 정답 제외
+        self.assertEqual(
+            snapshot['arrow_acquisition_question_answers'],
+            [
+                {
+                    'id': self.answer.id,
+                    'arrow_acquisition_question_rule_id': self.question_rule.id,
+                    'answer': 'answer',
+                },
+            ],
+        )
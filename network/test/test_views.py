@@ -0,0 +1,520 @@
+import json
+
+from common.common_testcase_helpers.testcase_helpers import (
+    GuestTokenMixin,
+    test_case_create_arrow,
+    test_case_create_arrow_acquisition_question_rule,
+    test_case_create_arrow_acquisition_rule,
+    test_case_create_map,
+    test_case_create_member_node_acquisition,
+    test_case_create_node,
+    test_case_create_node_acquisition_rule,
+)
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.urls import reverse
+from member.models import (
+    Guest,
+    Member,
+    MemberArrowAcquisition,
+    MemberMapSubscription,
+    MemberNodeAcquisition,
+)
+from network.consts import (
+    NodePhase,
+    QuestionMemberResponseStatus,
+)
+from network.exceptions import (
+    ArrowQuestionNotExistsException,
+    ArrowSourceNodeNotAcquiredException,
+    MapPermissionDeniedException,
+    MemberMapSubscriptionNotExistsException,
+    NodeNotExistsException,
+    QuestionResponseLeaseExpiredException,
+)
+from network.helpers.map_transfer_helpers import iter_map_export_lines
+from network.helpers.map_version_helpers import get_map_version
+from network.helpers.progress_helpers import (
+    decode_bitset,
+    ordinals_to_bitset,
+)
+from network.models import (
+    ArrowAcquisitionQuestionMemberResponse,
+    Node,
+)
+
+
+class MapProgressAPIViewTestCase(GuestTokenMixin, TestCase):
+    def setUp(self):
+        super(MapProgressAPIViewTestCase, self).setUp()
+        self.guest = Guest.objects.all().first()
+        self.member = self.guest.member
+        self.map = test_case_create_map(self.member)
+        # node1(START) -arrow1-> node2 -arrow2-> node3
+        self.node1 = test_case_create_node(self.map, '1', phase=NodePhase.START.value)
+        self.node2 = test_case_create_node(self.map, '2')
+        self.node3 = test_case_create_node(self.map, '3')
+        self.arrow1 = test_case_create_arrow(self.node1, self.node2)
+        self.arrow2 = test_case_create_arrow(self.node2, self.node3)
+        test_case_create_node_acquisition_rule(self.node2, [self.arrow1])
+        test_case_create_node_acquisition_rule(self.node3, [self.arrow2])
+        self.member_map_subscription = MemberMapSubscription.objects.create(
+            member=self.member,
+            map=self.map,
+        )
+
+    def test_map_progress_should_return_acquired_acquirable_and_locked(self):
+        # Given: Node 1 획득
+        self.login_guest(self.guest)
+        MemberNodeAcquisition.objects.create(
+            member_map_subscription=self.member_map_subscription,
+            map=self.map,
+            node=self.node1,
+        )
+
+        # When:
+        response = self.client.get(reverse('network:map_progress', args=[self.map.id]))
+
+        # Then:
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content)
+        self.assertEqual(content['map_id'], self.map.id)
+        self.assertEqual(content['version'], get_map_version(self.map.id))
+        self.assertEqual(content['node_ids'], [self.node1.id, self.node2.id, self.node3.id])
+        self.assertEqual(content['arrow_ids'], [self.arrow1.id, self.arrow2.id])
+        self.assertEqual(content['nodes']['acquired_ids'], [self.node1.id])
+        self.assertEqual(content['nodes']['acquirable_ids'], [self.node2.id])
+        self.assertEqual(content['nodes']['locked_ids'], [self.node3.id])
+        self.assertEqual(content['arrows']['acquired_ids'], [])
+        self.assertEqual(content['arrows']['acquirable_ids'], [self.arrow1.id])
+        self.assertEqual(content['arrows']['locked_ids'], [self.arrow2.id])
+        # And: ordinal 기준 bitset
+        self.assertEqual(decode_bitset(content['nodes']['bitsets']['acquired']), ordinals_to_bitset([0]))
+        self.assertEqual(decode_bitset(content['nodes']['bitsets']['acquirable']), ordinals_to_bitset([1]))
+        self.assertEqual(decode_bitset(content['nodes']['bitsets']['locked']), ordinals_to_bitset([2]))
+
+    def test_map_progress_should_reflect_arrow_acquisition(self):
+        # Given: Node 1, Arrow 1 획득
+        self.login_guest(self.guest)
+        MemberNodeAcquisition.objects.create(
+            member_map_subscription=self.member_map_subscription,
+            map=self.map,
+            node=self.node1,
+        )
+        MemberArrowAcquisition.objects.create(
+            member_map_subscription=self.member_map_subscription,
+            map=self.map,
+            arrow=self.arrow1,
+        )
+
+        # When:
+        response = self.client.get(reverse('network:map_progress', args=[self.map.id]))
+
+        # Then:
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content)
+        self.assertEqual(content['arrows']['acquired_ids'], [self.arrow1.id])
+        self.assertEqual(content['arrows']['locked_ids'], [self.arrow2.id])
+        self.assertEqual(content['nodes']['acquirable_ids'], [self.node2.id])
+
+    def test_map_progress_should_return_400_when_not_subscribed(self):
+        # Given: 구독 해지
+        self.login_guest(self.guest)
+        self.member_map_subscription.is_deleted = True
+        self.member_map_subscription.save()
+
+        # When:
+        response = self.client.get(reverse('network:map_progress', args=[self.map.id]))
+
+        # Then:
+        self.assertEqual(response.status_code, 400)
+        content = json.loads(response.content)
+        self.assertEqual(content['message'], MemberMapSubscriptionNotExistsException.default_detail)
+
+    def test_map_progress_should_return_401_when_not_login(self):
+        # Given:
+        # When:
+        response = self.client.get(reverse('network:map_progress', args=[self.map.id]))
+
+        # Then:
+        self.assertEqual(response.status_code, 401)
+
+
+class NodeSearchAPIViewTestCase(TestCase):
+    def setUp(self):
+        cache.delete_pattern('node:search:*')
+        self.member = Member.objects.first()
+        self.map = test_case_create_map(self.member)
+        self.node = test_case_create_node(self.map, 'python')
+
+    def tearDown(self):
+        cache.delete_pattern('node:search:*')
+
+    def test_node_search_should_return_ranked_nodes(self):
+        # Given:
+        # When:
+        response = self.client.get(reverse('network:node_search'), {'q': 'python', 'map_id': self.map.id})
+
+        # Then:
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content)
+        self.assertEqual([node['id'] for node in content['nodes']], [self.node.id])
+        self.assertEqual(content['nodes'][0]['map_id'], self.map.id)
+        self.assertFalse(content['has_more'])
+
+    def test_node_search_should_return_400_when_map_id_is_invalid(self):
+        # Given:
+        # When:
+        response = self.client.get(reverse('network:node_search'), {'q': 'python', 'map_id': 'a'})
+
+        # Then:
+        self.assertEqual(response.status_code, 400)
+
+
+class MapTransferAPIViewTestCase(GuestTokenMixin, TestCase):
+    def setUp(self):
+        super(MapTransferAPIViewTestCase, self).setUp()
+        self.guest = Guest.objects.all().first()
+        self.member = self.guest.member
+        self.map = test_case_create_map(self.member)
+        self.node1 = test_case_create_node(self.map, '1')
+        self.node2 = test_case_create_node(self.map, '2')
+        test_case_create_arrow(self.node1, self.node2)
+
+    def test_map_export_should_stream_json_lines(self):
+        # Given:
+        self.login_guest(self.guest)
+
+        # When:
+        response = self.client.get(reverse('network:map_export', args=[self.map.id]))
+
+        # Then:
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual([json.loads(line)['type'] for line in lines], ['map', 'node', 'node', 'arrow'])
+
+    def test_map_export_should_return_403_when_not_map_creator(self):
+        # Given: 다른 회원의 Map
+        self.login_guest(self.guest)
+        other_member = Member.objects.create_user(username='other', nickname='other')
+        other_map = test_case_create_map(other_member)
+
+        # When:
+        response = self.client.get(reverse('network:map_export', args=[other_map.id]))
+
+        # Then:
+        self.assertEqual(response.status_code, 403)
+        content = json.loads(response.content)
+        self.assertEqual(content['message'], MapPermissionDeniedException.default_detail)
+
+    def test_map_import_should_create_map_from_uploaded_file(self):
+        # Given:
+        self.login_guest(self.guest)
+        file = SimpleUploadedFile(
+            'map.jsonl',
+            ''.join(iter_map_export_lines(self.map.id)).encode('utf-8'),
+            content_type='application/x-ndjson',
+        )
+
+        # When:
+        response = self.client.post(reverse('network:map_import'), {'file': file})
+
+        # Then:
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content)
+        self.assertNotEqual(content['map_id'], self.map.id)
+        self.assertEqual(Node.objects.filter(map_id=content['map_id']).count(), 2)
+
+    def test_map_import_should_return_400_when_format_is_invalid(self):
+        # Given:
+        self.login_guest(self.guest)
+        file = SimpleUploadedFile('map.jsonl', b'{"type": "node"}\n', content_type='application/x-ndjson')
+
+        # When:
+        response = self.client.post(reverse('network:map_import'), {'file': file})
+
+        # Then:
+        self.assertEqual(response.status_code, 400)
+
+
+class NodeRequirementAPIViewTestCase(GuestTokenMixin, TestCase):
+    def setUp(self):
+        super(NodeRequirementAPIViewTestCase, self).setUp()
+        self.guest = Guest.objects.all().first()
+        self.member = self.guest.member
+        self.map = test_case_create_map(self.member)
+        # node1(START) -arrow1-> node2 -arrow2-> node3
+        self.node1 = test_case_create_node(self.map, '1', phase=NodePhase.START.value)
+        self.node2 = test_case_create_node(self.map, '2')
+        self.node3 = test_case_create_node(self.map, '3')
+        self.arrow1 = test_case_create_arrow(self.node1, self.node2)
+        self.arrow2 = test_case_create_arrow(self.node2, self.node3)
+        test_case_create_node_acquisition_rule(self.node2, [self.arrow1])
+        test_case_create_node_acquisition_rule(self.node3, [self.arrow2])
+        self.member_map_subscription = MemberMapSubscription.objects.create(
+            member=self.member,
+            map=self.map,
+        )
+
+    def test_node_requirement_should_return_required_nodes_and_arrows(self):
+        # Given: Node 1 획득
+        self.login_guest(self.guest)
+        MemberNodeAcquisition.objects.create(
+            member_map_subscription=self.member_map_subscription,
+            map=self.map,
+            node=self.node1,
+        )
+
+        # When:
+        response = self.client.get(reverse('network:node_requirement', args=[self.map.id, self.node3.id]))
+
+        # Then:
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content)
+        self.assertEqual(content['node_id'], self.node3.id)
+        self.assertFalse(content['is_acquired'])
+        self.assertTrue(content['is_acquirable'])
+        self.assertEqual(content['required_node_ids'], [self.node2.id, self.node3.id])
+        self.assertEqual(content['required_arrow_ids'], [self.arrow1.id, self.arrow2.id])
+        self.assertEqual(content['next_node_ids'], [])
+        self.assertEqual(content['next_arrow_ids'], [self.arrow1.id])
+
+    def test_node_requirement_should_return_400_when_node_not_in_map(self):
+        # Given:
+        self.login_guest(self.guest)
+        other_map = test_case_create_map(self.member)
+        other_node = test_case_create_node(other_map, 'other')
+
+        # When:
+        response = self.client.get(reverse('network:node_requirement', args=[self.map.id, other_node.id]))
+
+        # Then:
+        self.assertEqual(response.status_code, 400)
+        content = json.loads(response.content)
+        self.assertEqual(content['message'], NodeNotExistsException.default_detail)
+
+
+class ArrowQuestionResponseAPIViewTestCase(GuestTokenMixin, TestCase):
+    def setUp(self):
+        super(ArrowQuestionResponseAPIViewTestCase, self).setUp()
+        self.guest = Guest.objects.all().first()
+        self.member = self.guest.member
+        self.map = test_case_create_map(self.member)
+        # node1(START) -arrow-> node2
+        self.node1 = test_case_create_node(self.map, '1', phase=NodePhase.START.value)
+        self.node2 = test_case_create_node(self.map, '2')
+        self.arrow = test_case_create_arrow(self.node1, self.node2)
+        test_case_create_node_acquisition_rule(self.node2, [self.arrow])
+        self.question = test_case_create_arrow_acquisition_question_rule(
+            test_case_create_arrow_acquisition_rule(self.arrow),
+            'question',
+            answers=['answer'],
+            is_auto_mark=True,
+        )
+        test_case_create_member_node_acquisition(
+            MemberMapSubscription.objects.create(member=self.member, map=self.map),
+            self.node1,
+        )
+        self.url = reverse('network:arrow_question_response', args=[self.map.id, self.arrow.id])
+
+    def test_arrow_question_response_should_acquire_arrow_when_correct(self):
+        # Given:
+        self.login_guest(self.guest)
+
+        # When:
+        response = self.client.post(
+            self.url,
+            {'responses': [{'question_id': self.question.id, 'response': ' Answer'}]},
+            content_type='application/json',
+        )
+
+        # Then:
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content)
+        self.assertEqual(content['arrow_id'], self.arrow.id)
+        self.assertTrue(content['is_arrow_acquired'])
+        self.assertEqual(content['acquired_node_ids'], [self.node2.id])
+        self.assertEqual(content['responses'][0]['question_id'], self.question.id)
+        self.assertEqual(content['responses'][0]['status'], QuestionMemberResponseStatus.CORRECT.value)
+
+    def test_arrow_question_response_should_not_acquire_arrow_when_wrong(self):
+        # Given:
+        self.login_guest(self.guest)
+
+        # When:
+        response = self.client.post(
+            self.url,
+            {'responses': [{'question_id': self.question.id, 'response': 'wrong'}]},
+            content_type='application/json',
+        )
+
+        # Then:
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content)
+        self.assertFalse(content['is_arrow_acquired'])
+        self.assertEqual(content['responses'][0]['status'], QuestionMemberResponseStatus.WRONG.value)
+        self.assertFalse(MemberArrowAcquisition.objects.filter(arrow=self.arrow).exists())
+
+    def test_arrow_question_response_should_return_400_when_question_not_exists(self):
+        # Given:
+        self.login_guest(self.guest)
+
+        # When:
+        response = self.client.post(
+            self.url,
+            {'responses': [{'question_id': 0, 'response': 'answer'}]},
+            content_type='application/json',
+        )
+
+        # Then:
+        self.assertEqual(response.status_code, 400)
+        content = json.loads(response.content)
+        self.assertEqual(content['message'], ArrowQuestionNotExistsException.default_detail)
+
+    def test_arrow_question_response_should_return_400_when_source_node_not_acquired(self):
+        # Given: 출발 Node 미획득
+        self.login_guest(self.guest)
+        MemberNodeAcquisition.objects.filter(node=self.node1).update(is_deleted=True)
+
+        # When:
+        response = self.client.post(
+            self.url,
+            {'responses': [{'question_id': self.question.id, 'response': 'answer'}]},
+            content_type='application/json',
+        )
+
+        # Then:
+        self.assertEqual(response.status_code, 400)
+        content = json.loads(response.content)
+        self.assertEqual(content['message'], ArrowSourceNodeNotAcquiredException.default_detail)
+        self.assertFalse(MemberArrowAcquisition.objects.filter(arrow=self.arrow).exists())
+
+    def test_arrow_question_response_should_return_400_when_invalid_input(self):
+        # Given:
+        self.login_guest(self.guest)
+
+        # When: question_id 누락
+        response = self.client.post(
+            self.url,
+            {'responses': [{'response': 'answer'}]},
+            content_type='application/json',
+        )
+
+        # Then:
+        self.assertEqual(response.status_code, 400)
+
+
+class QuestionResponseGradingAPIViewTestCase(GuestTokenMixin, TestCase):
+    def setUp(self):
+        super(QuestionResponseGradingAPIViewTestCase, self).setUp()
+        self.guest = Guest.objects.all().first()
+        self.member = self.guest.member
+        self.map = test_case_create_map(self.member)
+        # node1(START) -arrow-> node2
+        self.node1 = test_case_create_node(self.map, '1', phase=NodePhase.START.value)
+        self.node2 = test_case_create_node(self.map, '2')
+        self.arrow = test_case_create_arrow(self.node1, self.node2)
+        self.question = test_case_create_arrow_acquisition_question_rule(
+            test_case_create_arrow_acquisition_rule(self.arrow),
+            'question',
+        )
+        member_map_subscription = MemberMapSubscription.objects.create(member=self.member, map=self.map)
+        test_case_create_member_node_acquisition(member_map_subscription, self.node1)
+        self.member_response = ArrowAcquisitionQuestionMemberResponse.objects.create(
+            arrow_acquisition_question_rule=self.question,
+            member_map_subscription=member_map_subscription,
+            response='response',
+            status=QuestionMemberResponseStatus.PENDING.value,
+        )
+
+    def test_question_response_lease_and_reply(self):
+        # Given:
+        self.login_guest(self.guest)
+
+        # When: 점유
+        response = self.client.post(
+            reverse('network:question_response_lease', args=[self.map.id]),
+            {'size': 10},
+            content_type='application/json',
+        )
+
+        # Then:
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content)
+        self.assertEqual([item['id'] for item in content['responses']], [self.member_response.id])
+        self.assertEqual(content['responses'][0]['question'], 'question')
+        self.assertIsNotNone(content['responses'][0]['lease_expires_at'])
+
+        # When: 정답 처리
+        response = self.client.post(
+            reverse('network:question_response_reply', args=[self.map.id]),
+            {'replies': [{'response_id': self.member_response.id, 'status': 'CORRECT', 'reply': 'good'}]},
+            content_type='application/json',
+        )
+
+        # Then: Arrow 획득
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content)
+        self.assertEqual(content['responses'][0]['status'], QuestionMemberResponseStatus.CORRECT.value)
+        self.assertEqual(content['acquired_arrow_count'], 1)
+        self.assertTrue(MemberArrowAcquisition.objects.filter(arrow=self.arrow).exists())
+
+    def test_question_response_reply_should_return_400_when_not_leased(self):
+        # Given:
+        self.login_guest(self.guest)
+
+        # When:
+        response = self.client.post(
+            reverse('network:question_response_reply', args=[self.map.id]),
+            {'replies': [{'response_id': self.member_response.id, 'status': 'CORRECT'}]},
+            content_type='application/json',
+        )
+
+        # Then:
+        self.assertEqual(response.status_code, 400)
+        content = json.loads(response.content)
+        self.assertEqual(content['message'], QuestionResponseLeaseExpiredException.default_detail)
+
+    def test_question_response_reply_should_return_400_when_status_is_invalid(self):
+        # Given:
+        self.login_guest(self.guest)
+
+        # When: PENDING 으로 답변
+        response = self.client.post(
+            reverse('network:question_response_reply', args=[self.map.id]),
+            {'replies': [{'response_id': self.member_response.id, 'status': 'PENDING'}]},
+            content_type='application/json',
+        )
+
+        # Then:
+        self.assertEqual(response.status_code, 400)
+
+    def test_question_response_lease_should_return_400_when_size_is_not_positive(self):
+        # Given:
+        self.login_guest(self.guest)
+
+        for size in (0, -1, 'a'):
+            # When:
+            response = self.client.post(
+                reverse('network:question_response_lease', args=[self.map.id]),
+                {'size': size},
+                content_type='application/json',
+            )
+
+            # Then: 점유하지 않음
+            self.assertEqual(response.status_code, 400)
+        self.assertFalse(ArrowAcquisitionQuestionMemberResponse.objects.filter(leased_by__isnull=False).exists())
+
+    def test_question_response_lease_should_return_403_when_not_map_creator(self):
+        # Given: 다른 회원의 Map
+        self.login_guest(self.guest)
+        other_map = test_case_create_map(Member.objects.create_user(username='other', nickname='other'))
+
+        # When:
+        response = self.client.post(reverse('network:question_response_lease', args=[other_map.id]))
+
+        # Then:
+        self.assertEqual(response.status_code, 403)
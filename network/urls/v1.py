@@ -1,4 +1,41 @@
+from django.urls import path
+from network.views import (
+    ArrowQuestionResponseAPIView,
+    MapExportAPIView,
+    MapImportAPIView,
+    MapProgressAPIView,
+    NodeRequirementAPIView,
+    NodeSearchAPIView,
+    QuestionResponseLeaseAPIView,
+    QuestionResponseReplyAPIView,
+)
+
 app_name = 'network'
 
 
-urlpatterns = []
+urlpatterns = [
+    path('map/<int:map_id>/progress', MapProgressAPIView.as_view(), name='map_progress'),
+    path(
+        'map/<int:map_id>/node/<int:node_id>/requirement',
+        NodeRequirementAPIView.as_view(),
+        name='node_requirement',
+    ),
+    path(
+        'map/<int:map_id>/arrow/<int:arrow_id>/question-response',
+        ArrowQuestionResponseAPIView.as_view(),
+        name='arrow_question_response',
+    ),
+    path(
+        'map/<int:map_id>/question-response/lease',
+        QuestionResponseLeaseAPIView.as_view(),
+        name='question_response_lease',
+    ),
+    path(
+        'map/<int:map_id>/question-response/reply',
+        QuestionResponseReplyAPIView.as_view(),
+        name='question_response_reply',
+    ),
+    path('map/<int:map_id>/export', MapExportAPIView.as_view(), name='map_export'),
+    path('map/import', MapImportAPIView.as_view(), name='map_import'),
+    path('node/search', NodeSearchAPIView.as_view(), name='node_search'),
+]
@@ -0,0 +1,257 @@
+from common.common_consts.common_error_messages import InvalidInputResponseErrorStatus
+from common.common_decorators.request_decorators import (
+    cursor_pagination,
+    mandatories,
+    optionals,
+)
+from common.common_exceptions import PydanticAPIException
+from common.common_exceptions.exceptions import MissingMandatoryParameterException
+from common.common_utils.search_utils import (
+    get_search_cache_key,
+    normalize_search_query,
+)
+from common.consts import SEARCH_CACHE_TTL
+from django.core.cache import cache
+from django.http import StreamingHttpResponse
+from member.permissions import IsMemberLogin
+from network.consts import (
+    NODE_SEARCH_CACHE_KEY,
+    QUESTION_RESPONSE_LEASE_MAX_SIZE,
+)
+from network.cursor_criteria import NodeSearchCursorCriteria
+from network.dtos.model_dtos import (
+    ArrowQuestionMemberResponseItem,
+    LeasedQuestionResponseItem,
+    NodeSearchItem,
+)
+from network.dtos.request_dtos import (
+    ArrowQuestionResponsesRequest,
+    QuestionResponseRepliesRequest,
+)
+from network.dtos.response_dtos import (
+    ArrowQuestionResponsesResponse,
+    MapImportResponse,
+    MapProgressResponse,
+    NodeRequirementResponse,
+    NodeSearchResponse,
+    QuestionResponseLeaseResponse,
+    QuestionResponseReplyResponse,
+)
+from network.exceptions import NodeNotExistsException
+from network.helpers.map_transfer_helpers import (
+    import_map_lines,
+    iter_map_export_lines,
+)
+from network.services import (
+    get_created_map,
+    get_map_graph,
+    get_member_map_progress,
+    get_member_map_subscription,
+    get_member_node_requirement,
+    lease_pending_question_responses,
+    reply_question_responses,
+    search_nodes,
+    submit_arrow_question_responses,
+)
+from pydantic import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class MapProgressAPIView(APIView):
+    permission_classes = [
+        IsMemberLogin,
+    ]
+    # 회원 id 만 사용하는 조회 API 이므로 토큰의 status claim 으로 인증합니다.
+    allow_stateless_authentication = True
+
+    def get(self, request, map_id):
+        member_map_subscription = get_member_map_subscription(request.member, map_id)
+        return Response(
+            MapProgressResponse.of(
+                map_id=map_id,
+                map_progress=get_member_map_progress(member_map_subscription),
+            ).model_dump(),
+            status=200,
+        )
+
+
+class NodeRequirementAPIView(APIView):
+    permission_classes = [
+        IsMemberLogin,
+    ]
+    # 회원 id 만 사용하는 조회 API 이므로 토큰의 status claim 으로 인증합니다.
+    allow_stateless_authentication = True
+
+    def get(self, request, map_id, node_id):
+        member_map_subscription = get_member_map_subscription(request.member, map_id)
+        if not get_map_graph(map_id).has_node(node_id):
+            raise NodeNotExistsException()
+
+        return Response(
+            NodeRequirementResponse.of(
+                node_id=node_id,
+                node_requirement=get_member_node_requirement(member_map_subscription, node_id),
+            ).model_dump(),
+            status=200,
+        )
+
+
+class ArrowQuestionResponseAPIView(APIView):
+    permission_classes = [
+        IsMemberLogin,
+    ]
+
+    @mandatories('responses')
+    def post(self, request, map_id, arrow_id, m):
+        try:
+            arrow_question_responses_request = ArrowQuestionResponsesRequest(responses=m['responses'])
+        except ValidationError as e:
+            raise PydanticAPIException(
+                status_code=400,
+                error_summary=InvalidInputResponseErrorStatus.INVALID_ARROW_QUESTION_RESPONSE_INPUT_DATA_400.label,
+                error_code=InvalidInputResponseErrorStatus.INVALID_ARROW_QUESTION_RESPONSE_INPUT_DATA_400.value,
+                errors=e.errors(),
+            )
+
+        member_map_subscription = get_member_map_subscription(request.member, map_id)
+        member_responses, member_node_acquisitions, is_arrow_acquired = submit_arrow_question_responses(
+            member_map_subscription,
+            arrow_id,
+            [
+                (item.question_id, item.response)
+                for item in arrow_question_responses_request.responses
+            ],
+        )
+        return Response(
+            ArrowQuestionResponsesResponse(
+                arrow_id=arrow_id,
+                is_arrow_acquired=is_arrow_acquired,
+                acquired_node_ids=[
+                    member_node_acquisition.node_id
+                    for member_node_acquisition in member_node_acquisitions
+                ],
+                responses=[
+                    ArrowQuestionMemberResponseItem.of(member_response)
+                    for member_response in member_responses
+                ],
+            ).model_dump(),
+            status=200,
+        )
+
+
+class NodeSearchAPIView(APIView):
+    @cursor_pagination(default_size=20, cursor_criteria=[NodeSearchCursorCriteria])
+    @mandatories('q')
+    @optionals({'map_id': None})
+    def get(self, request, decoded_next_cursor, size, m, o):
+        query = normalize_search_query(m['q'])
+        try:
+            map_id = int(o['map_id']) if o['map_id'] else None
+        except ValueError:
+            raise MissingMandatoryParameterException(errors={'map_id': ['map_id 입력값을 확인해주세요.']})
+
+        def _search():
+            nodes, has_more, next_cursor = search_nodes(query, decoded_next_cursor, size, map_id)
+            return NodeSearchResponse(
+                nodes=[NodeSearchItem.of(node) for node in nodes],
+                has_more=has_more,
+                next_cursor=next_cursor,
+            ).model_dump()
+
+        return Response(
+            cache.get_or_set(
+                get_search_cache_key(NODE_SEARCH_CACHE_KEY, query, map_id, request.GET.get('next_cursor'), size),
+                _search,
+                SEARCH_CACHE_TTL,
+            ),
+            status=200,
+        )
+
+
+class MapExportAPIView(APIView):
+    permission_classes = [
+        IsMemberLogin,
+    ]
+
+    def get(self, request, map_id):
+        get_created_map(request.member, map_id)
+        response = StreamingHttpResponse(iter_map_export_lines(map_id), content_type='application/x-ndjson')
+        response['Content-Disposition'] = f'attachment; filename="map_{map_id}.jsonl"'
+        return response
+
+
+class MapImportAPIView(APIView):
+    permission_classes = [
+        IsMemberLogin,
+    ]
+
+    @mandatories('file')
+    def post(self, request, m):
+        map = import_map_lines(m['file'], request.member)
+        return Response(MapImportResponse(map_id=map.id).model_dump(), status=200)
+
+
+class QuestionResponseLeaseAPIView(APIView):
+    permission_classes = [
+        IsMemberLogin,
+    ]
+
+    @optionals({'size': 20})
+    def post(self, request, map_id, o):
+        get_created_map(request.member, map_id)
+        try:
+            size = int(o['size'])
+        except (TypeError, ValueError):
+            size = 0
+        if size < 1:
+            raise MissingMandatoryParameterException(errors={'size': ['size 입력값을 확인해주세요.']})
+        size = min(size, QUESTION_RESPONSE_LEASE_MAX_SIZE)
+
+        return Response(
+            QuestionResponseLeaseResponse(
+                responses=[
+                    LeasedQuestionResponseItem.of(member_response)
+                    for member_response in lease_pending_question_responses(request.member, map_id, size)
+                ],
+            ).model_dump(),
+            status=200,
+        )
+
+
+class QuestionResponseReplyAPIView(APIView):
+    permission_classes = [
+        IsMemberLogin,
+    ]
+
+    @mandatories('replies')
+    def post(self, request, map_id, m):
+        try:
+            question_response_replies_request = QuestionResponseRepliesRequest(replies=m['replies'])
+        except ValidationError as e:
+            raise PydanticAPIException(
+                status_code=400,
+                error_summary=InvalidInputResponseErrorStatus.INVALID_QUESTION_RESPONSE_REPLY_INPUT_DATA_400.label,
+                error_code=InvalidInputResponseErrorStatus.INVALID_QUESTION_RESPONSE_REPLY_INPUT_DATA_400.value,
+                errors=e.errors(),
+            )
+
+        get_created_map(request.member, map_id)
+        member_responses, acquired_arrow_count = reply_question_responses(
+            request.member,
+            map_id,
+            [
+                (item.response_id, item.status, item.reply)
+                for item in question_response_replies_request.replies
+            ],
+        )
+        return Response(
+            QuestionResponseReplyResponse(
+                responses=[
+                    ArrowQuestionMemberResponseItem.of(member_response)
+                    for member_response in member_responses
+                ],
+                acquired_arrow_count=acquired_arrow_count,
+            ).model_dump(),
+            status=200,
+        )
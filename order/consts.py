@@ -28,3 +28,17 @@ class PaymentType(StrValueLabel):
     KAKAOPAY = ('KAKAOPAY', '카카오페이')
     KAKAOPAY_CARD = ('KAKAOPAY_CARD', '카카오페이-카드')
     KAKAOPAY_MONEY = ('KAKAOPAY_MONEY', '카카오페이-머니')
+
+
+# 주문 번호
+ORDER_NUMBER_LENGTH = 17
+# prefix 자리 수, 짧은 prefix 는 ORDER_NUMBER_PREFIX_PADDING 으로 채웁니다.
+ORDER_NUMBER_PREFIX_LENGTH = 3
+ORDER_NUMBER_PREFIX_PADDING = '0'  # ORDER_NUMBER_CHARS 에 없는 문자
+ORDER_NUMBER_CHARS = 'ABCDEFGHIJKLMNPQRSTUVWXYZ123456789'  # 헷갈리는 'O', '0' 제외
+ORDER_NUMBER_SEQUENCE = 'order_order_number_seq'
+# 프로세스가 미리 할당받는 번호 수, sequence 의 INCREMENT BY 와 같아야 합니다. (바꾸면 ALTER SEQUENCE migration 필요)
+ORDER_NUMBER_BLOCK_SIZE = 100
+# 연속된 번호가 그대로 드러나지 않도록 섞는 값 (ORDER_NUMBER_CHARS 길이와 서로소)
+ORDER_NUMBER_MULTIPLIER = 6364136223846793005
+ORDER_NUMBER_OFFSET = 1442695040888963407
@@ -0,0 +1,76 @@
+import os
+import threading
+
+from django.db import connection
+from order.consts import (
+    ORDER_NUMBER_BLOCK_SIZE,
+    ORDER_NUMBER_CHARS,
+    ORDER_NUMBER_LENGTH,
+    ORDER_NUMBER_MULTIPLIER,
+    ORDER_NUMBER_OFFSET,
+    ORDER_NUMBER_PREFIX_LENGTH,
+    ORDER_NUMBER_PREFIX_PADDING,
+    ORDER_NUMBER_SEQUENCE,
+)
+
+
+def encode_order_number(prefix: str, sequence: int) -> str:
+    """
+    sequence 를 ORDER_NUMBER_CHARS 진법의 고정 길이 문자열로 바꿉니다.
+    (sequence * MULTIPLIER + OFFSET) mod N^k 는 전단사이므로 sequence 가 다르면 주문 번호도 다릅니다.
+    prefix 는 ORDER_NUMBER_PREFIX_LENGTH 자리로 채우므로 'P' 와 'P1' 처럼 한 prefix 가 다른 prefix 로 시작해도
+    ('P00', 'P10') 주문 번호가 겹치지 않습니다.
+    """
+    if len(prefix) > ORDER_NUMBER_PREFIX_LENGTH or ORDER_NUMBER_PREFIX_PADDING in prefix:
+        raise ValueError(f'Order number prefix {prefix} is invalid.')
+
+    prefix = prefix.ljust(ORDER_NUMBER_PREFIX_LENGTH, ORDER_NUMBER_PREFIX_PADDING)
+    length = ORDER_NUMBER_LENGTH - ORDER_NUMBER_PREFIX_LENGTH
+    base = len(ORDER_NUMBER_CHARS)
+    space = base ** length
+    if not 0 <= sequence < space:
+        raise ValueError(f'Order number sequence {sequence} is out of range.')
+
+    value = (sequence * ORDER_NUMBER_MULTIPLIER + ORDER_NUMBER_OFFSET) % space
+    chars = []
+    for _ in range(length):
+        value, remainder = divmod(value, base)
+        chars.append(ORDER_NUMBER_CHARS[remainder])
+    return prefix + ''.join(reversed(chars))
+
+
+class OrderNumberAllocator:
+    """
+    sequence 에서 ORDER_NUMBER_BLOCK_SIZE 단위로 번호 구간을 받아 프로세스 안에서 나눠 씁니다.
+    구간을 다 쓸 때만 DB 를 조회하고, fork 된 프로세스는 부모의 구간을 쓰지 않도록 새로 받습니다.
+    """
+
+    def __init__(self, block_size: int = ORDER_NUMBER_BLOCK_SIZE) -> None:
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self._pid = None
+        self._next = 0
+        self._end = 0
+
+    def _allocate_block(self) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT nextval(%s)', [ORDER_NUMBER_SEQUENCE])
+            (block_start,) = cursor.fetchone()
+        self._pid = os.getpid()
+        self._next = block_start
+        self._end = block_start + self.block_size
+
+    def allocate(self) -> int:
+        with self._lock:
+            if self._pid != os.getpid() or self._next >= self._end:
+                self._allocate_block()
+            sequence = self._next
+            self._next += 1
+            return sequence
+
+
+order_number_allocator = OrderNumberAllocator()
+
+
+def allocate_order_number(prefix: str) -> str:
+    return encode_order_number(prefix, order_number_allocator.allocate())
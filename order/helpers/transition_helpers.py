@@ -0,0 +1,168 @@
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from django.apps import apps
+from django.db import (
+    connection,
+    transaction,
+)
+from django.utils import timezone
+from order.consts import OrderStatus
+
+
+ORDER_RETURNING_COLUMNS = (
+    'id',
+    'status',
+    'payment_type',
+    'succeeded_at',
+    'canceled_at',
+    'refunded_at',
+    'total_refunded_price',
+    'is_once_refunded',
+)
+
+
+class OrderTransition:
+    """
+    Order / OrderItem 상태 전이 정의
+
+    order_assignments: Order 컬럼별 SET 식 (변경 전 Order 값을 참조)
+    item_assignments: OrderItem 컬럼별 SET 식 (i: 변경 전 OrderItem, o: 변경 후 Order)
+    식에서는 %(now)s 와 전이 호출 시 넘긴 값(%(payment_type)s 등)을 사용할 수 있습니다.
+    """
+
+    def __init__(self, name: str, order_assignments: Dict[str, str], item_assignments: Dict[str, str]) -> None:
+        self.name = name
+        self.order_assignments = order_assignments
+        self.item_assignments = item_assignments
+
+
+APPROVE = OrderTransition(
+    name='approve',
+    order_assignments={
+        'status': f"'{OrderStatus.SUCCESS.value}'",
+        'payment_type': '%(payment_type)s',
+        'succeeded_at': '%(now)s',
+    },
+    item_assignments={
+        'status': 'o.status',
+        'succeeded_at': '%(now)s',
+    },
+)
+
+# 결제 성공한 주문은 환불, 나머지는 취소
+CANCEL = OrderTransition(
+    name='cancel',
+    order_assignments={
+        'status': f"CASE WHEN status = '{OrderStatus.SUCCESS.value}' "
+                  f"THEN '{OrderStatus.REFUND.value}' ELSE '{OrderStatus.CANCEL.value}' END",
+        'refunded_at': f"CASE WHEN status = '{OrderStatus.SUCCESS.value}' THEN %(now)s ELSE refunded_at END",
+        'total_refunded_price': f"CASE WHEN status = '{OrderStatus.SUCCESS.value}' "
+                                f"THEN total_paid_price ELSE total_refunded_price END",
+        'is_once_refunded': f"CASE WHEN status = '{OrderStatus.SUCCESS.value}' THEN true ELSE is_once_refunded END",
+        'canceled_at': f"CASE WHEN status = '{OrderStatus.SUCCESS.value}' THEN canceled_at ELSE %(now)s END",
+    },
+    item_assignments={
+        'status': 'o.status',
+        'refunded_at': f"CASE WHEN o.status = '{OrderStatus.REFUND.value}' THEN %(now)s ELSE i.refunded_at END",
+        'refunded_price': f"CASE WHEN o.status = '{OrderStatus.REFUND.value}' "
+                          f"THEN i.paid_price ELSE i.refunded_price END",
+        'total_refunded_quantity': f"CASE WHEN o.status = '{OrderStatus.REFUND.value}' "
+                                   f"THEN i.item_quantity ELSE i.total_refunded_quantity END",
+        'canceled_at': f"CASE WHEN o.status = '{OrderStatus.CANCEL.value}' THEN %(now)s ELSE i.canceled_at END",
+    },
+)
+
+FAIL = OrderTransition(
+    name='fail',
+    order_assignments={
+        'status': f"'{OrderStatus.FAIL.value}'",
+    },
+    item_assignments={
+        'status': 'o.status',
+    },
+)
+
+
+def _get_set_clause(assignments: Dict[str, str]) -> str:
+    return ', '.join(f'{connection.ops.quote_name(column)} = {expression}' for column, expression in assignments.items())
+
+
+@transaction.atomic
+def transition_orders(order_ids: Iterable[int],
+                      transition: OrderTransition,
+                      from_statuses: Optional[Iterable[str]] = None,
+                      **params) -> List[Tuple]:
+    """
+    여러 주문을 한 번에 상태 전이합니다.
+    Order, OrderItem 을 각각 UPDATE ... RETURNING 한 번으로 변경하고
+    OrderStatusLog, OrderItemStatusLog, OrderItemRefund 를 각각 INSERT 한 번으로 남깁니다.
+    from_statuses 가 있으면 해당 상태의 주문만 전이합니다.
+    변경된 주문의 ORDER_RETURNING_COLUMNS 값 목록을 반환합니다.
+    """
+    order_model = apps.get_model('order', 'Order')
+    order_item_model = apps.get_model('order', 'OrderItem')
+    order_status_log_model = apps.get_model('order', 'OrderStatusLog')
+    order_item_status_log_model = apps.get_model('order', 'OrderItemStatusLog')
+    order_item_refund_model = apps.get_model('order', 'OrderItemRefund')
+
+    order_ids = list(order_ids)
+    if not order_ids:
+        return []
+
+    now = timezone.now()
+    params = {**params, 'now': now, 'order_ids': order_ids}
+    status_filter = ''
+    if from_statuses is not None:
+        params['from_statuses'] = list(from_statuses)
+        status_filter = 'AND status = ANY(%(from_statuses)s)'
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'UPDATE {order_model._meta.db_table} '
+            f'SET {_get_set_clause(transition.order_assignments)} '
+            f'WHERE id = ANY(%(order_ids)s) {status_filter} '
+            f'RETURNING {", ".join(ORDER_RETURNING_COLUMNS)}',
+            params,
+        )
+        orders = cursor.fetchall()
+        if not orders:
+            return []
+
+        params['order_ids'] = [order[0] for order in orders]
+        cursor.execute(
+            f'UPDATE {order_item_model._meta.db_table} AS i '
+            f'SET {_get_set_clause(transition.item_assignments)} '
+            f'FROM {order_model._meta.db_table} AS o '
+            f'WHERE i.order_id = o.id AND o.id = ANY(%(order_ids)s) '
+            f'RETURNING i.id, i.status, i.refunded_price, i.total_refunded_quantity',
+            params,
+        )
+        items = cursor.fetchall()
+
+    order_status_log_model.objects.bulk_create(
+        [order_status_log_model(order_id=order[0], status=order[1]) for order in orders]
+    )
+    order_item_status_log_model.objects.bulk_create(
+        [
+            order_item_status_log_model(order_item_id=item_id, status=status, request_at=now)
+            for item_id, status, _, _ in items
+        ]
+    )
+    refunds = [
+        order_item_refund_model(
+            order_item_id=item_id,
+            refunded_price=refunded_price,
+            refunded_quantity=refunded_quantity,
+        )
+        for item_id, status, refunded_price, refunded_quantity in items
+        if transition is CANCEL and status == OrderStatus.REFUND.value
+    ]
+    if refunds:
+        order_item_refund_model.objects.bulk_create(refunds)
+    return orders
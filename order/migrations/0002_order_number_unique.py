@@ -0,0 +1,47 @@
+# Generated by Django 4.1.10 on 2026-10-18 19:17
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def check_duplicated_order_numbers(apps, schema_editor):
+    """
+    unique 인덱스 생성 전에 중복된 주문 번호가 있으면 번호를 알려주고 중단합니다.
+    결제사에 전달된 주문 번호일 수 있으므로 임의로 바꾸지 않고 직접 정리한 뒤 다시 실행합니다.
+    """
+    Order = apps.get_model('order', 'Order')
+
+    duplicated_order_numbers = list(
+        Order.objects.values(
+            'order_number',
+        ).annotate(
+            order_count=Count('id'),
+        ).filter(
+            order_count__gt=1,
+        ).values_list(
+            'order_number',
+            flat=True,
+        )[:100]
+    )
+    if duplicated_order_numbers:
+        raise RuntimeError(f'Duplicated order numbers must be resolved first: {duplicated_order_numbers}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicated_order_numbers, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='order',
+            name='order_number',
+            field=models.CharField(max_length=50, unique=True, verbose_name='주문 번호'),
+        ),
+        migrations.RunSQL(
+            sql='CREATE SEQUENCE order_order_number_seq START WITH 1 INCREMENT BY 100',
+            reverse_sql='DROP SEQUENCE order_order_number_seq',
+        ),
+    ]
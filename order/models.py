@@ -1,17 +1,27 @@
-import random
-import string
+from typing import (
+    Iterable,
+    List,
+    Optional,
+)
 
 from django.db import (
     models,
     transaction,
 )
-from django.db.models import F
-from django.utils import timezone
 from order.consts import (
     OrderStatus,
     PaymentType,
     ProductType,
 )
+from order.helpers.order_number_helpers import allocate_order_number
+from order.helpers.transition_helpers import (
+    APPROVE,
+    CANCEL,
+    FAIL,
+    ORDER_RETURNING_COLUMNS,
+    OrderTransition,
+    transition_orders,
+)
 
 
 class Order(models.Model):
@@ -51,7 +61,7 @@ class Order(models.Model):
     """
     guest_id = models.BigIntegerField(verbose_name='Guest Id', db_index=True)
     member_id = models.BigIntegerField(verbose_name='Member Id', db_index=True, null=True)
-    order_number = models.CharField(verbose_name='주문 번호', max_length=50, db_index=True)
+    order_number = models.CharField(verbose_name='주문 번호', max_length=50, unique=True)
     tid = models.CharField(verbose_name='결제 고유 번호', max_length=50, db_index=True, null=True, blank=True)
     total_price = models.IntegerField(verbose_name='총 결제 금액', default=0, db_index=True)
     total_tax_price = models.IntegerField(verbose_name='세금', default=0, db_index=True)
@@ -89,19 +99,10 @@ class Order(models.Model):
 
     @staticmethod
     def create_order_number(prefix: str):
-        valid_chars = [char for char in string.ascii_uppercase if char != 'O'] + \
-                      [digit for digit in string.digits if digit != '0']
-        while True:
-            order_number = prefix + ''.join(
-                random.choices(
-                    valid_chars,
-                    k=17 - len(prefix)
-                )
-            )
-            if not Order.objects.filter(order_number=order_number).exists():
-                break
-
-        return order_number
+        """
+        sequence 기반이라 중복 확인 없이 유일하며, unique 인덱스가 한 번 더 보장합니다.
+        """
+        return allocate_order_number(prefix)
 
     @classmethod
     @transaction.atomic
@@ -146,139 +147,44 @@ class Order(models.Model):
         )
         return order
 
-    @transaction.atomic
+    def _transition(self, transition: OrderTransition, **params) -> None:
+        """
+        상태 전이 후 변경된 값을 인스턴스에 반영합니다.
+        """
+        for order in transition_orders([self.id], transition, **params):
+            for column, value in zip(ORDER_RETURNING_COLUMNS, order):
+                setattr(self, column, value)
+
     def approve(self, payment_type: str):
         """
         결제 승인
         """
-        # 상태 업데이트
-        now = timezone.now()
-        self.status = OrderStatus.SUCCESS.value
-        self.payment_type = payment_type
-        self.succeeded_at = now
-        self.save(update_fields=['status', 'payment_type', 'succeeded_at'])
-        # 상태 Log 생성
-        OrderStatusLog.objects.create(
-            order=self,
-            status=OrderStatus.SUCCESS.value,
-        )
+        self._transition(APPROVE, payment_type=payment_type)
 
-        # Item 상태 업데이트
-        self.items.update(
-            status=OrderStatus.SUCCESS.value,
-            succeeded_at=now,
-        )
-        # Item 상태 Log 생성
-        OrderItemStatusLog.objects.bulk_create(
-            [
-                OrderItemStatusLog(
-                    order_item=item,
-                    status=OrderStatus.SUCCESS.value,
-                    request_at=now,
-                )
-                for item in self.items.all()
-            ]
-        )
-
-    @transaction.atomic
     def cancel(self):
         """
         결제 취소 및 환불
 
         결제 취소 중 환불 같은 경우는 결제가 성공이 된 경우에만 일어날 수 있습니다.
         """
-        # 상태 업데이트
-        now = timezone.now()
-        update_fields = ['status']
-
-        if self.status == OrderStatus.SUCCESS.value:
-            self.status = OrderStatus.REFUND.value
-            self.refunded_at = now
-            self.total_refunded_price = self.total_paid_price
-            self.is_once_refunded = True
-            update_fields.extend(
-                [
-                    'refunded_at',
-                    'total_refunded_price',
-                    'is_once_refunded',
-                ]
-            )
-        else:
-            self.status = OrderStatus.CANCEL.value
-            self.canceled_at = now
-            update_fields.append('canceled_at')
-        self.save(update_fields=update_fields)
+        self._transition(CANCEL)
 
-        OrderStatusLog.objects.create(
-            order=self,
-            status=self.status,
-        )
-
-        # Item 상태 업데이트
-        if self.status == OrderStatus.REFUND.value:
-            self.items.update(
-                status=self.status,
-                refunded_at=now,
-                refunded_price=F('paid_price'),
-                total_refunded_quantity=F('item_quantity'),
-            )
-            OrderItemRefund.objects.bulk_create(
-                [
-                    OrderItemRefund(
-                        order_item=item,
-                        refunded_price=item.paid_price,
-                        refunded_quantity=item.item_quantity,
-                    )
-                    for item in self.items.all()
-                ]
-            )
-        else:
-            self.items.update(
-                status=self.status,
-                canceled_at=now,
-            )
-        # Item 상태 Log 생성
-        OrderItemStatusLog.objects.bulk_create(
-            [
-                OrderItemStatusLog(
-                    order_item=item,
-                    status=self.status,
-                    request_at=now,
-                )
-                for item in self.items.all()
-            ]
-        )
-
-    @transaction.atomic
     def fail(self):
         """
         결제 실패
         """
-        now = timezone.now()
-        # 상태 업데이트
-        self.status = OrderStatus.FAIL.value
-        self.save(update_fields=['status'])
-        # 상태 Log 생성
-        OrderStatusLog.objects.create(
-            order=self,
-            status=OrderStatus.FAIL.value,
-        )
+        self._transition(FAIL)
 
-        # Item 상태 업데이트
-        self.items.update(
-            status=OrderStatus.FAIL.value,
-        )
-        # Item 상태 Log 생성
-        OrderItemStatusLog.objects.bulk_create(
-            [
-                OrderItemStatusLog(
-                    order_item=item,
-                    status=OrderStatus.FAIL.value,
-                    request_at=now,
-                )
-                for item in self.items.all()
-            ]
-        )
+    @classmethod
+    def bulk_transition(cls,
+                        order_ids: Iterable[int],
+                        transition: OrderTransition,
+                        from_statuses: Optional[Iterable[str]] = None,
+                        **params) -> List[int]:
+        """
+        정산 / 대사 작업에서 여러 주문을 한 번에 전이합니다. 전이된 주문 id 목록을 반환합니다.
+        """
+        return [order[0] for order in transition_orders(order_ids, transition, from_statuses, **params)]
 
 
 class OrderStatusLog(models.Model):
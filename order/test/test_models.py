@@ -4,7 +4,9 @@ from common.common_testcase_helpers.testcase_helpers import (
     test_case_create_order,
     test_case_create_order_item,
 )
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from freezegun import freeze_time
 from member.models import Guest
@@ -12,6 +14,10 @@ from order.consts import (
     OrderStatus,
     PaymentType,
 )
+from order.helpers.transition_helpers import (
+    CANCEL,
+    FAIL,
+)
 from order.models import (
     Order,
     OrderItem,
@@ -387,6 +393,98 @@ class OrderMethodTestCase(TestCase):
             True
         )
 
+    def test_approve_should_refresh_instance_and_write_in_fixed_queries(self):
+        # Given: OrderItem 추가
+        test_case_create_order_item(
+            order=self.order,
+            product_type='POINT',
+            product_id=3,
+            item_quantity=1,
+            status=OrderStatus.READY.value,
+        )
+
+        # When: approved with KAKAOPAY_CARD
+        with CaptureQueriesContext(connection) as context:
+            self.order.approve(PaymentType.KAKAOPAY_CARD.value)
+
+        # Then: Order UPDATE, OrderItem UPDATE, OrderStatusLog / OrderItemStatusLog INSERT
+        queries = [query for query in context.captured_queries if 'SAVEPOINT' not in query['sql']]
+        self.assertEqual(len(queries), 4)
+        # And: 인스턴스에 반영
+        self.assertEqual(self.order.status, OrderStatus.SUCCESS.value)
+        self.assertEqual(self.order.payment_type, PaymentType.KAKAOPAY_CARD.value)
+        self.assertEqual(self.order.succeeded_at, datetime(2022, 1, 1).replace(tzinfo=timezone.utc))
+        # And: OrderItemStatusLog 3개
+        self.assertEqual(
+            OrderItemStatusLog.objects.filter(
+                order_item__order_id=self.order.id,
+                status=OrderStatus.SUCCESS.value,
+            ).count(),
+            3
+        )
+
+    def test_bulk_transition(self):
+        # Given: SUCCESS 주문 1개, READY 주문 1개, FAIL 주문 1개
+        self.order.approve(PaymentType.KAKAOPAY_CARD.value)
+        ready_order = test_case_create_order(
+            guest=self.guest,
+            order_number='F1234512346',
+            tid='test_tid',
+            status=OrderStatus.READY.value,
+            order_phone_number='01012341234',
+            payment_type='',
+        )
+        ready_order_item = test_case_create_order_item(
+            order=ready_order,
+            product_type='POINT',
+            product_id=1,
+            item_quantity=1,
+            status=OrderStatus.READY.value,
+        )
+        failed_order = test_case_create_order(
+            guest=self.guest,
+            order_number='F1234512347',
+            tid='test_tid',
+            status=OrderStatus.FAIL.value,
+            order_phone_number='01012341234',
+            payment_type='',
+        )
+
+        # When: SUCCESS, READY 주문만 취소
+        order_ids = Order.bulk_transition(
+            [self.order.id, ready_order.id, failed_order.id],
+            CANCEL,
+            from_statuses=[OrderStatus.SUCCESS.value, OrderStatus.READY.value],
+        )
+
+        # Then: FAIL 주문은 제외
+        self.assertEqual(set(order_ids), {self.order.id, ready_order.id})
+        self.assertEqual(Order.objects.get(id=self.order.id).status, OrderStatus.REFUND.value)
+        self.assertEqual(Order.objects.get(id=ready_order.id).status, OrderStatus.CANCEL.value)
+        self.assertEqual(Order.objects.get(id=failed_order.id).status, OrderStatus.FAIL.value)
+        self.assertFalse(OrderStatusLog.objects.filter(order_id=failed_order.id).exists())
+        # And: 환불 주문의 OrderItem 만 OrderItemRefund 생성
+        self.assertEqual(
+            OrderItemRefund.objects.filter(order_item__order_id=self.order.id).count(),
+            2
+        )
+        self.assertFalse(OrderItemRefund.objects.filter(order_item_id=ready_order_item.id).exists())
+        self.assertEqual(
+            OrderItem.objects.get(id=ready_order_item.id).canceled_at,
+            datetime(2022, 1, 1).replace(tzinfo=timezone.utc),
+        )
+
+    def test_bulk_transition_when_no_order_matched(self):
+        # When: READY 주문을 SUCCESS 상태에서만 실패 처리
+        order_ids = Order.bulk_transition([self.order.id], FAIL, from_statuses=[OrderStatus.SUCCESS.value])
+
+        # Then: 변경 없음
+        self.assertEqual(order_ids, [])
+        self.assertEqual(Order.objects.get(id=self.order.id).status, OrderStatus.READY.value)
+        self.assertFalse(
+            OrderItemStatusLog.objects.filter(order_item__order_id=self.order.id).exists()
+        )
+
 
 @freeze_time('2022-01-01')
 class OrderItemMethodTestCase(TestCase):
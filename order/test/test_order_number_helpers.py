@@ -0,0 +1,138 @@
+from unittest.mock import patch
+
+from common.common_testcase_helpers.testcase_helpers import test_case_create_order
+from django.db import (
+    IntegrityError,
+    connection,
+    transaction,
+)
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from member.models import Guest
+from order.consts import (
+    ORDER_NUMBER_BLOCK_SIZE,
+    ORDER_NUMBER_CHARS,
+    OrderStatus,
+    PaymentType,
+)
+from order.helpers.order_number_helpers import (
+    OrderNumberAllocator,
+    encode_order_number,
+)
+from order.models import Order
+
+
+class EncodeOrderNumberTestCase(TestCase):
+    def test_encode_order_number_should_be_unique_with_fixed_length(self):
+        # When:
+        order_numbers = [encode_order_number('P1', sequence) for sequence in range(5000)]
+
+        # Then: 길이 17, prefix 유지, 허용 문자만 사용, 중복 없음
+        self.assertEqual({len(order_number) for order_number in order_numbers}, {17})
+        self.assertTrue(all(order_number.startswith('P1') for order_number in order_numbers))
+        self.assertTrue(all(char in ORDER_NUMBER_CHARS for order_number in order_numbers for char in order_number[3:]))
+        self.assertEqual(len(set(order_numbers)), 5000)
+
+    def test_encode_order_number_should_not_expose_sequence_order(self):
+        # When:
+        first = encode_order_number('P1', 1)
+        second = encode_order_number('P1', 2)
+
+        # Then: 연속된 sequence 라도 뒷자리만 바뀌지 않습니다.
+        self.assertNotEqual(first[:10], second[:10])
+
+    def test_encode_order_number_should_not_collide_between_overlapping_prefixes(self):
+        # When: 'P' 는 'P1' 의 앞부분인 prefix
+        p_order_numbers = {encode_order_number('P', sequence) for sequence in range(0, 5000, 2)}
+        p1_order_numbers = {encode_order_number('P1', sequence) for sequence in range(1, 5000, 2)}
+
+        # Then: prefix 자리를 채우므로 겹치지 않습니다.
+        self.assertEqual({len(order_number) for order_number in p_order_numbers}, {17})
+        self.assertTrue(all(order_number.startswith('P00') for order_number in p_order_numbers))
+        self.assertTrue(all(order_number.startswith('P10') for order_number in p1_order_numbers))
+        self.assertFalse(p_order_numbers & p1_order_numbers)
+
+    def test_encode_order_number_should_raise_when_prefix_is_invalid(self):
+        # Expect: prefix 자리 초과, 채움 문자 포함
+        with self.assertRaises(ValueError):
+            encode_order_number('P123', 1)
+        with self.assertRaises(ValueError):
+            encode_order_number('P0', 1)
+
+    def test_encode_order_number_should_raise_when_sequence_out_of_range(self):
+        # Expect:
+        with self.assertRaises(ValueError):
+            encode_order_number('P1', -1)
+
+
+class OrderNumberAllocatorTestCase(TestCase):
+    def test_allocate_should_query_once_per_block(self):
+        # Given:
+        allocator = OrderNumberAllocator()
+
+        # When: 한 구간만큼 할당
+        with CaptureQueriesContext(connection) as context:
+            sequences = [allocator.allocate() for _ in range(ORDER_NUMBER_BLOCK_SIZE)]
+
+        # Then: sequence 조회는 한 번이고 연속된 번호
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual(sequences, list(range(sequences[0], sequences[0] + ORDER_NUMBER_BLOCK_SIZE)))
+
+        # When: 구간을 다 쓴 뒤 할당
+        with CaptureQueriesContext(connection) as context:
+            next_sequence = allocator.allocate()
+
+        # Then: 새 구간을 받습니다.
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertNotIn(next_sequence, sequences)
+
+    def test_allocators_should_not_share_blocks(self):
+        # Given: 서로 다른 프로세스의 allocator
+        first_allocator = OrderNumberAllocator()
+        second_allocator = OrderNumberAllocator()
+
+        # When:
+        first_sequences = {first_allocator.allocate() for _ in range(10)}
+        second_sequences = {second_allocator.allocate() for _ in range(10)}
+
+        # Then:
+        self.assertFalse(first_sequences & second_sequences)
+
+    def test_allocate_should_allocate_new_block_after_fork(self):
+        # Given:
+        allocator = OrderNumberAllocator()
+        sequence = allocator.allocate()
+
+        # When: fork 된 프로세스에서 할당
+        with patch('order.helpers.order_number_helpers.os.getpid', return_value=-1):
+            forked_sequence = allocator.allocate()
+
+        # Then: 부모의 구간을 쓰지 않습니다.
+        self.assertGreaterEqual(forked_sequence, sequence + ORDER_NUMBER_BLOCK_SIZE)
+
+
+class OrderNumberUniqueTestCase(TestCase):
+    def test_order_number_should_be_unique(self):
+        # Given:
+        order_kwargs = {
+            'guest': Guest.objects.first(),
+            'order_number': 'P1AAAAAAAAAAAAAAA',
+            'tid': None,
+            'status': OrderStatus.READY.value,
+            'order_phone_number': '01012341234',
+            'payment_type': PaymentType.KAKAOPAY.value,
+        }
+        test_case_create_order(**order_kwargs)
+
+        # Expect:
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            test_case_create_order(**order_kwargs)
+
+    def test_create_order_number_should_not_query_exists(self):
+        # When:
+        Order.create_order_number('P1')
+        with CaptureQueriesContext(connection) as context:
+            Order.create_order_number('P1')
+
+        # Then: 중복 확인 조회가 없습니다.
+        self.assertFalse([query for query in context.captured_queries if 'order_order' in query['sql']])
@@ -51,9 +51,7 @@ def kakao_pay_approve_give_product_success(order_id: int, pg_token: str) -> None
             'id',
             flat=True,
         )
-        give_products = GiveProduct.objects.filter(order_item_id__in=order_items)
-        for give_product in give_products:
-            give_product.give()
+        GiveProduct.objects.filter(order_item_id__in=order_items).give()
 
 
 def kakao_pay_approve_give_product_cancel(order_id_token: str, cancel_reason: str) -> None:
@@ -81,9 +79,7 @@ def kakao_pay_approve_give_product_cancel(order_id_token: str, cancel_reason: st
             'id',
             flat=True,
         )
-        give_products = GiveProduct.objects.filter(order_item_id__in=order_items)
-        for give_product in give_products:
-            give_product.cancel()
+        GiveProduct.objects.filter(order_item_id__in=order_items).cancel()
 
     kakao_pay = KakaoPay(
         KakaoPayProductHandler(order_id=order.id)
@@ -116,6 +112,4 @@ def kakao_pay_approve_give_product_fail(order_id_token: str) -> None:
             'id',
             flat=True,
         )
-        give_products = GiveProduct.objects.filter(order_item_id__in=order_items)
-        for give_product in give_products:
-            give_product.fail()
+        GiveProduct.objects.filter(order_item_id__in=order_items).fail()
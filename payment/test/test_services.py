@@ -64,7 +64,7 @@ class KakaoPayApproveGiveProductSuccessTestCase(TestCase):
             paid_price=self.active_1000_point_product_ordering_1.price * 3,
         )
 
-    @patch('payment.services.GiveProduct.give')
+    @patch('product.managers.GiveProductQuerySet.give')
     @patch('payment.services.KakaoPay.approve_payment')
     def test_kakao_pay_approve_give_product_success_when_success(self,
                                                                  mock_approve_payment,
@@ -166,7 +166,7 @@ class KakaoPayApproveGiveProductCancelTestCase(TestCase):
         )
 
     @patch('payment.services.KakaoPay.cancel_payment')
-    @patch('payment.services.GiveProduct.cancel')
+    @patch('product.managers.GiveProductQuerySet.cancel')
     @patch('payment.services.Order.cancel')
     def test_kakao_pay_approve_give_product_cancel_when_success(self,
                                                                 mock_order_cancel,
@@ -327,7 +327,7 @@ class KakaoPayApproveGiveProductFailTestCase(GuestTokenMixin, TestCase):
             paid_price=self.active_1000_point_product_ordering_1.price * 3,
         )
 
-    @patch('payment.services.GiveProduct.fail')
+    @patch('product.managers.GiveProductQuerySet.fail')
     @patch('payment.services.Order.fail')
     def test_kakao_pay_fail_for_buy_product_when_success(self,
                                                          mock_order_fail,
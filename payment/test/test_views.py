@@ -224,7 +224,7 @@ class KakaoPayApproveForBuyProductAPIViewTestCase(GuestTokenMixin, TestCase):
             paid_price=self.active_1000_point_product_ordering_1.price * 3,
         )
 
-    @patch('payment.services.GiveProduct.give')
+    @patch('product.managers.GiveProductQuerySet.give')
     @patch('payment.services.KakaoPay.approve_payment')
     def test_kakao_pay_approve_for_buy_product_api_when_success(self,
                                                                 mock_approve_payment,
@@ -342,7 +342,7 @@ class KakaoPayCancelForBuyProductAPIViewTestCase(GuestTokenMixin, TestCase):
         )
 
     @patch('payment.services.KakaoPay.cancel_payment')
-    @patch('payment.services.GiveProduct.cancel')
+    @patch('product.managers.GiveProductQuerySet.cancel')
     @patch('payment.services.Order.cancel')
     def test_kakao_pay_cancel_for_buy_product_api_when_success(self,
                                                                mock_order_cancel,
@@ -517,7 +517,7 @@ class KakaoPayFailForBuyProductAPIViewTestCase(GuestTokenMixin, TestCase):
             paid_price=self.active_1000_point_product_ordering_1.price * 3,
         )
 
-    @patch('payment.services.GiveProduct.fail')
+    @patch('product.managers.GiveProductQuerySet.fail')
     @patch('payment.services.Order.fail')
     def test_kakao_pay_fail_for_buy_product_api_when_success(self,
                                                              mock_order_fail,
@@ -605,7 +605,7 @@ class ApproveGiveProductSuccessByTemplateTestCase(GuestTokenMixin, TestCase):
             paid_price=self.active_1000_point_product_ordering_1.price * 3,
         )
 
-    @patch('payment.services.GiveProduct.give')
+    @patch('product.managers.GiveProductQuerySet.give')
     @patch('payment.services.KakaoPay.approve_payment')
     def test_kakao_pay_approve_for_buy_product_template_when_success(self,
                                                                      mock_approve_payment,
@@ -716,7 +716,7 @@ class ApproveGiveProductCancelByTemplateTestCase(GuestTokenMixin, TestCase):
         )
 
     @patch('payment.services.KakaoPay.cancel_payment')
-    @patch('payment.services.GiveProduct.cancel')
+    @patch('product.managers.GiveProductQuerySet.cancel')
     @patch('payment.services.Order.cancel')
     def test_kakao_pay_cancel_for_buy_product_template_when_success(self,
                                                                     mock_order_cancel,
@@ -895,7 +895,7 @@ class ApproveGiveProductFailByTemplateTestCase(GuestTokenMixin, TestCase):
             paid_price=self.active_1000_point_product_ordering_1.price * 3,
         )
 
-    @patch('payment.services.GiveProduct.fail')
+    @patch('product.managers.GiveProductQuerySet.fail')
     @patch('payment.services.Order.fail')
     def test_kakao_pay_fail_for_buy_product_template_when_success(self,
                                                                   mock_order_fail,
@@ -1,5 +1,8 @@
 from django.contrib import admin
-from point.models import GuestPoint
+from point.models import (
+    GuestPoint,
+    GuestPointBalance,
+)
 
 
 class GuestPointAdmin(admin.ModelAdmin):
@@ -9,7 +12,19 @@ class GuestPointAdmin(admin.ModelAdmin):
         'point',
         'reason',
         'is_active',
+        'is_checkpointed',
+        'remaining_point',
+    ]
+
+
+class GuestPointBalanceAdmin(admin.ModelAdmin):
+    list_display = [
+        'id',
+        'guest',
+        'point',
+        'updated_at',
     ]
 
 
 admin.site.register(GuestPoint, GuestPointAdmin)
+admin.site.register(GuestPointBalance, GuestPointBalanceAdmin)
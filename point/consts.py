@@ -1,5 +1,21 @@
+from datetime import timedelta
+
 from common.common_consts.common_enums import StrValueLabel
 
 
 class PointType(StrValueLabel):
     NORMAL_POINT = ('NORMAL_POINT', '포인트')
+
+
+# GuestPointBalance 에 반영된 포인트에 영향을 주는 필드
+GUEST_POINT_BALANCE_FIELDS = {'guest', 'guest_id', 'point', 'is_active', 'valid_from', 'valid_until'}
+GUEST_POINT_CHECKPOINT_BATCH_SIZE = 1000
+GUEST_POINT_EXPIRY_BATCH_SIZE = 1000
+# valid_until 을 나눠 처리하는 시간 단위
+GUEST_POINT_EXPIRY_BUCKET_SIZE = timedelta(hours=1)
+
+POINT_LEDGER_EXPORT_S3_TYPE = 'point_ledger'
+POINT_LEDGER_EXPORT_HEADER = ('date', 'guest_id', 'type', 'reason', 'given_point', 'used_point', 'count')
+POINT_LEDGER_EXPORT_ITERATOR_CHUNK_SIZE = 2000
+# pre-signed 업로드 최대 크기(10MB) 를 넘지 않도록 UTF-8 최대 3 byte 기준으로 나눕니다.
+POINT_LEDGER_EXPORT_CHUNK_CHARS = 3 * 1024 * 1024
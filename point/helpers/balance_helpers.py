@@ -0,0 +1,56 @@
+from typing import (
+    Dict,
+    Iterable,
+)
+
+from django.apps import apps
+from django.db import connection
+from django.utils import timezone
+
+
+def increase_guest_point_balances(deltas: Dict[int, int]) -> None:
+    """
+    Guest 별 포인트 증감분을 GuestPointBalance 에 INSERT ... ON CONFLICT 한 번으로 반영합니다.
+    데드락을 피하기 위해 guest_id 순서로 반영합니다.
+    """
+    deltas = sorted((guest_id, delta) for guest_id, delta in deltas.items() if delta)
+    if not deltas:
+        return
+
+    table = apps.get_model('point', 'GuestPointBalance')._meta.db_table
+    now = timezone.now()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {table} (guest_id, point, updated_at) '
+            f'VALUES {", ".join(["(%s, %s, %s)"] * len(deltas))} '
+            f'ON CONFLICT (guest_id) DO UPDATE '
+            f'SET point = {table}.point + EXCLUDED.point, updated_at = EXCLUDED.updated_at',
+            [value for guest_id, delta in deltas for value in (guest_id, delta, now)],
+        )
+
+
+def lock_guest_point_balances(guest_ids: Iterable[int]) -> None:
+    """
+    Guest 별 GuestPointBalance Row 를 guest_id 순서로 잠급니다. (SELECT ... FOR UPDATE)
+    포인트 사용 / 회수는 잔액 확인 전에 잠가야 동시에 사용해도 잔액을 초과하지 않습니다.
+    GuestPoint Row 를 잠그는 모든 경로는 이 잠금을 먼저 잡아 잠금 순서를 GuestPointBalance -> GuestPoint 로 맞춥니다.
+    """
+    guest_point_balance_model = apps.get_model('point', 'GuestPointBalance')
+    guest_ids = sorted(set(guest_ids))
+    if not guest_ids:
+        return
+
+    guest_point_balance_model.objects.bulk_create(
+        [guest_point_balance_model(guest_id=guest_id) for guest_id in guest_ids],
+        ignore_conflicts=True,
+    )
+    list(
+        guest_point_balance_model.objects.select_for_update().filter(
+            guest_id__in=guest_ids,
+        ).order_by(
+            'guest_id',
+        ).values_list(
+            'id',
+            flat=True,
+        )
+    )
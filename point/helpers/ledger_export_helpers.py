@@ -0,0 +1,122 @@
+import csv
+import io
+from datetime import (
+    date,
+    datetime,
+    time,
+    timedelta,
+)
+from typing import (
+    Iterator,
+    List,
+    Tuple,
+)
+
+from common.common_utils.s3_utils import upload_file_to_s3
+from django.apps import apps
+from django.db.models import (
+    Count,
+    Q,
+    Sum,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from point.consts import (
+    POINT_LEDGER_EXPORT_CHUNK_CHARS,
+    POINT_LEDGER_EXPORT_HEADER,
+    POINT_LEDGER_EXPORT_ITERATOR_CHUNK_SIZE,
+    POINT_LEDGER_EXPORT_S3_TYPE,
+)
+
+
+def iter_point_ledger_rows(target_date: date,
+                           chunk_size: int = POINT_LEDGER_EXPORT_ITERATOR_CHUNK_SIZE) -> Iterator[Tuple]:
+    """
+    target_date 하루 동안의 Guest, 포인트 타입, 사유별 지급 / 사용 포인트 합계
+    Postgres 에서 집계하고 server-side cursor 로 chunk_size 개씩 읽습니다.
+    """
+    start = timezone.make_aware(datetime.combine(target_date, time.min))
+    return apps.get_model('point', 'GuestPoint').objects.filter(
+        created_at__gte=start,
+        created_at__lt=start + timedelta(days=1),
+    ).values(
+        'guest_id',
+        'type',
+        'reason',
+    ).annotate(
+        given_point=Coalesce(Sum('point', filter=Q(point__gt=0)), 0),
+        used_point=Coalesce(Sum('point', filter=Q(point__lt=0)), 0),
+        count=Count('id'),
+    ).order_by(
+        'guest_id',
+        'type',
+        'reason',
+    ).values_list(
+        'guest_id',
+        'type',
+        'reason',
+        'given_point',
+        'used_point',
+        'count',
+    ).iterator(chunk_size=chunk_size)
+
+
+class PointLedgerChunkWriter:
+    """
+    CSV 를 chunk_chars 단위로 나눠 {POINT_LEDGER_EXPORT_S3_TYPE}/{날짜}/part-00000.csv 로 업로드합니다.
+    메모리에는 업로드 전 chunk 하나만 유지합니다.
+    """
+
+    def __init__(self, target_date: date, chunk_chars: int = POINT_LEDGER_EXPORT_CHUNK_CHARS) -> None:
+        self.target_date = target_date
+        self.chunk_chars = chunk_chars
+        self.file_names = []
+        self.row_count = 0
+        self._new_buffer()
+
+    def _new_buffer(self) -> None:
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer)
+        self.writer.writerow(POINT_LEDGER_EXPORT_HEADER)
+        self.row_count = 0
+
+    def write(self, row: Tuple) -> None:
+        self.writer.writerow((self.target_date.isoformat(), *row))
+        self.row_count += 1
+        if self.buffer.tell() >= self.chunk_chars:
+            self.flush()
+
+    def flush(self) -> None:
+        file_name = f'part-{len(self.file_names):05d}.csv'
+        if not upload_file_to_s3(
+            file_name,
+            self.buffer.getvalue().encode('utf-8'),
+            _type=POINT_LEDGER_EXPORT_S3_TYPE,
+            unique=self.target_date.isoformat(),
+        ):
+            raise Exception(f'{POINT_LEDGER_EXPORT_S3_TYPE}/{self.target_date}/{file_name} 업로드에 실패했습니다.')
+        self.file_names.append(f'{POINT_LEDGER_EXPORT_S3_TYPE}/{self.target_date.isoformat()}/{file_name}')
+        self._new_buffer()
+
+    def close(self) -> List[str]:
+        """
+        남은 Row 를 업로드합니다. 내역이 없는 날도 header 만 있는 파일을 남깁니다.
+        """
+        if self.row_count or not self.file_names:
+            self.flush()
+        return self.file_names
+
+
+def export_point_ledger(start_date: date, end_date: date, chunk_chars: int = POINT_LEDGER_EXPORT_CHUNK_CHARS) -> List[str]:
+    """
+    start_date ~ end_date 의 일별 포인트 내역 집계를 S3 에 CSV 로 업로드하고 업로드한 파일 목록을 반환합니다.
+    """
+    file_names = []
+    target_date = start_date
+    while target_date <= end_date:
+        chunk_writer = PointLedgerChunkWriter(target_date, chunk_chars)
+        for row in iter_point_ledger_rows(target_date):
+            chunk_writer.write(row)
+        file_names.extend(chunk_writer.close())
+        target_date += timedelta(days=1)
+    return file_names
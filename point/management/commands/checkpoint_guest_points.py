@@ -0,0 +1,9 @@
+from django.core.management.base import BaseCommand
+from point.tasks import checkpoint_guest_points_task
+
+
+class Command(BaseCommand):
+    help = '유효 기간이 시작된 포인트를 GuestPointBalance 에 반영하는 Celery 작업을 요청합니다. (crontab 에서 10분마다 실행)'
+
+    def handle(self, *args, **options):
+        checkpoint_guest_points_task.delay()
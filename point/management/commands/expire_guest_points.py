@@ -0,0 +1,9 @@
+from django.core.management.base import BaseCommand
+from point.tasks import expire_guest_points_task
+
+
+class Command(BaseCommand):
+    help = 'valid_until 이 지난 포인트를 비활성화하는 Celery 작업을 요청합니다. (crontab 에서 5분마다 실행)'
+
+    def handle(self, *args, **options):
+        expire_guest_points_task.delay()
@@ -0,0 +1,33 @@
+from datetime import (
+    date,
+    timedelta,
+)
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+from django.utils import timezone
+from point.helpers.ledger_export_helpers import export_point_ledger
+from point.tasks import export_point_ledger_task
+
+
+class Command(BaseCommand):
+    help = '일별 Guest, 포인트 타입, 사유별 포인트 내역을 S3 에 CSV 로 내보냅니다. (crontab 에서 매일 전날 내역 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start-date', type=date.fromisoformat, help='YYYY-MM-DD (없으면 어제)')
+        parser.add_argument('--end-date', type=date.fromisoformat, help='YYYY-MM-DD (없으면 start-date)')
+        parser.add_argument('--sync', action='store_true', help='Celery 작업을 요청하지 않고 바로 실행합니다.')
+
+    def handle(self, *args, **options):
+        start_date = options['start_date'] or timezone.localdate() - timedelta(days=1)
+        end_date = options['end_date'] or start_date
+        if start_date > end_date:
+            raise CommandError('start-date 가 end-date 보다 늦습니다.')
+
+        if options['sync']:
+            for file_name in export_point_ledger(start_date, end_date):
+                self.stdout.write(file_name)
+        else:
+            export_point_ledger_task.delay(start_date.isoformat(), end_date.isoformat())
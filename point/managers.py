@@ -0,0 +1,69 @@
+from collections import defaultdict
+from typing import Dict
+
+from django.db import transaction
+from django.db.models import QuerySet
+from point.consts import GUEST_POINT_BALANCE_FIELDS
+from point.helpers.balance_helpers import (
+    increase_guest_point_balances,
+    lock_guest_point_balances,
+)
+
+
+class GuestPointQuerySet(QuerySet):
+    """
+    GuestPointBalance 에 반영된(is_checkpointed) 포인트가 bulk_create, update, delete 에서도 맞도록 유지합니다.
+    """
+
+    def _get_checkpointed_deltas(self) -> Dict[int, int]:
+        """
+        반영된 포인트를 되돌리기 위한 Guest 별 차감분
+        대상 Guest 의 GuestPointBalance 를 먼저 잠근 뒤 반영된 Row 를 잠급니다.
+        """
+        lock_guest_point_balances(self.order_by().values_list('guest_id', flat=True).distinct())
+        deltas = defaultdict(int)
+        for guest_id, point in self.filter(
+            is_checkpointed=True,
+        ).select_for_update().values_list(
+            'guest_id',
+            'point',
+        ):
+            deltas[guest_id] -= point
+        return deltas
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        유효 기간이 없는 활성 포인트는 INSERT 와 같은 트랜잭션에서 GuestPointBalance 에 반영합니다.
+        적립 포인트는 남은 포인트를 지급한 포인트로 초기화합니다.
+        """
+        objs = list(objs)
+        deltas = defaultdict(int)
+        for obj in objs:
+            obj.initialize_remaining_point()
+            obj.is_checkpointed = obj.is_always_valid()
+            if obj.is_checkpointed:
+                deltas[obj.guest_id] += obj.point
+        with transaction.atomic():
+            objs = super().bulk_create(objs, *args, **kwargs)
+            increase_guest_point_balances(deltas)
+        return objs
+
+    def update(self, **kwargs):
+        """
+        잔액에 영향을 주는 필드를 변경하면 반영된 포인트를 되돌리고 다음 checkpoint 에서 다시 반영합니다.
+        """
+        if not GUEST_POINT_BALANCE_FIELDS & kwargs.keys():
+            return super().update(**kwargs)
+
+        with transaction.atomic():
+            deltas = self._get_checkpointed_deltas()
+            rows = super().update(is_checkpointed=False, **kwargs)
+            increase_guest_point_balances(deltas)
+        return rows
+
+    def delete(self):
+        with transaction.atomic():
+            deltas = self._get_checkpointed_deltas()
+            deleted = super().delete()
+            increase_guest_point_balances(deltas)
+        return deleted
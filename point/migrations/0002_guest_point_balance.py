@@ -0,0 +1,41 @@
+# Generated by Django 4.1.10 on 2026-10-18 19:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('member', '0005_membernodeacquisition_memberarrowacquisition'),
+        ('point', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GuestPointBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('point', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Guest 포인트 잔액',
+                'verbose_name_plural': 'Guest 포인트 잔액',
+            },
+        ),
+        migrations.AddField(
+            model_name='guestpoint',
+            name='is_checkpointed',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='guestpoint',
+            index=models.Index(condition=models.Q(('is_checkpointed', False)), fields=['guest', 'valid_until'], name='guest_point_open_idx'),
+        ),
+        migrations.AddField(
+            model_name='guestpointbalance',
+            name='guest',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.DO_NOTHING, related_name='point_balance', to='member.guest'),
+        ),
+    ]
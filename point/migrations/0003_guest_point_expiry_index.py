@@ -0,0 +1,25 @@
+# Generated by Django 4.1.10 on 2026-10-18 19:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('point', '0002_guest_point_balance'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='guestpoint',
+            name='guest_point_open_idx',
+        ),
+        migrations.AddIndex(
+            model_name='guestpoint',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_checkpointed', False)), fields=['guest', 'valid_until'], name='guest_point_open_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='guestpoint',
+            index=models.Index(condition=models.Q(('is_active', True), ('valid_until__isnull', False)), fields=['valid_until', 'id'], name='guest_point_expiry_idx'),
+        ),
+    ]
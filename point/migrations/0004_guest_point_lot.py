@@ -0,0 +1,66 @@
+# Generated by Django 4.1.10 on 2026-10-18 19:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def forward(apps, schema_editor):
+    """
+    Guest 별 포인트 내역을 id 순서로 다시 계산해 적립 포인트의 남은 포인트를 채웁니다.
+    기존 사용 포인트는 사용 시점에 유효했던 적립 포인트를 만료가 가까운 순서로 차감한 것으로 봅니다.
+    """
+    GuestPoint = apps.get_model('point', 'GuestPoint')
+
+    guest_ids = GuestPoint.objects.order_by().values_list('guest_id', flat=True).distinct()
+    for guest_id in guest_ids.iterator():
+        lots = []
+        for guest_point in GuestPoint.objects.filter(guest_id=guest_id, is_active=True).order_by('id').iterator():
+            if guest_point.point > 0:
+                guest_point.remaining_point = guest_point.point
+                lots.append(guest_point)
+                continue
+
+            used_point = -guest_point.point
+            for lot in sorted(
+                lots,
+                key=lambda lot: (lot.valid_until is None, lot.valid_until or guest_point.created_at, lot.id),
+            ):
+                if not used_point:
+                    break
+                if lot.valid_from and lot.valid_from > guest_point.created_at:
+                    continue
+                if lot.valid_until and lot.valid_until < guest_point.created_at:
+                    continue
+                consumed_point = min(lot.remaining_point, used_point)
+                lot.remaining_point -= consumed_point
+                used_point -= consumed_point
+        GuestPoint.objects.bulk_update(lots, ['remaining_point'], batch_size=1000)
+
+
+def backward(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('point', '0003_guest_point_expiry_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='guestpoint',
+            name='lot',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='consumed_points', to='point.guestpoint'),
+        ),
+        migrations.AddField(
+            model_name='guestpoint',
+            name='remaining_point',
+            field=models.BigIntegerField(null=True),
+        ),
+        migrations.AddIndex(
+            model_name='guestpoint',
+            index=models.Index(condition=models.Q(('is_active', True), ('remaining_point__gt', 0)), fields=['guest', 'valid_until', 'id'], name='guest_point_open_lot_idx'),
+        ),
+        migrations.RunPython(forward, backward),
+    ]
@@ -1,6 +1,17 @@
-from django.db import models
+from collections import defaultdict
+
+from django.db import (
+    models,
+    transaction,
+)
+from django.db.models import Q
 from member.models import Guest
 from point.consts import PointType
+from point.helpers.balance_helpers import (
+    increase_guest_point_balances,
+    lock_guest_point_balances,
+)
+from point.managers import GuestPointQuerySet
 
 
 class GuestPoint(models.Model):
@@ -16,12 +27,113 @@ class GuestPoint(models.Model):
     is_active = models.BooleanField(default=True)
     valid_from = models.DateTimeField(null=True, db_index=True)
     valid_until = models.DateTimeField(null=True, db_index=True)
+    # GuestPointBalance 에 반영 여부
+    is_checkpointed = models.BooleanField(default=False)
+    # 적립 포인트(lot)의 남은 포인트, 사용 포인트는 null
+    remaining_point = models.BigIntegerField(null=True)
+    # 사용 포인트가 차감한 적립 포인트
+    lot = models.ForeignKey('self', null=True, on_delete=models.DO_NOTHING, related_name='consumed_points')
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = GuestPointQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Guest 포인트'
         verbose_name_plural = 'Guest 포인트'
+        indexes = [
+            # 잔액 조회 시 GuestPointBalance 에 반영되지 않은 포인트만 합산합니다.
+            models.Index(
+                fields=['guest', 'valid_until'],
+                name='guest_point_open_idx',
+                condition=Q(is_checkpointed=False, is_active=True),
+            ),
+            # 만료 처리 대상을 valid_until, id 순서로 조회합니다.
+            models.Index(
+                fields=['valid_until', 'id'],
+                name='guest_point_expiry_idx',
+                condition=Q(is_active=True, valid_until__isnull=False),
+            ),
+            # 남은 포인트가 있는 적립 포인트를 만료가 가까운 순서로 조회합니다.
+            models.Index(
+                fields=['guest', 'valid_until', 'id'],
+                name='guest_point_open_lot_idx',
+                condition=Q(is_active=True, remaining_point__gt=0),
+            ),
+        ]
 
     def __str__(self):
         return f'{self.guest} - {self.point} - is_active: {self.is_active}'
+
+    def is_always_valid(self) -> bool:
+        return self.is_active and self.valid_from is None and self.valid_until is None
+
+    def initialize_remaining_point(self) -> None:
+        if self.remaining_point is None and self.point > 0 and self.lot_id is None:
+            self.remaining_point = self.point
+
+    def _lock_guest_point_balances(self) -> None:
+        """
+        Row 를 잠그기 전에 저장된 Guest 와 저장할 Guest 의 GuestPointBalance 를 먼저 잠급니다.
+        """
+        lock_guest_point_balances(
+            {
+                self.guest_id,
+                *type(self).objects.filter(pk=self.pk).values_list('guest_id', flat=True),
+            }
+        )
+
+    @transaction.atomic
+    def save(self, *args, **kwargs):
+        """
+        유효 기간이 없는 활성 포인트는 저장과 같은 트랜잭션에서 GuestPointBalance 에 반영합니다.
+        이미 반영된 포인트를 수정하면 반영된 값을 되돌리고 다시 반영합니다.
+        """
+        deltas = defaultdict(int)
+        if self._state.adding:
+            self.initialize_remaining_point()
+        if self.pk is not None:
+            self._lock_guest_point_balances()
+            checkpointed = type(self).objects.filter(
+                pk=self.pk,
+                is_checkpointed=True,
+            ).select_for_update().values('guest_id', 'point').first()
+            if checkpointed:
+                deltas[checkpointed['guest_id']] -= checkpointed['point']
+
+        self.is_checkpointed = self.is_always_valid()
+        if self.is_checkpointed:
+            deltas[self.guest_id] += self.point
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'is_checkpointed'}
+        super().save(*args, **kwargs)
+        increase_guest_point_balances(deltas)
+
+    @transaction.atomic
+    def delete(self, *args, **kwargs):
+        self._lock_guest_point_balances()
+        checkpointed = type(self).objects.filter(
+            pk=self.pk,
+            is_checkpointed=True,
+        ).select_for_update().values('guest_id', 'point').first()
+        deleted = super().delete(*args, **kwargs)
+        if checkpointed:
+            increase_guest_point_balances({checkpointed['guest_id']: -checkpointed['point']})
+        return deleted
+
+
+class GuestPointBalance(models.Model):
+    """
+    GuestPoint 중 is_checkpointed 인 포인트의 Guest 별 합계
+    잔액은 point 와 아직 반영되지 않은 GuestPoint 의 합입니다.
+    """
+    guest = models.OneToOneField(Guest, on_delete=models.DO_NOTHING, related_name='point_balance')
+    point = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Guest 포인트 잔액'
+        verbose_name_plural = 'Guest 포인트 잔액'
+
+    def __str__(self):
+        return f'{self.guest} - {self.point}'
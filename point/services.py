@@ -1,38 +1,353 @@
-from datetime import datetime
+from collections import defaultdict
+from datetime import (
+    datetime,
+    timedelta,
+)
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 
+from common.common_criteria.cursor_criteria import RowValueComparison
+from django.db import transaction
 from django.db.models import (
+    Case,
+    F,
     Q,
     Sum,
+    Value,
+    When,
 )
 from django.db.models.functions import Coalesce
+from django.utils import timezone
+from point.consts import (
+    GUEST_POINT_CHECKPOINT_BATCH_SIZE,
+    GUEST_POINT_EXPIRY_BATCH_SIZE,
+    GUEST_POINT_EXPIRY_BUCKET_SIZE,
+)
 from point.exceptions import NotEnoughGuestPoints
-from point.models import GuestPoint
+from point.helpers.balance_helpers import (
+    increase_guest_point_balances,
+    lock_guest_point_balances,
+)
+from point.models import (
+    GuestPoint,
+    GuestPointBalance,
+)
 
 
-def get_guest_available_total_point(guest_id: int) -> int:
+def get_guest_available_total_points(guest_ids: Iterable[int]) -> Dict[int, int]:
+    """
+    Guest 별 GuestPointBalance 에 반영된 포인트와 아직 반영되지 않은 유효한 포인트의 합
+    반영되지 않은 포인트만 합산하므로 포인트 내역이 늘어나도 조회 비용이 일정합니다.
+    """
+    guest_ids = set(guest_ids)
     now = datetime.now()
-    total_point = GuestPoint.objects.filter(
+    total_points = defaultdict(int)
+    for guest_id, point in GuestPointBalance.objects.filter(
+        guest_id__in=guest_ids,
+    ).values_list(
+        'guest_id',
+        'point',
+    ):
+        total_points[guest_id] += point
+    for guest_id, point in GuestPoint.objects.filter(
         (Q(valid_from__lte=now) | Q(valid_from__isnull=True)),
         (Q(valid_until__gte=now) | Q(valid_until__isnull=True)),
-        guest_id=guest_id,
+        guest_id__in=guest_ids,
+        is_active=True,
+        is_checkpointed=False,
+    ).values(
+        'guest_id',
+    ).annotate(
+        total_point=Coalesce(Sum('point'), 0),
+    ).values_list(
+        'guest_id',
+        'total_point',
+    ):
+        total_points[guest_id] += point
+    return {guest_id: max(total_points[guest_id], 0) for guest_id in guest_ids}
+
+
+def get_guest_available_total_point(guest_id: int) -> int:
+    return get_guest_available_total_points([guest_id])[guest_id]
+
+
+def checkpoint_guest_points(batch_size: int = GUEST_POINT_CHECKPOINT_BATCH_SIZE) -> int:
+    """
+    유효 기간이 시작되어 만료되지 않는 포인트를 id 순서로 batch_size 개씩 GuestPointBalance 에 반영합니다.
+    포인트 사용과 같은 순서로 GuestPointBalance 를 먼저 잠근 뒤 GuestPoint 를 잠급니다.
+    다른 트랜잭션이 잠근 Row 는 건너뛰고 다음 checkpoint 에서 반영합니다. 반영한 Row 수를 반환합니다.
+    """
+    now = timezone.now()
+    last_id = 0
+    checkpointed_count = 0
+    while True:
+        with transaction.atomic():
+            guest_points = GuestPoint.objects.filter(
+                Q(valid_from__lte=now) | Q(valid_from__isnull=True),
+                is_checkpointed=False,
+                is_active=True,
+                valid_until__isnull=True,
+            )
+            candidates = list(
+                guest_points.filter(
+                    id__gt=last_id,
+                ).order_by(
+                    'id',
+                ).values_list(
+                    'id',
+                    'guest_id',
+                )[:batch_size]
+            )
+            if not candidates:
+                return checkpointed_count
+
+            guest_ids = {guest_id for _, guest_id in candidates}
+            lock_guest_point_balances(guest_ids)
+            locked_guest_points = list(
+                guest_points.filter(
+                    id__in=[guest_point_id for guest_point_id, _ in candidates],
+                    guest_id__in=guest_ids,
+                ).select_for_update(
+                    skip_locked=True,
+                ).order_by(
+                    'id',
+                ).values_list(
+                    'id',
+                    'guest_id',
+                    'point',
+                )
+            )
+            deltas = defaultdict(int)
+            for _, guest_id, point in locked_guest_points:
+                deltas[guest_id] += point
+            GuestPoint.objects.filter(
+                id__in=[guest_point_id for guest_point_id, _, _ in locked_guest_points],
+            ).update(
+                is_checkpointed=True,
+            )
+            increase_guest_point_balances(deltas)
+        checkpointed_count += len(locked_guest_points)
+        last_id = candidates[-1][0]
+
+
+def _expire_guest_point_bucket(bucket_start: datetime, bucket_end: datetime, batch_size: int) -> int:
+    """
+    valid_until 이 [bucket_start, bucket_end) 인 활성 포인트를 (valid_until, id) keyset 순서로 batch_size 개씩 비활성화합니다.
+    포인트 사용과 같은 순서로 GuestPointBalance 를 먼저 잠근 뒤 GuestPoint 를 잠급니다.
+    """
+    expired_count = 0
+    last_key = None
+    while True:
+        with transaction.atomic():
+            guest_points = GuestPoint.objects.filter(
+                is_active=True,
+                valid_until__gte=bucket_start,
+                valid_until__lt=bucket_end,
+            )
+            candidates = guest_points
+            if last_key is not None:
+                candidates = candidates.filter(
+                    RowValueComparison(attributes=['valid_until', 'id'], operator='gt', values=list(last_key)),
+                )
+            candidates = list(
+                candidates.order_by(
+                    'valid_until',
+                    'id',
+                ).values_list(
+                    'valid_until',
+                    'id',
+                    'guest_id',
+                )[:batch_size]
+            )
+            if not candidates:
+                return expired_count
+
+            guest_ids = {guest_id for _, _, guest_id in candidates}
+            lock_guest_point_balances(guest_ids)
+            expired_ids = list(
+                guest_points.filter(
+                    id__in=[guest_point_id for _, guest_point_id, _ in candidates],
+                    guest_id__in=guest_ids,
+                ).select_for_update(
+                    skip_locked=True,
+                ).values_list(
+                    'id',
+                    flat=True,
+                )
+            )
+            # GuestPointBalance 에 반영된 포인트가 있으면 QuerySet.update 에서 되돌립니다.
+            GuestPoint.objects.filter(
+                id__in=expired_ids,
+            ).update(
+                is_active=False,
+            )
+        expired_count += len(expired_ids)
+        last_key = candidates[-1][:2]
+
+
+def expire_guest_points(now: Optional[datetime] = None,
+                        batch_size: int = GUEST_POINT_EXPIRY_BATCH_SIZE,
+                        bucket_size: timedelta = GUEST_POINT_EXPIRY_BUCKET_SIZE) -> int:
+    """
+    valid_until 이 지난 활성 포인트를 valid_until 시간 버킷 순서로 비활성화합니다.
+    처리할 포인트가 없는 버킷은 건너뜁니다. 비활성화한 Row 수를 반환합니다.
+    """
+    now = now or timezone.now()
+    expired_guest_points = GuestPoint.objects.filter(
         is_active=True,
-    ).aggregate(
-        total_point=Coalesce(Sum('point'), 0)
-    ).get(
-        'total_point'
+        valid_until__lt=now,
+    ).order_by(
+        'valid_until',
+    ).values_list(
+        'valid_until',
+        flat=True,
     )
-    return max(total_point, 0)
+    expired_count = 0
+    bucket_start = expired_guest_points.first()
+    while bucket_start is not None:
+        bucket_end = min(bucket_start + bucket_size, now)
+        expired_count += _expire_guest_point_bucket(bucket_start, bucket_end, batch_size)
+        bucket_start = expired_guest_points.filter(valid_until__gte=bucket_end).first()
+    return expired_count
 
 
 def use_point(guest_id: int, point: int, description: str) -> GuestPoint:
-    total_point = get_guest_available_total_point(guest_id)
-    if total_point < point:
-        raise NotEnoughGuestPoints
-    return GuestPoint.objects.create(
-        guest_id=guest_id,
-        point=-point,
-        reason=description,
+    """
+    여러 적립 포인트에서 차감되면 첫 번째 사용 포인트를 반환합니다. 모든 사용 포인트는 use_points 로 받습니다.
+    """
+    return use_points([(guest_id, point, description)])[0]
+
+
+def _get_open_lots(guest_ids: Iterable[int]) -> Dict[int, List[GuestPoint]]:
+    """
+    Guest 별 남은 포인트가 있는 유효한 적립 포인트를 잠그고 만료가 가까운 순서로 반환합니다. (만료 기간 없으면 마지막)
+    """
+    now = timezone.now()
+    open_lots = defaultdict(list)
+    for lot in GuestPoint.objects.filter(
+        (Q(valid_from__lte=now) | Q(valid_from__isnull=True)),
+        (Q(valid_until__gte=now) | Q(valid_until__isnull=True)),
+        guest_id__in=guest_ids,
+        is_active=True,
+        remaining_point__gt=0,
+    ).select_for_update().order_by(
+        F('valid_until').asc(nulls_last=True),
+        'id',
+    ):
+        open_lots[lot.guest_id].append(lot)
+    return open_lots
+
+
+@transaction.atomic
+def use_points(spends: Iterable[Tuple[int, int, str]]) -> List[GuestPoint]:
+    """
+    (guest_id, point, description) 목록을 한 트랜잭션에서 사용합니다.
+    Guest 별 잔액 Row 를 잠근 뒤 사용 합계를 확인하므로 하나라도 부족하면 모두 사용하지 않습니다.
+
+    적립 포인트를 만료가 가까운 순서로 차감하고 차감한 적립 포인트마다 사용 포인트를 남깁니다.
+    사용 포인트는 적립 포인트의 만료 기간을 따르므로 적립 포인트가 만료되면 남은 포인트만 사라집니다.
+    """
+    spends = list(spends)
+    guest_total_points = defaultdict(int)
+    for guest_id, point, _ in spends:
+        guest_total_points[guest_id] += point
+
+    lock_guest_point_balances(guest_total_points)
+    available_points = get_guest_available_total_points(guest_total_points)
+    for guest_id, total_point in guest_total_points.items():
+        if available_points[guest_id] < total_point:
+            raise NotEnoughGuestPoints()
+
+    open_lots = _get_open_lots(guest_total_points)
+    consumed_lots = {}
+    guest_points = []
+    for guest_id, point, description in spends:
+        left_point = point
+        for lot in open_lots[guest_id]:
+            if not left_point:
+                break
+            consumed_point = min(lot.remaining_point, left_point)
+            if not consumed_point:
+                continue
+            lot.remaining_point -= consumed_point
+            left_point -= consumed_point
+            consumed_lots[lot.id] = lot
+            guest_points.append(
+                GuestPoint(
+                    guest_id=guest_id,
+                    type=lot.type,
+                    point=-consumed_point,
+                    reason=description,
+                    valid_until=lot.valid_until,
+                    lot=lot,
+                )
+            )
+        if left_point:
+            # 적립 포인트로 추적되지 않는 잔액에서 사용
+            guest_points.append(
+                GuestPoint(
+                    guest_id=guest_id,
+                    point=-left_point,
+                    reason=description,
+                )
+            )
+    GuestPoint.objects.bulk_update(consumed_lots.values(), ['remaining_point'])
+    return GuestPoint.objects.bulk_create(guest_points)
+
+
+@transaction.atomic
+def refund_points(guest_point_ids: Iterable[int]) -> int:
+    """
+    사용 포인트를 비활성화하고 차감했던 적립 포인트의 남은 포인트를 돌려줍니다.
+    환불한 사용 포인트 수를 반환합니다.
+    """
+    guest_point_ids = list(guest_point_ids)
+    lock_guest_point_balances(
+        GuestPoint.objects.filter(
+            id__in=guest_point_ids,
+        ).values_list(
+            'guest_id',
+            flat=True,
+        )
+    )
+    used_points = list(
+        GuestPoint.objects.filter(
+            id__in=guest_point_ids,
+            is_active=True,
+            point__lt=0,
+        ).select_for_update().values_list(
+            'id',
+            'lot_id',
+            'point',
+        )
+    )
+    if not used_points:
+        return 0
+
+    refunded_lot_points = defaultdict(int)
+    for _, lot_id, point in used_points:
+        if lot_id is not None:
+            refunded_lot_points[lot_id] -= point
+    GuestPoint.objects.filter(
+        id__in=[guest_point_id for guest_point_id, _, _ in used_points],
+    ).update(
+        is_active=False,
     )
+    if refunded_lot_points:
+        GuestPoint.objects.filter(
+            id__in=refunded_lot_points,
+        ).update(
+            remaining_point=F('remaining_point') + Case(
+                *[When(id=lot_id, then=Value(point)) for lot_id, point in refunded_lot_points.items()],
+                default=Value(0),
+            ),
+        )
+    return len(used_points)
 
 
 def give_point(guest_id: int, point: int, reason: str) -> GuestPoint:
@@ -0,0 +1,24 @@
+from datetime import date
+from typing import List
+
+from config.celery import app
+from point.helpers.ledger_export_helpers import export_point_ledger
+from point.services import (
+    checkpoint_guest_points,
+    expire_guest_points,
+)
+
+
+@app.task
+def checkpoint_guest_points_task() -> int:
+    return checkpoint_guest_points()
+
+
+@app.task
+def expire_guest_points_task() -> int:
+    return expire_guest_points()
+
+
+@app.task
+def export_point_ledger_task(start_date: str, end_date: str) -> List[str]:
+    return export_point_ledger(date.fromisoformat(start_date), date.fromisoformat(end_date))
@@ -0,0 +1,90 @@
+import csv
+import io
+from datetime import date
+from unittest.mock import patch
+
+from django.test import TestCase
+from freezegun import freeze_time
+from member.models import Guest
+from point.consts import (
+    POINT_LEDGER_EXPORT_HEADER,
+    PointType,
+)
+from point.helpers.ledger_export_helpers import (
+    export_point_ledger,
+    iter_point_ledger_rows,
+)
+from point.services import (
+    give_point,
+    use_point,
+)
+
+
+class PointLedgerExportTestCase(TestCase):
+    def setUp(self):
+        self.guest = Guest.objects.all().first()
+        with freeze_time('2022-01-01 12:00:00'):
+            give_point(self.guest.id, 100, '포인트 지급')
+            give_point(self.guest.id, 200, '포인트 지급')
+            use_point(self.guest.id, 50, '상품 구매')
+        with freeze_time('2022-01-02 12:00:00'):
+            give_point(self.guest.id, 300, '포인트 지급')
+
+    @staticmethod
+    def _read_uploaded_rows(mock_upload_file_to_s3) -> list:
+        rows = []
+        for call in mock_upload_file_to_s3.call_args_list:
+            reader = csv.reader(io.StringIO(call.args[1].decode('utf-8')))
+            # 모든 파일에 header 가 있습니다.
+            assert tuple(next(reader)) == POINT_LEDGER_EXPORT_HEADER
+            rows.extend(reader)
+        return rows
+
+    def test_iter_point_ledger_rows_should_aggregate_by_guest_type_and_reason(self):
+        # When:
+        rows = list(iter_point_ledger_rows(date(2022, 1, 1)))
+
+        # Then:
+        self.assertEqual(
+            rows,
+            [
+                (self.guest.id, PointType.NORMAL_POINT.value, '상품 구매', 0, -50, 1),
+                (self.guest.id, PointType.NORMAL_POINT.value, '포인트 지급', 300, 0, 2),
+            ]
+        )
+
+    @patch('point.helpers.ledger_export_helpers.upload_file_to_s3')
+    def test_export_point_ledger_should_upload_chunks_per_day(self, mock_upload_file_to_s3):
+        # Given:
+        mock_upload_file_to_s3.return_value = True
+
+        # When: 한 Row 씩 나눠지도록 작은 chunk
+        file_names = export_point_ledger(date(2022, 1, 1), date(2022, 1, 3), chunk_chars=1)
+
+        # Then: 날짜별 파일, 내역이 없는 날은 header 만 업로드
+        self.assertEqual(
+            file_names,
+            [
+                'point_ledger/2022-01-01/part-00000.csv',
+                'point_ledger/2022-01-01/part-00001.csv',
+                'point_ledger/2022-01-02/part-00000.csv',
+                'point_ledger/2022-01-03/part-00000.csv',
+            ]
+        )
+        self.assertEqual(
+            self._read_uploaded_rows(mock_upload_file_to_s3),
+            [
+                ['2022-01-01', str(self.guest.id), PointType.NORMAL_POINT.value, '상품 구매', '0', '-50', '1'],
+                ['2022-01-01', str(self.guest.id), PointType.NORMAL_POINT.value, '포인트 지급', '300', '0', '2'],
+                ['2022-01-02', str(self.guest.id), PointType.NORMAL_POINT.value, '포인트 지급', '300', '0', '1'],
+            ]
+        )
+
+    @patch('point.helpers.ledger_export_helpers.upload_file_to_s3')
+    def test_export_point_ledger_should_fail_when_upload_fails(self, mock_upload_file_to_s3):
+        # Given:
+        mock_upload_file_to_s3.return_value = False
+
+        # Expected:
+        with self.assertRaises(Exception):
+            export_point_ledger(date(2022, 1, 1), date(2022, 1, 1))
@@ -1,14 +1,31 @@
-from datetime import datetime
+import threading
+import time
+from datetime import (
+    datetime,
+    timedelta,
+)
+from unittest.mock import patch
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from freezegun import freeze_time
 from member.models import Guest
 from point.exceptions import NotEnoughGuestPoints
-from point.models import GuestPoint
+from point.models import (
+    GuestPoint,
+    GuestPointBalance,
+)
 from point.services import (
+    _get_open_lots,
+    checkpoint_guest_points,
+    expire_guest_points,
     get_guest_available_total_point,
     give_point,
+    refund_points,
     use_point,
+    use_points,
 )
 
 
@@ -143,3 +160,345 @@ class GuestPointTestCase(TestCase):
         self.assertEqual(guest_point.guest_id, self.guest.id)
         self.assertEqual(guest_point.reason, reason)
         self.assertEqual(guest_point.point, point)
+
+
+class GuestPointBalanceTestCase(TestCase):
+    def setUp(self):
+        super(GuestPointBalanceTestCase, self).setUp()
+        self.guest = Guest.objects.all().first()
+
+    def _get_balance_point(self) -> int:
+        return GuestPointBalance.objects.get(guest_id=self.guest.id).point
+
+    def test_create_should_update_balance_in_same_transaction(self):
+        # When: 유효 기간 없는 포인트 지급 / 사용
+        give_point(self.guest.id, 300, 'test')
+        use_point(self.guest.id, 100, 'test')
+
+        # Then: GuestPointBalance 반영
+        self.assertEqual(self._get_balance_point(), 200)
+        self.assertEqual(GuestPoint.objects.filter(is_checkpointed=False).count(), 0)
+
+    def test_bulk_create_should_update_balance(self):
+        # When:
+        GuestPoint.objects.bulk_create(
+            [
+                GuestPoint(guest=self.guest, point=100, reason='test'),
+                GuestPoint(guest=self.guest, point=200, reason='test'),
+                GuestPoint(guest=self.guest, point=300, reason='test', valid_until=datetime(2099, 1, 1)),
+            ]
+        )
+
+        # Then: 유효 기간이 있는 포인트는 반영하지 않습니다.
+        self.assertEqual(self._get_balance_point(), 300)
+        self.assertEqual(get_guest_available_total_point(self.guest.id), 600)
+
+    def test_get_guest_available_total_point_should_not_depend_on_history_length(self):
+        # Given: 포인트 내역 100개
+        GuestPoint.objects.bulk_create(
+            [GuestPoint(guest=self.guest, point=10, reason='test') for _ in range(100)]
+        )
+
+        # When:
+        with CaptureQueriesContext(connection) as context:
+            total_point = get_guest_available_total_point(self.guest.id)
+
+        # Then: GuestPointBalance 와 반영되지 않은 포인트만 조회합니다.
+        self.assertEqual(total_point, 1000)
+        self.assertEqual(len(context.captured_queries), 2)
+        self.assertIn('"is_checkpointed"', context.captured_queries[1]['sql'])
+
+    def test_queryset_update_should_revert_checkpointed_point(self):
+        # Given:
+        give_point(self.guest.id, 300, 'test')
+        give_point(self.guest.id, 200, 'test')
+
+        # When: 하나를 비활성화
+        GuestPoint.objects.filter(point=300).update(is_active=False)
+
+        # Then: 반영된 포인트를 되돌립니다.
+        self.assertEqual(self._get_balance_point(), 200)
+        self.assertEqual(get_guest_available_total_point(self.guest.id), 200)
+
+    def test_delete_should_revert_checkpointed_point(self):
+        # Given:
+        guest_point = give_point(self.guest.id, 300, 'test')
+        give_point(self.guest.id, 200, 'test')
+
+        # When:
+        guest_point.delete()
+
+        # Then:
+        self.assertEqual(self._get_balance_point(), 200)
+
+    @freeze_time('2020-01-02 00:00:00')
+    def test_checkpoint_guest_points_should_fold_started_points(self):
+        # Given: 유효 기간이 시작된 포인트, 아직 시작되지 않은 포인트, 만료 기간이 있는 포인트
+        GuestPoint.objects.create(guest=self.guest, point=100, reason='test', valid_from=datetime(2020, 1, 1))
+        GuestPoint.objects.create(guest=self.guest, point=200, reason='test', valid_from=datetime(2020, 1, 3))
+        GuestPoint.objects.create(guest=self.guest, point=300, reason='test', valid_until=datetime(2020, 1, 3))
+
+        # When:
+        checkpointed_count = checkpoint_guest_points(batch_size=1)
+
+        # Then: 시작되었고 만료되지 않는 포인트만 반영합니다.
+        self.assertEqual(checkpointed_count, 1)
+        self.assertEqual(self._get_balance_point(), 100)
+        # And: 잔액은 그대로
+        self.assertEqual(get_guest_available_total_point(self.guest.id), 400)
+
+
+class GuestPointLockOrderTestCase(TestCase):
+    """
+    checkpoint 와 포인트 사용을 서로 다른 연결에서 동시에 실행합니다.
+    다른 연결에서 보이도록 데이터는 별도 연결에서 커밋하고 tearDown 에서 지웁니다.
+    """
+
+    @staticmethod
+    def _run_in_thread(func, errors: list, results: list = None) -> threading.Thread:
+        def target():
+            try:
+                result = func()
+                if results is not None:
+                    results.append(result)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=target)
+        thread.start()
+        return thread
+
+    def _run_committed(self, func):
+        errors, results = [], []
+        self._run_in_thread(func, errors, results).join()
+        if errors:
+            raise errors[0]
+        return results[0]
+
+    def setUp(self):
+        super(GuestPointLockOrderTestCase, self).setUp()
+        self.guest = self._run_committed(
+            lambda: Guest.objects.create(temp_nickname='lock', ip='127.0.0.1', email='lock@test.com')
+        )
+        # 유효 기간이 시작되어 checkpoint 대상이면서 사용할 수 있는 적립 포인트
+        self.lot = self._run_committed(
+            lambda: GuestPoint.objects.create(
+                guest=self.guest,
+                point=100,
+                reason='test',
+                valid_from=timezone.now() - timedelta(days=1),
+            )
+        )
+
+    def tearDown(self):
+        def delete():
+            GuestPoint.objects.filter(guest_id=self.guest.id).delete()
+            GuestPointBalance.objects.filter(guest_id=self.guest.id).delete()
+            return Guest.objects.filter(id=self.guest.id).delete()
+
+        self._run_committed(delete)
+        super(GuestPointLockOrderTestCase, self).tearDown()
+
+    def test_checkpoint_should_not_deadlock_with_use_points(self):
+        # Given: 포인트 사용이 GuestPointBalance 를 잠근 뒤 적립 포인트를 잠그기 전에 checkpoint 실행
+        balance_locked = threading.Event()
+
+        def get_open_lots(guest_ids):
+            balance_locked.set()
+            time.sleep(0.5)
+            return _get_open_lots(guest_ids)
+
+        def checkpoint():
+            balance_locked.wait(timeout=5)
+            checkpoint_guest_points()
+
+        errors = []
+        with patch('point.services._get_open_lots', side_effect=get_open_lots):
+            # When:
+            threads = [
+                self._run_in_thread(lambda: use_points([(self.guest.id, 30, 'test')]), errors),
+                self._run_in_thread(checkpoint, errors),
+            ]
+            for thread in threads:
+                thread.join(timeout=10)
+
+        # Then: 데드락 없이 둘 다 성공합니다.
+        self.assertEqual(errors, [])
+        self.lot.refresh_from_db()
+        self.assertEqual(self.lot.remaining_point, 70)
+        self.assertTrue(self.lot.is_checkpointed)
+        self.assertEqual(GuestPointBalance.objects.get(guest_id=self.guest.id).point, 70)
+        self.assertEqual(get_guest_available_total_point(self.guest.id), 70)
+
+
+class UsePointsTestCase(TestCase):
+    def setUp(self):
+        super(UsePointsTestCase, self).setUp()
+        self.guest = Guest.objects.all().first()
+        self.other_guest = Guest.objects.create(temp_nickname='other', ip='127.0.0.1', email='other@test.com')
+
+    def test_use_point_should_lock_balance_row_before_checking(self):
+        # Given:
+        give_point(self.guest.id, 100, 'test')
+
+        # When:
+        with CaptureQueriesContext(connection) as context:
+            use_point(self.guest.id, 100, 'test')
+
+        # Then: 잔액 확인 전에 GuestPointBalance Row 를 잠급니다.
+        queries = [query['sql'] for query in context.captured_queries]
+        locking_index = next(index for index, sql in enumerate(queries) if 'FOR UPDATE' in sql)
+        sum_index = next(index for index, sql in enumerate(queries) if 'SUM(' in sql)
+        self.assertLess(locking_index, sum_index)
+        self.assertIn(f'FROM "{GuestPointBalance._meta.db_table}"', queries[locking_index])
+
+    def test_use_points_should_spend_for_multiple_guests(self):
+        # Given:
+        give_point(self.guest.id, 300, 'test')
+        give_point(self.other_guest.id, 100, 'test')
+
+        # When: 한 트랜잭션에서 여러 번 사용
+        guest_points = use_points(
+            [
+                (self.guest.id, 100, 'test1'),
+                (self.guest.id, 200, 'test2'),
+                (self.other_guest.id, 100, 'test3'),
+            ]
+        )
+
+        # Then:
+        self.assertEqual([guest_point.point for guest_point in guest_points], [-100, -200, -100])
+        self.assertEqual(get_guest_available_total_point(self.guest.id), 0)
+        self.assertEqual(get_guest_available_total_point(self.other_guest.id), 0)
+
+    def test_use_points_should_not_spend_any_when_one_guest_has_not_enough_point(self):
+        # Given:
+        give_point(self.guest.id, 300, 'test')
+        give_point(self.other_guest.id, 100, 'test')
+
+        # Expected: 합계가 잔액을 초과하면 모두 사용하지 않습니다.
+        with self.assertRaises(NotEnoughGuestPoints):
+            use_points(
+                [
+                    (self.other_guest.id, 100, 'test'),
+                    (self.guest.id, 200, 'test'),
+                    (self.guest.id, 200, 'test'),
+                ]
+            )
+        self.assertEqual(get_guest_available_total_point(self.guest.id), 300)
+        self.assertEqual(get_guest_available_total_point(self.other_guest.id), 100)
+
+
+class ExpireGuestPointsTestCase(TestCase):
+    def setUp(self):
+        super(ExpireGuestPointsTestCase, self).setUp()
+        self.guest = Guest.objects.all().first()
+
+    @freeze_time('2020-01-10 00:00:00')
+    def test_expire_guest_points_should_deactivate_expired_points_in_buckets(self):
+        # Given: 서로 다른 버킷에 만료된 포인트 3개, 만료되지 않은 포인트 1개, 기간 없는 포인트 1개
+        expired_ids = [
+            GuestPoint.objects.create(guest=self.guest, point=100, reason='test', valid_until=valid_until).id
+            for valid_until in (
+                datetime(2020, 1, 1, 0, 10),
+                datetime(2020, 1, 1, 0, 20),
+                datetime(2020, 1, 5),
+            )
+        ]
+        GuestPoint.objects.create(guest=self.guest, point=200, reason='test', valid_until=datetime(2020, 1, 11))
+        give_point(self.guest.id, 300, 'test')
+
+        # When: batch 1개씩 처리
+        expired_count = expire_guest_points(batch_size=1)
+
+        # Then: 만료된 포인트만 비활성화
+        self.assertEqual(expired_count, 3)
+        self.assertEqual(
+            set(GuestPoint.objects.filter(is_active=False).values_list('id', flat=True)),
+            set(expired_ids)
+        )
+        # And: 잔액은 그대로
+        self.assertEqual(get_guest_available_total_point(self.guest.id), 500)
+        self.assertEqual(GuestPointBalance.objects.get(guest_id=self.guest.id).point, 300)
+
+    @freeze_time('2020-01-10 00:00:00')
+    def test_expire_guest_points_should_do_nothing_when_no_expired_points(self):
+        # Given:
+        GuestPoint.objects.create(guest=self.guest, point=200, reason='test', valid_until=datetime(2020, 1, 11))
+
+        # When:
+        expired_count = expire_guest_points()
+
+        # Then:
+        self.assertEqual(expired_count, 0)
+        self.assertFalse(GuestPoint.objects.filter(is_active=False).exists())
+
+
+class GuestPointLotTestCase(TestCase):
+    def setUp(self):
+        super(GuestPointLotTestCase, self).setUp()
+        self.guest = Guest.objects.all().first()
+
+    @freeze_time('2020-01-01 00:00:00')
+    def test_use_points_should_consume_soonest_expiring_lot_first(self):
+        # Given: 기간 없는 적립 포인트, 늦게 만료되는 적립 포인트, 빨리 만료되는 적립 포인트
+        unlimited_lot = give_point(self.guest.id, 100, 'test')
+        late_lot = GuestPoint.objects.create(guest=self.guest, point=100, reason='test', valid_until=datetime(2020, 3, 1))
+        early_lot = GuestPoint.objects.create(guest=self.guest, point=100, reason='test', valid_until=datetime(2020, 2, 1))
+
+        # When:
+        guest_points = use_points([(self.guest.id, 150, 'test')])
+
+        # Then: 빨리 만료되는 적립 포인트부터 차감합니다.
+        self.assertEqual(
+            [(guest_point.lot_id, guest_point.point) for guest_point in guest_points],
+            [(early_lot.id, -100), (late_lot.id, -50)]
+        )
+        self.assertEqual(
+            list(
+                GuestPoint.objects.filter(
+                    id__in=[unlimited_lot.id, late_lot.id, early_lot.id],
+                ).order_by('id').values_list('remaining_point', flat=True)
+            ),
+            [100, 50, 0]
+        )
+        self.assertEqual(get_guest_available_total_point(self.guest.id), 150)
+
+    def test_expire_guest_points_should_expire_only_remaining_point(self):
+        # Given: 만료 기간이 있는 적립 포인트 100 중 60 사용
+        with freeze_time('2020-01-01 00:00:00'):
+            GuestPoint.objects.create(guest=self.guest, point=100, reason='test', valid_until=datetime(2020, 2, 1))
+            give_point(self.guest.id, 50, 'test')
+            use_point(self.guest.id, 60, 'test')
+            self.assertEqual(get_guest_available_total_point(self.guest.id), 90)
+
+        # When: 만료
+        with freeze_time('2020-02-02 00:00:00'):
+            expire_guest_points()
+
+            # Then: 남은 40 만 사라집니다.
+            self.assertEqual(get_guest_available_total_point(self.guest.id), 50)
+
+    def test_refund_points_should_restore_consumed_lots(self):
+        # Given:
+        lot = give_point(self.guest.id, 100, 'test')
+        guest_points = use_points([(self.guest.id, 70, 'test')])
+
+        # When:
+        refunded_count = refund_points([guest_point.id for guest_point in guest_points])
+
+        # Then: 사용 포인트 비활성화 및 적립 포인트 복구
+        self.assertEqual(refunded_count, 1)
+        lot.refresh_from_db()
+        self.assertEqual(lot.remaining_point, 100)
+        self.assertEqual(get_guest_available_total_point(self.guest.id), 100)
+
+        # When: 다시 환불
+        refunded_count = refund_points([guest_point.id for guest_point in guest_points])
+
+        # Then: 이미 환불한 포인트는 무시합니다.
+        self.assertEqual(refunded_count, 0)
+        lot.refresh_from_db()
+        self.assertEqual(lot.remaining_point, 100)
@@ -4,6 +4,7 @@ from product.models import (
     GiveProductLog,
     PointProduct,
     ProductImage,
+    ProductStockShard,
     ProductTag,
 )
 
@@ -22,7 +23,21 @@ class PointProductAdmin(admin.ModelAdmin):
         'is_sold_out',
         'is_deleted',
         'point',
+        'stock_shard_count',
     ]
+    # 재고 분할은 split_product_stock 명령어로만 변경합니다. (shard 없이 분할 수만 바꾸면 구매할 수 없습니다.)
+    readonly_fields = [
+        'stock_shard_count',
+    ]
+
+    def get_readonly_fields(self, request, obj=None):
+        """
+        재고를 분할한 상품의 남은 재고는 shard 합계이므로 상품 Row 의 left_quantity 를 수정할 수 없습니다.
+        """
+        readonly_fields = super(PointProductAdmin, self).get_readonly_fields(request, obj)
+        if obj and obj.stock_shard_count:
+            return [*readonly_fields, 'left_quantity']
+        return readonly_fields
 
 
 class GiveProductAdmin(admin.ModelAdmin):
@@ -62,8 +77,19 @@ class ProductImageAdmin(admin.ModelAdmin):
     ]
 
 
+class ProductStockShardAdmin(admin.ModelAdmin):
+    list_display = [
+        'id',
+        'product_type',
+        'product_pk',
+        'shard_no',
+        'left_quantity',
+    ]
+
+
 admin.site.register(PointProduct, PointProductAdmin)
 admin.site.register(GiveProduct, GiveProductAdmin)
 admin.site.register(GiveProductLog, GiveProductLogAdmin)
 admin.site.register(ProductTag, ProductTagAdmin)
 admin.site.register(ProductImage, ProductImageAdmin)
+admin.site.register(ProductStockShard, ProductStockShardAdmin)
@@ -0,0 +1,10 @@
+from common.common_criteria.cursor_criteria import CursorCriteria
+from product.models import PointProduct
+
+
+class PointProductCursorCriteria(CursorCriteria):
+    cursor_keys = [
+        'ordering__gt',
+        'id__gt',
+    ]
+    model = PointProduct
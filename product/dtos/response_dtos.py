@@ -1,5 +1,9 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
 class PointProductListResponse(BaseModel):
     products: list = Field(...)
+    has_more: bool = Field(...)
+    next_cursor: Optional[str] = None
@@ -0,0 +1,26 @@
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+from product.models import PointProduct
+
+
+class Command(BaseCommand):
+    help = '포인트 상품의 남은 재고를 shard_count 개의 ProductStockShard 로 나눕니다. (0 이면 분할 해제)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('product_id', type=int)
+        parser.add_argument('shard_count', type=int)
+
+    def handle(self, *args, **options):
+        product = PointProduct.objects.filter(id=options['product_id']).first()
+        if not product:
+            raise CommandError(f'PointProduct {options["product_id"]} 가 존재하지 않습니다.')
+
+        try:
+            shards = product.split_stock(options['shard_count'])
+        except ValueError as e:
+            raise CommandError(str(e))
+        self.stdout.write(
+            self.style.SUCCESS(f'PointProduct {product.id} 의 남은 재고 {product.left_quantity} 개를 {len(shards)} 개로 나눴습니다.')
+        )
@@ -1,20 +1,211 @@
+import json
+from collections import defaultdict
+from typing import (
+    Dict,
+    Iterable,
+    List,
+)
+
+from django.apps import apps
+from django.db import transaction
 from django.db.models import (
+    BigIntegerField,
+    Case,
+    F,
+    OuterRef,
     Q,
     QuerySet,
+    Subquery,
+    Sum,
+    When,
 )
+from django.db.models.functions import Coalesce
 from django.utils import timezone
+from point.exceptions import (
+    NotEnoughGuestPoints,
+    NotEnoughGuestPointsForCancelOrder,
+)
+from point.models import GuestPoint
+from point.services import use_points
+from product.consts import ProductGivenStatus
 
 
 class ProductQuerySet(QuerySet):
+    def annotate_left_quantity(self) -> 'ProductQuerySet':
+        """
+        남은 재고를 current_left_quantity 로 추가합니다. 재고를 분할한 상품은 ProductStockShard 합계입니다.
+        """
+        product_stock_shard_model = apps.get_model('product', 'ProductStockShard')
+        return self.annotate(
+            current_left_quantity=Case(
+                When(
+                    stock_shard_count__gt=0,
+                    then=Coalesce(
+                        Subquery(
+                            product_stock_shard_model.objects.filter(
+                                product_type=self.model.product_type,
+                                product_pk=OuterRef('id'),
+                            ).order_by().values(
+                                'product_pk',
+                            ).annotate(
+                                left_quantity=Sum('left_quantity'),
+                            ).values('left_quantity')
+                        ),
+                        0,
+                    ),
+                ),
+                default=F('left_quantity'),
+                output_field=BigIntegerField(),
+            ),
+        )
+
     def get_actives(self, now=None):
         if now is None:
             now = timezone.now()
 
-        return self.filter(
+        return self.annotate_left_quantity().filter(
             (Q(start_time__lte=now) | Q(start_time__isnull=True)),
             (Q(end_time__gte=now) | Q(end_time__isnull=True)),
-            (Q(left_quantity__gt=0) | Q(left_quantity__isnull=True)),
+            (Q(current_left_quantity__gt=0) | Q(current_left_quantity__isnull=True)),
             is_active=True,
             is_deleted=False,
             is_sold_out=False,
         )
+
+
+class GiveProductQuerySet(QuerySet):
+    """
+    여러 GiveProduct 를 상품 타입별로 묶어 한 번에 지급 / 취소 / 실패 처리합니다.
+    상태 변경, GiveProductLog, GuestPoint 를 각각 한 번의 UPDATE / INSERT 로 처리하므로
+    주문 Item 수와 관계없이 쿼리 수가 일정합니다.
+    """
+
+    def _change_status(self, status: str, from_statuses: Iterable[str]) -> List[dict]:
+        """
+        대상 중 from_statuses 상태인 Row 만 잠그고 status 로 변경한 뒤 변경 전 값을 반환합니다.
+        이미 처리된 Row 는 제외되므로 같은 요청을 재시도해도 중복 지급 / 회수되지 않습니다.
+        """
+        from_statuses = list(from_statuses)
+        give_products = list(
+            self.filter(status__in=from_statuses).select_for_update().order_by('id').values(
+                'id',
+                'guest_id',
+                'product_pk',
+                'product_type',
+                'quantity',
+                'meta_data',
+                'status',
+            )
+        )
+        if not give_products:
+            return []
+
+        self.model.objects.filter(
+            id__in=[give_product['id'] for give_product in give_products],
+            status__in=from_statuses,
+        ).update(
+            status=status,
+            updated_at=timezone.now(),
+        )
+        give_product_log_model = apps.get_model('product', 'GiveProductLog')
+        give_product_log_model.objects.bulk_create(
+            [
+                give_product_log_model(give_product_id=give_product['id'], status=status)
+                for give_product in give_products
+            ]
+        )
+        return give_products
+
+    @staticmethod
+    def _group_by_product_type(give_products: List[dict]) -> Dict[str, List[dict]]:
+        give_products_by_product_type = defaultdict(list)
+        for give_product in give_products:
+            give_products_by_product_type[give_product['product_type']].append(give_product)
+        return give_products_by_product_type
+
+    @staticmethod
+    def _release_stock(give_products: List[dict]) -> None:
+        """
+        상품별 수량을 합쳐 한 번씩 재고를 돌려줍니다.
+        """
+        point_product_model = apps.get_model('product', 'PointProduct')
+        quantities = defaultdict(int)
+        for give_product in give_products:
+            if give_product['product_type'] == point_product_model.product_type:
+                quantities[give_product['product_pk']] += give_product['quantity']
+        for product_pk, quantity in quantities.items():
+            point_product_model.release_stock(product_pk, quantity)
+
+    @transaction.atomic
+    def give(self) -> None:
+        give_products = self._change_status(
+            ProductGivenStatus.SUCCESS.value,
+            from_statuses=[ProductGivenStatus.READY.value],
+        )
+        point_product_model = apps.get_model('product', 'PointProduct')
+        point_give_products = self._group_by_product_type(give_products)[point_product_model.product_type]
+        if not point_give_products:
+            return
+
+        points = dict(
+            point_product_model.objects.filter(
+                id__in={give_product['product_pk'] for give_product in point_give_products},
+            ).values_list(
+                'id',
+                'point',
+            )
+        )
+        guest_points = []
+        for give_product in point_give_products:
+            if give_product['product_pk'] in points:
+                point = points[give_product['product_pk']] * give_product['quantity']
+            else:
+                point = json.loads(give_product['meta_data']).get('total_point', 0)
+            guest_points.append(
+                GuestPoint(
+                    guest_id=give_product['guest_id'],
+                    point=point,
+                    reason='포인트 지급',
+                )
+            )
+        GuestPoint.objects.bulk_create(guest_points)
+
+    @transaction.atomic
+    def cancel(self) -> None:
+        give_products = self._change_status(
+            ProductGivenStatus.CANCEL.value,
+            from_statuses=[ProductGivenStatus.READY.value, ProductGivenStatus.SUCCESS.value],
+        )
+        self._release_stock(give_products)
+
+        point_product_model = apps.get_model('product', 'PointProduct')
+        succeeded_point_give_products = [
+            give_product
+            for give_product in self._group_by_product_type(give_products)[point_product_model.product_type]
+            if give_product['status'] == ProductGivenStatus.SUCCESS.value
+        ]
+        if not succeeded_point_give_products:
+            return
+
+        # 적립 포인트를 차감하도록 사용 포인트로 회수합니다.
+        try:
+            use_points(
+                [
+                    (
+                        give_product['guest_id'],
+                        json.loads(give_product['meta_data']).get('total_point', 0),
+                        '결제 취소로 포인트 회수',
+                    )
+                    for give_product in succeeded_point_give_products
+                ]
+            )
+        except NotEnoughGuestPoints:
+            raise NotEnoughGuestPointsForCancelOrder()
+
+    @transaction.atomic
+    def fail(self) -> None:
+        give_products = self._change_status(
+            ProductGivenStatus.FAIL.value,
+            from_statuses=[ProductGivenStatus.READY.value],
+        )
+        self._release_stock(give_products)
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.10 on 2026-10-18 19:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pointproduct',
+            index=models.Index(fields=['ordering', 'id'], name='point_product_ordering_id_idx'),
+        ),
+    ]
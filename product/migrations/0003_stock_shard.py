@@ -0,0 +1,36 @@
+# Generated by Django 4.1.10 on 2026-10-18 19:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0002_pointproduct_cursor_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductStockShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('product_type', models.CharField(choices=[('POINT', '포인트')], max_length=20, verbose_name='상품 타입')),
+                ('product_pk', models.PositiveBigIntegerField(verbose_name='상품 pk')),
+                ('shard_no', models.PositiveSmallIntegerField(verbose_name='shard 번호')),
+                ('left_quantity', models.PositiveIntegerField(default=0, verbose_name='남은 수량')),
+            ],
+            options={
+                'verbose_name': '상품 재고 분할',
+                'verbose_name_plural': '상품 재고 분할',
+            },
+        ),
+        migrations.AddField(
+            model_name='pointproduct',
+            name='stock_shard_count',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='재고 분할 수'),
+        ),
+        migrations.AddConstraint(
+            model_name='productstockshard',
+            constraint=models.UniqueConstraint(fields=('product_type', 'product_pk', 'shard_no'), name='product_stock_shard_unique'),
+        ),
+    ]
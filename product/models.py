@@ -1,22 +1,33 @@
 import json
-from typing import List
+from typing import (
+    List,
+    Optional,
+)
 
+from common.helpers.counter_helpers import increase_counters_on_commit
 from django.db import (
     models,
     transaction,
 )
+from django.db.models import (
+    Case,
+    F,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
 from order.models import (
     Order,
     OrderItem,
 )
-from point.exceptions import NotEnoughGuestPointsForCancelOrder
-from point.services import (
-    get_guest_available_total_point,
-    give_point,
-)
 from product.consts import ProductGivenStatus, ProductType
 from product.exceptions import ProductStockNotEnough
-from product.managers import ProductQuerySet
+from product.managers import (
+    GiveProductQuerySet,
+    ProductQuerySet,
+)
 
 
 class ProductTag(models.Model):
@@ -55,6 +66,7 @@ class Product(models.Model):
     review_count = models.PositiveIntegerField(verbose_name='리뷰 수', default=0, db_index=True)
     like_count = models.PositiveIntegerField(verbose_name='좋아요 수', default=0, db_index=True)
     review_rate = models.FloatField(verbose_name='리뷰 평점', default=0, db_index=True)
+    stock_shard_count = models.PositiveSmallIntegerField(verbose_name='재고 분할 수', default=0)  # 0 이면 분할하지 않음
     created_guest = models.ForeignKey(
         verbose_name='Guest',
         to='member.Guest',
@@ -79,16 +91,89 @@ class Product(models.Model):
         return f'{self.title} - {self.price}'
 
     def _adjust_stock_after_sale(self, quantity: int) -> None:
-        if not self.total_quantity or not self.left_quantity:
+        """
+        재고를 읽지 않고 조건부 UPDATE 한 번으로 차감하므로 동시에 구매해도 초과 판매되지 않습니다.
+        재고를 분할한 상품은 상품 Row 대신 ProductStockShard 에서 차감합니다.
+        구매 수는 Row 잠금을 늘리지 않도록 카운터 버퍼에 누적합니다.
+        """
+        if not self.total_quantity or self.left_quantity is None:
             return
-        left_quantity = self.left_quantity - quantity
-        if left_quantity < 0:
-            raise ProductStockNotEnough()
-        self.left_quantity = max(left_quantity, 0)
-        self.bought_count = self.bought_count + 1
-        if self.left_quantity == 0:
-            self.is_sold_out = True
-        self.save(update_fields=['left_quantity', 'bought_count', 'is_sold_out'])
+
+        if self.stock_shard_count:
+            ProductStockShard.reserve(self, quantity)
+        else:
+            updated = type(self).objects.filter(
+                id=self.id,
+                left_quantity__gte=quantity,
+            ).update(
+                left_quantity=F('left_quantity') - quantity,
+                is_sold_out=Case(
+                    When(left_quantity=quantity, then=Value(True)),
+                    default=F('is_sold_out'),
+                ),
+            )
+            if not updated:
+                raise ProductStockNotEnough()
+            self.left_quantity = max(self.left_quantity - quantity, 0)
+            self.is_sold_out = self.is_sold_out or self.left_quantity == 0
+        increase_counters_on_commit(self._meta.label, 'bought_count', [self.id])
+
+    @classmethod
+    def release_stock(cls, product_pk: int, quantity: int) -> None:
+        """
+        주문 실패 / 취소로 차감했던 재고를 돌려줍니다.
+        """
+        product = cls.objects.filter(id=product_pk).values('total_quantity', 'left_quantity', 'stock_shard_count').first()
+        if not product or not product['total_quantity'] or product['left_quantity'] is None:
+            return
+
+        if product['stock_shard_count']:
+            ProductStockShard.release(cls.product_type, product_pk, quantity)
+            # 품절 처리된 경우에만 상품 Row 를 갱신합니다.
+            cls.objects.filter(id=product_pk, is_sold_out=True).update(
+                left_quantity=F('left_quantity') + quantity,
+                is_sold_out=False,
+            )
+        else:
+            cls.objects.filter(id=product_pk).update(
+                left_quantity=F('left_quantity') + quantity,
+                is_sold_out=False,
+            )
+
+    @transaction.atomic
+    def split_stock(self, shard_count: int) -> List['ProductStockShard']:
+        """
+        남은 재고를 shard_count 개의 ProductStockShard 로 나눕니다. (이미 나눈 재고는 합쳐서 다시 나눔)
+        shard_count 가 0 이면 분할을 해제하고 상품 Row 로 되돌립니다.
+        구매와 같은 순서로 shard 를 id 순서로 먼저 잠근 뒤 상품 Row 를 잠그고, 잠근 shard 의 재고를 합산합니다.
+        """
+        if shard_count < 0:
+            raise ValueError('shard_count 는 0 이상이어야 합니다.')
+
+        shards = ProductStockShard.objects.filter(product_type=self.product_type, product_pk=self.id)
+        list(shards.select_for_update().order_by('id').values_list('id', flat=True))
+        product = type(self).objects.select_for_update().get(id=self.id)
+        left_quantity = product.left_quantity or 0
+        if product.stock_shard_count:
+            # 상품 Row 를 기다리는 동안 다른 분할이 shard 를 다시 만들었을 수 있어 다시 잠그고 합산합니다.
+            left_quantity = sum(shards.select_for_update().order_by('id').values_list('left_quantity', flat=True))
+        shards.delete()
+
+        new_shards = ProductStockShard.objects.bulk_create(
+            [
+                ProductStockShard(
+                    product_type=self.product_type,
+                    product_pk=self.id,
+                    shard_no=shard_no,
+                    left_quantity=left_quantity // shard_count + (1 if shard_no < left_quantity % shard_count else 0),
+                )
+                for shard_no in range(shard_count)
+            ]
+        )
+        self.stock_shard_count = shard_count
+        self.left_quantity = left_quantity
+        self.save(update_fields=['stock_shard_count', 'left_quantity'])
+        return new_shards
 
     def _initialize_order(
             self,
@@ -121,6 +206,19 @@ class Product(models.Model):
             **kwargs
         )
 
+    def get_left_quantity(self) -> Optional[int]:
+        """
+        남은 재고 (재고를 분할한 상품은 shard 합계, Null 이면 무제한)
+        """
+        if not self.stock_shard_count:
+            return self.left_quantity
+        return ProductStockShard.objects.filter(
+            product_type=self.product_type,
+            product_pk=self.id,
+        ).aggregate(
+            left_quantity=Coalesce(Sum('left_quantity'), 0),
+        )['left_quantity']
+
     def get_product_images(self) -> List['ProductImage']:
         return list(
             ProductImage.objects.filter(
@@ -141,6 +239,9 @@ class PointProduct(Product):
     class Meta:
         verbose_name = '포인트 상품'
         verbose_name_plural = '포인트 상품'
+        indexes = [
+            models.Index(fields=['ordering', 'id'], name='point_product_ordering_id_idx'),
+        ]
 
     def __str__(self):
         return f'{self.title} - {self.price} - {self.point}'
@@ -219,6 +320,8 @@ class GiveProduct(models.Model):
     created_at = models.DateTimeField(verbose_name='생성일', auto_now_add=True)
     updated_at = models.DateTimeField(verbose_name='수정일', auto_now=True)
 
+    objects = GiveProductQuerySet.as_manager()
+
     class Meta:
         verbose_name = '상품 지급'
         verbose_name_plural = '상품 지급'
@@ -250,62 +353,127 @@ class GiveProduct(models.Model):
         )
         return give_product
 
-    @transaction.atomic
     def cancel(self) -> None:
-        before_status = self.status
-        self.status = ProductGivenStatus.CANCEL.value
-        self.save(update_fields=['status', 'updated_at'])
-        # Save Log
-        GiveProductLog.objects.create(
-            give_product=self,
-            status=ProductGivenStatus.CANCEL.value,
-        )
+        type(self).objects.filter(pk=self.pk).cancel()
+        self.refresh_from_db(fields=['status', 'updated_at'])
 
-        if not before_status == ProductGivenStatus.SUCCESS.value:
-            return
+    def fail(self) -> None:
+        type(self).objects.filter(pk=self.pk).fail()
+        self.refresh_from_db(fields=['status', 'updated_at'])
 
-        if self.product_type == PointProduct.product_type:
-            point = json.loads(self.meta_data).get('total_point', 0)
-            if get_guest_available_total_point(self.guest_id) < point:
-                raise NotEnoughGuestPointsForCancelOrder()
-            give_point(
-                guest_id=self.guest_id,
-                point=point * -1,
-                reason='결제 취소로 포인트 회수',
-            )
+    def give(self) -> None:
+        type(self).objects.filter(pk=self.pk).give()
+        self.refresh_from_db(fields=['status', 'updated_at'])
 
-    @transaction.atomic
-    def fail(self) -> None:
-        self.status = ProductGivenStatus.FAIL.value
-        self.save(update_fields=['status', 'updated_at'])
-        # Save Log
-        GiveProductLog.objects.create(
-            give_product=self,
-            status=ProductGivenStatus.FAIL.value,
-        )
 
+class ProductStockShard(models.Model):
+    """
+    인기 상품의 재고를 여러 Row 로 나눈 것
+    구매마다 잠금이 걸리지 않은 shard 하나를 골라 차감하므로 상품 Row 하나에 잠금이 몰리지 않습니다.
+    분할한 상품의 남은 재고는 shard 합계이며 (Product.get_left_quantity, ProductQuerySet.annotate_left_quantity)
+    상품 Row 의 left_quantity 는 모든 shard 가 소진되면 0 / 품절이 됩니다.
+    """
+    product_type = models.CharField(verbose_name='상품 타입', max_length=20, choices=ProductType.choices())
+    product_pk = models.PositiveBigIntegerField(verbose_name='상품 pk')
+    shard_no = models.PositiveSmallIntegerField(verbose_name='shard 번호')
+    left_quantity = models.PositiveIntegerField(verbose_name='남은 수량', default=0)
+
+    class Meta:
+        verbose_name = '상품 재고 분할'
+        verbose_name_plural = '상품 재고 분할'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['product_type', 'product_pk', 'shard_no'],
+                name='product_stock_shard_unique',
+            ),
+        ]
+
+    @classmethod
     @transaction.atomic
-    def give(self) -> None:
-        self.status = ProductGivenStatus.SUCCESS.value
-        self.save(update_fields=['status', 'updated_at'])
-        # Save Log
-        GiveProductLog.objects.create(
-            give_product=self,
-            status=ProductGivenStatus.SUCCESS.value,
+    def reserve(cls, product: Product, quantity: int) -> None:
+        """
+        잠기지 않은 shard 중 재고가 충분한 것을 무작위로 골라 차감합니다. (FOR UPDATE SKIP LOCKED)
+        없으면 모든 shard 를 잠그고 여러 shard 에서 나눠 차감하며, 그래도 부족하면 ProductStockNotEnough 입니다.
+        마지막 재고를 차감한 구매가 상품을 품절 처리합니다.
+        """
+        shard = cls.objects.filter(
+            product_type=product.product_type,
+            product_pk=product.id,
+            left_quantity__gte=quantity,
+        ).select_for_update(
+            skip_locked=True,
+        ).order_by('?').values('id', 'left_quantity').first()
+        if shard is None:
+            left_quantity = cls._reserve_across_shards(product, quantity)
+        else:
+            cls.objects.filter(id=shard['id']).update(left_quantity=F('left_quantity') - quantity)
+            left_quantity = None
+            if shard['left_quantity'] == quantity:
+                left_quantity = cls._get_left_quantity_with_product_lock(product)
+
+        if left_quantity == 0:
+            type(product).objects.filter(id=product.id).update(left_quantity=0, is_sold_out=True)
+            product.left_quantity = 0
+            product.is_sold_out = True
+
+    @classmethod
+    def _get_left_quantity_with_product_lock(cls, product: Product) -> int:
+        """
+        상품 Row 를 잠근 뒤 shard 재고 합계를 읽습니다. (shard 를 비운 구매만 호출)
+        동시에 마지막 shard 들을 비운 구매는 상품 Row 잠금을 차례로 얻고, 나중에 얻은 구매는 앞선 구매의 커밋을 보므로
+        모든 shard 가 소진되면 마지막 구매가 반드시 0 을 읽습니다.
+        """
+        list(type(product).objects.select_for_update().filter(id=product.id).values_list('id', flat=True))
+        return cls.objects.filter(
+            product_type=product.product_type,
+            product_pk=product.id,
+        ).aggregate(
+            left_quantity=Coalesce(Sum('left_quantity'), 0),
+        )['left_quantity']
+
+    @classmethod
+    def _reserve_across_shards(cls, product: Product, quantity: int) -> int:
+        """
+        모든 shard 를 id 순서로 잠그고 앞에서부터 차감합니다. 남은 전체 재고를 반환합니다.
+        """
+        locked_shards = list(
+            cls.objects.select_for_update().filter(
+                product_type=product.product_type,
+                product_pk=product.id,
+            ).order_by('id')
         )
+        left_quantity = sum(shard.left_quantity for shard in locked_shards)
+        if left_quantity < quantity:
+            raise ProductStockNotEnough()
 
-        if self.product_type == PointProduct.product_type:
-            try:
-                point = PointProduct.objects.get(
-                    id=self.product_pk,
-                ).point * self.quantity
-            except PointProduct.DoesNotExist:
-                point = json.loads(self.meta_data).get('total_point', 0)
-            give_point(
-                guest_id=self.guest_id,
-                point=point,
-                reason='포인트 지급',
-            )
+        remaining = quantity
+        updated_shards = []
+        for shard in locked_shards:
+            if not remaining:
+                break
+            taken = min(shard.left_quantity, remaining)
+            if taken:
+                shard.left_quantity -= taken
+                remaining -= taken
+                updated_shards.append(shard)
+        cls.objects.bulk_update(updated_shards, ['left_quantity'])
+        return left_quantity - quantity
+
+    @classmethod
+    def release(cls, product_type: str, product_pk: int, quantity: int) -> Optional[int]:
+        """
+        무작위 shard 하나에 재고를 돌려줍니다.
+        """
+        return cls.objects.filter(
+            id=Subquery(
+                cls.objects.filter(
+                    product_type=product_type,
+                    product_pk=product_pk,
+                ).order_by('?').values('id')[:1]
+            ),
+        ).update(
+            left_quantity=F('left_quantity') + quantity,
+        )
 
 
 class GiveProductLog(models.Model):
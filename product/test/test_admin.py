@@ -0,0 +1,38 @@
+from django.contrib import admin
+from django.test import TestCase
+from member.models import Guest
+from product.admin import PointProductAdmin
+from product.models import PointProduct
+
+
+class PointProductAdminTestCase(TestCase):
+    def setUp(self):
+        self.model_admin = PointProductAdmin(PointProduct, admin.site)
+        self.product = PointProduct.objects.create(
+            title='포인트 1000',
+            price=1000,
+            point=1000,
+            created_guest=Guest.objects.first(),
+            total_quantity=80,
+            left_quantity=10,
+        )
+
+    def test_get_readonly_fields_should_not_allow_stock_shard_count_to_be_edited(self):
+        # Given:
+        # When:
+        readonly_fields = self.model_admin.get_readonly_fields(None, self.product)
+
+        # Then: 분할하지 않은 상품은 남은 재고만 수정할 수 있습니다.
+        self.assertIn('stock_shard_count', readonly_fields)
+        self.assertNotIn('left_quantity', readonly_fields)
+
+    def test_get_readonly_fields_should_not_allow_left_quantity_to_be_edited_when_stock_is_split(self):
+        # Given: 재고 분할 상품
+        self.product.split_stock(2)
+
+        # When:
+        readonly_fields = self.model_admin.get_readonly_fields(None, self.product)
+
+        # Then:
+        self.assertIn('stock_shard_count', readonly_fields)
+        self.assertIn('left_quantity', readonly_fields)
@@ -0,0 +1,56 @@
+from io import StringIO
+
+from django.core.management import (
+    CommandError,
+    call_command,
+)
+from django.test import TestCase
+from member.models import Guest
+from product.models import (
+    PointProduct,
+    ProductStockShard,
+)
+
+
+class SplitProductStockCommandTestCase(TestCase):
+    def setUp(self):
+        self.product = PointProduct.objects.create(
+            title='포인트 1000',
+            price=1000,
+            point=1000,
+            created_guest=Guest.objects.first(),
+            total_quantity=80,
+            left_quantity=10,
+        )
+
+    def test_split_product_stock(self):
+        # Given:
+        out = StringIO()
+
+        # When:
+        call_command('split_product_stock', self.product.id, 3, stdout=out)
+
+        # Then:
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.stock_shard_count, 3)
+        self.assertEqual(
+            sorted(ProductStockShard.objects.filter(product_pk=self.product.id).values_list('left_quantity', flat=True)),
+            [3, 3, 4],
+        )
+        self.assertIn(f'PointProduct {self.product.id}', out.getvalue())
+
+    def test_split_product_stock_should_raise_when_product_not_exists(self):
+        # Given:
+        # When:
+        # Then:
+        with self.assertRaises(CommandError):
+            call_command('split_product_stock', 0, 3, stdout=StringIO())
+
+    def test_split_product_stock_should_raise_when_shard_count_is_negative(self):
+        # Given:
+        # When:
+        # Then:
+        with self.assertRaises(CommandError):
+            call_command('split_product_stock', self.product.id, -1, stdout=StringIO())
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.stock_shard_count, 0)
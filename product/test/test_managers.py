@@ -1,7 +1,10 @@
 from django.test import TestCase
 from django.utils import timezone
 from member.models import Guest
-from product.models import PointProduct
+from product.models import (
+    PointProduct,
+    ProductStockShard,
+)
 
 
 class TestProductQuerySet(TestCase):
@@ -97,3 +100,29 @@ class TestProductQuerySet(TestCase):
 
         # Then:
         self.assertNotIn(self.inactive_product_sold_out, active_products)
+
+    def test_get_actives_should_use_shard_left_quantity_when_stock_is_split(self):
+        # Given: 재고 분할 상품
+        self.active_product.split_stock(2)
+        # And: shard 재고가 모두 소진되었지만 상품 Row 는 아직 품절 처리되지 않음
+        ProductStockShard.objects.filter(product_pk=self.active_product.id).update(left_quantity=0)
+
+        # When: 실행
+        active_products = PointProduct.objects.get_actives()
+
+        # Then: shard 합계로 판단하여 제외합니다.
+        self.assertNotIn(self.active_product, active_products)
+
+    def test_annotate_left_quantity(self):
+        # Given: 재고 분할 상품
+        self.active_product.split_stock(2)
+        ProductStockShard.objects.filter(product_pk=self.active_product.id, shard_no=0).update(left_quantity=1)
+
+        # When: 실행
+        left_quantities = dict(
+            PointProduct.objects.annotate_left_quantity().values_list('id', 'current_left_quantity')
+        )
+
+        # Then: 분할 상품은 shard 합계, 나머지는 left_quantity
+        self.assertEqual(left_quantities[self.active_product.id], 6)
+        self.assertEqual(left_quantities[self.inactive_product_sold_out.id], 0)
@@ -8,12 +8,20 @@ from common.common_testcase_helpers.testcase_helpers import (
     test_case_create_order,
     test_case_create_order_item,
 )
+from django.db import connection
+from django.db.models import Sum
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from freezegun import freeze_time
 from member.models import Guest
 from order.consts import OrderStatus
 from point.exceptions import NotEnoughGuestPointsForCancelOrder
+from point.models import GuestPoint
+from point.services import (
+    get_guest_available_total_point,
+    use_point,
+)
 from product.consts import (
     ProductGivenStatus,
     ProductType,
@@ -24,6 +32,7 @@ from product.models import (
     GiveProductLog,
     PointProduct,
     ProductImage,
+    ProductStockShard,
 )
 from product.test import ConcreteProductTestModel
 
@@ -172,11 +181,7 @@ class GiveProductMethodTestCase(TestCase):
             False
         )
 
-    @patch('product.models.give_point')
-    @patch('product.models.get_guest_available_total_point')
-    def test_cancel_when_product_is_point_success(self,
-                                                  mock_get_guest_available_total_point,
-                                                  mock_give_point):
+    def test_cancel_when_product_is_point_success(self):
         # Given:
         point_1000_product = PointProduct.objects.create(
             title='포인트 1000',
@@ -196,7 +201,11 @@ class GiveProductMethodTestCase(TestCase):
                 'total_point': point_1000_product.point * quantity,
             },
         )
-        mock_get_guest_available_total_point.return_value = point_1000_product.point * quantity
+        GuestPoint.objects.create(
+            guest_id=self.guest.id,
+            point=point_1000_product.point * quantity,
+            reason='포인트 지급',
+        )
         # And: Set as success
         give_product_ready_status.status = ProductGivenStatus.SUCCESS.value
         give_product_ready_status.save()
@@ -222,10 +231,14 @@ class GiveProductMethodTestCase(TestCase):
             ).exists(),
             True
         )
-        mock_give_point.assert_called_once_with(
-            guest_id=self.guest.id,
-            point=json.loads(give_product_ready_status.meta_data)['total_point'] * -1,
-            reason='결제 취소로 포인트 회수',
+        # And: 지급한 포인트 회수
+        self.assertEqual(
+            GuestPoint.objects.filter(
+                guest_id=self.guest.id,
+                point=json.loads(give_product_ready_status.meta_data)['total_point'] * -1,
+                reason='결제 취소로 포인트 회수',
+            ).count(),
+            1
         )
 
     def test_fail(self):
@@ -262,8 +275,7 @@ class GiveProductMethodTestCase(TestCase):
             True
         )
 
-    @patch('product.models.give_point')
-    def test_give_when_point_product_exists(self, mock_give_point):
+    def test_give_when_point_product_exists(self):
         # Given:
         point_1000_product = PointProduct.objects.create(
             title='포인트 1000',
@@ -303,14 +315,53 @@ class GiveProductMethodTestCase(TestCase):
             ).exists(),
             True
         )
-        mock_give_point.assert_called_once_with(
+        # And: 포인트 지급
+        self.assertEqual(
+            GuestPoint.objects.filter(
+                guest_id=self.guest.id,
+                point=point_1000_product.point * quantity,
+                reason='포인트 지급',
+            ).count(),
+            1
+        )
+
+    def test_give_should_not_give_point_twice_when_retried(self):
+        # Given:
+        point_1000_product = PointProduct.objects.create(
+            title='포인트 1000',
+            price=1000,
+            point=1000,
+            created_guest=self.guest,
+        )
+        give_product_ready_status = GiveProduct.ready(
+            order_item_id=self.order_item1.id,
             guest_id=self.guest.id,
-            point=point_1000_product.point * quantity,
-            reason='포인트 지급',
+            quantity=10,
+            product_pk=point_1000_product.id,
+            product_type=point_1000_product.product_type,
+            data={'point': 10000},
+        )
+
+        # When: 재시도
+        give_product_ready_status.give()
+        give_product_ready_status.give()
+
+        # Then: 한 번만 지급
+        self.assertEqual(
+            GuestPoint.objects.filter(guest_id=self.guest.id, reason='포인트 지급').count(),
+            1
+        )
+        # And: Log 도 한 번만 생성
+        self.assertEqual(
+            GiveProductLog.objects.filter(
+                give_product_id=give_product_ready_status.id,
+                status=ProductGivenStatus.SUCCESS.value,
+            ).count(),
+            1
         )
+        self.assertEqual(give_product_ready_status.status, ProductGivenStatus.SUCCESS.value)
 
-    @patch('product.models.give_point')
-    def test_give_when_point_product_not_exists(self, mock_give_point):
+    def test_give_when_point_product_not_exists(self):
         # Given:
         quantity = 10
         meta_data = {
@@ -349,10 +400,179 @@ class GiveProductMethodTestCase(TestCase):
             ).exists(),
             True
         )
-        mock_give_point.assert_called_once_with(
+        # And: 메타 데이터의 포인트 지급
+        self.assertEqual(
+            GuestPoint.objects.filter(
+                guest_id=self.guest.id,
+                point=meta_data['total_point'],
+                reason='포인트 지급',
+            ).count(),
+            1
+        )
+
+
+@freeze_time('2022-01-01')
+class GiveProductQuerySetTestCase(TestCase):
+    def setUp(self):
+        self.guest = Guest.objects.first()
+        self.point_1000_product = PointProduct.objects.create(
+            title='포인트 1000',
+            price=1000,
+            point=1000,
+            created_guest=self.guest,
+        )
+        self.point_500_product = PointProduct.objects.create(
+            title='포인트 500',
+            price=500,
+            point=500,
+            created_guest=self.guest,
+        )
+
+    def _ready_give_products(self, count: int) -> list:
+        give_products = []
+        for i in range(count):
+            product = self.point_1000_product if i % 2 else self.point_500_product
+            give_products.append(
+                GiveProduct.ready(
+                    order_item_id=None,
+                    guest_id=self.guest.id,
+                    quantity=2,
+                    product_pk=product.id,
+                    product_type=product.product_type,
+                    data={'total_point': product.point * 2},
+                )
+            )
+        return give_products
+
+    def _count_queries(self, func) -> int:
+        with CaptureQueriesContext(connection) as context:
+            func()
+        return len([query for query in context.captured_queries if 'SAVEPOINT' not in query['sql']])
+
+    def test_give_should_run_constant_queries(self):
+        # Given: 2개, 6개 GiveProduct
+        small_give_products = self._ready_give_products(2)
+        large_give_products = self._ready_give_products(6)
+
+        # When:
+        small_query_count = self._count_queries(
+            GiveProduct.objects.filter(id__in=[give_product.id for give_product in small_give_products]).give
+        )
+        large_query_count = self._count_queries(
+            GiveProduct.objects.filter(id__in=[give_product.id for give_product in large_give_products]).give
+        )
+
+        # Then: Item 수와 관계없이 쿼리 수가 같습니다.
+        self.assertEqual(small_query_count, large_query_count)
+        # And: 모두 지급
+        self.assertEqual(
+            GiveProduct.objects.filter(status=ProductGivenStatus.SUCCESS.value).count(),
+            8
+        )
+        self.assertEqual(
+            GiveProductLog.objects.filter(status=ProductGivenStatus.SUCCESS.value).count(),
+            8
+        )
+        # And: 포인트 지급 (500 * 2 * 4 + 1000 * 2 * 4)
+        self.assertEqual(
+            GuestPoint.objects.filter(guest_id=self.guest.id, reason='포인트 지급').aggregate(Sum('point'))['point__sum'],
+            12000
+        )
+
+    def test_cancel_should_reclaim_given_points(self):
+        # Given: 지급 완료
+        give_products = self._ready_give_products(2)
+        queryset = GiveProduct.objects.filter(id__in=[give_product.id for give_product in give_products])
+        queryset.give()
+
+        # When:
+        queryset.cancel()
+
+        # Then: 취소
+        self.assertEqual(
+            GiveProduct.objects.filter(
+                id__in=[give_product.id for give_product in give_products],
+                status=ProductGivenStatus.CANCEL.value,
+            ).count(),
+            2
+        )
+        # And: 지급한 포인트 회수
+        self.assertEqual(
+            list(
+                GuestPoint.objects.filter(
+                    guest_id=self.guest.id,
+                    reason='결제 취소로 포인트 회수',
+                ).order_by('point').values_list('point', flat=True)
+            ),
+            [-2000, -1000]
+        )
+
+    def test_cancel_should_keep_open_lots_equal_to_balance(self):
+        # Given: 만료 기간이 있는 적립 포인트
+        GuestPoint.objects.create(
             guest_id=self.guest.id,
-            point=meta_data['point'] * quantity,
-            reason='포인트 지급',
+            point=1000,
+            reason='이벤트',
+            valid_until=datetime(2022, 2, 1).replace(tzinfo=timezone.utc),
+        )
+        # And: 지급 완료 후 일부 사용
+        give_products = self._ready_give_products(2)
+        queryset = GiveProduct.objects.filter(id__in=[give_product.id for give_product in give_products])
+        queryset.give()
+        use_point(self.guest.id, 500, '사용')
+
+        # When:
+        queryset.cancel()
+
+        # Then: 남은 적립 포인트 합계와 잔액이 같습니다.
+        open_lot_point = GuestPoint.objects.filter(
+            guest_id=self.guest.id,
+            is_active=True,
+            remaining_point__gt=0,
+        ).aggregate(
+            total_point=Sum('remaining_point'),
+        )['total_point'] or 0
+        self.assertEqual(open_lot_point, get_guest_available_total_point(self.guest.id))
+        # And: 회수 포인트도 적립 포인트를 차감합니다.
+        self.assertFalse(
+            GuestPoint.objects.filter(
+                guest_id=self.guest.id,
+                reason='결제 취소로 포인트 회수',
+                lot__isnull=True,
+            ).exists()
+        )
+
+    def test_cancel_should_fail_when_guest_points_not_enough(self):
+        # Given: 지급 후 포인트 사용
+        give_products = self._ready_give_products(2)
+        queryset = GiveProduct.objects.filter(id__in=[give_product.id for give_product in give_products])
+        queryset.give()
+        GuestPoint.objects.create(guest_id=self.guest.id, point=-2500, reason='사용')
+
+        # Expected: 전체 회수 포인트가 부족하면 아무것도 변경되지 않습니다.
+        with self.assertRaises(NotEnoughGuestPointsForCancelOrder):
+            queryset.cancel()
+        self.assertFalse(
+            GiveProduct.objects.filter(status=ProductGivenStatus.CANCEL.value).exists()
+        )
+
+    def test_fail_should_release_stock_for_ready(self):
+        # Given: 재고 상품
+        self.point_1000_product.total_quantity = 10
+        self.point_1000_product.left_quantity = 10
+        self.point_1000_product.save()
+        self.point_1000_product._adjust_stock_after_sale(quantity=4)
+        give_products = self._ready_give_products(4)
+
+        # When:
+        GiveProduct.objects.filter(id__in=[give_product.id for give_product in give_products]).fail()
+
+        # Then: 같은 상품의 수량을 합쳐 돌려받습니다.
+        self.point_1000_product.refresh_from_db()
+        self.assertEqual(self.point_1000_product.left_quantity, 10)
+        self.assertEqual(
+            GiveProductLog.objects.filter(status=ProductGivenStatus.FAIL.value).count(),
+            4
         )
 
 
@@ -475,123 +695,270 @@ class ProductMethodTestCase(TestCase):
             is_deleted=True,
         )
 
-    @patch('product.models.Product.save')
-    def test_adjust_stock_after_sale_should_not_call_save_when_total_quantity_is_false_type(self, mock_save):
-        # Given:
-        expected_total_quantities = [
-            0,
-            None
-        ]
-        for expected_total_quantity in expected_total_quantities:
-            # And: Product total_quantity is None
-            product = ConcreteProductTestModel(
-                title='포인트 1000',
-                price=1000,
-                created_guest=self.guest,
-                total_quantity=expected_total_quantity,
-            )
+    def _create_stock_product(self, total_quantity=80, left_quantity=10) -> PointProduct:
+        return PointProduct.objects.create(
+            title='포인트 1000',
+            price=1000,
+            point=1000,
+            created_guest=self.guest,
+            total_quantity=total_quantity,
+            left_quantity=left_quantity,
+        )
+
+    @patch('product.models.increase_counters_on_commit')
+    def test_adjust_stock_after_sale_should_not_update_when_stock_is_unlimited(self, mock_increase_counters_on_commit):
+        # Given: 무제한 재고 (total_quantity 0 / None, left_quantity None)
+        for total_quantity, left_quantity in [(0, 10), (None, 10), (80, None)]:
+            product = self._create_stock_product(total_quantity=total_quantity, left_quantity=left_quantity)
 
             # When:
-            product._adjust_stock_after_sale(
-                quantity=1,
-            )
+            with CaptureQueriesContext(connection) as context:
+                product._adjust_stock_after_sale(
+                    quantity=1,
+                )
 
-            # Then:
-            mock_save.assert_not_called()
+            # Then: 조회 / 갱신하지 않습니다.
+            self.assertEqual(len(context.captured_queries), 0)
+            mock_increase_counters_on_commit.assert_not_called()
 
-    @patch('product.models.Product.save')
-    def test_adjust_stock_after_sale_should_not_call_save_when_left_quantity_is_false_type(self, mock_save):
+    def test_adjust_stock_after_sale_should_raise_error_when_left_quantity_is_not_enough(self):
         # Given:
-        expected_left_quantities = [
-            0,
-            None
-        ]
-        for expected_left_quantity in expected_left_quantities:
-            # And: Product total_quantity is None
-            product = ConcreteProductTestModel(
-                title='포인트 1000',
-                price=1000,
-                created_guest=self.guest,
-                left_quantity=expected_left_quantity,
-            )
+        for left_quantity in [0, 10]:
+            product = self._create_stock_product(left_quantity=left_quantity)
 
-            # When:
-            product._adjust_stock_after_sale(
-                quantity=1,
-            )
+            # When: left_quantity over than quantity
+            with self.assertRaises(ProductStockNotEnough) as e:
+                product._adjust_stock_after_sale(
+                    quantity=11,
+                )
 
             # Then:
-            mock_save.assert_not_called()
+            self.assertEqual(e.exception.detail, '상품 재고가 부족합니다.')
+            product.refresh_from_db()
+            self.assertEqual(product.left_quantity, left_quantity)
+
+    def test_adjust_stock_after_sale_should_not_oversell_with_stale_instance(self):
+        # Given: 같은 상품을 먼저 읽어둔 두 요청
+        product = self._create_stock_product(left_quantity=10)
+        stale_product = PointProduct.objects.get(id=product.id)
 
-    @patch('product.models.Product.save')
-    def test_adjust_stock_after_sale_should_raise_error_when_left_quantity_is_less_then_zero(self, mock_save):
+        # When: 한 요청이 재고를 모두 차감
+        product._adjust_stock_after_sale(quantity=10)
+
+        # Then: 이전 값을 가진 요청은 차감하지 못합니다.
+        with self.assertRaises(ProductStockNotEnough):
+            stale_product._adjust_stock_after_sale(quantity=1)
+        product.refresh_from_db()
+        self.assertEqual(product.left_quantity, 0)
+
+    @patch('product.models.increase_counters_on_commit')
+    def test_adjust_stock_after_sale_should_update_conditionally(self, mock_increase_counters_on_commit):
         # Given:
-        product = ConcreteProductTestModel(
-            title='포인트 1000',
-            price=1000,
-            created_guest=self.guest,
-            total_quantity=80,
-            left_quantity=10,
-        )
+        product = self._create_stock_product(left_quantity=10)
 
-        # When: left_quantity over than quantity
-        with self.assertRaises(ProductStockNotEnough) as e:
+        # When:
+        with CaptureQueriesContext(connection) as context:
             product._adjust_stock_after_sale(
-                quantity=11,
+                quantity=5,
             )
-            self.assertEqual(e.exception.detail, '상품 재고가 부족합니다.')
 
-        # Then:
-        mock_save.assert_not_called()
+        # Then: 조건부 UPDATE 한 번
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertIn('"left_quantity" >= 5', context.captured_queries[0]['sql'])
+        product.refresh_from_db()
+        self.assertEqual(product.left_quantity, 5)
+        self.assertFalse(product.is_sold_out)
+        # And: bought_count 는 카운터 버퍼에 누적합니다.
+        mock_increase_counters_on_commit.assert_called_once_with('product.PointProduct', 'bought_count', [product.id])
 
-    @patch('product.models.Product.save')
-    def test_adjust_stock_after_sale_should_success_save_with_increase_bought_count(self, mock_save):
+    def test_adjust_stock_after_sale_should_make_sold_out_when_left_quantity_is_zero(self):
         # Given:
-        product = ConcreteProductTestModel(
-            title='포인트 1000',
-            price=1000,
-            created_guest=self.guest,
-            total_quantity=80,
-            left_quantity=10,
-        )
+        product = self._create_stock_product(left_quantity=10)
 
         # When:
         product._adjust_stock_after_sale(
-            quantity=5,
+            quantity=10,
         )
 
-        # Then: bought_count should be increased
-        self.assertEqual(product.bought_count, 1)
-        self.assertEqual(product.left_quantity, 5)
-        # And: save should be called
-        mock_save.assert_called_once_with(
-            update_fields=['left_quantity', 'bought_count', 'is_sold_out']
-        )
+        # Then:
+        self.assertEqual(product.left_quantity, 0)
+        self.assertTrue(product.is_sold_out)
+        product.refresh_from_db()
+        self.assertEqual(product.left_quantity, 0)
+        # And: is_sold_out should be True
+        self.assertTrue(product.is_sold_out)
+
+    def test_release_stock_should_return_stock_and_clear_sold_out(self):
+        # Given: 품절 상품
+        product = self._create_stock_product(left_quantity=3)
+        product._adjust_stock_after_sale(quantity=3)
+
+        # When:
+        PointProduct.release_stock(product.id, 2)
+
+        # Then:
+        product.refresh_from_db()
+        self.assertEqual(product.left_quantity, 2)
+        self.assertFalse(product.is_sold_out)
+
+    def test_give_product_fail_and_cancel_should_release_stock_once(self):
+        # Given: 재고를 차감한 주문 두 개
+        product = self._create_stock_product(left_quantity=10)
+        give_products = []
+        for _ in range(2):
+            product._adjust_stock_after_sale(quantity=3)
+            give_products.append(
+                GiveProduct.ready(
+                    order_item_id=None,
+                    quantity=3,
+                    guest_id=self.guest.id,
+                    product_pk=product.id,
+                    product_type=product.product_type,
+                    data={},
+                )
+            )
+
+        # When: 실패, 취소 후 다시 취소
+        give_products[0].fail()
+        give_products[1].cancel()
+        give_products[1].cancel()
+
+        # Then: 차감했던 재고만큼만 돌려받습니다.
+        product.refresh_from_db()
+        self.assertEqual(product.left_quantity, 10)
 
-    @patch('product.models.Product.save')
-    def test_adjust_stock_after_sale_should_make_sold_out_when_left_quantity_is_zero(self, mock_save):
+    def test_split_stock_should_distribute_left_quantity(self):
         # Given:
-        product = ConcreteProductTestModel(
-            title='포인트 1000',
-            price=1000,
-            created_guest=self.guest,
-            total_quantity=80,
-            left_quantity=10,
+        product = self._create_stock_product(left_quantity=10)
+
+        # When:
+        shards = product.split_stock(3)
+
+        # Then:
+        self.assertEqual(sorted(shard.left_quantity for shard in shards), [3, 3, 4])
+        product.refresh_from_db()
+        self.assertEqual(product.stock_shard_count, 3)
+
+        # When: 다시 분할
+        product.split_stock(2)
+
+        # Then: 남은 재고를 합쳐서 다시 나눕니다.
+        self.assertEqual(
+            list(
+                ProductStockShard.objects.filter(product_pk=product.id).order_by('shard_no').values_list('left_quantity', flat=True)
+            ),
+            [5, 5],
+        )
+
+    def test_split_stock_should_lock_shards_before_product(self):
+        # Given: 재고 분할 상품
+        product = self._create_stock_product(left_quantity=10)
+        product.split_stock(3)
+
+        # When: 다시 분할
+        with CaptureQueriesContext(connection) as context:
+            product.split_stock(2)
+
+        # Then: 구매와 같은 순서로 shard 를 먼저 잠근 뒤 상품 Row 를 잠급니다.
+        locking_queries = [query['sql'] for query in context.captured_queries if 'FOR UPDATE' in query['sql']]
+        self.assertIn('product_productstockshard', locking_queries[0])
+        self.assertIn('product_pointproduct', locking_queries[1])
+        # And: 잠근 shard 의 재고를 합쳐서 다시 나눕니다.
+        self.assertIn('product_productstockshard', locking_queries[2])
+        self.assertEqual(
+            sum(ProductStockShard.objects.filter(product_pk=product.id).values_list('left_quantity', flat=True)),
+            10,
         )
 
+    def test_split_stock_should_raise_value_error_when_shard_count_is_negative(self):
+        # Given:
+        product = self._create_stock_product(left_quantity=10)
+
+        # When: 음수 분할 수
+        with self.assertRaises(ValueError):
+            product.split_stock(-1)
+        product.refresh_from_db()
+        self.assertEqual(product.stock_shard_count, 0)
+        self.assertFalse(ProductStockShard.objects.filter(product_pk=product.id).exists())
+
+    def test_adjust_stock_after_sale_should_reserve_from_shard(self):
+        # Given: 재고 분할 상품
+        product = self._create_stock_product(left_quantity=10)
+        product.split_stock(5)
+
         # When:
-        product._adjust_stock_after_sale(
-            quantity=10,
+        with CaptureQueriesContext(connection) as context:
+            product._adjust_stock_after_sale(quantity=1)
+
+        # Then: 잠기지 않은 shard 하나를 골라 차감하고 상품 Row 는 갱신하지 않습니다.
+        queries = [query['sql'] for query in context.captured_queries if 'SAVEPOINT' not in query['sql']]
+        self.assertEqual(len(queries), 2)
+        self.assertIn('SKIP LOCKED', queries[0])
+        self.assertFalse([query for query in queries if 'product_pointproduct' in query])
+        self.assertEqual(
+            sum(ProductStockShard.objects.filter(product_pk=product.id).values_list('left_quantity', flat=True)),
+            9,
         )
 
-        # Then: bought_count should be increased
-        self.assertEqual(product.bought_count, 1)
+    def test_adjust_stock_after_sale_should_check_sold_out_with_product_lock_when_shard_is_emptied(self):
+        # Given: shard 마다 재고가 1 개
+        product = self._create_stock_product(left_quantity=2)
+        product.split_stock(2)
+
+        # When: shard 하나를 비움
+        with CaptureQueriesContext(connection) as context:
+            product._adjust_stock_after_sale(quantity=1)
+
+        # Then: 상품 Row 를 잠그고 남은 재고를 확인하며 품절은 아닙니다.
+        queries = [query['sql'] for query in context.captured_queries if 'SAVEPOINT' not in query['sql']]
+        self.assertTrue([query for query in queries if 'product_pointproduct' in query and 'FOR UPDATE' in query])
+        product.refresh_from_db()
+        self.assertFalse(product.is_sold_out)
+        self.assertEqual(product.get_left_quantity(), 1)
+
+        # When: 남은 shard 도 비움
+        product._adjust_stock_after_sale(quantity=1)
+
+        # Then: 품절 처리됩니다.
+        product.refresh_from_db()
+        self.assertTrue(product.is_sold_out)
         self.assertEqual(product.left_quantity, 0)
-        # And: is_sold_out should be True
-        self.assertEqual(product.is_sold_out, True)
-        # And: save should be called
-        mock_save.assert_called_once_with(
-            update_fields=['left_quantity', 'bought_count', 'is_sold_out']
+        self.assertEqual(product.get_left_quantity(), 0)
+
+    def test_adjust_stock_after_sale_should_reserve_across_shards_and_make_sold_out(self):
+        # Given: shard 마다 재고가 1 개
+        product = self._create_stock_product(left_quantity=3)
+        product.split_stock(3)
+
+        # When: 한 shard 보다 많은 수량
+        product._adjust_stock_after_sale(quantity=2)
+
+        # Then: 여러 shard 에서 나눠 차감합니다.
+        self.assertEqual(
+            sum(ProductStockShard.objects.filter(product_pk=product.id).values_list('left_quantity', flat=True)),
+            1,
+        )
+
+        # When: 남은 재고를 모두 소진
+        product._adjust_stock_after_sale(quantity=1)
+
+        # Then: 품절 처리됩니다.
+        product.refresh_from_db()
+        self.assertEqual(product.left_quantity, 0)
+        self.assertTrue(product.is_sold_out)
+        # And: 더 구매할 수 없습니다.
+        with self.assertRaises(ProductStockNotEnough):
+            product._adjust_stock_after_sale(quantity=1)
+
+        # When: 재고 반환
+        PointProduct.release_stock(product.id, 1)
+
+        # Then: shard 와 상품 Row 에 반환됩니다.
+        product.refresh_from_db()
+        self.assertFalse(product.is_sold_out)
+        self.assertEqual(
+            sum(ProductStockShard.objects.filter(product_pk=product.id).values_list('left_quantity', flat=True)),
+            1,
         )
 
     @patch('product.models.Product._adjust_stock_after_sale')
@@ -76,31 +76,50 @@ class PointProductListAPIViewTestCase(TestCase):
             }
         )
 
-    def test_point_product_list_with_pagination(self):
-        # Given:
-        params = {
-            'page': 1,
-            'size': 1,
-        }
-        # When:
-        response = self.client.get(reverse('product:points'), data=params)
+    def test_point_product_list_with_cursor_pagination(self):
+        # Given: ordering 이 같은 상품 추가
+        active_1000_point_product_ordering_1_2 = PointProduct.objects.create(
+            title='Active Point Product3',
+            price=1000,
+            start_time=timezone.now() - timezone.timedelta(hours=1),
+            end_time=timezone.now() + timezone.timedelta(hours=1),
+            total_quantity=10,
+            left_quantity=10,
+            point=1000,
+            ordering=1,
+            created_guest=self.guest
+        )
+
+        # When: 첫 페이지 조회
+        response = self.client.get(reverse('product:points'), data={'size': 2})
         content = json.loads(response.content)
 
-        # Then: product excepted list
+        # Then: (ordering, id) 순서로 반환
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(content['products']), 1)
-        self.assertDictEqual(
-            content['products'][0],
-            {
-                'product_id': self.active_1000_point_product_ordering_1.id,
-                'title': 'Active Point Product1',
-                'description': None,
-                'is_sold_out': False,
-                'price': 1000,
-                'point': 1000,
-                'product_type': self.active_1000_point_product_ordering_1.product_type,
-                'review_count': 0,
-                'review_rate': 0.0,
-                'bought_count': 0,
-            }
+        self.assertEqual(
+            [product['product_id'] for product in content['products']],
+            [self.active_1000_point_product_ordering_1.id, active_1000_point_product_ordering_1_2.id],
+        )
+        self.assertTrue(content['has_more'])
+
+        # When: 다음 cursor 로 조회
+        response = self.client.get(
+            reverse('product:points'),
+            data={'size': 2, 'next_cursor': content['next_cursor']},
+        )
+        content = json.loads(response.content)
+
+        # Then: 같은 ordering 의 상품을 건너뛰지 않고 다음 상품 반환
+        self.assertEqual(
+            [product['product_id'] for product in content['products']],
+            [self.active_1000_point_product_ordering_2.id],
         )
+        self.assertFalse(content['has_more'])
+        self.assertIsNone(content['next_cursor'])
+
+    def test_point_product_list_should_fail_when_next_cursor_invalid(self):
+        # When: 잘못된 next_cursor 로 조회
+        response = self.client.get(reverse('product:points'), data={'next_cursor': 'invalid'})
+
+        # Then: 에러 반환
+        self.assertEqual(response.status_code, 500)
@@ -1,4 +1,6 @@
-from common.common_decorators.request_decorators import pagination
+from common.common_decorators.request_decorators import cursor_pagination
+from common.common_paginations.cursor_pagination_helpers import get_objects_with_cursor_pagination
+from product.cursor_criteria import PointProductCursorCriteria
 from product.dtos.model_dtos import PointProductItem
 from product.dtos.response_dtos import PointProductListResponse
 from product.models import PointProduct
@@ -7,15 +9,21 @@ from rest_framework.views import APIView
 
 
 class PointProductListAPIView(APIView):
-    @pagination(default_size=10)
-    def get(self, request, start_row, end_row):
-        point_products = [
-            PointProductItem.of(point_product).model_dump()
-            for point_product in PointProduct.objects.get_actives().order_by('ordering')[start_row:end_row]
-        ]
+    @cursor_pagination(default_size=10, cursor_criteria=[PointProductCursorCriteria])
+    def get(self, request, decoded_next_cursor, size):
+        point_products, has_more, next_cursor = get_objects_with_cursor_pagination(
+            PointProduct.objects.get_actives().filter(
+                PointProductCursorCriteria.get_filtering_q(decoded_next_cursor),
+            ),
+            PointProductCursorCriteria,
+            {},
+            size,
+        )
         return Response(
             data=PointProductListResponse(
-                products=point_products
+                products=[PointProductItem.of(point_product).model_dump() for point_product in point_products],
+                has_more=has_more,
+                next_cursor=next_cursor,
             ).model_dump(),
             status=200
         )
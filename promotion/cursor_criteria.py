@@ -0,0 +1,12 @@
+from common.common_criteria.cursor_criteria import CursorCriteria
+from promotion.models import Banner
+
+
+class BannerCursorCriteria(CursorCriteria):
+    cursor_keys = [
+        'id__gt',
+    ]
+    model = Banner
+    filter_fields = [
+        'target_layer',
+    ]
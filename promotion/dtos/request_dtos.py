@@ -1,4 +1,7 @@
-from typing import List
+from typing import (
+    List,
+    Optional,
+)
 
 from promotion.consts import BannerTargetLayer
 from pydantic import (
@@ -13,3 +16,5 @@ class GetBannerRequest(BaseModel):
 
 class GetBannerResponse(BaseModel):
     banners: List = Field(...)
+    has_more: bool = Field(...)
+    next_cursor: Optional[str] = None
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.10 on 2026-10-18 19:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('promotion', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='banner',
+            index=models.Index(fields=['target_layer', 'id'], name='banner_target_layer_id_idx'),
+        ),
+    ]
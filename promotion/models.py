@@ -124,6 +124,9 @@ class Banner(models.Model):
     class Meta:
         verbose_name = '배너'
         verbose_name_plural = '배너'
+        indexes = [
+            models.Index(fields=['target_layer', 'id'], name='banner_target_layer_id_idx'),
+        ]
 
     def __str__(self):
         return self.title
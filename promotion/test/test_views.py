@@ -62,10 +62,40 @@ class PromotionBannerAPITests(TestCase):
                         'external_target_url': self.banner.promotion_rule.external_target_url,
                         'tags': ['test_tag'],
                     }
-                ]
+                ],
+                'has_more': False,
+                'next_cursor': None,
             }
         )
 
+    def test_get_promotion_banner_should_paginate_with_next_cursor(self):
+        # Given: 같은 target_layer 배너 추가
+        next_banner = Banner.objects.create(
+            promotion_rule=self.rule,
+            target_layer=self.target_layer,
+        )
+
+        # When: 첫 페이지 조회
+        response = self.client.get(self.url, {'target_layer': self.target_layer, 'size': 1})
+
+        # Then: id 오름차순 첫 배너와 다음 cursor 반환
+        self.assertEqual(response.status_code, 200)
+        content = response.json()
+        self.assertEqual([banner['banner_id'] for banner in content['banners']], [self.banner.id])
+        self.assertTrue(content['has_more'])
+
+        # When: 다음 cursor 로 조회
+        response = self.client.get(
+            self.url,
+            {'target_layer': self.target_layer, 'size': 1, 'next_cursor': content['next_cursor']},
+        )
+
+        # Then: 다음 배너 반환
+        content = response.json()
+        self.assertEqual([banner['banner_id'] for banner in content['banners']], [next_banner.id])
+        self.assertFalse(content['has_more'])
+        self.assertIsNone(content['next_cursor'])
+
     def test_get_promotion_banner_should_return_400_when_mandatory_key_is_not_exists(self):
         # Given: mandatory key not exists
         param = {}
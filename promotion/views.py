@@ -1,8 +1,10 @@
 from common.common_decorators.request_decorators import (
+    cursor_pagination,
     mandatories,
-    pagination,
 )
+from common.common_paginations.cursor_pagination_helpers import get_objects_with_cursor_pagination
 from promotion.consts import BannerTargetLayer
+from promotion.cursor_criteria import BannerCursorCriteria
 from promotion.dtos.model_dtos import PromotionBanner
 from promotion.dtos.request_dtos import (
     GetBannerRequest,
@@ -14,16 +16,27 @@ from rest_framework.views import APIView
 
 
 class PromotionBannerAPIView(APIView):
-    @pagination(default_size=10)
+    @cursor_pagination(default_size=10, cursor_criteria=[BannerCursorCriteria])
     @mandatories('target_layer')
-    def get(self, request, start_row, end_row, m):
+    def get(self, request, decoded_next_cursor, size, m):
         try:
             banner_request = GetBannerRequest(target_layer=BannerTargetLayer(m['target_layer']))
         except ValueError:
             return Response({'message': '잘못된 target_layer 입니다.'}, status=400)
 
-        banners = get_active_banners(banner_request.target_layer)[start_row:end_row]
+        banners, has_more, next_cursor = get_objects_with_cursor_pagination(
+            get_active_banners(banner_request.target_layer).filter(
+                BannerCursorCriteria.get_filtering_q(decoded_next_cursor),
+            ),
+            BannerCursorCriteria,
+            {},
+            size,
+        )
         return Response(
-            GetBannerResponse(banners=[PromotionBanner.of(banner) for banner in banners]).model_dump(),
+            GetBannerResponse(
+                banners=[PromotionBanner.of(banner) for banner in banners],
+                has_more=has_more,
+                next_cursor=next_cursor,
+            ).model_dump(),
             status=200,
         )